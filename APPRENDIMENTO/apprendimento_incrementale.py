@@ -0,0 +1,175 @@
+import time #usato per misurare durata e righe al secondo di ogni passata
+import argparse #usato per leggere le opzioni da riga di comando
+import numpy as np  #usato per etichette, pesi e colonne numeriche di ogni blocco
+import pandas as pd #usato per leggere il CSV a blocchi
+from scipy import sparse    #usato per la matrice CSR delle feature di ogni blocco
+from sklearn.linear_model import SGDClassifier, Perceptron  #modelli lineari addestrabili a blocchi (partial_fit)
+from sklearn.naive_bayes import GaussianNB  #Naive Bayes addestrabile a blocchi (partial_fit)
+
+#moduli interni del progetto
+from crea_modello import adatta_input   #rende densa la matrice per i modelli che non accettano input sparsi
+
+try:
+    import resource #per il picco di memoria del processo (solo Linux/macOS)
+except ImportError:
+    resource = None
+
+#colonne lette dal CSV: le altre (titolo, stato, ...) non vengono mai caricate
+COLONNE = ['Generi', 'Punteggio_Utente', 'Punteggio_Medio', 'Rank', 'Popolarita']
+NUMERICHE = ['Punteggio_Medio', 'Rank', 'Popolarita']
+#colonna in cui finiscono i generi mai visti nel training set (es. presenti solo nelle righe di test)
+ALTRO = '<altro>'
+
+#modelli incrementali, i nomi già presenti in crea_modello (es. Naive Bayes) ricevono lo stesso formato di input
+def crea_modelli_incrementali():
+    return {
+        #regressione logistica stimata con discesa del gradiente stocastica
+        'SGD (log loss)': SGDClassifier(loss='log_loss', alpha=1e-4, random_state=42),
+        #come sopra con loss più robusta agli outlier
+        'SGD (modified huber)': SGDClassifier(loss='modified_huber', alpha=1e-4, random_state=42),
+        #classificatore lineare più semplice
+        'Perceptron': Perceptron(random_state=42),
+        #Naive Bayes gaussiano, aggiorna medie e varianze blocco per blocco
+        #la smoothing predefinita è proporzionale alla varianza massima: con i numeri standardizzati (varianza 1) sarebbe trascurabile
+        #e le varianze quasi nulle dei generi rari dominerebbero, mentre nella versione in memoria la varianza di Rank la rende grande
+        'Naive Bayes': GaussianNB(var_smoothing=0.1)
+    }
+
+#legge il CSV a blocchi di righe, restituisce ciascun blocco (solo righe con voto) con la posizione delle righe nel file
+def leggi_blocchi(percorso_csv, blocco=100000):
+    inizio = 0
+    for df in pd.read_csv(percorso_csv, usecols=COLONNE, chunksize=blocco, dtype={'Generi': str}):
+        posizioni = np.arange(inizio, inizio + len(df), dtype=np.uint64)
+        inizio += len(df)
+        #elimina righe con voti assenti o nulli
+        tieni = df['Punteggio_Utente'].to_numpy() > 0
+        yield df[tieni].reset_index(drop=True), posizioni[tieni]
+
+#suddivisione train/test stabile: dipende solo dalla posizione della riga, non dalla dimensione dei blocchi
+def in_test(posizioni, quota=0.2):
+    mescolate = (posizioni * np.uint64(0x9E3779B97F4A7C15)) >> np.uint64(40)
+    return mescolate % np.uint64(1000) < np.uint64(int(quota * 1000))
+
+#scompone la colonna dei generi in coppie (riga, genere) con la stessa pulizia di prepara_denso
+def esplodi_generi(generi):
+    esplosi = generi.fillna('').str.split(',').explode().str.strip()
+    esplosi = esplosi[esplosi != '']
+    return esplosi.str.lower().str.replace(' ', '_')
+
+#prima passata: vocabolario dei generi, media e deviazione standard delle colonne numeriche e numero di esempi per classe (solo training)
+#il vocabolario viene costruito solo sulle righe di training, più la colonna ALTRO per i generi che compaiono solo nel test
+def statistiche_stream(percorso_csv, blocco=100000):
+    vocabolario = set()
+    n, somma, somma_quadrati = 0, np.zeros(len(NUMERICHE)), np.zeros(len(NUMERICHE))
+    positivi = negativi = 0
+    for df, posizioni in leggi_blocchi(percorso_csv, blocco):
+        train = ~in_test(posizioni)
+        vocabolario.update(esplodi_generi(df['Generi'][train]).unique())
+        numeriche = np.nan_to_num(df[NUMERICHE].to_numpy(dtype=np.float64)[train])
+        n += len(numeriche)
+        somma += numeriche.sum(axis=0)
+        somma_quadrati += (numeriche ** 2).sum(axis=0)
+        piace = df['Punteggio_Utente'].to_numpy()[train] >= 7
+        positivi += int(piace.sum())
+        negativi += int(len(piace) - piace.sum())
+    media = somma / max(n, 1)
+    deviazione = np.sqrt(np.maximum(somma_quadrati / max(n, 1) - media ** 2, 0))
+    deviazione[deviazione == 0] = 1
+    return {'vocabolario': sorted(vocabolario) + [ALTRO], 'media': media, 'deviazione': deviazione, 'positivi': positivi, 'negativi': negativi}
+
+#codifica un blocco con il vocabolario fisso: generi CSR 0/1 (quelli fuori vocabolario vanno nella colonna ALTRO) e numeri standardizzati, tutto in float32
+def codifica_blocco(df, codice, statistiche):
+    esplosi = esplodi_generi(df['Generi']).map(codice).fillna(codice[ALTRO])
+    generi = sparse.csr_matrix((np.ones(len(esplosi), dtype=np.float32), (esplosi.index.to_numpy(), esplosi.to_numpy(dtype=np.int64))), shape=(len(df), len(codice)))
+    #un genere ripetuto nella stessa riga vale comunque 1
+    generi.sum_duplicates()
+    generi.data[:] = 1
+    numeriche = (np.nan_to_num(df[NUMERICHE].to_numpy(dtype=np.float64)) - statistiche['media']) / statistiche['deviazione']
+    X = sparse.hstack([generi, sparse.csr_matrix(numeriche.astype(np.float32))], format='csr')
+    y = (df['Punteggio_Utente'].to_numpy() >= 7).astype(np.int8)
+    return X, y
+
+#accumula la matrice di confusione blocco per blocco, le metriche finali sono identiche a quelle calcolate su tutto il test set
+class MetricheStreaming:
+    def __init__(self):
+        self.tp = self.fp = self.tn = self.fn = 0
+
+    def aggiorna(self, y_vero, y_predetto):
+        y_vero, y_predetto = np.asarray(y_vero) == 1, np.asarray(y_predetto) == 1
+        self.tp += int((y_vero & y_predetto).sum())
+        self.fp += int((~y_vero & y_predetto).sum())
+        self.tn += int((~y_vero & ~y_predetto).sum())
+        self.fn += int((y_vero & ~y_predetto).sum())
+
+    #accuracy, precision, recall e F1 (0 quando non definite, come zero_division=0)
+    def risultati(self):
+        totale = self.tp + self.fp + self.tn + self.fn
+        precision = self.tp / (self.tp + self.fp) if self.tp + self.fp else 0.0
+        recall = self.tp / (self.tp + self.fn) if self.tp + self.fn else 0.0
+        f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+        return {'accuracy': (self.tp + self.tn) / totale if totale else 0.0, 'precision': precision, 'recall': recall, 'f1': f1, 'esempi': totale}
+
+#picco di memoria residente del processo in MB (None se non disponibile)
+def picco_memoria():
+    if resource is None:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+#addestramento out-of-core: la memoria dipende dalla dimensione del blocco e non dal numero di righe del CSV
+#la classe minoritaria pesa negativi/positivi volte di più, al posto dell'oversampling della versione in memoria
+def appr_incrementale(percorso_csv='DATASET/dataset_ml.csv', blocco=100000, epoche=3, modelli=None, statistiche=None):
+    inizio = time.perf_counter()
+    statistiche = statistiche or statistiche_stream(percorso_csv, blocco)
+    print(f"Statistiche: {len(statistiche['vocabolario'])} generi, {statistiche['positivi']} positivi e {statistiche['negativi']} negativi nel training set ({time.perf_counter() - inizio:.1f} s)")
+    modelli = modelli or crea_modelli_incrementali()
+    codice = {genere: i for i, genere in enumerate(statistiche['vocabolario'])}
+    peso_positivi = statistiche['negativi'] / max(statistiche['positivi'], 1)
+    rng = np.random.default_rng(42)
+
+    for epoca in range(epoche):
+        inizio, righe = time.perf_counter(), 0
+        for df, posizioni in leggi_blocchi(percorso_csv, blocco):
+            X, y = codifica_blocco(df, codice, statistiche)
+            train = ~in_test(posizioni)
+            #le righe del blocco vengono mescolate a ogni epoca
+            ordine = rng.permutation(np.flatnonzero(train))
+            X, y = X[ordine], y[ordine]
+            if len(y) == 0:
+                continue
+            peso = np.where(y == 1, peso_positivi, 1.0)
+            for nome, modello in modelli.items():
+                modello.partial_fit(adatta_input(nome, X), y, classes=[0, 1], sample_weight=peso)
+            righe += len(y)
+        durata = time.perf_counter() - inizio
+        print(f"Epoca {epoca + 1}/{epoche}: {righe} righe in {durata:.1f} s ({righe / durata if durata > 0 else 0:.0f} righe/s)")
+
+    #valutazione sul test set letto anch'esso a blocchi
+    metriche = {nome: MetricheStreaming() for nome in modelli}
+    for df, posizioni in leggi_blocchi(percorso_csv, blocco):
+        test = in_test(posizioni)
+        if not test.any():
+            continue
+        X, y = codifica_blocco(df, codice, statistiche)
+        X, y = X[test], y[test]
+        for nome, modello in modelli.items():
+            metriche[nome].aggiorna(y, modello.predict(adatta_input(nome, X)))
+
+    print("\nValutazione sul test set")
+    risultati = {}
+    for nome, accumulatore in metriche.items():
+        risultati[nome] = accumulatore.risultati()
+        r = risultati[nome]
+        print(f"    {nome}: Accuracy={r['accuracy']:.3f} & Precision={r['precision']:.3f} & Recall={r['recall']:.3f} & F1={r['f1']:.3f} ({r['esempi']} esempi)")
+    memoria = picco_memoria()
+    if memoria is not None:
+        print(f"Picco di memoria del processo: {memoria:.0f} MB")
+    return modelli, risultati
+
+#main
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Addestramento incrementale a blocchi (out-of-core) sul dataset delle letture")
+    parser.add_argument('--csv', default='DATASET/dataset_ml.csv', help="CSV con le colonne di dataset_ml.csv, anche con milioni di righe")
+    parser.add_argument('--blocco', type=int, default=100000, help="righe lette e addestrate per volta")
+    parser.add_argument('--epoche', type=int, default=3, help="passate sul training set")
+    args = parser.parse_args()
+    appr_incrementale(args.csv, blocco=args.blocco, epoche=args.epoche)
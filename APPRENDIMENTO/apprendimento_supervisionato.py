@@ -1,58 +1,45 @@
-def appr_sup():
+import os   #per costruire il percorso dei moduli di PYTHON_DATASET
+import sys  #per rendere importabili i moduli di PYTHON_DATASET (strumentazione, dataset_colonnare), anche nei processi di joblib
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'PYTHON_DATASET'))
+
+#n_jobs = core totali per la griglia degli iperparametri, confronta_seriale = riesegue la griglia su un core per misurare lo speedup
+#usa_cache = riusa modelli e punteggi già calcolati sugli stessi dati (APPRENDIMENTO/cache_modelli.py)
+#sparso = feature in una matrice CSR float32 (generi sparsi) al posto del DataFrame denso
+#grafici = genera i PNG dopo l'addestramento (report.py), le metriche vengono comunque salvate in DATASET/metriche_ml.json
+#processi_report = processi del pool che disegna i grafici, indipendenti da n_jobs (None = tutti i core)
+def appr_sup(formato='csv', n_jobs=1, confronta_seriale=False, usa_cache=True, sparso=False, grafici=True, processi_report=None):
     import pandas as pd #oer caricare e manipolare dataset in formato tabellare
-    import os   #per gestire directory, creare cartelle, salvare file
-    import matplotlib.pyplot as plt #libreria base per visualizzazione di grafici
-    from sklearn.model_selection import train_test_split, cross_val_score   #per suddividere i dati in training/test e per cross-validation
-    from sklearn.preprocessing import MultiLabelBinarizer   #per trasformare etichette multilabel in codifica one-hot binaria
-    from sklearn.metrics import make_scorer, accuracy_score, precision_score, recall_score, f1_score    #metriche di valutazione del modello
+    import time #per misurare la durata dell'addestramento separata da quella dei grafici
+    from sklearn.model_selection import train_test_split   #per suddividere i dati in training/test
     from itertools import product   #permette di generare tutte le combinazioni possibili tra i valori degli iperparametri
-    from sklearn.utils import resample  #per effettuare oversampling dei dati (duplicare la classe minoritaria)
 
     #moduli interni del progetto
     from config_parametri import get_parametri #restituisce un dizionario con i parametri da testare per ciascun modello
-    from crea_modello import get_modelli #costruisce e restituisce un classificatore ML in base al nome e ai parametri specificati
     from valutazione_finale import valuta_modello_finale   #funzione per valutazione finale su test set con AdaBoost (utile per vedere tp,tn,fp,fn)
+    from cache_modelli import CacheModelli, impronta_dati  #cache dei modelli addestrati indirizzata dal contenuto dei dati
+    from punteggio_catalogo import salva_modello   #salva il modello finale con colonne e vocabolario dei generi
     
-    #funzioni di plotting
-    from grafici_modelli import plot_accuracy, plot_confusion_matrix, plot_bar_chart_naive_bayes, plot_radar_all_models  
-
-    os.makedirs("PNG", exist_ok=True)
-
-    #pre-processing del dataset
-    df = pd.read_csv('DATASET/dataset_ml.csv')
-    #elimina righe con voti assenti o nulli
-    df = df[df['Punteggio_Utente'] > 0]
-
-    #etichetta binaria: piace (1) se punteggio utente ≥ 7
-    df['Piace'] = df['Punteggio_Utente'].apply(lambda x: 1 if x >= 7 else 0)
-    
-    #pulizia e codifica dei generi
-    df['Generi'] = df['Generi'].fillna('').apply(lambda x: [g.strip().lower().replace(' ', '_') for g in x.split(',') if g])
+    #i grafici vengono disegnati dopo l'addestramento a partire dalle metriche registrate
+    from report import salva_metriche, genera_report
+    from strumentazione import span, registra  #durata, tempo CPU e memoria di ogni fase (attivi con main.py --metriche)
 
-    #per assegnare più generi contemporaneamente a un singolo esempio
-    mlb = MultiLabelBinarizer()
-    generi_encoded = pd.DataFrame(mlb.fit_transform(df['Generi']), columns=mlb.classes_, index=df.index)
+    inizio = time.perf_counter()
 
-    #costruzione matrice X (feature) e vettore y (target)
-    X = pd.concat([generi_encoded, df[['Punteggio_Medio', 'Rank', 'Popolarita']]], axis=1).fillna(0)
-    y = df['Piace']
+    with span('preparazione', profila=True, formato=formato, sparso=str(sparso)) as misura:
+        if formato == 'colonnare':
+            #formato colonnare: legge solo le colonne necessarie, i generi arrivano già codificati come bitmask
+            X, y, colonne = carica_colonnare('DATASET/dataset_ml.csv', sparso=sparso)
+        else:
+            #pre-processing del dataset
+            df = pd.read_csv('DATASET/dataset_ml.csv')
+            X, y, colonne = prepara_sparso(df) if sparso else prepara_denso(df)
 
-    #suddivisione train/test
-    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+        #suddivisione train/test
+        X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
 
-    #bilanciamento del training set (oversampling)
-    train_df = pd.concat([X_train, y_train], axis=1)
-    #divide per classe
-    minority = train_df[train_df['Piace'] == 1]
-    majority = train_df[train_df['Piace'] == 0]
-
-    #oversampling della classe minoritaria (ci sono pochi esempi con punteggio maggiore di 7)
-    minority_upsampled = resample(minority, replace=True, n_samples=len(majority), random_state=42)
-
-    #combina di nuovo
-    train_balanced = pd.concat([majority, minority_upsampled])
-    X_train = train_balanced.drop(columns='Piace')
-    y_train = train_balanced['Piace']
+        #bilanciamento del training set (oversampling), la versione sparsa seleziona le righe per indice senza copie intermedie
+        X_train, y_train = bilancia_indici(X_train, y_train) if sparso else bilancia_denso(X_train, y_train)
+        misura.imposta(righe=X.shape[0], colonne=len(colonne), righe_train=X_train.shape[0])
 
     #configurazione dei modelli e parametri
     param_grid = get_parametri()
@@ -65,8 +52,14 @@ def appr_sup():
         'XGBoost': {'n_estimators': 100}
     }
 
-    model_names = []
-    radar_data = []
+    #metriche registrate per il report (griglia e fold di ogni modello, matrice di confusione finale)
+    metriche = {'modelli': {}}
+    tempi_griglia = {}
+
+    #impronte dei dati: le voci in cache valgono solo per gli stessi train/test set e lo stesso dataset completo
+    cache = CacheModelli() if usa_cache else None
+    impronta_griglia = impronta_dati(X_train, y_train, X_test, y_test) if cache else None
+    impronta_cv = impronta_dati(X, y) if cache else None
 
     #addestramento e valutazione di ciascun modello
     for model_name, param_grid_model in param_grid.items():
@@ -77,40 +70,30 @@ def appr_sup():
         keys, values = zip(*param_grid_model.items()) if param_grid_model else ([], [])
         combinations = [dict(zip(keys, v)) for v in product(*values)] if values else [{}]
 
-        for combo in combinations:
-            try:
-                model = get_modelli(model_name, combo)
-                model.fit(X_train, y_train)
-                train_acc.append(model.score(X_train, y_train))
-                test_acc.append(model.score(X_test, y_test))
-                labels.append(str(combo))
-            except Exception as e:
-                print(f"Errore con i parametri {combo}: {e}")
+        #le combinazioni vengono addestrate in parallelo, i risultati tornano nell'ordine della griglia
+        #con la cache vengono addestrate solo le combinazioni nuove
+        risultati, durata = esegui_griglia(model_name, combinations, X_train, y_train, X_test, y_test, n_jobs, cache, impronta_griglia)
+        for combo, (train, test, errore) in zip(combinations, risultati):
+            if errore:
+                print(f"Errore con i parametri {combo}: {errore}")
+                continue
+            train_acc.append(train)
+            test_acc.append(test)
+            labels.append(str(combo))
 
-        #plot accuracy se non è Naive Bayes
-        if model_name != 'Naive Bayes':
-            plot_accuracy(labels, train_acc, test_acc, model_name)
+        #stessa griglia su un solo core (senza cache) per confrontare i tempi
+        seriale = esegui_griglia(model_name, combinations, X_train, y_train, X_test, y_test, 1)[1] if confronta_seriale and n_jobs != 1 else None
+        tempi_griglia[model_name] = (len(combinations), durata, seriale)
+        print(f"    Griglia: {len(combinations)} combinazioni in {durata:.2f} s" + (f" (seriale {seriale:.2f} s, speedup {seriale / durata:.2f}x)" if seriale else ""))
 
         #valutazione con Cross-Validation
         print(f"\n[Cross Validation]: {model_name}")
-        model = get_modelli(model_name, default_params[model_name])
-        acc_scores = cross_val_score(model, X, y, cv=5, scoring='accuracy')
-        prec_scores = cross_val_score(model, X, y, cv=5, scoring=make_scorer(precision_score, zero_division=0))
-        rec_scores  = cross_val_score(model, X, y, cv=5, scoring=make_scorer(recall_score, zero_division=0))
-        f1_scores   = cross_val_score(model, X, y, cv=5, scoring=make_scorer(f1_score, zero_division=0))
+        cv = esegui_cv(model_name, default_params[model_name], X, y, n_jobs, cache, impronta_cv)
+        acc_scores, prec_scores, rec_scores, f1_scores = cv['test_accuracy'], cv['test_precision'], cv['test_recall'], cv['test_f1']
 
         #stampa metriche fold per fold
         for i in range(5):
-            print(f"    Fold {i+1}: Accuracy={acc_scores[i]:.3f} & Precision={prec_scores[i]:.3f} & Recall={rec_scores[i]:.3f} & F1={f1_scores[i]:.3f}")
-            metrics = ['Accuracy', 'Precision', 'Recall', 'F1-score']
-            values = [acc_scores[i], prec_scores[i], rec_scores[i], f1_scores[i]]
-            plt.figure()
-            plt.bar(metrics, values, color='lightblue')
-            plt.ylim(0, 1)
-            plt.title(f'{model_name} - Fold {i+1}')
-            safe_name = model_name.replace(" ", "_").lower()
-            plt.savefig(f'PNG/{safe_name}_fold_{i+1}.png')
-            plt.close()
+            print(f"    Fold {i+1}: Accuracy={acc_scores[i]:.3f} & Precision={prec_scores[i]:.3f} & Recall={rec_scores[i]:.3f} & F1={f1_scores[i]:.3f} (fit {cv['fit_time'][i]:.2f} s, score {cv['score_time'][i]:.2f} s)")
 
         #stampa media CV
         print(f"    Media Accuracy:  {acc_scores.mean():.3f} ± {acc_scores.std():.3f}")
@@ -118,15 +101,271 @@ def appr_sup():
         print(f"    Media Recall:    {rec_scores.mean():.3f} ± {rec_scores.std():.3f}")
         print(f"    Media F1-score:  {f1_scores.mean():.3f} ± {f1_scores.std():.3f}")
 
-        #salva dati per radar plot
-        model_names.append(model_name)
-        radar_data.append([acc_scores.mean(), prec_scores.mean(), rec_scores.mean(), f1_scores.mean()])
+        #salva i dati per i grafici (accuracy della griglia, fold, radar plot e barre del Naive Bayes)
+        metriche['modelli'][model_name] = {
+            'griglia': {'labels': labels, 'train': train_acc, 'test': test_acc},
+            'cv': {nome: [float(v) for v in cv[chiave]] for nome, chiave in (('accuracy', 'test_accuracy'), ('precision', 'test_precision'), ('recall', 'test_recall'), ('f1', 'test_f1'), ('fit_time', 'fit_time'), ('score_time', 'score_time'))}
+        }
 
-        #grafico a barre per Naive Bayes
-        if model_name == 'Naive Bayes':
-            plot_bar_chart_naive_bayes(['Accuracy', 'Precision', 'Recall', 'F1-score'],[acc_scores.mean(), prec_scores.mean(), rec_scores.mean(), f1_scores.mean()])
+    #riepilogo dei tempi della griglia per famiglia di modelli
+    print(f"\nTempi della griglia (n_jobs={n_jobs})")
+    for model_name, (combinazioni, durata, seriale) in tempi_griglia.items():
+        print(f"    {model_name}: {combinazioni} combinazioni in {durata:.2f} s" + (f", seriale {seriale:.2f} s, speedup {seriale / durata:.2f}x" if seriale else ""))
 
     #valutazione finale su test set con AdaBoost
-    valuta_modello_finale(X_train, X_test, y_train, y_test)
-    #radar plot finale per confronto modelli
-    plot_radar_all_models(model_names, ['Accuracy', 'Precision', 'Recall', 'F1-score'], radar_data)
\ No newline at end of file
+    with span('valutazione_finale', profila=True, modello='AdaBoost'):
+        modello_finale, matrice_confusione = valuta_modello_finale(X_train, X_test, y_train, y_test, cache=cache)
+    metriche['finale'] = {'modello': 'AdaBoost', 'matrice_confusione': matrice_confusione.tolist()}
+    #salva il modello finale per punteggio_catalogo.py (classifica dei manga non letti)
+    salva_modello(modello_finale, colonne, sparso=sparso, dataset='DATASET/dataset_ml.csv')
+    #rimuove le voci meno usate se la cache supera la dimensione massima
+    if cache:
+        cache.rimuovi_eccesso()
+        cache.stampa_statistiche()
+    print(f"\nAddestramento completato in {time.perf_counter() - inizio:.1f} s")
+    registra('addestramento', time.perf_counter() - inizio, {'formato': formato, 'sparso': str(sparso)}, n_jobs=n_jobs, modelli=len(param_grid))
+
+    #le metriche restano su disco, così i grafici possono essere rigenerati con report.py senza riaddestrare
+    salva_metriche(metriche)
+    if grafici:
+        with span('report', profila=True):
+            genera_report(processi=processi_report)
+
+#addestra una combinazione di iperparametri e restituisce (accuratezza train, accuratezza test, errore)
+#eseguita nei processi di joblib, quindi gli errori vengono restituiti e stampati dal processo principale
+#se riceve la cache salva direttamente il modello addestrato con i suoi punteggi
+def addestra_combinazione(model_name, combo, X_train, y_train, X_test, y_test, thread, cache=None, chiave=None):
+    import time #per separare il tempo di fit da quello di score
+    from crea_modello import get_modelli, adatta_input #costruisce il classificatore con i thread assegnati
+    from strumentazione import span    #uno span per combinazione, scritto anche dai processi di joblib
+    X_train, X_test = adatta_input(model_name, X_train), adatta_input(model_name, X_test)
+    with span('griglia_combinazione', modello=model_name) as misura:
+        misura.imposta(combinazione=str(combo), thread=thread, righe=X_train.shape[0])
+        try:
+            model = get_modelli(model_name, combo, n_jobs=thread)
+            inizio = time.perf_counter()
+            model.fit(X_train, y_train)
+            fit = time.perf_counter() - inizio
+            train, test = model.score(X_train, y_train), model.score(X_test, y_test)
+            misura.imposta(fit_secondi=round(fit, 6), score_secondi=round(time.perf_counter() - inizio - fit, 6))
+        except Exception as e:
+            misura.imposta(errore=str(e))
+            return None, None, str(e)
+    if cache is not None:
+        cache.scrivi(chiave, {'train': train, 'test': test, 'modello': model})
+    return train, test, None
+
+#esegue tutte le combinazioni di un modello dividendo n_jobs core tra processi paralleli e thread del singolo modello
+#con la cache (e l'impronta dei dati) addestra solo le combinazioni non ancora salvate
+#restituisce i risultati nell'ordine delle combinazioni e la durata in secondi
+def esegui_griglia(model_name, combinations, X_train, y_train, X_test, y_test, n_jobs=1, cache=None, impronta=None):
+    import os   #per contare i core quando n_jobs = -1
+    import time #per misurare la durata della griglia
+    from joblib import Parallel, delayed    #per addestrare più combinazioni in processi separati
+    from strumentazione import span    #durata della griglia di un modello
+
+    n_jobs = os.cpu_count() if n_jobs in (None, -1) else max(1, n_jobs)
+    inizio = time.perf_counter()
+    with span('griglia', profila=True, modello=model_name) as misura:
+        #le combinazioni già in cache restituiscono i punteggi salvati
+        risultati = [None] * len(combinations)
+        chiavi = [cache.chiave(impronta, model_name, combo) if cache else None for combo in combinations]
+        for i, chiave in enumerate(chiavi):
+            voce = cache.leggi(chiave) if cache else None
+            if voce is not None:
+                risultati[i] = (voce['train'], voce['test'], None)
+        da_addestrare = [i for i, r in enumerate(risultati) if r is None]
+        if cache and len(da_addestrare) < len(combinations):
+            print(f"    {len(combinations) - len(da_addestrare)} combinazioni dalla cache, {len(da_addestrare)} da addestrare")
+
+        if da_addestrare:
+            #un processo per combinazione finché ci sono core, i core avanzati vanno ai thread del modello (es. 8 core e 3 combinazioni = 3 processi da 2 thread)
+            processi = min(n_jobs, len(da_addestrare))
+            thread = max(1, n_jobs // processi)
+            if processi == 1:
+                nuovi = [addestra_combinazione(model_name, combinations[i], X_train, y_train, X_test, y_test, thread, cache, chiavi[i]) for i in da_addestrare]
+            else:
+                nuovi = Parallel(n_jobs=processi)(delayed(addestra_combinazione)(model_name, combinations[i], X_train, y_train, X_test, y_test, thread, cache, chiavi[i]) for i in da_addestrare)
+            for i, risultato in zip(da_addestrare, nuovi):
+                risultati[i] = risultato
+        misura.imposta(combinazioni=len(combinations), n_jobs=n_jobs)
+    return risultati, time.perf_counter() - inizio
+
+#cross-validation a 5 fold con i parametri predefiniti del modello, restituisce il dizionario di cross_validate (punteggi, tempi e modelli dei fold)
+#i 5 fold vengono eseguiti in parallelo, i core avanzati vanno ai thread del modello
+def esegui_cv(model_name, params, X, y, n_jobs=1, cache=None, impronta=None):
+    from sklearn.model_selection import cross_validate #tutte le metriche con un solo addestramento per fold
+    from sklearn.metrics import make_scorer, precision_score, recall_score, f1_score   #metriche di valutazione del modello
+    from crea_modello import get_modelli, adatta_input #costruisce il classificatore, adatta_input rende densa la matrice per i modelli che non accettano input sparsi
+    from strumentazione import span, registra  #durata della cross-validation e di ogni fold
+
+    fold_paralleli = min(n_jobs, 5) if n_jobs > 0 else n_jobs
+    model = get_modelli(model_name, params, n_jobs=max(1, n_jobs // 5))
+    #ogni fold addestra il modello una sola volta e calcola tutte le metriche sulle stesse predizioni
+    scorer = {
+        'accuracy': 'accuracy',
+        'precision': make_scorer(precision_score, zero_division=0),
+        'recall': make_scorer(recall_score, zero_division=0),
+        'f1': make_scorer(f1_score, zero_division=0)
+    }
+    chiave = cache.chiave(impronta, model_name, params, fase='cv') if cache else None
+    with span('cv', profila=True, modello=model_name) as misura:
+        cv = cache.leggi(chiave) if cache else None
+        misura.imposta(da_cache=cv is not None, righe=X.shape[0])
+        if cv is None:
+            cv = cross_validate(model, adatta_input(model_name, X), y, cv=5, scoring=scorer, n_jobs=fold_paralleli, return_estimator=True)
+            if cache:
+                cache.scrivi(chiave, cv)
+            #i fold girano nei processi di cross_validate: i tempi arrivano da fit_time e score_time
+            for i, (fit, score) in enumerate(zip(cv['fit_time'], cv['score_time'])):
+                registra('cv_fold', fit + score, {'modello': model_name}, fold=i + 1, fit_secondi=round(float(fit), 6), score_secondi=round(float(score), 6))
+        else:
+            print("    (risultati dalla cache, tempi dell'addestramento originale)")
+    return cv
+
+#pre-processing denso del dataset letto da CSV, restituisce X (DataFrame), y e i nomi delle colonne
+def prepara_denso(df):
+    import pandas as pd #per costruire la matrice delle feature
+    from sklearn.preprocessing import MultiLabelBinarizer   #per trasformare etichette multilabel in codifica one-hot binaria
+
+    #elimina righe con voti assenti o nulli
+    df = df[df['Punteggio_Utente'] > 0].copy()
+
+    #etichetta binaria: piace (1) se punteggio utente ≥ 7
+    df['Piace'] = df['Punteggio_Utente'].apply(lambda x: 1 if x >= 7 else 0)
+
+    #pulizia e codifica dei generi
+    df['Generi'] = df['Generi'].fillna('').apply(lambda x: [g.strip().lower().replace(' ', '_') for g in x.split(',') if g])
+
+    #per assegnare più generi contemporaneamente a un singolo esempio
+    mlb = MultiLabelBinarizer()
+    generi_encoded = pd.DataFrame(mlb.fit_transform(df['Generi']), columns=mlb.classes_, index=df.index)
+
+    #costruzione matrice X (feature) e vettore y (target)
+    X = pd.concat([generi_encoded, df[['Punteggio_Medio', 'Rank', 'Popolarita']]], axis=1).fillna(0)
+    y = df['Piace']
+    return X, y, list(X.columns)
+
+#oversampling della classe minoritaria sul DataFrame denso
+def bilancia_denso(X_train, y_train):
+    import pandas as pd #per unire e dividere feature e target
+    from sklearn.utils import resample  #per effettuare oversampling dei dati (duplicare la classe minoritaria)
+
+    train_df = pd.concat([X_train, y_train], axis=1)
+    #divide per classe
+    minority = train_df[train_df['Piace'] == 1]
+    majority = train_df[train_df['Piace'] == 0]
+
+    #oversampling della classe minoritaria (ci sono pochi esempi con punteggio maggiore di 7)
+    minority_upsampled = resample(minority, replace=True, n_samples=len(majority), random_state=42)
+
+    #combina di nuovo
+    train_balanced = pd.concat([majority, minority_upsampled])
+    return train_balanced.drop(columns='Piace'), train_balanced['Piace']
+
+#unisce generi (matrice sparsa) e colonne numeriche in una CSR float32
+def matrice_feature(generi, numeriche):
+    import numpy as np  #per le colonne numeriche in float32
+    from scipy import sparse    #per la matrice CSR
+    return sparse.hstack([generi.astype(np.float32), sparse.csr_matrix(np.nan_to_num(numeriche).astype(np.float32))], format='csr')
+
+#pre-processing sparso del dataset letto da CSV: stesse righe, colonne ed etichette di prepara_denso
+#i generi restano una matrice CSR (circa 3 valori non nulli su 80 colonne) e i numeri sono float32, senza DataFrame intermedi
+def prepara_sparso(df):
+    import numpy as np  #per filtrare le righe e costruire le colonne numeriche
+    from sklearn.preprocessing import MultiLabelBinarizer   #codifica dei generi direttamente in formato sparso
+
+    punteggio = df['Punteggio_Utente'].to_numpy()
+    righe = np.flatnonzero(punteggio > 0)
+    generi = [[g.strip().lower().replace(' ', '_') for g in x.split(',') if g] for x in df['Generi'].fillna('').to_numpy()[righe]]
+    mlb = MultiLabelBinarizer(sparse_output=True)
+    generi_encoded = mlb.fit_transform(generi)
+    numeriche = df[['Punteggio_Medio', 'Rank', 'Popolarita']].to_numpy(dtype=np.float64)[righe]
+    X = matrice_feature(generi_encoded, numeriche)
+    y = (punteggio[righe] >= 7).astype(np.int8)
+    return X, y, list(mlb.classes_) + ['Punteggio_Medio', 'Rank', 'Popolarita']
+
+#oversampling per indici: duplica le righe della classe minoritaria con gli stessi indici estratti da bilancia_denso
+#funziona con matrici sparse e array numpy, copia le feature una sola volta
+def bilancia_indici(X_train, y_train):
+    import numpy as np  #per gli indici delle due classi
+    from sklearn.utils import resample  #stesso campionamento (e stesso seme) della versione densa
+
+    y_train = np.asarray(y_train)
+    minority = np.flatnonzero(y_train == 1)
+    majority = np.flatnonzero(y_train == 0)
+    minority_upsampled = resample(minority, replace=True, n_samples=len(majority), random_state=42)
+    indici = np.concatenate([majority, minority_upsampled])
+    return X_train[indici], y_train[indici]
+
+#misura il picco di memoria della preparazione (feature, train/test, oversampling) densa e sparsa con il dataset replicato più volte
+def misura_memoria(percorso_csv='DATASET/dataset_ml.csv', fattori=(1, 10, 100)):
+    import gc   #per liberare la memoria tra una misura e l'altra
+    import tracemalloc  #per il picco di memoria allocata (numpy e pandas compresi)
+    import pandas as pd #per leggere e replicare il dataset
+    from sklearn.model_selection import train_test_split    #stessa suddivisione di appr_sup
+
+    originale = pd.read_csv(percorso_csv)
+    print(f"{'righe':>10} {'denso (MB)':>12} {'sparso (MB)':>12} {'X denso (MB)':>13} {'X sparso (MB)':>14}")
+    for fattore in fattori:
+        df = pd.concat([originale] * fattore, ignore_index=True)
+        picchi, dimensioni = [], []
+        for prepara, bilancia in ((prepara_denso, bilancia_denso), (prepara_sparso, bilancia_indici)):
+            gc.collect()
+            tracemalloc.start()
+            X, y, _ = prepara(df)
+            X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+            X_train, y_train = bilancia(X_train, y_train)
+            picchi.append(tracemalloc.get_traced_memory()[1] / 1024 / 1024)
+            tracemalloc.stop()
+            dimensioni.append((X.memory_usage(deep=True).sum() if hasattr(X, 'memory_usage') else X.data.nbytes + X.indices.nbytes + X.indptr.nbytes) / 1024 / 1024)
+            del X, y, X_train, X_test, y_train, y_test
+        print(f"{len(df):>10} {picchi[0]:>12.1f} {picchi[1]:>12.1f} {dimensioni[0]:>13.1f} {dimensioni[1]:>14.1f}")
+
+#costruisce X e y dal formato colonnare di PYTHON_DATASET/dataset_colonnare.py, con le stesse colonne della lettura da CSV
+#sparso = restituisce X come CSR float32 invece del DataFrame
+def carica_colonnare(percorso_csv, sparso=False):
+    import os   #per costruire il percorso dei moduli di PYTHON_DATASET
+    import sys  #per rendere importabili i moduli di PYTHON_DATASET
+    import numpy as np  #per filtrare e convertire le colonne tipizzate
+    import pandas as pd #per restituire X e y come nella lettura da CSV
+    sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'PYTHON_DATASET'))
+    from dataset_colonnare import cartella_colonnare, aggiornato, converti_csv, leggi_schema, carica_colonne, generi_a_matrice, MANCANTE
+
+    #converte il CSV solo se la versione colonnare manca o è più vecchia
+    cartella = cartella_colonnare(percorso_csv)
+    if not aggiornato(percorso_csv, cartella):
+        converti_csv(percorso_csv, cartella)
+    schema = leggi_schema(cartella)
+    colonne = carica_colonne(cartella, ['Punteggio_Utente', 'Generi', 'Punteggio_Medio', 'Rank', 'Popolarita'])
+
+    #elimina righe con voti assenti o nulli
+    punteggio = np.asarray(colonne['Punteggio_Utente'])
+    righe = np.flatnonzero(punteggio > 0)
+
+    #espande la bitmask dei generi e tiene solo quelli presenti nelle righe selezionate (come MultiLabelBinarizer)
+    vocabolario = schema['colonne']['Generi']['vocabolario']
+    generi = generi_a_matrice(np.asarray(colonne['Generi'])[righe], len(vocabolario))
+    nomi = [g.lower().replace(' ', '_') for g in vocabolario]
+    presenti = sorted((nomi[c], c) for c in np.flatnonzero(generi.any(axis=0)))
+    nomi_colonne = [nome for nome, _ in presenti] + ['Punteggio_Medio', 'Rank', 'Popolarita']
+
+    #valori numerici: i mancanti (NaN o -1) diventano 0 come nella lettura da CSV
+    #il passaggio dal testo del float32 restituisce esattamente il valore del CSV (9.47 e non 9.470000267)
+    numeriche = {'Punteggio_Medio': np.nan_to_num(np.asarray(colonne['Punteggio_Medio'])[righe].astype(str).astype(np.float64))}
+    for nome in ('Rank', 'Popolarita'):
+        valori = np.asarray(colonne[nome])[righe].astype(np.int64)
+        numeriche[nome] = np.where(valori == MANCANTE, 0, valori)
+
+    if sparso:
+        from scipy import sparse    #per la matrice CSR dei generi
+        X = matrice_feature(sparse.csr_matrix(generi[:, [c for _, c in presenti]]), np.column_stack(list(numeriche.values())))
+        return X, (punteggio[righe] >= 7).astype(np.int8), nomi_colonne
+
+    X = pd.DataFrame(generi[:, [c for _, c in presenti]].astype(np.int64), columns=[nome for nome, _ in presenti], index=righe)
+    for nome, valori in numeriche.items():
+        X[nome] = valori
+
+    #etichetta binaria: piace (1) se punteggio utente ≥ 7
+    y = pd.Series((punteggio[righe] >= 7).astype(np.int64), index=righe, name='Piace')
+    return X, y, nomi_colonne
@@ -0,0 +1,106 @@
+import os   #usato per gestire la cartella e i file della cache
+import contextlib   #usato per ignorare le voci già rimosse da un altro processo
+import json #usato per serializzare in modo stabile nome del modello e parametri nella chiave
+import hashlib  #usato per calcolare le chiavi (impronta dei dati + modello + parametri)
+import joblib   #usato per salvare e caricare i modelli addestrati
+import numpy as np  #usato per l'impronta delle matrici numpy
+import pandas as pd #usato per l'impronta di DataFrame e Series
+from scipy import sparse    #usato per l'impronta delle matrici sparse
+import sklearn  #la versione entra nella chiave: un modello salvato con un'altra versione non viene riusato
+import xgboost  #come sopra
+
+#file che costruisce i modelli: se cambia (es. nuovo parametro passato al costruttore) le voci salvate non valgono più
+CREA_MODELLO = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'crea_modello.py')
+
+#impronta SHA-256 di una o più strutture dati (DataFrame, Series, matrici sparse, array numpy), dipende da valori, indice, colonne e tipi
+def impronta_dati(*oggetti):
+    h = hashlib.sha256()
+    for oggetto in oggetti:
+        if isinstance(oggetto, pd.DataFrame):
+            h.update(json.dumps([list(map(str, oggetto.columns)), list(map(str, oggetto.dtypes))]).encode('utf-8'))
+            h.update(pd.util.hash_pandas_object(oggetto, index=True).to_numpy().tobytes())
+        elif isinstance(oggetto, pd.Series):
+            h.update(json.dumps([str(oggetto.name), str(oggetto.dtype)]).encode('utf-8'))
+            h.update(pd.util.hash_pandas_object(oggetto, index=True).to_numpy().tobytes())
+        elif sparse.issparse(oggetto):
+            csr = sparse.csr_matrix(oggetto)
+            h.update(json.dumps(['csr', csr.shape, str(csr.dtype)]).encode('utf-8'))
+            for parte in (csr.data, csr.indices, csr.indptr):
+                h.update(np.ascontiguousarray(parte).tobytes())
+        else:
+            array = np.ascontiguousarray(oggetto)
+            h.update(json.dumps([array.shape, str(array.dtype)]).encode('utf-8'))
+            h.update(array.tobytes())
+    return h.hexdigest()
+
+#cache su disco dei modelli addestrati e dei loro punteggi, indirizzata dal contenuto e con eviction LRU per dimensione
+#ogni voce è un file joblib: i processi di joblib possono scrivere in parallelo senza un indice condiviso
+class CacheModelli:
+    def __init__(self, cartella=os.path.join('DATASET', 'cache_modelli'), dimensione_massima=2 * 1024 * 1024 * 1024):
+        os.makedirs(cartella, exist_ok=True)
+        self.cartella = cartella
+        self.dimensione_massima = dimensione_massima
+        with open(CREA_MODELLO, 'rb') as f:
+            self.versione = [sklearn.__version__, xgboost.__version__, hashlib.sha256(f.read()).hexdigest()]
+        #contatori (del processo che li usa)
+        self.hit = 0
+        self.miss = 0
+        self.salvati = 0
+        self.rimossi = 0
+
+    #la chiave dipende da versioni delle librerie, impronta dei dati, fase (griglia, cv, finale), modello e parametri
+    def chiave(self, impronta, nome, params, fase='griglia'):
+        testo = json.dumps([self.versione, impronta, fase, nome, params], sort_keys=True, default=str)
+        return hashlib.sha256(testo.encode('utf-8')).hexdigest()
+
+    def percorso(self, chiave):
+        return os.path.join(self.cartella, chiave + '.joblib')
+
+    #restituisce la voce salvata oppure None, un hit aggiorna la data di ultimo accesso usata dall'eviction
+    def leggi(self, chiave):
+        percorso = self.percorso(chiave)
+        try:
+            voce = joblib.load(percorso)
+            os.utime(percorso)
+        except FileNotFoundError:
+            self.miss += 1
+            return None
+        except Exception:
+            #voce illeggibile (es. scrittura interrotta): viene eliminata e ricalcolata, se un altro processo l'ha già rimossa resta un miss
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(percorso)
+            self.miss += 1
+            return None
+        self.hit += 1
+        return voce
+
+    #salva una voce scrivendo prima un file temporaneo, così chi legge non trova mai un file a metà
+    def scrivi(self, chiave, voce):
+        percorso = self.percorso(chiave)
+        temporaneo = f'{percorso}.{os.getpid()}.tmp'
+        joblib.dump(voce, temporaneo)
+        os.replace(temporaneo, percorso)
+        self.salvati += 1
+
+    #dimensione totale in byte delle voci salvate
+    def dimensione(self):
+        return sum(voce.stat().st_size for voce in os.scandir(self.cartella) if voce.name.endswith('.joblib'))
+
+    #rimuove le voci usate meno di recente finché la cache non rientra nella dimensione massima
+    def rimuovi_eccesso(self):
+        voci = sorted((voce.stat().st_mtime, voce.stat().st_size, voce.path) for voce in os.scandir(self.cartella) if voce.name.endswith('.joblib'))
+        totale = sum(dimensione for _, dimensione, _ in voci)
+        for _, dimensione, percorso in voci:
+            if totale <= self.dimensione_massima:
+                break
+            os.remove(percorso)
+            totale -= dimensione
+            self.rimossi += 1
+
+    #restituisce i contatori della cache
+    def statistiche(self):
+        return {'hit': self.hit, 'miss': self.miss, 'salvati': self.salvati, 'rimossi': self.rimossi, 'byte': self.dimensione()}
+
+    #stampa un riepilogo dei contatori
+    def stampa_statistiche(self):
+        print(f"Cache modelli: {self.hit} hit, {self.miss} miss, {self.rimossi} rimossi, {self.dimensione() / 1024 / 1024:.1f} MB su disco")
@@ -5,23 +5,34 @@ from sklearn.neighbors import KNeighborsClassifier #KNN classifica in base ai k
 from sklearn.naive_bayes import GaussianNB #classificatore probabilistico (basato sul teorema di Bayes)
 from xgboost import XGBClassifier   #XGBoost algoritmo di boosting basato su gradienti
 
+#modelli che ricevono la versione densa della matrice delle feature: GaussianNB non accetta matrici sparse,
+#XGBoost le accetta ma tratta gli zeri non memorizzati come valori mancanti (e non come genere assente)
+MODELLI_DENSI = {'Naive Bayes', 'XGBoost'}
+
+#restituisce X nel formato accettato dal modello (densa solo se il modello lo richiede)
+def adatta_input(name, X):
+    if name in MODELLI_DENSI and hasattr(X, 'toarray'):
+        return X.toarray()
+    return X
+
 #ritorna un modello ML configurato in base al nome e ai parametri
-def get_modelli(name, params):
+#n_jobs = thread che il singolo modello può usare (Random Forest, KNN e XGBoost), assegnati dal chiamante per non superare i core disponibili
+def get_modelli(name, params, n_jobs=1):
     if name == 'Decision Tree':
         #albero decisionale con controllo su profondità massima e numero minimo di campioni per foglia
         return DecisionTreeClassifier(max_depth=params['max_depth'],min_samples_leaf=params.get('min_samples_leaf', 5),random_state=42)
     if name == 'Random Forest':
         #RandomForest con numero di alberi, profondità e foglie minime specificabili
-        return RandomForestClassifier(n_estimators=params['n_estimators'],max_depth=params['max_depth'],min_samples_leaf=params.get('min_samples_leaf', 5),random_state=42)
+        return RandomForestClassifier(n_estimators=params['n_estimators'],max_depth=params['max_depth'],min_samples_leaf=params.get('min_samples_leaf', 5),random_state=42,n_jobs=n_jobs)
     if name == 'AdaBoost':
         #AdaBoost con numero di stime e learning rate
         return AdaBoostClassifier(n_estimators=params['n_estimators'],learning_rate=params.get('learning_rate', 1.0),random_state=42)
     if name == 'KNN':
         #KNN con numero di vicini specificato
-        return KNeighborsClassifier(n_neighbors=params['n_neighbors'])
+        return KNeighborsClassifier(n_neighbors=params['n_neighbors'],n_jobs=n_jobs)
     if name == 'Naive Bayes':
         #Gaussian Naive Bayes non ha parametri essendo probabilistico
         return GaussianNB()
     if name == 'XGBoost':
         #XGBoost con numero stimatori, profondità, learning rate
-        return XGBClassifier(n_estimators=params['n_estimators'],max_depth=params.get('max_depth', 3),learning_rate=params.get('learning_rate', 0.1),eval_metric='logloss')
\ No newline at end of file
+        return XGBClassifier(n_estimators=params['n_estimators'],max_depth=params.get('max_depth', 3),learning_rate=params.get('learning_rate', 0.1),eval_metric='logloss',random_state=42,n_jobs=n_jobs)
\ No newline at end of file
@@ -66,4 +66,25 @@ def plot_radar_all_models(model_names, metric_labels, data, output_dir="PNG"):
     plt.tight_layout()
     path = os.path.join(output_dir, "radar_plot_supervisionati.png")
     plt.savefig(path)
-    plt.close()
\ No newline at end of file
+    plt.close()
+
+#metriche di un singolo fold della cross-validation
+def plot_fold(model_name, fold, metrics, values):
+    plt.figure()
+    plt.bar(metrics, values, color='lightblue')
+    plt.ylim(0, 1)
+    plt.title(f'{model_name} - Fold {fold}')
+    safe_name = model_name.replace(" ", "_").lower()
+    plt.savefig(os.path.join(OUTPUT_DIR, f'{safe_name}_fold_{fold}.png'))
+    plt.close()
+
+#matrice di confusione del modello finale a partire dai conteggi già calcolati
+def plot_confusion_matrix_finale(cm, model_name="AdaBoost"):
+    plt.figure(figsize=(6,4))
+    sns.heatmap(np.array(cm), annot=True, fmt='d', cmap='Blues')
+    plt.title(f"Confusion Matrix - {model_name}")
+    plt.xlabel("Predicted")
+    plt.ylabel("Actual")
+    plt.tight_layout()
+    plt.savefig(os.path.join(OUTPUT_DIR, f"confusion_matrix_{model_name.lower().replace(' ', '_')}.png"))
+    plt.close()
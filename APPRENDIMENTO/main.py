@@ -1,8 +1,37 @@
-from apprendimento_supervisionato import appr_sup    #apprendimento supervisionato
+import argparse #per scegliere da riga di comando il formato del dataset
+from apprendimento_supervisionato import appr_sup, misura_memoria    #apprendimento supervisionato, confronto di memoria tra feature dense e sparse
+from apprendimento_incrementale import appr_incrementale    #addestramento a blocchi per dataset che non entrano in memoria
+from strumentazione import configura    #span e metriche della pipeline (PYTHON_DATASET, reso importabile da apprendimento_supervisionato)
 
 #main
 if __name__ == '__main__':
-    #esecuzione dell'apprendimento supervisionato
-    print("APPRENDIMENTO SUPERVISIONATO")
-    #esegue appr. sup. e stampa le metriche
-    appr_sup()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Apprendimento supervisionato sul dataset dell'utente")
+    parser.add_argument('--formato', choices=['csv', 'colonnare'], default='csv', help="colonnare = legge DATASET/colonne (creato da PYTHON_DATASET/dataset_colonnare.py)")
+    parser.add_argument('--n-jobs', type=int, default=1, help="core usati per la griglia degli iperparametri (-1 = tutti)")
+    parser.add_argument('--confronta-seriale', action='store_true', help="riesegue ogni griglia su un core e stampa lo speedup")
+    parser.add_argument('--no-cache', action='store_true', help="riaddestra tutti i modelli ignorando DATASET/cache_modelli")
+    parser.add_argument('--sparso', action='store_true', help="feature in una matrice sparsa CSR float32 (i modelli che non la accettano ricevono la versione densa)")
+    parser.add_argument('--misura-memoria', action='store_true', help="confronta il picco di memoria della preparazione densa e sparsa con il dataset 1x, 10x e 100x ed esce")
+    parser.add_argument('--incrementale', action='store_true', help="addestramento out-of-core a blocchi con modelli partial_fit (per dataset molto grandi)")
+    parser.add_argument('--blocco', type=int, default=100000, help="righe per blocco in modalità incrementale")
+    parser.add_argument('--csv', default='DATASET/dataset_ml.csv', help="CSV letto a blocchi in modalità incrementale (stesse colonne di dataset_ml.csv)")
+    parser.add_argument('--epoche', type=int, default=3, help="passate sul training set in modalità incrementale")
+    parser.add_argument('--processi-report', type=int, default=None, help="processi usati per disegnare i grafici dopo l'addestramento (predefinito: tutti i core)")
+    parser.add_argument('--metriche', help="cartella in cui salvare gli span (eventi.jsonl, anche dai processi della griglia) e il riepilogo Prometheus (metriche.prom)")
+    parser.add_argument('--profilo', action='store_true', help="con --metriche salva anche il profilo cProfile di ogni fase (preparazione, griglie, cross-validation, report)")
+    parser.add_argument('--no-plots', action='store_true', help="non genera i grafici PNG (le metriche vengono comunque salvate in DATASET/metriche_ml.json)")
+    args = parser.parse_args()
+
+    if args.metriche:
+        configura(args.metriche, profilo=args.profilo)
+
+    if args.misura_memoria:
+        misura_memoria()
+    elif args.incrementale:
+        print("APPRENDIMENTO INCREMENTALE")
+        appr_incrementale(args.csv, blocco=args.blocco, epoche=args.epoche)
+    else:
+        #esecuzione dell'apprendimento supervisionato
+        print("APPRENDIMENTO SUPERVISIONATO")
+        #esegue appr. sup. e stampa le metriche
+        appr_sup(formato=args.formato, n_jobs=args.n_jobs, confronta_seriale=args.confronta_seriale, usa_cache=not args.no_cache, sparso=args.sparso, grafici=not args.no_plots, processi_report=args.processi_report)
@@ -0,0 +1,155 @@
+import os   #usato per i percorsi di modelli, liste e partizioni per utente
+import time #usato per misurare le righe al secondo
+import argparse #usato per leggere le opzioni da riga di comando
+import joblib   #usato per salvare e caricare il modello con il suo vocabolario
+import numpy as np  #usato per costruire le feature di ogni blocco del catalogo
+import pandas as pd #usato per leggere il catalogo a blocchi e scrivere le raccomandazioni
+import sklearn  #la versione viene salvata con il modello
+from scipy import sparse    #usato per la matrice dei generi di ogni blocco
+
+#moduli interni del progetto
+from apprendimento_incrementale import esplodi_generi  #stessa pulizia dei generi usata in addestramento
+from apprendimento_supervisionato import prepara_denso, prepara_sparso, bilancia_denso, bilancia_indici, matrice_feature  #stessa preparazione di appr_sup
+
+#colonne numeriche del modello e nomi corrispondenti in top_manga.csv
+NUMERICHE = ['Punteggio_Medio', 'Rank', 'Popolarita']
+COLONNE_CATALOGO = {'Punteggio Medio': 'Punteggio_Medio', 'Rank': 'Rank', 'Popolarità': 'Popolarita'}
+
+#modello salvato da appr_sup (AdaBoost finale addestrato su DATASET/dataset_ml.csv)
+MODELLO_PREDEFINITO = os.path.join('DATASET', 'modello_piace.joblib')
+
+#salva il modello con tutto quello che serve per riusarlo: ordine delle colonne, vocabolario dei generi (classi del MultiLabelBinarizer) e formato delle feature
+def salva_modello(modello, colonne, percorso=MODELLO_PREDEFINITO, sparso=False, dataset=None):
+    cartella = os.path.dirname(percorso)
+    if cartella:
+        os.makedirs(cartella, exist_ok=True)
+    salvato = {
+        'modello': modello,
+        'colonne': list(colonne),
+        'generi': [c for c in colonne if c not in NUMERICHE],
+        'sparso': sparso,
+        'dataset': dataset,
+        'sklearn': sklearn.__version__
+    }
+    temporaneo = percorso + '.tmp'
+    joblib.dump(salvato, temporaneo)
+    os.replace(temporaneo, percorso)
+    print(f"Modello salvato in '{percorso}'")
+
+def carica_modello(percorso=MODELLO_PREDEFINITO):
+    salvato = joblib.load(percorso)
+    if salvato['sklearn'] != sklearn.__version__:
+        print(f"Attenzione: modello salvato con scikit-learn {salvato['sklearn']}, versione attuale {sklearn.__version__}")
+    return salvato
+
+#addestra il modello finale di appr_sup (AdaBoost n=100 sul training set bilanciato) per la lista di un utente e lo salva
+def addestra_modello(percorso_lista, percorso_modello, sparso=False):
+    from sklearn.model_selection import train_test_split    #stessa suddivisione di appr_sup
+    from sklearn.ensemble import AdaBoostClassifier #stesso modello di valuta_modello_finale
+    df = pd.read_csv(percorso_lista)
+    X, y, colonne = prepara_sparso(df) if sparso else prepara_denso(df)
+    X_train, _, y_train, _ = train_test_split(X, y, test_size=0.2, random_state=42)
+    X_train, y_train = bilancia_indici(X_train, y_train) if sparso else bilancia_denso(X_train, y_train)
+    modello = AdaBoostClassifier(n_estimators=100, random_state=42).fit(X_train, y_train)
+    salva_modello(modello, colonne, percorso_modello, sparso=sparso, dataset=percorso_lista)
+
+#ID già presenti nella lista dell'utente (da non raccomandare)
+def letti_da_utente(percorso_lista):
+    return set(pd.read_csv(percorso_lista, usecols=['ID'])['ID'])
+
+#feature di un blocco del catalogo nell'ordine delle colonne del modello, i generi fuori vocabolario vengono ignorati
+def feature_catalogo(df, salvato, codice):
+    esplosi = esplodi_generi(df['Generi'].reset_index(drop=True)).map(codice).dropna()
+    generi = sparse.csr_matrix((np.ones(len(esplosi)), (esplosi.index.to_numpy(), esplosi.to_numpy(dtype=np.int64))), shape=(len(df), len(codice)))
+    generi.sum_duplicates()
+    generi.data[:] = 1
+    #i valori mancanti diventano 0 come in addestramento
+    numeriche = np.nan_to_num(df.rename(columns=COLONNE_CATALOGO)[NUMERICHE].to_numpy(dtype=np.float64))
+    if salvato['sparso']:
+        return matrice_feature(generi, numeriche)
+    X = np.hstack([generi.toarray(), numeriche])
+    #un modello addestrato su un DataFrame si aspetta gli stessi nomi di colonna
+    if hasattr(salvato['modello'], 'feature_names_in_'):
+        return pd.DataFrame(X, columns=salvato['colonne'])
+    return X
+
+#utente da servire: modello salvato, ID già letti e vocabolario dei generi
+class Utente:
+    def __init__(self, nome, percorso_modello, percorso_lista, percorso_output):
+        self.nome = nome
+        self.salvato = carica_modello(percorso_modello)
+        self.letti = letti_da_utente(percorso_lista) if percorso_lista and os.path.exists(percorso_lista) else set()
+        self.codice = {genere: i for i, genere in enumerate(self.salvato['generi'])}
+        self.percorso_output = percorso_output
+        self.migliori = None
+
+#legge il catalogo a blocchi e calcola predict_proba vettoriale per tutti gli utenti, tenendo solo i k manga migliori non letti di ciascuno
+def punteggia_catalogo(percorso_catalogo, utenti, k=20, blocco=50000):
+    inizio, righe = time.perf_counter(), 0
+    for df in pd.read_csv(percorso_catalogo, chunksize=blocco, dtype={'Generi': str}):
+        for utente in utenti:
+            probabilita = utente.salvato['modello'].predict_proba(feature_catalogo(df, utente.salvato, utente.codice))[:, 1]
+            candidati = pd.DataFrame({'ID': df['ID'].to_numpy(), 'Titolo': df['Titolo'].to_numpy(), 'Probabilita': probabilita})
+            candidati = candidati[~candidati['ID'].isin(utente.letti)]
+            #la classifica parziale non supera mai k righe, la memoria non dipende dalla dimensione del catalogo
+            utente.migliori = candidati if utente.migliori is None else pd.concat([utente.migliori, candidati])
+            utente.migliori = utente.migliori.sort_values(['Probabilita', 'ID'], ascending=[False, True]).head(k)
+            righe += len(df)
+    durata = time.perf_counter() - inizio
+    print(f"Punteggi calcolati: {righe} righe (catalogo x utenti) in {durata:.2f} s, {righe / durata if durata > 0 else 0:.0f} righe/s")
+
+    for utente in utenti:
+        classifica = utente.migliori.reset_index(drop=True)
+        classifica.insert(0, 'Posizione', range(1, len(classifica) + 1))
+        classifica.to_csv(utente.percorso_output, index=False, float_format='%.4f')
+        print(f"    {utente.nome}: {len(classifica)} raccomandazioni in '{utente.percorso_output}'")
+    return righe / durata if durata > 0 else 0
+
+#stesso calcolo una riga alla volta su un campione del catalogo, per confronto con la versione a blocchi
+def punteggia_per_riga(percorso_catalogo, utente, campione=500):
+    df = pd.read_csv(percorso_catalogo, nrows=campione, dtype={'Generi': str})
+    inizio = time.perf_counter()
+    for i in range(len(df)):
+        utente.salvato['modello'].predict_proba(feature_catalogo(df.iloc[i:i + 1], utente.salvato, utente.codice))
+    durata = time.perf_counter() - inizio
+    print(f"Per riga: {len(df)} righe in {durata:.2f} s, {len(df) / durata:.0f} righe/s")
+    return len(df) / durata
+
+#utenti delle partizioni di ingestione_batch.py (DATASET/utenti/<utente>/dataset_ml.csv), il modello viene addestrato se manca o è più vecchio della lista
+def utenti_da_partizioni(cartella, sparso=False):
+    utenti = []
+    for nome in sorted(os.listdir(cartella)):
+        lista = os.path.join(cartella, nome, 'dataset_ml.csv')
+        if not os.path.exists(lista):
+            continue
+        modello = os.path.join(cartella, nome, 'modello_piace.joblib')
+        if not os.path.exists(modello) or os.path.getmtime(modello) < os.path.getmtime(lista):
+            addestra_modello(lista, modello, sparso=sparso)
+        utenti.append(Utente(nome, modello, lista, os.path.join(cartella, nome, 'raccomandazioni_ml.csv')))
+    return utenti
+
+#main
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Classifica dei manga non letti con il modello salvato, calcolata a blocchi su tutto il catalogo")
+    parser.add_argument('--catalogo', default=os.path.join('DATASET', 'top_manga.csv'), help="CSV del catalogo con le colonne di top_manga.csv")
+    parser.add_argument('--modello', default=MODELLO_PREDEFINITO, help="modello salvato (creato da main.py oppure addestrato da --lista se manca)")
+    parser.add_argument('--lista', default=os.path.join('DATASET', 'dataset_ml.csv'), help="lista dell'utente: i manga già presenti non vengono raccomandati")
+    parser.add_argument('--output', default=os.path.join('DATASET', 'raccomandazioni_ml.csv'), help="CSV con la classifica")
+    parser.add_argument('--utenti', help="cartella delle partizioni per utente (es. DATASET/utenti): una classifica per ogni utente")
+    parser.add_argument('--sparso', action='store_true', help="addestra i modelli mancanti con le feature sparse")
+    parser.add_argument('-k', type=int, default=20, help="raccomandazioni per utente")
+    parser.add_argument('--blocco', type=int, default=50000, help="righe del catalogo per blocco")
+    parser.add_argument('--confronta-per-riga', type=int, default=0, metavar='N', help="misura anche il calcolo riga per riga su N righe")
+    args = parser.parse_args()
+
+    if args.utenti:
+        utenti = utenti_da_partizioni(args.utenti, sparso=args.sparso)
+    else:
+        if not os.path.exists(args.modello):
+            addestra_modello(args.lista, args.modello, sparso=args.sparso)
+        utenti = [Utente('utente', args.modello, args.lista, args.output)]
+    print(f"Utenti: {len(utenti)}")
+    velocita = punteggia_catalogo(args.catalogo, utenti, k=args.k, blocco=args.blocco)
+    if args.confronta_per_riga and utenti:
+        per_riga = punteggia_per_riga(args.catalogo, utenti[0], args.confronta_per_riga)
+        print(f"Speedup a blocchi: {velocita / per_riga:.0f}x")
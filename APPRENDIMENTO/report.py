@@ -0,0 +1,107 @@
+import os   #usato per i percorsi di metriche, grafici e manifesto
+import json #usato per leggere le metriche registrate e il manifesto dei grafici
+import time #usato per misurare la durata del report
+import hashlib  #usato per l'impronta degli input di ogni grafico
+import argparse #usato per leggere le opzioni da riga di comando
+from concurrent.futures import ProcessPoolExecutor  #usato per disegnare i grafici in parallelo
+
+#metriche registrate da appr_sup e cartella dei grafici
+METRICHE_PREDEFINITE = os.path.join('DATASET', 'metriche_ml.json')
+CARTELLA_GRAFICI = 'PNG'
+#impronta degli input di ogni grafico già disegnato, per saltare quelli invariati
+MANIFESTO = os.path.join(CARTELLA_GRAFICI, '.report.json')
+#il codice dei grafici fa parte dell'impronta: se cambia vengono ridisegnati tutti
+GRAFICI_MODELLI = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'grafici_modelli.py')
+METRICHE = ['Accuracy', 'Precision', 'Recall', 'F1-score']
+
+#salva le metriche registrate durante l'addestramento
+def salva_metriche(metriche, percorso=METRICHE_PREDEFINITE):
+    cartella = os.path.dirname(percorso)
+    if cartella:
+        os.makedirs(cartella, exist_ok=True)
+    with open(percorso, 'w', encoding='utf-8') as f:
+        json.dump(metriche, f, indent=2, ensure_ascii=False)
+
+#elenco dei grafici da disegnare: (file prodotto, funzione di grafici_modelli, argomenti), gli stessi che appr_sup disegnava durante l'addestramento
+def grafici_da_metriche(metriche):
+    grafici = []
+    for model_name, dati in metriche['modelli'].items():
+        safe_name = model_name.replace(" ", "_").lower()
+        griglia = dati['griglia']
+        #accuracy della griglia se non è Naive Bayes
+        if model_name != 'Naive Bayes':
+            grafici.append((f"{safe_name}_accuracy_plot.png", 'plot_accuracy', {'labels': griglia['labels'], 'train_acc': griglia['train'], 'test_acc': griglia['test'], 'model_name': model_name}))
+        cv = dati['cv']
+        for i in range(len(cv['accuracy'])):
+            grafici.append((f"{safe_name}_fold_{i+1}.png", 'plot_fold', {'model_name': model_name, 'fold': i + 1, 'metrics': METRICHE, 'values': [cv['accuracy'][i], cv['precision'][i], cv['recall'][i], cv['f1'][i]]}))
+        #grafico a barre per Naive Bayes
+        if model_name == 'Naive Bayes':
+            grafici.append(("naive_bayes_bar_chart.png", 'plot_bar_chart_naive_bayes', {'metrics': METRICHE, 'values': medie_cv(cv)}))
+    grafici.append(("radar_plot_supervisionati.png", 'plot_radar_all_models', {'model_names': list(metriche['modelli']), 'metric_labels': METRICHE, 'data': [medie_cv(dati['cv']) for dati in metriche['modelli'].values()]}))
+    finale = metriche.get('finale')
+    if finale:
+        grafici.append((f"confusion_matrix_{finale['modello'].lower().replace(' ', '_')}.png", 'plot_confusion_matrix_finale', {'cm': finale['matrice_confusione'], 'model_name': finale['modello']}))
+    return grafici
+
+#medie di accuracy, precision, recall e F1 sui fold
+def medie_cv(cv):
+    return [sum(cv[m]) / len(cv[m]) for m in ('accuracy', 'precision', 'recall', 'f1')]
+
+#impronta di un grafico: funzione, argomenti e codice di grafici_modelli.py
+def impronta(funzione, argomenti, codice):
+    testo = json.dumps([codice, funzione, argomenti], sort_keys=True)
+    return hashlib.sha256(testo.encode('utf-8')).hexdigest()
+
+#i processi del pool usano il backend Agg (senza finestre), va scelto prima di importare pyplot; il processo principale non viene toccato
+def inizializza_worker():
+    import matplotlib   #per scegliere il backend
+    matplotlib.use('Agg')
+
+#disegna un grafico nel processo corrente
+def disegna(funzione, argomenti):
+    import grafici_modelli  #funzioni di plotting del progetto
+    getattr(grafici_modelli, funzione)(**argomenti)
+    return funzione
+
+#genera i grafici a partire dalle metriche registrate, saltando quelli con input invariati
+#processi = numero di processi del pool (None = tutti i core), i grafici vengono sempre disegnati nel pool; forza = ridisegna tutto
+def genera_report(percorso_metriche=METRICHE_PREDEFINITE, processi=None, forza=False):
+    inizio = time.perf_counter()
+    with open(percorso_metriche, 'r', encoding='utf-8') as f:
+        metriche = json.load(f)
+    with open(GRAFICI_MODELLI, 'rb') as f:
+        codice = hashlib.sha256(f.read()).hexdigest()
+    manifesto = {}
+    if os.path.exists(MANIFESTO) and not forza:
+        with open(MANIFESTO, 'r', encoding='utf-8') as f:
+            manifesto = json.load(f)
+
+    da_disegnare, invariati = [], 0
+    for nome_file, funzione, argomenti in grafici_da_metriche(metriche):
+        chiave = impronta(funzione, argomenti, codice)
+        if manifesto.get(nome_file) == chiave and os.path.exists(os.path.join(CARTELLA_GRAFICI, nome_file)):
+            invariati += 1
+            continue
+        da_disegnare.append((nome_file, funzione, argomenti, chiave))
+
+    os.makedirs(CARTELLA_GRAFICI, exist_ok=True)
+    if da_disegnare:
+        processi = max(1, min(processi or os.cpu_count() or 1, len(da_disegnare)))
+        with ProcessPoolExecutor(max_workers=processi, initializer=inizializza_worker) as executor:
+            list(executor.map(disegna, [g[1] for g in da_disegnare], [g[2] for g in da_disegnare]))
+
+    #il manifesto viene aggiornato solo dopo che tutti i grafici sono stati salvati
+    for nome_file, _, _, chiave in da_disegnare:
+        manifesto[nome_file] = chiave
+    with open(MANIFESTO, 'w', encoding='utf-8') as f:
+        json.dump(manifesto, f, indent=2)
+    print(f"Report: {len(da_disegnare)} grafici disegnati, {invariati} invariati, in {time.perf_counter() - inizio:.2f} s")
+
+#main: rigenera i grafici dalle metriche dell'ultima esecuzione di main.py
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Genera i grafici PNG dalle metriche registrate da main.py")
+    parser.add_argument('--metriche', default=METRICHE_PREDEFINITE, help="JSON delle metriche")
+    parser.add_argument('--processi', type=int, default=None, help="processi usati per disegnare (predefinito: tutti i core)")
+    parser.add_argument('--forza', action='store_true', help="ridisegna anche i grafici invariati")
+    args = parser.parse_args()
+    genera_report(args.metriche, processi=args.processi, forza=args.forza)
@@ -1,15 +1,27 @@
-import matplotlib.pyplot as plt   #per creare grafici e visualizzare la matrice di confusione
-import seaborn as sns             #per grafici avanzati con estetica migliorata
 from sklearn.metrics import classification_report, confusion_matrix  #classification_repor fornisce precision, recall, F1-score per ogni classe. confusion_matrix crea una tabella con i conteggi delle predizioni corrette/sbagliate
 from sklearn.ensemble import AdaBoostClassifier  #algoritmo di boosting che combina classificatori deboli per creare un classificatore forte
 
-#funzione per addestrare e valutare AdaBoost su un dataset
-def valuta_modello_finale(X_train, X_test, y_train, y_test):
+#funzione per addestrare e valutare AdaBoost su un dataset, restituisce il modello addestrato e la matrice di confusione
+#il grafico della matrice viene disegnato da report.py a partire dai conteggi restituiti
+#cache = CacheModelli opzionale, se contiene già il modello addestrato sugli stessi dati non lo riaddestra
+def valuta_modello_finale(X_train, X_test, y_train, y_test, cache=None):
     #inizializza AdaBoost con 100 stimatori deboli
     model = AdaBoostClassifier(n_estimators=100, random_state=42)
-    
-    #addestra il modello sul training set
-    model.fit(X_train, y_train)
+
+    #il modello in cache è indicizzato dall'impronta del training set e dai parametri del modello appena costruito, così una modifica al costruttore non riusa il modello vecchio
+    chiave, salvato = None, None
+    if cache is not None:
+        from cache_modelli import impronta_dati    #impronta del training set per la chiave
+        chiave = cache.chiave(impronta_dati(X_train, y_train), 'AdaBoost', model.get_params(), fase='finale')
+        salvato = cache.leggi(chiave)
+
+    if salvato is not None:
+        model = salvato
+    else:
+        #addestra il modello sul training set
+        model.fit(X_train, y_train)
+        if cache is not None:
+            cache.scrivi(chiave, model)
 
     #predice le classi sul test set
     y_pred = model.predict(X_test)
@@ -19,12 +31,4 @@ def valuta_modello_finale(X_train, X_test, y_train, y_test):
     print(classification_report(y_test, y_pred))
 
     #crea la matrice di confusione
-    plt.figure(figsize=(6,4))
-    sns.heatmap(confusion_matrix(y_test, y_pred), annot=True, fmt='d', cmap='Blues')
-    plt.title("Confusion Matrix - AdaBoost")
-    plt.xlabel("Predicted")
-    plt.ylabel("Actual")
-    plt.tight_layout()
-
-    #salva la matrice di confusione nella cartella PNG
-    plt.savefig('PNG/confusion_matrix_adaboost.png')
\ No newline at end of file
+    return model, confusion_matrix(y_test, y_pred)
\ No newline at end of file
@@ -0,0 +1,277 @@
+import os   #usato per i percorsi dei dati generati
+import json #usato per le risposte nel formato dell'API
+import time #usato per contare le richieste servite al secondo, per la latenza simulata e per le finestre della quota
+import random   #usato per la latenza variabile e per gli errori simulati (con seme fisso)
+import secrets  #usato per generare i token OAuth rilasciati dal server
+import argparse #usato per leggere le opzioni da riga di comando
+import threading    #usato per servire le richieste in un thread separato dal benchmark
+import urllib.parse #usato per leggere percorso e parametri delle richieste
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler #usato per il server HTTP locale (un thread per connessione)
+import pandas as pd #usato per leggere catalogo e letture generati
+
+#updated_at delle letture generate senza la colonna Aggiornato
+AGGIORNATO_PREDEFINITO = '2024-01-01T00:00:00+00:00'
+
+#dati serviti dal server: catalogo (top_manga.csv) e liste degli utenti (letture_utenti.csv) generati da genera_sintetico.py
+class DatiAPI:
+    def __init__(self, cartella, utenti=None):
+        dataset = os.path.join(cartella, 'DATASET')
+        catalogo = pd.read_csv(os.path.join(dataset, 'top_manga.csv'), dtype={'Generi': str, 'Autori': str}, keep_default_na=False)
+        self.generi = {}
+        self.manga = {}
+        for riga in catalogo.itertuples(index=False):
+            self.manga[int(riga[0])] = self.nodo(riga)
+        #ordine della classifica (il catalogo è già ordinato per rank)
+        self.classifica = [int(i) for i in catalogo['ID']]
+
+        #liste per utente, con utenti = insieme di nomi vengono caricate solo quelle liste
+        #ogni voce porta la propria data di modifica (colonna Aggiornato, assente nei dati generati dalle versioni precedenti)
+        self.liste = {}
+        for df in pd.read_csv(os.path.join(dataset, 'letture_utenti.csv'), chunksize=200000, dtype={'Generi': str}, keep_default_na=False):
+            if utenti is not None:
+                df = df[df['Utente'].isin(utenti)]
+            aggiornato = df['Aggiornato'] if 'Aggiornato' in df else [AGGIORNATO_PREDEFINITO] * len(df)
+            for utente, ID, punteggio, stato, data in zip(df['Utente'], df['ID'], df['Punteggio'], df['Stato'], aggiornato):
+                self.liste.setdefault(utente, []).append((int(ID), int(punteggio), stato, data))
+        #stesse liste ordinate per data di modifica (più recenti prima) per sort=list_updated_at, create alla prima richiesta
+        self.per_modifica = {}
+        self.lock = threading.Lock()
+
+    #lista dell'utente nell'ordine richiesto: come nel file oppure per data di modifica decrescente (le date ISO con lo stesso fuso si ordinano come stringhe)
+    def lista(self, utente, ordine=None):
+        lista = self.liste.get(utente)
+        if lista is None or ordine != 'list_updated_at':
+            return lista
+        with self.lock:
+            if utente not in self.per_modifica:
+                self.per_modifica[utente] = sorted(lista, key=lambda voce: voce[3], reverse=True)
+            return self.per_modifica[utente]
+
+    #nodo di un manga come nelle risposte di /v2/manga (campi usati da top_manga.py, user_manga.py e user_estesa.py)
+    def nodo(self, riga):
+        ID, titolo, generi, mean, rank, popolarita, stato, autori = riga
+        return {
+            'id': int(ID),
+            'title': titolo,
+            'genres': [{'id': self.generi.setdefault(g.strip(), len(self.generi) + 1), 'name': g.strip()} for g in generi.split(',') if g.strip()],
+            'mean': float(mean),
+            'rank': int(rank),
+            'popularity': int(popolarita),
+            'status': stato,
+            'authors': [{'node': {'first_name': a.strip().rsplit(' ', 1)[0], 'last_name': a.strip().rsplit(' ', 1)[-1]}, 'role': 'Story & Art'} for a in autori.split(',') if a.strip()]
+        }
+
+#comportamento dell'API reale sotto carico: latenza, errori 5xx e 429 casuali, quota di richieste per token
+#con i valori predefiniti il server risponde subito e senza errori
+class Guasti:
+    def __init__(self, latenza_ms=0, variazione_ms=0, errori=0.0, tasso_429=0.0, retry_after=1.0, quota=0, finestra=1.0, seed=0):
+        #ogni risposta attende latenza_ms ± variazione_ms
+        self.latenza_ms = latenza_ms
+        self.variazione_ms = variazione_ms
+        #frazione delle richieste che ricevono 503 o 429 (con Retry-After = retry_after secondi)
+        self.errori = errori
+        self.tasso_429 = tasso_429
+        self.retry_after = retry_after
+        #quota = richieste consentite a ogni token per finestra di secondi (0 = illimitate), oltre la quota 429 con i secondi mancanti alla nuova finestra
+        self.quota = quota
+        self.finestra = finestra
+        self.casuale = random.Random(seed)
+        self.finestre = {}
+        self.lock = threading.Lock()
+
+    def attesa(self):
+        with self.lock:
+            variazione = self.casuale.uniform(-self.variazione_ms, self.variazione_ms) if self.variazione_ms else 0
+        return max(0.0, self.latenza_ms + variazione) / 1000
+
+    #codice da simulare per la richiesta (None = risposta normale) e secondi per Retry-After
+    def esito(self, token):
+        with self.lock:
+            if self.quota:
+                adesso = time.monotonic()
+                inizio, conteggio = self.finestre.get(token, (adesso, 0))
+                if adesso - inizio >= self.finestra:
+                    inizio, conteggio = adesso, 0
+                #anche le richieste rifiutate consumano la quota, come per l'API reale
+                self.finestre[token] = (inizio, conteggio + 1)
+                if conteggio >= self.quota:
+                    return 429, max(0.01, self.finestra - (adesso - inizio))
+            numero = self.casuale.random()
+        if numero < self.tasso_429:
+            return 429, self.retry_after
+        if numero < self.tasso_429 + self.errori:
+            return 503, None
+        return None, None
+
+#gestisce le richieste GET con le stesse risposte (e la stessa paginazione con limit/offset) dell'API di MyAnimeList
+class GestoreAPI(BaseHTTPRequestHandler):
+    #HTTP/1.1: le connessioni keep-alive della sessione di crea_sessione vengono riusate
+    protocol_version = 'HTTP/1.1'
+    #intestazioni e corpo partono in due scritture: senza TCP_NODELAY ogni risposta attenderebbe l'ACK ritardato del client (~40 ms)
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        url = urllib.parse.urlparse(self.path)
+        params = {k: v[-1] for k, v in urllib.parse.parse_qs(url.query).items()}
+        parti = [p for p in url.path.split('/') if p]
+        self.server.conta(url.path)
+        guasti = self.server.guasti
+        time.sleep(guasti.attesa())
+
+        #/v1/oauth2/authorize: autorizza subito e rimanda a redirect_uri con il codice, come dopo il login sul sito
+        if parti == ['v1', 'oauth2', 'authorize']:
+            if 'redirect_uri' not in params:
+                return self.rispondi(400, {'error': 'invalid_request'})
+            self.send_response(302)
+            self.send_header('Location', f"{params['redirect_uri']}?{urllib.parse.urlencode({'code': secrets.token_hex(16), 'state': params.get('state', '')})}")
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        autorizzazione = self.headers.get('Authorization', '')
+        token = autorizzazione[len('Bearer '):]
+        if not autorizzazione.startswith('Bearer ') or (self.server.solo_token_emessi and token not in self.server.token):
+            return self.rispondi(401, {'error': 'invalid_token'})
+        codice, retry_after = guasti.esito(token)
+        if codice == 429:
+            return self.rispondi(429, {'error': 'too_many_requests'}, {'Retry-After': f'{retry_after:.2f}'.rstrip('0').rstrip('.')})
+        if codice is not None:
+            return self.rispondi(codice, {'error': 'service_unavailable'})
+        dati = self.server.dati
+
+        #/v2/users/<utente>/mangalist, con sort=list_updated_at le voci modificate più di recente per prime
+        if len(parti) == 4 and parti[:2] == ['v2', 'users'] and parti[3] == 'mangalist':
+            lista = dati.lista(urllib.parse.unquote(parti[2]), params.get('sort'))
+            if lista is None:
+                return self.rispondi(404, {'error': 'not_found'})
+            return self.pagina(url.path, params, [{'node': {k: dati.manga[ID][k] for k in ('id', 'title', 'genres')}, 'list_status': {'status': stato, 'score': punteggio, 'updated_at': aggiornato}} for ID, punteggio, stato, aggiornato in self.fetta(lista, params)], len(lista))
+        #/v2/manga/ranking
+        if parti == ['v2', 'manga', 'ranking']:
+            return self.pagina(url.path, params, [{'node': dati.manga[ID], 'ranking': {'rank': dati.manga[ID]['rank']}} for ID in self.fetta(dati.classifica, params)], len(dati.classifica))
+        #/v2/manga/<id>
+        if len(parti) == 3 and parti[:2] == ['v2', 'manga'] and parti[2].isdigit():
+            manga = dati.manga.get(int(parti[2]))
+            return self.rispondi(200, manga) if manga else self.rispondi(404, {'error': 'not_found'})
+        return self.rispondi(404, {'error': 'not_found'})
+
+    #/v1/oauth2/token: scambia il codice di autorizzazione (o il refresh token) con un access token
+    def do_POST(self):
+        url = urllib.parse.urlparse(self.path)
+        corpo = self.rfile.read(int(self.headers.get('Content-Length', 0))).decode('utf-8')
+        dati = {k: v[-1] for k, v in urllib.parse.parse_qs(corpo).items()}
+        self.server.conta(url.path)
+        time.sleep(self.server.guasti.attesa())
+        if url.path.rstrip('/') != '/v1/oauth2/token':
+            return self.rispondi(404, {'error': 'not_found'})
+        tipo = dati.get('grant_type')
+        if tipo not in ('authorization_code', 'refresh_token'):
+            return self.rispondi(400, {'error': 'unsupported_grant_type'})
+        if not dati.get('code' if tipo == 'authorization_code' else 'refresh_token'):
+            return self.rispondi(400, {'error': 'invalid_request'})
+        token = secrets.token_hex(32)
+        with self.server.lock:
+            self.server.token.add(token)
+        return self.rispondi(200, {'token_type': 'Bearer', 'expires_in': 2678400, 'access_token': token, 'refresh_token': secrets.token_hex(32)})
+
+    #elementi della pagina richiesta con limit e offset
+    def fetta(self, elementi, params):
+        offset = int(params.get('offset', 0))
+        return elementi[offset:offset + int(params.get('limit', 100))]
+
+    #risposta paginata con il link alla pagina successiva
+    def pagina(self, percorso, params, data, totale):
+        offset, limit = int(params.get('offset', 0)), int(params.get('limit', 100))
+        corpo = {'data': data, 'paging': {}}
+        if offset + limit < totale:
+            corpo['paging']['next'] = f"{self.server.url}{percorso}?{urllib.parse.urlencode(dict(params, offset=offset + limit))}"
+        return self.rispondi(200, corpo)
+
+    def rispondi(self, codice, corpo, intestazioni=None):
+        testo = json.dumps(corpo, ensure_ascii=False).encode('utf-8')
+        self.server.conta_codice(codice)
+        self.send_response(codice)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        for nome, valore in (intestazioni or {}).items():
+            self.send_header(nome, valore)
+        self.send_header('Content-Length', str(len(testo)))
+        self.end_headers()
+        self.wfile.write(testo)
+
+    #il log di ogni richiesta rallenterebbe il server e coprirebbe l'output dei download
+    def log_message(self, format, *args):
+        pass
+
+#server HTTP locale al posto di api.myanimelist.net e myanimelist.net: i fetcher lo usano impostando MAL_API_BASE e MAL_AUTH_BASE = url (prima di importarli)
+#solo_token_emessi = accetta solo i token rilasciati da /v1/oauth2/token (altrimenti basta un qualsiasi header Bearer)
+class ServerAPILocale(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, cartella, host='127.0.0.1', porta=0, utenti=None, guasti=None, solo_token_emessi=False):
+        self.dati = DatiAPI(cartella, utenti)
+        super().__init__((host, porta), GestoreAPI)
+        #con porta 0 il sistema sceglie una porta libera
+        self.url = f'http://{host}:{self.server_address[1]}'
+        self.guasti = guasti or Guasti()
+        self.solo_token_emessi = solo_token_emessi
+        self.token = set()
+        self.richieste = {}
+        self.codici = {}
+        self.lock = threading.Lock()
+        self.thread = None
+
+    #conta le richieste per endpoint (i dettagli /v2/manga/<id> vengono raggruppati)
+    def conta(self, percorso):
+        parti = percorso.strip('/').split('/')
+        endpoint = '/v2/manga/<id>' if parti[:2] == ['v2', 'manga'] and parti[-1].isdigit() else ('/v2/users/<utente>/mangalist' if parti[:2] == ['v2', 'users'] else percorso)
+        with self.lock:
+            self.richieste[endpoint] = self.richieste.get(endpoint, 0) + 1
+
+    #conta le risposte per codice HTTP (200, 429, 503, ...)
+    def conta_codice(self, codice):
+        with self.lock:
+            self.codici[codice] = self.codici.get(codice, 0) + 1
+
+    #avvia il server in un thread in background
+    def avvia(self):
+        self.thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self.thread.start()
+        print(f"API locale in ascolto su {self.url} ({len(self.dati.manga)} manga, {len(self.dati.liste)} utenti)")
+        return self
+
+    def chiudi(self):
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self):
+        return self.avvia()
+
+    def __exit__(self, *args):
+        self.chiudi()
+
+#main: serve i dati generati finché non viene interrotto (es. per provare a mano i fetcher con MAL_API_BASE e MAL_AUTH_BASE)
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Server locale con le risposte dell'API di MyAnimeList sui dati di genera_sintetico.py")
+    parser.add_argument('--cartella', default=os.path.join('BENCHMARK', 'dati'), help="cartella con DATASET/top_manga.csv e DATASET/letture_utenti.csv")
+    parser.add_argument('--porta', type=int, default=8765, help="porta del server")
+    parser.add_argument('--latenza-ms', type=float, default=0, help="latenza aggiunta a ogni risposta")
+    parser.add_argument('--variazione-ms', type=float, default=0, help="variazione casuale della latenza (±)")
+    parser.add_argument('--errori', type=float, default=0, help="frazione delle richieste che ricevono 503")
+    parser.add_argument('--tasso-429', type=float, default=0, help="frazione delle richieste che ricevono 429")
+    parser.add_argument('--retry-after', type=float, default=1, help="secondi indicati da Retry-After nei 429 casuali")
+    parser.add_argument('--quota', type=int, default=0, help="richieste consentite a ogni token per finestra (0 = illimitate), oltre la quota 429")
+    parser.add_argument('--finestra', type=float, default=1, help="durata in secondi della finestra della quota")
+    parser.add_argument('--seed', type=int, default=0, help="seme di latenza ed errori casuali")
+    parser.add_argument('--solo-token-emessi', action='store_true', help="accetta solo i token ottenuti da /v1/oauth2/token")
+    args = parser.parse_args()
+
+    guasti = Guasti(args.latenza_ms, args.variazione_ms, args.errori, args.tasso_429, args.retry_after, args.quota, args.finestra, args.seed)
+    server = ServerAPILocale(args.cartella, porta=args.porta, guasti=guasti, solo_token_emessi=args.solo_token_emessi)
+    print(f"Avviare i fetcher con MAL_API_BASE={server.url} MAL_AUTH_BASE={server.url}")
+    inizio = time.perf_counter()
+    try:
+        server.avvia().thread.join()
+    except KeyboardInterrupt:
+        durata = time.perf_counter() - inizio
+        totale = sum(server.richieste.values())
+        print(f"\nRichieste servite: {totale} in {durata:.1f} s ({totale / durata if durata > 0 else 0:.1f}/s) {server.richieste}, risposte per codice {server.codici}")
+        server.chiudi()
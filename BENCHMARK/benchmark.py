@@ -0,0 +1,307 @@
+import os   #usato per cartelle di lavoro e variabili d'ambiente
+import sys  #usato per rendere importabili i moduli di APPRENDIMENTO, KB e PYTHON_DATASET
+import json #usato per salvare e confrontare i risultati
+import time #usato per misurare tempo reale e tempo CPU di ogni benchmark
+import shutil   #usato per trovare SWI-Prolog e copiare la KB nella cartella di lavoro
+import argparse #usato per leggere le opzioni da riga di comando
+import platform #usato per descrivere la macchina nei risultati
+import tempfile #usato per la cartella di lavoro temporanea
+import subprocess   #usato per leggere il commit corrente
+from datetime import datetime   #usato per il nome del file dei risultati
+
+CARTELLA = os.path.dirname(os.path.abspath(__file__))
+RADICE = os.path.join(CARTELLA, '..')
+for sottocartella in ('APPRENDIMENTO', 'KB', 'PYTHON_DATASET'):
+    sys.path.append(os.path.join(RADICE, sottocartella))
+
+#moduli interni del progetto
+from genera_sintetico import genera_dati    #dati sintetici con gli schemi di DATASET
+from api_locale import ServerAPILocale, Guasti  #server locale al posto dell'API di MyAnimeList, con latenza, errori e quota simulati
+
+try:
+    import resource #per il picco di memoria del processo (solo Linux/macOS)
+except ImportError:
+    resource = None
+
+#benchmark disponibili, nell'ordine di esecuzione
+SEZIONI = ['generazione', 'kb', 'feature', 'griglia', 'regole', 'api']
+
+#griglia ridotta (una o due combinazioni per famiglia) con gli stessi modelli di config_parametri.py, per tempi confrontabili a ogni scala
+#solo parametri applicati da crea_modello.get_modelli: quelli che ignora produrrebbero combinazioni duplicate
+GRIGLIA = {
+    'Decision Tree': [{'max_depth': 6, 'min_samples_leaf': 5}, {'max_depth': 10, 'min_samples_leaf': 5}],
+    'Random Forest': [{'n_estimators': 100, 'max_depth': 10, 'min_samples_leaf': 5}],
+    'AdaBoost': [{'n_estimators': 100, 'learning_rate': 0.5}],
+    'Naive Bayes': [{}],
+    'XGBoost': [{'n_estimators': 100}]
+}
+
+#picco di memoria residente del processo in MB (cumulativo: non scende tra un benchmark e l'altro)
+def picco_memoria():
+    if resource is None:
+        return None
+    return round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+
+#esegue un benchmark e ne registra tempo reale, tempo CPU del processo, righe al secondo e picco di memoria
+#funzione restituisce un dizionario con 'righe' ed eventuali altri valori da salvare, oppure {'saltato': motivo}
+def misura(risultati, nome, funzione):
+    print(f"\n[{nome}]")
+    inizio, cpu = time.perf_counter(), time.process_time()
+    esito = funzione() or {}
+    secondi = time.perf_counter() - inizio
+    if 'saltato' in esito:
+        print(f"    saltato: {esito['saltato']}")
+        risultati[nome] = esito
+        return
+    voce = {'secondi': round(secondi, 4), 'cpu_secondi': round(time.process_time() - cpu, 4)}
+    if esito.get('righe'):
+        voce['righe'] = esito['righe']
+        voce['righe_al_secondo'] = round(esito['righe'] / secondi, 1) if secondi > 0 else None
+    voce.update({k: v for k, v in esito.items() if k != 'righe'})
+    voce['picco_processo_mb'] = picco_memoria()
+    risultati[nome] = voce
+    print(f"    {secondi:.3f} s" + (f", {voce['righe_al_secondo']:.0f} righe/s" if voce.get('righe_al_secondo') else ""))
+
+#descrizione della macchina e delle versioni, salvata con i risultati
+def meta():
+    import numpy, pandas, sklearn, xgboost    #solo per le versioni
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=RADICE, capture_output=True, text=True).stdout.strip() or None
+    except OSError:
+        commit = None
+    return {
+        'data': datetime.now().isoformat(timespec='seconds'),
+        'commit': commit,
+        'python': platform.python_version(),
+        'numpy': numpy.__version__,
+        'pandas': pandas.__version__,
+        'sklearn': sklearn.__version__,
+        'xgboost': xgboost.__version__,
+        'cpu': os.cpu_count(),
+        'sistema': platform.platform()
+    }
+
+#genera_kb_prolog sul primo utente e le letture degli altri utenti con partizione
+def bench_kb(lavoro, utenti_kb):
+    from crea_kb import genera_kb_prolog, genera_letture_prolog
+    dataset, cartella_kb = os.path.join(lavoro, 'DATASET'), os.path.join(lavoro, 'KB')
+    os.makedirs(cartella_kb, exist_ok=True)
+    genera_kb_prolog(os.path.join(dataset, 'mangalist.csv'), os.path.join(dataset, 'top_manga.csv'), cartella_kb, utente='sintetico_0')
+    righe = sum(1 for _ in open(os.path.join(dataset, 'top_manga.csv'), encoding='utf-8')) - 1
+    for u in range(utenti_kb):
+        lista = os.path.join(dataset, 'utenti', f'sintetico_{u}', 'mangalist.csv')
+        if u > 0:
+            genera_letture_prolog(lista, f'sintetico_{u}', os.path.join(cartella_kb, 'letture', f'sintetico_{u}.pl'))
+        righe += sum(1 for _ in open(lista, encoding='utf-8')) - 1
+    return {'righe': righe, 'utenti': utenti_kb}
+
+#lettura del CSV e preparazione delle feature (densa solo sotto max_righe, sparsa sempre)
+def bench_feature(lavoro, prepara, max_righe=None):
+    import pandas as pd
+    percorso = os.path.join(lavoro, 'DATASET', 'dataset_ml.csv')
+    if max_righe is not None:
+        righe = sum(1 for _ in open(percorso, encoding='utf-8')) - 1
+        if righe > max_righe:
+            return {'saltato': f"{righe} righe oltre il limite di {max_righe} per la versione densa"}
+    df = pd.read_csv(percorso)
+    X, y, colonne = prepara(df)
+    return {'righe': len(df), 'esempi': int(X.shape[0]), 'colonne': len(colonne)}
+
+#stessi passaggi di appr_sup (suddivisione, oversampling, griglia e cross-validation) con la griglia ridotta su un campione del dataset
+def bench_griglia(lavoro, risultati, max_righe, n_jobs):
+    import pandas as pd
+    from sklearn.model_selection import train_test_split
+    from apprendimento_supervisionato import prepara_denso, bilancia_denso, esegui_griglia, esegui_cv
+    df = pd.read_csv(os.path.join(lavoro, 'DATASET', 'dataset_ml.csv'), nrows=max_righe)
+    X, y, _ = prepara_denso(df)
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+    X_train, y_train = bilancia_denso(X_train, y_train)
+    for model_name, combinazioni in GRIGLIA.items():
+        def griglia():
+            esiti, _ = esegui_griglia(model_name, combinazioni, X_train, y_train, X_test, y_test, n_jobs)
+            return {'righe': len(X_train) * len(combinazioni), 'combinazioni': len(combinazioni), 'accuratezza_test': [round(test, 4) if test is not None else None for _, test, _ in esiti]}
+        misura(risultati, f'griglia/{model_name}', griglia)
+
+        def cv():
+            esito = esegui_cv(model_name, combinazioni[0], X, y, n_jobs)
+            return {'righe': len(X) * 5, 'fit_secondi': round(float(esito['fit_time'].sum()), 4), 'accuratezza': round(float(esito['test_accuracy'].mean()), 4)}
+        misura(risultati, f'cv/{model_name}', cv)
+
+#regole di system.pl: motore NumPy su molti utenti e, se SWI-Prolog è installato, pool di worker sulla KB generata
+def bench_regole(lavoro, risultati, utenti_regole, utenti_kb, richieste):
+    import pandas as pd
+    from crea_kb import leggi_righe
+    from motore_numpy import Catalogo, Utenti, misura_throughput
+
+    def numpy_regole():
+        catalogo = Catalogo(leggi_righe(os.path.join(lavoro, 'DATASET', 'top_manga.csv')))
+        nomi = {f'sintetico_{u}' for u in range(utenti_regole)}
+        letture = {}
+        for df in pd.read_csv(os.path.join(lavoro, 'DATASET', 'letture_utenti.csv'), chunksize=200000, dtype={'Generi': str}, keep_default_na=False):
+            for riga in df[df['Utente'].isin(nomi)].to_dict('records'):
+                letture.setdefault(riga['Utente'], []).append(riga)
+        utenti = Utenti(catalogo, letture)
+        durata = misura_throughput(utenti)
+        return {'righe': sum(len(v) for v in letture.values()), 'utenti': len(letture), 'utenti_al_secondo': round(len(letture) / durata, 1) if durata > 0 else None}
+    misura(risultati, 'regole/numpy', numpy_regole)
+
+    def prolog():
+        swipl = shutil.which('swipl')
+        if swipl is None:
+            return {'saltato': "SWI-Prolog non trovato"}
+        from pool_prolog import PoolProlog
+        #system.pl cerca catalogo.pl e letture/ nella propria cartella, quindi viene copiato accanto alla KB generata
+        cartella_kb = os.path.join(lavoro, 'KB')
+        if not os.path.exists(os.path.join(cartella_kb, 'catalogo.pl')):
+            return {'saltato': "KB non generata (eseguire anche il benchmark kb)"}
+        for nome in ('system.pl', 'worker_pool.pl'):
+            shutil.copy(os.path.join(RADICE, 'KB', nome), cartella_kb)
+        pool = PoolProlog(workers=1, comando=[swipl, '-q', '-g', 'servi', '-t', 'halt', os.path.join(cartella_kb, 'worker_pool.pl')])
+        try:
+            lotto = [{'query': 'campiona', 'regola': regola, 'k': 5, 'utente': f'sintetico_{u}'} for u in range(utenti_kb) for regola in ['random', 'qualita_nascosto', 'plan_to_read', 'premiato', 'misto']]
+            lotto = (lotto * (richieste // max(len(lotto), 1) + 1))[:richieste]
+            inizio = time.perf_counter()
+            risposte = pool.interroga(lotto)
+            durata = time.perf_counter() - inizio
+        finally:
+            pool.chiudi()
+        errori = len([r for r in risposte if not r.get('ok')])
+        return {'richieste': len(risposte), 'errori': errori, 'avvio_secondi': round(pool.avvio, 4), 'richieste_al_secondo': round(len(risposte) / durata, 1) if durata > 0 else None}
+    misura(risultati, 'regole/prolog', prolog)
+
+#fetcher di PYTHON_DATASET contro il server locale: lista semplice e lista estesa (con tutte le richieste di dettaglio) di più utenti tramite ingestione_batch
+#guasti = latenza, errori e quota del server (Guasti di api_locale): con errori o 429 misura anche retry e backoff dei fetcher
+def bench_api(lavoro, risultati, utenti_api, workers, rps, guasti=None):
+    nomi = [f'sintetico_{u}' for u in range(utenti_api)]
+    server = ServerAPILocale(lavoro, utenti=set(nomi), guasti=guasti, solo_token_emessi=True).avvia()
+    #gli indirizzi vengono letti da connessione_api al primo import dei fetcher, l'attesa breve tra i retry tiene il benchmark nell'ordine dei secondi
+    os.environ['MAL_API_BASE'] = server.url
+    os.environ['MAL_AUTH_BASE'] = server.url
+    os.environ.setdefault('MAL_RETRY_RITARDO', '0.05')
+    from ingestione_batch import ingestione_batch
+    from user_manga import get_access_token, sync_user_mangalist
+    try:
+        #il token arriva da /v1/oauth2/token come nel flusso OAuth reale
+        token = get_access_token('codice_sintetico', 'verificatore_sintetico')
+        for tipo in ('semplice', 'estesa'):
+            def scarica():
+                riepilogo = ingestione_batch([(nome, token) for nome in nomi], tipo=tipo, cartella=os.path.join(lavoro, 'DATASET', 'utenti_api'), workers=workers, workers_dettagli=workers, richieste_al_secondo=rps, usa_cache=False, usa_catalogo=False)
+                return {'righe': riepilogo['manga'], 'utenti': len(nomi), 'errori': len([u for u in riepilogo['utenti'] if u['errore']])}
+            prima, codici_prima = sum(server.richieste.values()), dict(server.codici)
+            misura(risultati, f'api/{tipo}', scarica)
+            risultati[f'api/{tipo}']['richieste_http'] = sum(server.richieste.values()) - prima
+            risultati[f'api/{tipo}']['risposte'] = {str(c): n - codici_prima.get(c, 0) for c, n in sorted(server.codici.items()) if n > codici_prima.get(c, 0)}
+
+        #sincronizzazione del primo utente: la prima scorre tutta la lista ordinata per data di modifica, la seconda si ferma al watermark
+        cartella_sync = os.path.join(lavoro, 'DATASET', 'sync_api')
+        if os.path.exists(os.path.join(cartella_sync, f'sync_{nomi[0]}.json')):
+            os.remove(os.path.join(cartella_sync, f'sync_{nomi[0]}.json'))
+        for fase in ('completa', 'incrementale'):
+            def sincronizza():
+                esito = sync_user_mangalist(nomi[0], token, folder=cartella_sync)
+                if esito is None:
+                    return {'errori': 1}
+                inseriti, aggiornati, cancellati = esito
+                return {'inseriti': inseriti, 'aggiornati': aggiornati, 'rimossi': cancellati}
+            prima = sum(server.richieste.values())
+            misura(risultati, f'api/sync_{fase}', sincronizza)
+            risultati[f'api/sync_{fase}']['richieste_http'] = sum(server.richieste.values()) - prima
+    finally:
+        server.chiudi()
+
+#confronta due file di risultati: rapporto dei tempi per ogni benchmark presente in entrambi, regressione se il nuovo è più lento oltre la soglia
+#i benchmark sotto minimo secondi in entrambi i file vengono ignorati (troppo rumorosi)
+def confronta(percorso_vecchio, percorso_nuovo, soglia=0.2, minimo=0.05):
+    with open(percorso_vecchio, 'r', encoding='utf-8') as f:
+        vecchio = json.load(f)
+    with open(percorso_nuovo, 'r', encoding='utf-8') as f:
+        nuovo = json.load(f)
+    if vecchio['parametri'] != nuovo['parametri']:
+        print(f"Attenzione: parametri diversi ({vecchio['parametri']} contro {nuovo['parametri']}), i tempi non sono confrontabili")
+    print(f"\nConfronto {vecchio['meta']['commit']} -> {nuovo['meta']['commit']} (soglia {soglia:.0%})")
+    print(f"{'benchmark':<28} {'prima (s)':>10} {'dopo (s)':>10} {'rapporto':>9}")
+    regressioni = []
+    for nome, voce in nuovo['risultati'].items():
+        prima = vecchio['risultati'].get(nome, {}).get('secondi')
+        dopo = voce.get('secondi')
+        if prima is None or dopo is None:
+            continue
+        rapporto = dopo / prima if prima > 0 else float('inf')
+        esito = ''
+        if max(prima, dopo) >= minimo and rapporto > 1 + soglia:
+            esito = 'REGRESSIONE'
+            regressioni.append(nome)
+        elif max(prima, dopo) >= minimo and rapporto < 1 / (1 + soglia):
+            esito = 'più veloce'
+        print(f"{nome:<28} {prima:>10.3f} {dopo:>10.3f} {rapporto:>8.2f}x {esito}")
+    print(f"\n{len(regressioni)} regressioni" + (f": {', '.join(regressioni)}" if regressioni else ""))
+    return regressioni
+
+#main
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark della pipeline (KB, feature, griglia/CV, regole, fetcher) su dati sintetici, risultati in JSON")
+    parser.add_argument('--righe', type=float, default=1e5, help="letture generate (da 1e3 a 1e7)")
+    parser.add_argument('--utenti', type=int, default=100, help="utenti generati (da 1 a 1e5)")
+    parser.add_argument('--manga', type=int, default=20000, help="manga nel catalogo generato")
+    parser.add_argument('--seed', type=int, default=42, help="seme del generatore")
+    parser.add_argument('--solo', nargs='+', choices=SEZIONI, help="esegue solo i benchmark indicati")
+    parser.add_argument('--cartella', help="cartella di lavoro da conservare (predefinita: temporanea, eliminata alla fine); senza 'generazione' in --solo riusa i dati già presenti")
+    parser.add_argument('--n-jobs', type=int, default=1, help="core per griglia e cross-validation")
+    parser.add_argument('--max-righe-dense', type=int, default=1000000, help="oltre questo numero di righe la preparazione densa viene saltata")
+    parser.add_argument('--max-righe-ml', type=int, default=50000, help="righe di dataset_ml.csv usate per griglia e cross-validation")
+    parser.add_argument('--utenti-kb', type=int, default=10, help="utenti convertiti in letture Prolog e interrogati dal pool")
+    parser.add_argument('--utenti-regole', type=int, default=1000, help="utenti valutati dal motore NumPy")
+    parser.add_argument('--richieste-prolog', type=int, default=200, help="richieste inviate al pool Prolog")
+    parser.add_argument('--utenti-api', type=int, default=5, help="utenti scaricati dal server locale")
+    parser.add_argument('--workers-api', type=int, default=4, help="thread di ingestione_batch (utenti e dettagli)")
+    parser.add_argument('--rps', type=float, default=1000, help="richieste al secondo del limitatore dei fetcher")
+    parser.add_argument('--latenza-api-ms', type=float, default=0, help="latenza del server locale per risposta")
+    parser.add_argument('--errori-api', type=float, default=0, help="frazione delle richieste a cui il server locale risponde 503")
+    parser.add_argument('--tasso-429', type=float, default=0, help="frazione delle richieste a cui il server locale risponde 429")
+    parser.add_argument('--retry-after', type=float, default=0.1, help="secondi di Retry-After nei 429 del server locale")
+    parser.add_argument('--quota-api', type=int, default=0, help="richieste al secondo consentite per token dal server locale (0 = illimitate)")
+    parser.add_argument('--output', help="file JSON dei risultati (predefinito: BENCHMARK/risultati/<data>.json)")
+    parser.add_argument('--confronta', nargs='+', metavar='FILE', help="con un file confronta il nuovo risultato con FILE, con due file confronta solo i due file senza eseguire")
+    parser.add_argument('--soglia', type=float, default=0.2, help="rallentamento oltre il quale un benchmark è una regressione (0.2 = 20%%)")
+    args = parser.parse_args()
+
+    if args.confronta and len(args.confronta) == 2:
+        sys.exit(1 if confronta(args.confronta[0], args.confronta[1], args.soglia) else 0)
+
+    sezioni = args.solo or SEZIONI
+    lavoro = os.path.abspath(args.cartella or tempfile.mkdtemp(prefix='benchmark_'))
+    parametri = {'righe': int(args.righe), 'utenti': args.utenti, 'manga': args.manga, 'seed': args.seed, 'max_righe_ml': args.max_righe_ml, 'utenti_kb': min(args.utenti_kb, args.utenti), 'utenti_regole': min(args.utenti_regole, args.utenti), 'utenti_api': min(args.utenti_api, args.utenti), 'n_jobs': args.n_jobs, 'guasti_api': {'latenza_ms': args.latenza_api_ms, 'errori': args.errori_api, 'tasso_429': args.tasso_429, 'retry_after': args.retry_after, 'quota': args.quota_api}}
+    risultati = {}
+    #i fetcher scrivono journal e partizioni sotto DATASET/ della cartella corrente
+    cartella_iniziale = os.getcwd()
+    os.makedirs(lavoro, exist_ok=True)
+    os.chdir(lavoro)
+    try:
+        if 'generazione' in sezioni or not os.path.exists(os.path.join(lavoro, 'DATASET', 'letture_utenti.csv')):
+            misura(risultati, 'generazione', lambda: {'righe': genera_dati(lavoro, righe=parametri['righe'], n_utenti=args.utenti, n_manga=args.manga, seed=args.seed, partizioni=parametri['utenti_kb'])['letture']})
+        if 'kb' in sezioni:
+            misura(risultati, 'kb', lambda: bench_kb(lavoro, parametri['utenti_kb']))
+        if 'feature' in sezioni:
+            from apprendimento_supervisionato import prepara_denso, prepara_sparso
+            misura(risultati, 'feature/densa', lambda: bench_feature(lavoro, prepara_denso, args.max_righe_dense))
+            misura(risultati, 'feature/sparsa', lambda: bench_feature(lavoro, prepara_sparso))
+        if 'griglia' in sezioni:
+            bench_griglia(lavoro, risultati, args.max_righe_ml, args.n_jobs)
+        if 'regole' in sezioni:
+            bench_regole(lavoro, risultati, parametri['utenti_regole'], parametri['utenti_kb'], args.richieste_prolog)
+        if 'api' in sezioni:
+            guasti = Guasti(args.latenza_api_ms, 0, args.errori_api, args.tasso_429, args.retry_after, args.quota_api, 1.0, args.seed)
+            bench_api(lavoro, risultati, parametri['utenti_api'], args.workers_api, args.rps, guasti)
+    finally:
+        os.chdir(cartella_iniziale)
+        if not args.cartella:
+            shutil.rmtree(lavoro, ignore_errors=True)
+
+    output = args.output or os.path.join(CARTELLA, 'risultati', datetime.now().strftime('%Y%m%d-%H%M%S') + '.json')
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump({'meta': meta(), 'parametri': parametri, 'risultati': risultati}, f, indent=2, ensure_ascii=False)
+    print(f"\nRisultati salvati in '{output}'")
+
+    if args.confronta:
+        sys.exit(1 if confronta(args.confronta[0], output, args.soglia) else 0)
@@ -0,0 +1,240 @@
+import os   #usato per creare le cartelle dei dati generati
+import time #usato per misurare la durata della generazione
+import argparse #usato per leggere le opzioni da riga di comando
+from collections import Counter #usato per le frequenze dei generi nei dati reali
+import numpy as np  #usato per tutti i campionamenti (con seme fisso)
+import pandas as pd #usato per leggere i dati reali e scrivere i CSV a blocchi
+
+#dati reali da cui vengono stimate le distribuzioni (un utente, ~6.5k letture e la top 1000)
+CARTELLA_REALE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'DATASET')
+
+#stesse colonne dei CSV prodotti da PYTHON_DATASET (top_manga.py, user_estesa.py, user_manga.py)
+COLONNE_CATALOGO = ['ID', 'Titolo', 'Generi', 'Punteggio Medio', 'Rank', 'Popolarità', 'Stato', 'Autori']
+COLONNE_ML = ['ID', 'Titolo', 'Generi', 'Punteggio_Utente', 'Stato_Utente', 'Punteggio_Medio', 'Rank', 'Popolarita']
+COLONNE_LISTA = ['ID', 'Titolo', 'Generi', 'Punteggio', 'Stato']
+#letture_utenti.csv aggiunge l'utente e la data di ultima modifica della voce (updated_at servito da api_locale.py)
+COLONNE_LETTURE = ['Utente'] + COLONNE_LISTA + ['Aggiornato']
+
+#intervallo delle date di modifica delle letture (secondi Unix, 2015-01-01 - 2025-01-01)
+INIZIO_MODIFICHE, FINE_MODIFICHE = 1420070400, 1735689600
+
+#righe elaborate per blocco: la memoria della generazione non dipende dal numero totale di righe
+RIGHE_PER_BLOCCO = 200000
+
+#stima dai CSV reali: frequenza dei generi, numero di generi per manga, punteggi medi, stato di pubblicazione e coppie (stato, voto) dell'utente
+def distribuzioni(cartella=CARTELLA_REALE):
+    catalogo = pd.read_csv(os.path.join(cartella, 'top_manga.csv'))
+    ml = pd.read_csv(os.path.join(cartella, 'dataset_ml.csv'))
+    lista = pd.read_csv(os.path.join(cartella, 'mangalist.csv'))
+
+    #un manga per ID tra catalogo e letture
+    manga = pd.concat([catalogo[['ID', 'Generi', 'Punteggio Medio']].rename(columns={'Punteggio Medio': 'Punteggio_Medio'}), ml[['ID', 'Generi', 'Punteggio_Medio']]]).drop_duplicates('ID')
+    generi = [[g.strip() for g in x.split(',') if g.strip()] for x in manga['Generi'].fillna('')]
+    frequenze = Counter(g for lista_generi in generi for g in lista_generi)
+    nomi = sorted(frequenze)
+
+    #coppie (stato, voto) delle letture escluse le plan_to_read (dataset_ml.csv non le contiene)
+    coppie = ml.groupby(['Stato_Utente', 'Punteggio_Utente']).size()
+    plan = lista[lista['Stato'] == 'plan_to_read']['Punteggio'].value_counts()
+    stati = catalogo['Stato'].value_counts()
+    return {
+        'generi': nomi,
+        'p_generi': np.array([frequenze[g] for g in nomi], dtype=np.float64) / sum(frequenze.values()),
+        'numero_generi': np.array([len(x) for x in generi]),
+        'medie': manga['Punteggio_Medio'].dropna().to_numpy(),
+        'stati_catalogo': stati.index.to_numpy(),
+        'p_stati_catalogo': stati.to_numpy() / stati.sum(),
+        'coppie': coppie.index.to_list(),
+        'p_coppie': coppie.to_numpy() / coppie.sum(),
+        'quota_plan': float((lista['Stato'] == 'plan_to_read').mean()),
+        'voti_plan': plan.index.to_numpy(),
+        'p_voti_plan': plan.to_numpy() / plan.sum()
+    }
+
+#catalogo di n_manga manga con lo schema di top_manga.csv, ordinato per rank
+#i generi di ogni manga sono estratti senza ripetizione con le frequenze reali (chiavi di Gumbel), la popolarità segue il punteggio medio con rumore
+def genera_catalogo(n_manga, dist, rng):
+    n_generi = len(dist['generi'])
+    ids = np.sort(rng.choice(np.arange(1, max(200000, 3 * n_manga)), size=n_manga, replace=False))
+    numero = np.clip(rng.choice(dist['numero_generi'], size=n_manga), 0, n_generi)
+    matrice = np.zeros((n_manga, n_generi), dtype=bool)
+    log_p = np.log(dist['p_generi'])
+    for inizio in range(0, n_manga, 10000):
+        fine = min(inizio + 10000, n_manga)
+        ordine = np.argsort(-(log_p + rng.gumbel(size=(fine - inizio, n_generi))), axis=1)
+        scelti = np.arange(n_generi) < numero[inizio:fine, None]
+        np.put_along_axis(matrice[inizio:fine], ordine, scelti, axis=1)
+
+    medie = np.round(np.clip(rng.choice(dist['medie'], size=n_manga) + rng.normal(0, 0.05, n_manga), 1, 10), 2)
+    rank = np.empty(n_manga, dtype=np.int64)
+    rank[np.lexsort((ids, -medie))] = np.arange(1, n_manga + 1)
+    popolarita = np.empty(n_manga, dtype=np.int64)
+    popolarita[np.argsort(-(medie + rng.normal(0, 1, n_manga)))] = np.arange(1, n_manga + 1)
+    autori = rng.integers(0, max(1, n_manga // 5), size=(n_manga, 2))
+    due_autori = rng.random(n_manga) < 0.3
+
+    #i generi sono in ordine alfabetico come nelle risposte dell'API
+    nomi = np.array(dist['generi'], dtype=object)
+    catalogo = pd.DataFrame({
+        'ID': ids,
+        'Titolo': [f'Manga sintetico {i}' for i in ids],
+        'Generi': [', '.join(nomi[riga]) for riga in matrice],
+        'Punteggio Medio': medie,
+        'Rank': rank,
+        'Popolarità': popolarita,
+        'Stato': rng.choice(dist['stati_catalogo'], size=n_manga, p=dist['p_stati_catalogo']),
+        'Autori': [f'Autore {a} Sintetico, Autore {b} Sintetico' if due else f'Autore {a} Sintetico' for (a, b), due in zip(autori, due_autori)]
+    })
+    ordine = np.argsort(rank)
+    return catalogo.iloc[ordine].reset_index(drop=True), matrice[ordine]
+
+#numero di letture di ogni utente: distribuzione lognormale (pochi utenti con liste lunghissime) con totale pari a righe
+#un utente non può leggere più manga del catalogo: le letture in eccesso passano agli utenti non ancora saturi, in proporzione ai loro pesi
+def letture_per_utente(righe, n_utenti, n_manga, rng):
+    pesi = rng.lognormal(0, 1, n_utenti)
+    conteggi = np.clip(np.round(righe * pesi / pesi.sum()), 1, n_manga)
+    while (conteggi == n_manga).any():
+        liberi = conteggi < n_manga
+        mancanti = righe - conteggi.sum()
+        if mancanti < 1 or not liberi.any():
+            break
+        aggiornati = np.minimum(conteggi[liberi] + np.round(mancanti * pesi[liberi] / pesi[liberi].sum()), n_manga)
+        if (aggiornati == conteggi[liberi]).all():
+            break
+        conteggi[liberi] = aggiornati
+    return conteggi.astype(np.int64)
+
+#genera le letture a blocchi di utenti come DataFrame (Utente, colonne di mangalist.csv e dati del catalogo)
+#i manga letti seguono la popolarità (legge di Zipf) senza ripetizioni nella stessa lista, i voti dipendono dal punteggio medio e dai gusti dell'utente per i generi
+def genera_letture(catalogo, matrice, conteggi, dist, rng):
+    n_manga = len(catalogo)
+    peso = 1.0 / catalogo['Popolarità'].to_numpy() ** 0.8
+    peso /= peso.sum()
+    coppie = np.array(dist['coppie'], dtype=object)
+    medie = catalogo['Punteggio Medio'].to_numpy()
+    numero_generi = np.maximum(matrice.sum(axis=1), 1)
+
+    inizio = 0
+    while inizio < len(conteggi):
+        #utenti del blocco finché le letture restano sotto RIGHE_PER_BLOCCO (almeno un utente)
+        fine = inizio + max(1, int(np.searchsorted(np.cumsum(conteggi[inizio:]), RIGHE_PER_BLOCCO)))
+        fine = min(fine, len(conteggi))
+        c = conteggi[inizio:fine]
+
+        #estrazione con ripetizione e sovracampionamento, poi per ogni utente restano le prime c estrazioni distinte
+        estratti = np.minimum(np.ceil(c * 2).astype(np.int64) + 5, n_manga * 4)
+        utente = np.repeat(np.arange(len(c)), estratti)
+        manga = rng.choice(n_manga, size=len(utente), p=peso)
+        _, prime = np.unique(utente * n_manga + manga, return_index=True)
+        prime = np.sort(prime)
+        gruppo = utente[prime]
+        posizione = np.arange(len(prime)) - np.searchsorted(gruppo, gruppo)
+        tieni = prime[posizione < c[gruppo]]
+        utente, manga = utente[tieni], manga[tieni]
+
+        #gli utenti con liste vicine alla dimensione del catalogo hanno meno di c estrazioni distinte:
+        #i manga mancanti vengono estratti senza ripetizione tra quelli non ancora letti (chiavi di Gumbel sui pesi di popolarità)
+        ottenuti = np.bincount(utente, minlength=len(c))
+        corti = np.flatnonzero(ottenuti < c)
+        if len(corti):
+            aggiunti_utente, aggiunti_manga = [utente], [manga]
+            for u in corti:
+                chiavi = np.log(peso) + rng.gumbel(size=n_manga)
+                chiavi[manga[utente == u]] = -np.inf
+                nuovi = np.argpartition(-chiavi, c[u] - ottenuti[u] - 1)[:c[u] - ottenuti[u]]
+                aggiunti_utente.append(np.full(len(nuovi), u))
+                aggiunti_manga.append(nuovi)
+            utente, manga = np.concatenate(aggiunti_utente), np.concatenate(aggiunti_manga)
+            ordine = np.argsort(utente, kind='stable')
+            utente, manga = utente[ordine], manga[ordine]
+
+        #stato e voto: plan_to_read con la quota reale, le altre letture con le coppie (stato, voto) di dataset_ml.csv
+        n = len(manga)
+        plan = rng.random(n) < dist['quota_plan']
+        scelte = coppie[rng.choice(len(coppie), size=n, p=dist['p_coppie'])]
+        stato = np.where(plan, 'plan_to_read', scelte[:, 0]).astype(object)
+        voto = np.where(plan, rng.choice(dist['voti_plan'], size=n, p=dist['p_voti_plan']), scelte[:, 1]).astype(np.float64)
+        gusti = rng.normal(0, 1.5, size=(len(c), matrice.shape[1])).astype(np.float32)
+        affinita = (gusti[utente] * matrice[manga]).sum(axis=1) / numero_generi[manga]
+        votati = voto > 0
+        voto[votati] = np.clip(np.round(voto[votati] + (medie[manga][votati] - 7) * 1.5 + affinita[votati]), 1, 10)
+        #data di modifica con la risoluzione del secondo come updated_at dell'API: voci diverse possono avere la stessa data
+        aggiornato = pd.to_datetime(rng.integers(INIZIO_MODIFICHE, FINE_MODIFICHE, size=n), unit='s').strftime('%Y-%m-%dT%H:%M:%S+00:00')
+
+        righe = catalogo.iloc[manga]
+        yield pd.DataFrame({
+            'Utente': [f'sintetico_{u}' for u in utente + inizio],
+            'ID': righe['ID'].to_numpy(),
+            'Titolo': righe['Titolo'].to_numpy(),
+            'Generi': righe['Generi'].to_numpy(),
+            'Punteggio': voto.astype(np.int64),
+            'Stato': stato,
+            'Punteggio_Medio': righe['Punteggio Medio'].to_numpy(),
+            'Rank': righe['Rank'].to_numpy(),
+            'Popolarita': righe['Popolarità'].to_numpy(),
+            'Aggiornato': aggiornato
+        })
+        inizio = fine
+
+#accoda un blocco a un CSV scrivendo l'intestazione solo alla prima scrittura
+def accoda_csv(df, percorso, colonne):
+    nuovo = not os.path.exists(percorso)
+    df.to_csv(percorso, columns=colonne, index=False, header=nuovo, mode='w' if nuovo else 'a', encoding='utf-8')
+
+#righe nel formato di dataset_ml.csv (senza plan_to_read, come estrai_voce di user_estesa.py)
+def righe_ml(df):
+    df = df[df['Stato'] != 'plan_to_read']
+    return df.rename(columns={'Punteggio': 'Punteggio_Utente', 'Stato': 'Stato_Utente'})
+
+#genera nella cartella la struttura di DATASET con dati sintetici:
+#    DATASET/top_manga.csv    catalogo di n_manga manga
+#    DATASET/dataset_ml.csv   letture con voto di tutti gli utenti (circa righe righe, senza plan_to_read)
+#    DATASET/mangalist.csv    lista del primo utente
+#    DATASET/letture_utenti.csv   tutte le liste con le colonne Utente e Aggiornato (usate da api_locale.py e dai benchmark multiutente)
+#    DATASET/utenti/<utente>/    partizioni dei primi utenti nello stesso formato di ingestione_batch.py
+def genera_dati(cartella, righe=100000, n_utenti=100, n_manga=20000, seed=42, partizioni=0, distribuzione=None):
+    inizio = time.perf_counter()
+    rng = np.random.default_rng(seed)
+    dist = distribuzione or distribuzioni()
+    dataset = os.path.join(cartella, 'DATASET')
+    os.makedirs(dataset, exist_ok=True)
+    #i file vengono riscritti da zero
+    for nome in ('top_manga.csv', 'dataset_ml.csv', 'mangalist.csv', 'letture_utenti.csv'):
+        if os.path.exists(os.path.join(dataset, nome)):
+            os.remove(os.path.join(dataset, nome))
+
+    catalogo, matrice = genera_catalogo(n_manga, dist, rng)
+    catalogo.to_csv(os.path.join(dataset, 'top_manga.csv'), index=False, encoding='utf-8')
+
+    conteggi = letture_per_utente(righe, n_utenti, n_manga, rng)
+    letture = ml = 0
+    for df in genera_letture(catalogo, matrice, conteggi, dist, rng):
+        accoda_csv(df, os.path.join(dataset, 'letture_utenti.csv'), COLONNE_LETTURE)
+        accoda_csv(righe_ml(df), os.path.join(dataset, 'dataset_ml.csv'), COLONNE_ML)
+        if letture == 0:
+            accoda_csv(df[df['Utente'] == 'sintetico_0'], os.path.join(dataset, 'mangalist.csv'), COLONNE_LISTA)
+        for utente, lista in df[df['Utente'].isin([f'sintetico_{u}' for u in range(partizioni)])].groupby('Utente'):
+            cartella_utente = os.path.join(dataset, 'utenti', utente)
+            os.makedirs(cartella_utente, exist_ok=True)
+            lista.to_csv(os.path.join(cartella_utente, 'mangalist.csv'), columns=COLONNE_LISTA, index=False, encoding='utf-8')
+            righe_ml(lista).to_csv(os.path.join(cartella_utente, 'dataset_ml.csv'), columns=COLONNE_ML, index=False, encoding='utf-8')
+        letture += len(df)
+        ml += int((df['Stato'] != 'plan_to_read').sum())
+
+    durata = time.perf_counter() - inizio
+    if letture < 0.9 * righe:
+        print(f"Attenzione: generate {letture} letture invece di {righe}, ogni utente legge al massimo {n_manga} manga (aumentare --manga o --utenti)")
+    print(f"Dati sintetici in '{dataset}': {n_manga} manga, {n_utenti} utenti, {letture} letture ({ml} in dataset_ml.csv) in {durata:.1f} s")
+    return {'manga': n_manga, 'utenti': n_utenti, 'letture': letture, 'righe_ml': ml, 'secondi': round(durata, 3)}
+
+#main
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Genera dati sintetici con gli stessi schemi e distribuzioni dei CSV di DATASET")
+    parser.add_argument('--cartella', default=os.path.join('BENCHMARK', 'dati'), help="cartella in cui creare DATASET/ con i dati generati")
+    parser.add_argument('--righe', type=float, default=1e5, help="letture totali (da 1e3 a 1e7)")
+    parser.add_argument('--utenti', type=int, default=100, help="numero di utenti (da 1 a 1e5)")
+    parser.add_argument('--manga', type=int, default=20000, help="manga nel catalogo")
+    parser.add_argument('--seed', type=int, default=42, help="seme: stessi parametri e stesso seme producono gli stessi file")
+    parser.add_argument('--partizioni', type=int, default=0, help="crea DATASET/utenti/<utente>/ per i primi N utenti")
+    args = parser.parse_args()
+    genera_dati(args.cartella, righe=int(args.righe), n_utenti=args.utenti, n_manga=args.manga, seed=args.seed, partizioni=args.partizioni)
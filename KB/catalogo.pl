@@ -998,566 +998,4414 @@ manga(933, 'elfen_lied', ['action', '_drama', '_gore', '_horror', '_psychologica
 manga(1264, 'higurashi_no_naku_koro_ni:_onisarashi-hen', ['drama', '_horror', '_mystery', '_psychological'], 7.78, 1436, 2785, finished, ['en_kito', '__ryukishi07']).
 manga(3537, 'yankee-kun_to_megane-chan', ['action', '_comedy', '_delinquents', '_romance', '_school', '_shounen'], 7.78, 1437, 417, finished, ['miki_yoshikawa']).
 manga(3737, 'asterisk', ['action', '_boys_love', '_fantasy', '_shoujo', '_supernatural'], 7.78, 1438, 7740, finished, ['shuu_morimoto']).
-lettura_utente(3, '20th_century_boys', completed, 9.0, ['award_winning', '_drama', '_historical', '_mystery', '_psychological', '_sci-fi', '_seinen']).
-lettura_utente(743, '21st_century_boys', completed, 0.0, ['award_winning', '_drama', '_mystery', '_psychological', '_sci-fi', '_seinen']).
-lettura_utente(1224, '3-gatsu_no_lion', on_hold, 6.0, ['award_winning', '_childcare', '_drama', '_iyashikei', '_seinen', '_slice_of_life', '_strategy_game']).
-lettura_utente(147337, '66,666_years:_advent_of_the_dark_mage', dropped, 4.0, ['fantasy', '_reincarnation']).
-lettura_utente(134678, 'a_business_proposal', completed, 5.0, ['adult_cast', '_comedy', '_drama', '_romance', '_workplace']).
-lettura_utente(148457, 'a_dance_of_swords_in_the_night', dropped, 5.0, ['action', '_fantasy', '_martial_arts']).
-lettura_utente(41723, 'a_fairytale_for_the_demon_lord', plan_to_read, 0.0, ['action', '_adventure', '_fantasy', '_romance']).
-lettura_utente(158496, 'a_modern_man_who_got_transmigrated_into_the_murim_world', plan_to_read, 0.0, ['action', '_fantasy', '_isekai', '_martial_arts', '_reincarnation']).
-lettura_utente(132247, 'a_returner\'s_magic_should_be_special', completed, 6.0, ['action', '_fantasy', '_school', '_time_travel']).
-lettura_utente(50027, 'about_death', completed, 8.0, ['psychological', '_slice_of_life', '_supernatural']).
-lettura_utente(172750, 'absolute_regression', reading, 7.0, ['action', '_fantasy', '_martial_arts', '_time_travel']).
-lettura_utente(174691, 'absolute_reign', reading, 7.0, ['action', '_fantasy', '_martial_arts']).
-lettura_utente(149880, 'absolute_sword_sense', dropped, 4.0, ['action', '_fantasy', '_martial_arts', '_time_travel']).
-lettura_utente(143991, 'after_god', plan_to_read, 0.0, ['action', '_fantasy']).
-lettura_utente(147448, 'after_school_lessons_for_unripe_apples', dropped, 6.0, ['romance', '_school']).
-lettura_utente(150210, 'after_ten_millennia_in_hell', dropped, 5.0, ['action', '_fantasy']).
-lettura_utente(103939, 'aharen-san_wa_hakarenai', dropped, 3.0, ['comedy', '_love_status_quo', '_romance', '_school', '_shounen']).
-lettura_utente(147014, 'aisha', plan_to_read, 0.0, ['drama', '_mystery', '_psychological', '_suspense']).
-lettura_utente(49865, 'ajin', completed, 7.0, ['action', '_gore', '_horror', '_mystery', '_seinen', '_supernatural']).
-lettura_utente(1218, 'akagi:_yami_ni_oritatta_tensai', plan_to_read, 0.0, ['action', '_adult_cast', '_drama', '_organized_crime', '_psychological', '_strategy_game']).
-lettura_utente(21525, 'akatsuki_no_yona', plan_to_read, 0.0, ['adventure', '_fantasy', '_romance', '_shoujo']).
-lettura_utente(664, 'akira', plan_to_read, 0.0, ['action', '_award_winning', '_gore', '_sci-fi', '_seinen']).
-lettura_utente(24705, 'aku_no_hana', plan_to_read, 0.0, ['drama', '_psychological', '_romance', '_school', '_shounen']).
-lettura_utente(1101, 'akumetsu', completed, 8.0, ['action', '_detective', '_drama', '_psychological', '_shounen', '_suspense']).
-lettura_utente(125325, 'akuyaku_reijou_tensei_ojisan', dropped, 3.0, ['comedy', '_fantasy', '_school', '_seinen', '_villainess']).
-lettura_utente(62887, 'all_you_need_is_kill', completed, 7.0, ['action', '_military', '_sci-fi', '_seinen', '_time_travel']).
-lettura_utente(63535, 'amaama_to_inazuma', completed, 5.0, ['childcare', '_comedy', '_gourmet', '_iyashikei', '_seinen', '_slice_of_life']).
-lettura_utente(129418, 'ame_to_kimi_to', plan_to_read, 0.0, ['comedy', '_seinen', '_slice_of_life']).
-lettura_utente(143336, 'among_us', completed, 6.0, ['comedy', '_kids', '_sci-fi', '_space']).
-lettura_utente(128953, 'ankoku_kishi_no_ore_desu_ga_saikyou_no_paladin_wo_mezashimasu', dropped, 2.0, ['action', '_fantasy', '_school']).
-lettura_utente(30079, 'annarasumanara', completed, 9.0, ['drama', '_mystery', '_psychological', '_romance', '_school', '_seinen']).
-lettura_utente(296, 'anne_freaks', completed, 5.0, ['horror', '_mystery', '_psychological']).
-lettura_utente(102256, 'ao_ashi', plan_to_read, 0.0, ['award_winning', '_seinen', '_sports', '_team_sports']).
-lettura_utente(13492, 'ao_no_exorcist', plan_to_read, 0.0, ['action', '_mythology', '_school', '_shounen', '_supernatural']).
-lettura_utente(135545, 'ao_no_hako', plan_to_read, 0.0, ['romance', '_school', '_shounen', '_sports', '_team_sports']).
-lettura_utente(14154, 'arakawa_under_the_bridge', completed, 4.0, ['comedy', '_romance', '_seinen']).
-lettura_utente(96528, 'arifureta_shokugyou_de_sekai_saikyou', dropped, 4.0, ['action', '_adventure', '_fantasy', '_harem', '_isekai']).
-lettura_utente(1303, 'ashita_no_joe', plan_to_read, 0.0, ['combat_sports', '_drama', '_shounen', '_slice_of_life', '_sports']).
-lettura_utente(131084, 'assassin\'s_creed_valhalla_x_vinland_saga', completed, 4.0, ['action', '_historical', '_seinen']).
-lettura_utente(153965, 'auto_hunting_with_my_clones', dropped, 6.0, ['action', '_fantasy']).
-lettura_utente(141583, 'ayashimon', completed, 5.0, ['action', '_organized_crime', '_shounen', '_supernatural']).
-lettura_utente(93350, 'ayeshah\'s_secret', completed, 7.0, ['drama']).
-lettura_utente(85, 'azumanga_daioh', dropped, 3.0, ['cgdct', '_comedy', '_school', '_slice_of_life']).
-lettura_utente(72299, 'baki-dou', plan_to_read, 0.0, ['action', '_gore', '_martial_arts', '_shounen']).
-lettura_utente(115749, 'baki-dou', plan_to_read, 0.0, ['action', '_martial_arts', '_shounen']).
-lettura_utente(5157, 'baki:_new_grappler_baki', plan_to_read, 0.0, ['action', '_combat_sports', '_gore', '_martial_arts', '_shounen']).
-lettura_utente(9711, 'bakuman.', plan_to_read, 0.0, ['comedy', '_drama', '_otaku_culture', '_romance', '_shounen']).
-lettura_utente(756, 'banana_fish', plan_to_read, 0.0, ['action', '_adventure', '_delinquents', '_drama', '_organized_crime', '_psychological', '_shoujo', '_suspense']).
-lettura_utente(13568, 'barairo_no_kaibutsu', completed, 5.0, ['horror', '_psychological', '_seinen']).
-lettura_utente(17051, 'barakamon', dropped, 4.0, ['childcare', '_comedy', '_iyashikei', '_shounen', '_slice_of_life', '_visual_arts']).
-lettura_utente(111213, 'bastard', completed, 8.0, ['drama', '_gore', '_horror', '_mystery', '_psychological', '_romance']).
-lettura_utente(103701, 'beastars', completed, 9.0, ['anthropomorphic', '_award_winning', '_drama', '_psychological', '_shounen', '_slice_of_life']).
-lettura_utente(10010, 'beelzebub', plan_to_read, 0.0, ['action', '_childcare', '_comedy', '_delinquents', '_mythology', '_school', '_shounen', '_supernatural']).
-lettura_utente(2, 'berserk', dropped, 10.0, ['action', '_adventure', '_award_winning', '_drama', '_fantasy', '_gore', '_horror', '_military', '_psychological', '_seinen']).
-lettura_utente(92299, 'berserk:_shinen_no_kami_2', completed, 0.0, ['seinen']).
-lettura_utente(147662, 'best_teacher_baek', reading, 7.0, ['action', '_fantasy', '_martial_arts', '_reincarnation']).
-lettura_utente(113835, 'biao_ren', reading, 8.0, ['action', '_drama', '_historical']).
-lettura_utente(11054, 'billy_bat', plan_to_read, 0.0, ['detective', '_drama', '_historical', '_mystery', '_psychological', '_seinen', '_supernatural']).
-lettura_utente(168969, 'black_and_white_martial_emperor', dropped, 3.0, ['action', '_fantasy', '_martial_arts']).
-lettura_utente(86337, 'black_clover', plan_to_read, 0.0, ['action', '_fantasy', '_shounen']).
-lettura_utente(735, 'black_lagoon', plan_to_read, 0.0, ['action', '_adult_cast', '_drama', '_military', '_organized_crime', '_seinen']).
-lettura_utente(149, 'blame!', completed, 6.0, ['action', '_drama', '_horror', '_psychological', '_sci-fi', '_seinen']).
-lettura_utente(12, 'bleach', plan_to_read, 0.0, ['action', '_adventure', '_award_winning', '_shounen', '_supernatural']).
-lettura_utente(85719, 'blue_giant', completed, 7.0, ['award_winning', '_music', '_seinen']).
-lettura_utente(100922, 'blue_giant_supreme', plan_to_read, 0.0, ['music', '_seinen']).
-lettura_utente(1479, 'blue_heaven', completed, 5.0, ['action', '_psychological', '_seinen']).
-lettura_utente(114745, 'blue_lock', reading, 7.0, ['award_winning', '_shounen', '_sports', '_team_sports']).
-lettura_utente(107931, 'blue_period', reading, 8.0, ['award_winning', '_drama', '_school', '_seinen', '_visual_arts']).
-lettura_utente(2109, 'bokkou', completed, 5.0, ['action', '_award_winning', '_drama', '_historical', '_seinen']).
-lettura_utente(75989, 'boku_no_hero_academia', completed, 4.0, ['action', '_school', '_shounen', '_super_power']).
-lettura_utente(112807, 'boku_no_kokoro_no_yabai_yatsu', plan_to_read, 0.0, ['comedy', '_romance', '_school', '_shounen']).
-lettura_utente(153950, 'boku_to_jinginaki_ojisan', completed, 4.0, ['comedy', '_shounen']).
-lettura_utente(94919, 'bokutachi_ga_yarimashita', plan_to_read, 0.0, ['drama', '_seinen']).
-lettura_utente(175296, 'bones', dropped, 2.0, ['action', '_fantasy', '_urban_fantasy']).
-lettura_utente(148617, 'book_eater', dropped, 5.0, ['action', '_adventure', '_fantasy', '_school']).
-lettura_utente(119533, 'boukensha_license_wo_hakudatsu_sareta_ossan_dakedo,_manamusume_ga_dekita_node_nonbiri_jinsei_wo_ouka_suru', on_hold, 6.0, ['action', '_adventure', '_fantasy']).
-lettura_utente(115194, 'boukensha_ni_naritai_to_miyako_ni_deteitta_musume_ga_s-rank_ni_natteta', on_hold, 6.0, ['action', '_adventure', '_fantasy']).
-lettura_utente(130977, 'build_king', completed, 2.0, ['action', '_adventure', '_fantasy', '_shounen']).
-lettura_utente(23419, 'byousoku_5_centimeter', completed, 6.0, ['drama', '_romance', '_seinen']).
-lettura_utente(103444, 'candy_&_cigarettes', completed, 5.0, ['action', '_seinen']).
-lettura_utente(116778, 'chainsaw_man', on_hold, 8.0, ['action', '_award_winning', '_fantasy', '_gore', '_shounen', '_urban_fantasy']).
-lettura_utente(104271, 'chi_no_wadachi', plan_to_read, 0.0, ['drama', '_psychological', '_seinen', '_suspense']).
-lettura_utente(76813, 'chichi_to_ko', plan_to_read, 0.0, ['childcare', '_comedy', '_shounen', '_slice_of_life']).
-lettura_utente(148428, 'child_of_the_sheath', dropped, 5.0, ['action', '_adventure', '_fantasy']).
-lettura_utente(131403, 'choujin_x', plan_to_read, 0.0, ['action', '_seinen', '_supernatural']).
-lettura_utente(174692, 'chronicles_of_a_doomed_prodigy', reading, 5.0, ['action', '_adventure', '_fantasy', '_martial_arts']).
-lettura_utente(157591, 'chronicles_of_the_demon_faction', dropped, 4.0, ['action', '_fantasy', '_martial_arts', '_reincarnation']).
-lettura_utente(177080, 'chronicles_of_the_reincarnated_demon_god', dropped, 5.0, ['action', '_fantasy', '_martial_arts', '_reincarnation']).
-lettura_utente(583, 'claymore', plan_to_read, 0.0, ['action', '_adventure', '_fantasy', '_gore', '_horror', '_shounen']).
-lettura_utente(36595, 'cocoon', completed, 6.0, ['drama', '_historical', '_josei']).
-lettura_utente(5651, 'crows', plan_to_read, 0.0, ['action', '_delinquents', '_school', '_shounen']).
-lettura_utente(127084, 'cuprum_no_hanayome', dropped, 4.0, ['comedy', '_romance', '_seinen']).
-lettura_utente(24, 'd.gray-man', plan_to_read, 0.0, ['action', '_adventure', '_fantasy', '_shounen', '_urban_fantasy']).
-lettura_utente(118858, 'dai_dark', on_hold, 9.0, ['comedy', '_horror', '_sci-fi', '_shounen']).
-lettura_utente(158565, 'damedol_to_sekai_ni_hitori_dake_no_fan', dropped, 4.0, ['comedy', '_idols_(female)', '_romance']).
-lettura_utente(135496, 'dandadan', on_hold, 8.0, ['action', '_comedy', '_shounen', '_supernatural']).
-lettura_utente(130755, 'darwin_jihen', plan_to_read, 0.0, ['award_winning', '_sci-fi', '_seinen']).
-lettura_utente(70801, 'dead_dead_demons_dededede_destruction', completed, 6.0, ['award_winning', '_drama', '_school', '_sci-fi', '_seinen']).
-lettura_utente(110301, 'dead_mount_death_play', dropped, 3.0, ['action', '_fantasy', '_reincarnation', '_seinen', '_urban_fantasy']).
-lettura_utente(21, 'death_note', completed, 7.0, ['psychological', '_shounen', '_supernatural', '_suspense']).
-lettura_utente(149465, 'demon_devourer', dropped, 5.0, ['action', '_fantasy']).
-lettura_utente(147847, 'descended_from_divinity', dropped, 4.0, ['action', '_fantasy', '_reincarnation']).
-lettura_utente(148070, 'descent_of_the_demon_master', on_hold, 6.0, ['action', '_fantasy', '_martial_arts', '_reincarnation']).
-lettura_utente(150998, 'designated_bully', dropped, 3.0, ['action', '_delinquents', '_school']).
-lettura_utente(1474, 'devilman', completed, 5.0, ['action', '_adventure', '_drama', '_fantasy', '_horror', '_mythology', '_psychological', '_sci-fi', '_shounen', '_super_power', '_supernatural']).
-lettura_utente(148456, 'disciple_of_the_holy_sword', on_hold, 5.0, ['action', '_adventure', '_fantasy']).
-lettura_utente(82947, 'distant_sky', completed, 7.0, ['action', '_drama', '_horror', '_mystery', '_survival']).
-lettura_utente(111767, 'do_chokkyuu_kareshi_x_kanojo', dropped, 3.0, ['comedy', '_romance', '_school', '_shounen']).
-lettura_utente(151060, 'doctor,_live_again', on_hold, 6.0, ['action', '_fantasy', '_isekai', '_martial_arts', '_medical', '_reincarnation']).
-lettura_utente(147172, 'doom_breaker', on_hold, 6.0, ['action', '_fantasy', '_time_travel']).
-lettura_utente(1133, 'dorohedoro', completed, 10.0, ['action', '_comedy', '_fantasy', '_gore', '_horror', '_seinen']).
-lettura_utente(156024, 'doumo,_yuusha_no_chichi_desu._kono_tabi_wa_gusoku_ga_gomeiwaku_wo_kakete,_moushiwake_arimasen.', completed, 3.0, ['action', '_adventure', '_comedy', '_fantasy']).
-lettura_utente(40345, 'dr._frost', dropped, 4.0, ['drama', '_medical', '_psychological']).
-lettura_utente(103897, 'dr._stone', plan_to_read, 0.0, ['adventure', '_award_winning', '_sci-fi', '_shounen', '_survival', '_suspense']).
-lettura_utente(146618, 'drawing:_saikyou_mangaka_wa_oekaki_skill_de_isekai_musou_suru!', dropped, 2.0, ['adventure', '_fantasy', '_isekai', '_reincarnation']).
-lettura_utente(85781, 'dungeon_meshi', plan_to_read, 0.0, ['award_winning', '_comedy', '_fantasy', '_gourmet', '_seinen']).
-lettura_utente(152405, 'dungeon_odyssey', dropped, 4.0, ['action', '_fantasy']).
-lettura_utente(147438, 'dungeon_reset', dropped, 5.0, ['action', '_adventure', '_fantasy']).
-lettura_utente(147171, 'eleceed', reading, 7.0, ['action', '_super_power']).
-lettura_utente(10970, 'emerging', completed, 4.0, ['drama', '_gore', '_horror', '_medical', '_psychological', '_seinen']).
-lettura_utente(150204, 'ending_maker', on_hold, 6.0, ['action', '_fantasy', '_isekai', '_romance']).
-lettura_utente(43, 'eyeshield_21', plan_to_read, 0.0, ['shounen', '_sports', '_team_sports']).
-lettura_utente(43913, 'feng_shen_ji', completed, 8.0, ['action', '_fantasy', '_historical', '_martial_arts', '_supernatural']).
-lettura_utente(147463, 'fff-class_trashero', dropped, 3.0, ['action', '_adventure', '_fantasy', '_isekai', '_time_travel']).
-lettura_utente(118805, 'fight_class_3', dropped, 5.0, ['action', '_martial_arts', '_school']).
-lettura_utente(98270, 'fire_punch', dropped, 4.0, ['action', '_gore', '_mystery', '_shounen', '_supernatural']).
-lettura_utente(150088, 'fist_demon_of_mount_hua', dropped, 4.0, ['action', '_adventure', '_fantasy', '_martial_arts']).
-lettura_utente(25, 'fullmetal_alchemist', plan_to_read, 0.0, ['action', '_adventure', '_award_winning', '_drama', '_fantasy', '_military', '_shounen']).
-lettura_utente(102343, 'fumetsu_no_anata_e', on_hold, 8.0, ['adventure', '_award_winning', '_drama', '_shounen', '_supernatural']).
-lettura_utente(112694, 'fushigi_neko_no_kyuu-chan', completed, 6.0, ['comedy', '_pets', '_slice_of_life']).
-lettura_utente(103694, 'gal_gohan', dropped, 3.0, ['comedy', '_gourmet', '_love_status_quo', '_romance', '_school', '_seinen']).
-lettura_utente(24903, 'gangsta.', plan_to_read, 0.0, ['action', '_adult_cast', '_drama', '_organized_crime', '_seinen']).
-lettura_utente(564, 'gantz', dropped, 4.0, ['action', '_drama', '_gore', '_horror', '_psychological', '_sci-fi', '_seinen', '_supernatural', '_survival']).
-lettura_utente(15010, 'gekiryuuchi', completed, 5.0, ['action', '_drama', '_martial_arts', '_psychological', '_school', '_seinen']).
-lettura_utente(146875, 'get_schooled', on_hold, 6.0, ['drama', '_school']).
-lettura_utente(110727, 'gigant', completed, 2.0, ['drama', '_romance', '_sci-fi', '_seinen']).
-lettura_utente(124145, 'gilgamesh', completed, 7.0, ['action', '_adventure', '_fantasy']).
-lettura_utente(25096, 'gin_no_saji', dropped, 5.0, ['award_winning', '_comedy', '_drama', '_school', '_shounen']).
-lettura_utente(44, 'gintama', plan_to_read, 0.0, ['action', '_comedy', '_gag_humor', '_historical', '_parody', '_samurai', '_sci-fi', '_shounen']).
-lettura_utente(98720, 'goblin_slayer', dropped, 5.0, ['action', '_fantasy', '_seinen']).
-lettura_utente(106247, 'goblin_wa_mou_juubun_ni_tsuyoi', completed, 4.0, ['comedy', '_fantasy', '_shounen']).
-lettura_utente(147532, 'god_of_blackfield', on_hold, 6.0, ['action', '_reincarnation', '_school']).
-lettura_utente(1092, 'gokusen', dropped, 3.0, ['action', '_comedy', '_delinquents', '_josei', '_organized_crime', '_romance', '_school', '_slice_of_life', '_workplace']).
-lettura_utente(112922, 'gokushufudou', reading, 7.0, ['adult_cast', '_comedy', '_organized_crime']).
-lettura_utente(85968, 'golden_kamuy', dropped, 6.0, ['action', '_adventure', '_award_winning', '_historical', '_seinen']).
-lettura_utente(1470, 'gon', completed, 7.0, ['action', '_adventure', '_award_winning', '_drama', '_seinen']).
-lettura_utente(147530, 'gosu', completed, 7.0, ['action', '_adventure', '_historical', '_martial_arts']).
-lettura_utente(70345, 'grand_blue', plan_to_read, 4.0, ['comedy', '_seinen']).
-lettura_utente(11425, 'grappler_baki', reading, 7.0, ['action', '_gore', '_martial_arts', '_shounen']).
-lettura_utente(107909, 'grashros', completed, 4.0, ['action', '_seinen']).
-lettura_utente(36099, 'green_blood', plan_to_read, 0.0, ['action', '_historical', '_psychological', '_seinen', '_suspense']).
-lettura_utente(336, 'gto', dropped, 3.0, ['action', '_award_winning', '_comedy', '_delinquents', '_drama', '_ecchi', '_school', '_shounen', '_workplace']).
-lettura_utente(128783, 'gyakusatsu_happy_end', plan_to_read, 0.0, ['horror', '_mystery', '_psychological', '_supernatural', '_suspense']).
-lettura_utente(87637, 'hai_to_gensou_no_grimgar', completed, 5.0, ['action', '_adventure', '_drama', '_fantasy', '_isekai', '_shounen']).
-lettura_utente(35243, 'haikyuu!!', completed, 7.0, ['award_winning', '_school', '_shounen', '_sports', '_team_sports']).
-lettura_utente(7, 'hajime_no_ippo', plan_to_read, 0.0, ['award_winning', '_combat_sports', '_shounen', '_sports']).
-lettura_utente(146944, 'hardcore_leveling_warrior', plan_to_read, 0.0, ['action', '_adventure', '_fantasy', '_video_game']).
-lettura_utente(147572, 'heavenly_demon_reborn!', completed, 6.0, ['action', '_fantasy', '_martial_arts', '_reincarnation']).
-lettura_utente(162325, 'heavenly_grand_archive\'s_young_master', on_hold, 5.0, ['action', '_fantasy', '_martial_arts']).
-lettura_utente(151667, 'hectopascal', dropped, 4.0, ['action']).
-lettura_utente(77637, 'helck', completed, 8.0, ['action', '_fantasy']).
-lettura_utente(61583, 'hellper', completed, 8.0, ['action', '_fantasy', '_supernatural']).
-lettura_utente(267, 'hellsing', plan_to_read, 0.0, ['action', '_adult_cast', '_gore', '_historical', '_horror', '_seinen', '_supernatural', '_vampire']).
-lettura_utente(151242, 'helmut', dropped, 3.0, ['action', '_fantasy']).
-lettura_utente(176511, 'henkyou_mob_kizoku_no_uchi_ni_totsuidekita_akuyaku_reijou_ga,_mechakucha_dekiru_ii_yome_nanda_ga?', dropped, 4.0, ['fantasy', '_isekai', '_reincarnation', '_romance']).
-lettura_utente(147290, 'hero_killer', dropped, 6.0, ['action', '_super_power']).
-lettura_utente(1325, 'hi_no_tori_(1967)', completed, 7.0, ['drama', '_fantasy', '_historical', '_psychological', '_romance', '_sci-fi', '_shounen', '_space', '_supernatural']).
-lettura_utente(35719, 'hibi_chouchou', dropped, 4.0, ['romance', '_school', '_shoujo']).
-lettura_utente(116766, 'hige_wo_soru._soshite_joshikousei_wo_hirou.', dropped, 2.0, ['drama', '_romance', '_shounen']).
-lettura_utente(12200, 'high_school_musical', completed, 3.0, ['comedy', '_romance', '_school', '_shoujo']).
-lettura_utente(36413, 'hinamatsuri', completed, 9.0, ['childcare', '_comedy', '_organized_crime', '_seinen', '_supernatural']).
-lettura_utente(137303, 'hirayasumi', reading, 8.0, ['seinen', '_slice_of_life']).
-lettura_utente(143305, 'hiroware_koneko_to_moto_yakuza', completed, 5.0, ['comedy', '_pets']).
-lettura_utente(148050, 'his_majesty\'s_secret_heroine', completed, 4.0, ['action', '_adventure', '_crossdressing', '_fantasy', '_romance']).
-lettura_utente(2924, 'historie', plan_to_read, 0.0, ['action', '_adventure', '_award_winning', '_historical', '_seinen']).
-lettura_utente(147643, 'hoarding_in_hell', dropped, 5.0, ['action', '_fantasy', '_isekai']).
-lettura_utente(1149, 'hokuto_no_ken', plan_to_read, 0.0, ['action', '_drama', '_martial_arts', '_sci-fi', '_shounen']).
-lettura_utente(3285, 'holyland', reading, 7.0, ['action', '_delinquents', '_martial_arts', '_psychological', '_seinen']).
-lettura_utente(936, 'homunculus', completed, 7.0, ['drama', '_horror', '_mystery', '_psychological', '_seinen', '_supernatural']).
-lettura_utente(42451, 'horimiya', completed, 5.0, ['romance', '_school', '_shounen']).
-lettura_utente(21467, 'hoshi_mamoru_inu', plan_to_read, 0.0, ['pets', '_seinen', '_slice_of_life']).
-lettura_utente(366, 'hoshi_no_koe', completed, 5.0, ['drama', '_mecha', '_romance', '_sci-fi', '_seinen']).
-lettura_utente(44489, 'houseki_no_kuni', plan_to_read, 0.0, ['action', '_anthropomorphic', '_drama', '_fantasy', '_seinen']).
-lettura_utente(151440, 'how_to_live_as_a_villain', dropped, 3.0, ['action', '_fantasy', '_isekai', '_psychological', '_survival']).
-lettura_utente(147318, 'how_to_use_a_returner', dropped, 3.0, ['action', '_adventure', '_fantasy', '_isekai']).
-lettura_utente(26, 'hunter_x_hunter', reading, 8.0, ['action', '_adventure', '_fantasy', '_shounen']).
-lettura_utente(14440, 'i_am_a_hero', plan_to_read, 0.0, ['award_winning', '_drama', '_gore', '_horror', '_psychological', '_seinen']).
-lettura_utente(153199, 'i_only_want_to_beat_you', completed, 6.0, ['comedy', '_love_status_quo', '_romance', '_school']).
-lettura_utente(147822, 'i_stan_the_prince', dropped, 4.0, ['comedy', '_fantasy', '_romance']).
-lettura_utente(147392, 'i\'m_the_max-level_newbie', dropped, 4.0, ['action', '_fantasy']).
-lettura_utente(33031, 'imawa_no_kuni_no_alice', plan_to_read, 0.0, ['action', '_gore', '_high_stakes_game', '_horror', '_psychological', '_shounen', '_supernatural', '_survival']).
-lettura_utente(171441, 'immortal,_invincible', dropped, 4.0, ['action', '_fantasy', '_martial_arts', '_reincarnation']).
-lettura_utente(114824, 'in_the_room', completed, 4.0, ['drama', '_horror', '_seinen', '_supernatural']).
-lettura_utente(58563, 'innocent', plan_to_read, 0.0, ['drama', '_historical', '_seinen']).
-lettura_utente(93699, 'innocent_rouge', plan_to_read, 0.0, ['award_winning', '_drama', '_historical', '_seinen']).
-lettura_utente(64465, 'inuyashiki', completed, 7.0, ['drama', '_gore', '_sci-fi', '_seinen']).
-lettura_utente(90190, 'isekai_izakaya_\"nobu\"', on_hold, 6.0, ['adult_cast', '_fantasy', '_gourmet', '_isekai', '_iyashikei', '_seinen', '_workplace']).
-lettura_utente(110621, 'isekai_omotenashi_gohan', completed, 4.0, ['fantasy', '_gourmet', '_isekai', '_slice_of_life']).
-lettura_utente(102671, 'isekai_shokudou', completed, 6.0, ['comedy', '_fantasy', '_gourmet', '_iyashikei', '_mystery', '_seinen', '_workplace']).
-lettura_utente(44743, 'itou_junji_kyoufu_manga_collection:_nikuiro_no_kai', completed, 6.0, ['drama', '_horror', '_psychological', '_seinen', '_supernatural', '_suspense']).
-lettura_utente(104314, 'jagaaaaaan', dropped, 5.0, ['drama', '_gore', '_horror', '_mystery', '_seinen', '_supernatural']).
-lettura_utente(21665, 'jigoku_no_alice', plan_to_read, 0.0, ['action', '_sci-fi', '_seinen']).
-lettura_utente(112318, 'jigokuraku', dropped, 5.0, ['action', '_fantasy', '_historical', '_shounen']).
-lettura_utente(106025, 'jinmen', plan_to_read, 0.0, ['gore', '_horror']).
-lettura_utente(131703, 'jinrui_wo_metsubou_sasete_wa_ikemasen', completed, 6.0, ['childcare', '_sci-fi', '_seinen', '_slice_of_life']).
-lettura_utente(3006, 'jojo_no_kimyou_na_bouken_part_4:_diamond_wa_kudakenai', plan_to_read, 0.0, ['action', '_shounen', '_supernatural']).
-lettura_utente(3008, 'jojo_no_kimyou_na_bouken_part_5:_ougon_no_kaze', plan_to_read, 0.0, ['action', '_adventure', '_organized_crime', '_shounen']).
-lettura_utente(1706, 'jojo_no_kimyou_na_bouken_part_7:_steel_ball_run', completed, 9.0, ['action', '_adventure', '_historical', '_mystery', '_seinen', '_shounen', '_supernatural']).
-lettura_utente(25515, 'jojo_no_kimyou_na_bouken_part_8:_jojolion', completed, 8.0, ['action', '_adventure', '_award_winning', '_mystery', '_seinen', '_supernatural']).
-lettura_utente(139629, 'jojo_no_kimyou_na_bouken_part_9:_the_jojolands', plan_to_read, 0.0, ['action', '_adventure', '_seinen', '_supernatural']).
-lettura_utente(149983, 'judge_and_executioner', completed, 6.0, ['action', '_drama', '_psychological']).
-lettura_utente(113138, 'jujutsu_kaisen', on_hold, 7.0, ['action', '_school', '_shounen', '_supernatural']).
-lettura_utente(100448, 'jumyou_wo_kaitotte_moratta._ichinen_ni_tsuki,_ichimanen_de.', completed, 6.0, ['drama', '_shounen']).
-lettura_utente(147053, 'jungle_juice', dropped, 5.0, ['action', '_fantasy']).
-lettura_utente(125076, 'juujika_no_rokunin', on_hold, 1.0, ['gore', '_mystery', '_psychological', '_shounen', '_suspense']).
-lettura_utente(171811, 'juvenile_detention_center', reading, 5.0, ['action', '_drama']).
-lettura_utente(122353, 'kaette_kudasai!_akutsu-san', on_hold, 5.0, ['comedy', '_love_status_quo', '_romance']).
-lettura_utente(119022, 'kage_no_jitsuryokusha_ni_naritakute!', dropped, 4.0, ['action', '_comedy', '_fantasy', '_isekai', '_reincarnation']).
-lettura_utente(90125, 'kaguya-sama_wa_kokurasetai:_tensai-tachi_no_renai_zunousen', completed, 7.0, ['award_winning', '_comedy', '_romance', '_school', '_seinen']).
-lettura_utente(127907, 'kaijuu_8-gou', dropped, 6.0, ['action', '_adult_cast', '_fantasy', '_sci-fi', '_shounen', '_urban_fantasy']).
-lettura_utente(108948, 'kaitai_zanuff', completed, 4.0, ['horror', '_psychological', '_seinen']).
-lettura_utente(128784, 'kami_ni_aisareta_ko', dropped, 2.0, ['fantasy', '_slice_of_life']).
-lettura_utente(24808, 'kami_no_kodomo', completed, 3.0, ['horror', '_psychological']).
-lettura_utente(111228, 'kami-tachi_ni_hirowareta_otoko', plan_to_read, 0.0, ['adventure', '_fantasy', '_isekai', '_iyashikei', '_reincarnation']).
-lettura_utente(50217, 'kamisama_ga_uso_wo_tsuku.', completed, 7.0, ['drama', '_romance', '_school', '_seinen']).
-lettura_utente(90800, 'kanojo_wa_rokurokubi', completed, 5.0, ['comedy', '_school', '_shounen', '_supernatural']).
-lettura_utente(144267, 'kaoru_hana_wa_rin_to_saku', reading, 8.0, ['drama', '_romance', '_school']).
-lettura_utente(55377, 'kasane', plan_to_read, 0.0, ['drama', '_performing_arts', '_psychological', '_seinen', '_supernatural']).
-lettura_utente(119687, 'katabami_to_ougon', plan_to_read, 0.0, ['drama', '_historical', '_seinen']).
-lettura_utente(18161, 'katanagatari', plan_to_read, 0.0, ['action', '_adventure', '_comedy', '_romance', '_samurai']).
-lettura_utente(47, 'katekyou_hitman_reborn!', plan_to_read, 0.0, ['action', '_comedy', '_organized_crime', '_school', '_shounen', '_super_power']).
-lettura_utente(118196, 'kawaii_dake_ja_nai_shikimori-san', dropped, 3.0, ['comedy', '_romance']).
-lettura_utente(651, 'kaze_no_tani_no_nausicaä', plan_to_read, 0.0, ['action', '_adventure', '_award_winning', '_fantasy']).
-lettura_utente(72025, 'kengan_ashura', completed, 6.0, ['action', '_martial_arts']).
-lettura_utente(146979, 'kill_the_hero', dropped, 1.0, ['action', '_adventure', '_fantasy', '_time_travel']).
-lettura_utente(96792, 'kimetsu_no_yaiba', completed, 6.0, ['action', '_fantasy', '_historical', '_shounen']).
-lettura_utente(99314, 'kimi_no_na_wa.', completed, 6.0, ['drama', '_seinen']).
-lettura_utente(104538, 'kimi_no_suizou_wo_tabetai', completed, 8.0, ['drama', '_romance']).
-lettura_utente(121213, 'kimi_wa_houkago_insomnia', completed, 8.0, ['romance', '_school', '_seinen']).
-lettura_utente(16765, 'kingdom', reading, 9.0, ['action', '_award_winning', '_historical', '_military', '_seinen']).
-lettura_utente(131342, 'kizoku_tensei:_megumareta_umare_kara_saikyou_no_chikara_wo_eru', dropped, 3.0, ['action', '_adventure', '_fantasy', '_reincarnation']).
-lettura_utente(80119, 'kobayashi-san_chi_no_maid_dragon', dropped, 1.0, ['fantasy', '_slice_of_life']).
-lettura_utente(56805, 'koe_no_katachi', completed, 8.0, ['award_winning', '_drama', '_shounen']).
-lettura_utente(7375, 'kokou_no_hito', completed, 10.0, ['award_winning', '_drama', '_psychological', '_seinen', '_sports']).
-lettura_utente(99007, 'komi-san_wa,_comyushou_desu.', dropped, 4.0, ['award_winning', '_comedy', '_school', '_shounen']).
-lettura_utente(116772, 'kono_yuusha_ga_ore_tueee_kuse_ni_shinchou_sugiru', dropped, 4.0, ['action', '_adventure', '_comedy', '_fantasy', '_isekai', '_shounen']).
-lettura_utente(153492, 'koroshiya_no_oshi', dropped, 5.0, ['action', '_comedy', '_seinen']).
-lettura_utente(138703, 'kotoshi_no_mitsuishi-san_wa_dokoka_okashii', dropped, 3.0, ['comedy', '_romance', '_school']).
-lettura_utente(42579, 'kubera', dropped, 3.0, ['action', '_adventure', '_comedy', '_fantasy', '_romance']).
-lettura_utente(128093, 'kuchi_ga_saketemo_kimi_ni_wa', completed, 5.0, ['fantasy', '_romance', '_shounen']).
-lettura_utente(144453, 'kuchibeta_shokudou', on_hold, 5.0, ['comedy', '_slice_of_life']).
-lettura_utente(121615, 'kumichou_musume_to_sewagakari', reading, 5.0, ['childcare', '_organized_crime', '_slice_of_life']).
-lettura_utente(95012, 'kumo_desu_ga,_nani_ka?', completed, 6.0, ['action', '_adventure', '_comedy', '_fantasy', '_isekai', '_reincarnation']).
-lettura_utente(136979, 'kuroiwa_medaka_ni_watashi_no_kawaii_ga_tsuujinai', dropped, 3.0, ['comedy', '_love_status_quo', '_romance', '_school', '_shounen']).
-lettura_utente(3866, 'kuroshitsuji', plan_to_read, 0.0, ['action', '_fantasy', '_historical', '_mystery', '_mythology', '_shounen', '_supernatural']).
-lettura_utente(96050, 'kuzumi-kun,_kuuki_yometemasu_ka?', completed, 4.0, ['comedy', '_romance', '_school', '_shounen']).
-lettura_utente(117549, 'kyuujitsu_no_warumono-san', on_hold, 5.0, ['fantasy', '_iyashikei', '_slice_of_life', '_urban_fantasy']).
-lettura_utente(156825, 'last_on_earth', dropped, 3.0, ['action', '_adventure', '_fantasy']).
-lettura_utente(146982, 'latna_saga:_survival_of_a_sword_king', on_hold, 7.0, ['action', '_adventure', '_fantasy', '_isekai']).
-lettura_utente(150784, 'legend_of_an_asura:_the_poison_dragon', on_hold, 6.0, ['action', '_fantasy', '_martial_arts']).
-lettura_utente(171243, 'level_0_no_munou_tansakusha_to_sagesumaretemo_jitsu_wa_sekai_saikyou_desu:_tansaku_ranking_1-i_wa_nazo_no_hito', dropped, 2.0, ['action', '_adventure', '_fantasy', '_harem']).
-lettura_utente(148009, 'level_up_with_the_gods', dropped, 5.0, ['action', '_adventure', '_fantasy', '_time_travel']).
-lettura_utente(147460, 'leveling_beyond_the_max', dropped, 3.0, ['action', '_fantasy', '_isekai', '_martial_arts']).
-lettura_utente(148137, 'leviathan', dropped, 6.0, ['action', '_fantasy', '_survival']).
-lettura_utente(147981, 'little_rabbit_and_the_big_bad_leopard', completed, 5.0, ['anthropomorphic', '_fantasy', '_romance']).
-lettura_utente(147389, 'log-in_murim', plan_to_read, 0.0, ['action', '_adventure', '_fantasy', '_martial_arts']).
-lettura_utente(138673, 'look_back', plan_to_read, 0.0, ['drama', '_shounen']).
-lettura_utente(111202, 'lookism', reading, 7.0, ['action', '_comedy', '_drama', '_school', '_supernatural']).
-lettura_utente(132500, 'loop_7-kaime_no_akuyaku_reijou_wa,_moto_tekikoku_de_jiyuu_kimama_na_hanayome_seikatsu_wo_mankitsu_suru', dropped, 6.0, ['fantasy', '_romance', '_time_travel']).
-lettura_utente(147317, 'lout_of_count\'s_family', dropped, 4.0, ['fantasy', '_isekai', '_reincarnation']).
-lettura_utente(119152, 'lv2_kara_cheat_datta_motoyuusha_kouho_no_mattari_isekai_life', dropped, 5.0, ['adventure', '_fantasy', '_isekai', '_romance']).
-lettura_utente(91941, 'made_in_abyss', plan_to_read, 0.0, ['adventure', '_drama', '_fantasy', '_sci-fi']).
-lettura_utente(14790, 'magi', plan_to_read, 0.0, ['adventure', '_award_winning', '_fantasy', '_shounen']).
-lettura_utente(61189, 'mahoutsukai_no_yome', on_hold, 7.0, ['drama', '_fantasy', '_mythology', '_romance', '_shounen', '_urban_fantasy']).
-lettura_utente(160056, 'mahoutsukai_to_aka_no_pilgrim', completed, 7.0, ['adventure', '_fantasy']).
-lettura_utente(104241, 'mairimashita!_iruma-kun', dropped, 4.0, ['comedy', '_fantasy', '_shounen']).
-lettura_utente(1415, 'manhole', plan_to_read, 0.0, ['detective', '_horror', '_mystery', '_seinen']).
-lettura_utente(13387, 'march_story', plan_to_read, 0.0, ['action', '_drama', '_fantasy', '_horror', '_seinen', '_supernatural']).
-lettura_utente(124085, 'mashle', completed, 6.0, ['action', '_comedy', '_fantasy', '_gag_humor', '_parody', '_school', '_shounen']).
-lettura_utente(3579, 'mashounen_b.t.', completed, 4.0, ['action', '_comedy', '_fantasy', '_mystery', '_psychological', '_shounen', '_supernatural']).
-lettura_utente(848, 'master_keaton', plan_to_read, 0.0, ['adult_cast', '_adventure', '_drama', '_historical', '_military', '_mystery', '_seinen', '_slice_of_life']).
-lettura_utente(147820, 'master_villainess_the_invincible!', dropped, 5.0, ['action', '_fantasy', '_isekai', '_martial_arts', '_villainess']).
-lettura_utente(147455, 'masters_of_lightning_knives', on_hold, 5.0, ['action', '_martial_arts']).
-lettura_utente(110160, 'mata,_onaji_yume_wo_miteita', completed, 6.0, ['drama']).
-lettura_utente(147712, 'maybe_meant_to_be', reading, 6.0, ['adult_cast', '_comedy', '_romance']).
-lettura_utente(5711, 'megumi_no_daigo', plan_to_read, 0.0, ['action', '_award_winning', '_drama', '_shounen']).
-lettura_utente(105877, 'mobuko_no_koi', reading, 6.0, ['adult_cast', '_drama', '_romance', '_seinen']).
-lettura_utente(104440, 'monkey_peak', plan_to_read, 0.0, ['horror', '_seinen']).
-lettura_utente(1, 'monster', completed, 8.0, ['adult_cast', '_award_winning', '_drama', '_mystery', '_psychological', '_seinen']).
-lettura_utente(129808, 'mookhyang:_dark_lady', reading, 7.0, ['action', '_adventure', '_fantasy', '_magical_sex_shift']).
-lettura_utente(149141, 'mookhyang:_the_origin', completed, 6.0, ['action', '_adventure', '_fantasy']).
-lettura_utente(124471, 'moon_you', completed, 6.0, ['comedy', '_drama', '_sci-fi', '_space']).
-lettura_utente(147941, 'mori-chan_ken-chan', completed, 8.0, ['drama', '_memoir', '_seinen']).
-lettura_utente(658, 'mugen_no_juunin', plan_to_read, 5.0, ['action', '_adventure', '_drama', '_historical', '_martial_arts', '_samurai', '_seinen', '_supernatural']).
-lettura_utente(147642, 'murim_rpg_simulation', dropped, 5.0, ['action', '_adventure', '_fantasy', '_martial_arts', '_time_travel', '_video_game']).
-lettura_utente(418, 'mushishi', plan_to_read, 0.0, ['adult_cast', '_award_winning', '_fantasy', '_historical', '_iyashikei', '_mystery', '_seinen', '_supernatural']).
-lettura_utente(70259, 'mushoku_tensei:_isekai_ittara_honki_dasu', dropped, 2.0, ['fantasy', '_isekai', '_reincarnation', '_seinen']).
-lettura_utente(149438, 'my_blasted_reincarnated_life', dropped, 4.0, ['action', '_fantasy', '_reincarnation']).
-lettura_utente(148733, 'my_boss\'s_special_request', on_hold, 5.0, ['adult_cast', '_romance', '_workplace']).
-lettura_utente(148620, 'my_dad_is_too_strong', dropped, 3.0, ['action', '_comedy', '_fantasy']).
-lettura_utente(150203, 'my_daughter_is_the_final_boss', dropped, 3.0, ['action', '_childcare', '_fantasy', '_time_travel']).
-lettura_utente(151111, 'my_f-rank_high_school_life', dropped, 2.0, ['action', '_school', '_super_power']).
-lettura_utente(143627, 'my_gently_raised_beast', completed, 6.0, ['fantasy', '_romance']).
-lettura_utente(108032, 'my_home_hero', plan_to_read, 0.0, ['drama', '_seinen', '_suspense']).
-lettura_utente(147073, 'my_life_as_a_loser', dropped, 4.0, ['action', '_drama', '_school', '_time_travel']).
-lettura_utente(148958, 'my_master_is_a_backseat_gamer', dropped, 2.0, ['action', '_fantasy']).
-lettura_utente(151757, 'my_royal_awakening', completed, 6.0, ['drama', '_historical', '_reincarnation', '_time_travel']).
-lettura_utente(147202, 'my_s-class_hunters', dropped, 3.0, ['action', '_adventure', '_fantasy', '_time_travel']).
-lettura_utente(150561, 'mythic_item_obtained', on_hold, 6.0, ['action', '_fantasy']).
-lettura_utente(138533, 'nan_hao_shang_feng', reading, 7.0, ['comedy', '_school']).
-lettura_utente(28, 'nana', plan_to_read, 0.0, ['adult_cast', '_award_winning', '_drama', '_love_polygon', '_music', '_romance', '_shoujo']).
-lettura_utente(44485, 'nanatsu_no_taizai', dropped, 1.0, ['action', '_adventure', '_award_winning', '_fantasy', '_shounen']).
-lettura_utente(147863, 'nano_machine', dropped, 5.0, ['action', '_adventure', '_fantasy', '_martial_arts', '_sci-fi']).
-lettura_utente(112245, 'navillera:_like_a_butterfly', plan_to_read, 0.0, ['drama', '_performing_arts']).
-lettura_utente(102458, 'neko_no_otera_no_chion-san', plan_to_read, 0.0, ['seinen', '_slice_of_life']).
-lettura_utente(141226, 'neko_no_te_datte_yaku_ni_tatsu', dropped, 3.0, ['comedy', '_romance', '_supernatural']).
-lettura_utente(18753, 'nekojiru_udon', completed, 4.0, ['anthropomorphic', '_comedy', '_seinen']).
-lettura_utente(159130, 'nick_to_lever', completed, 6.0, ['comedy', '_gag_humor', '_seinen']).
-lettura_utente(119084, 'nihon_e_youkoso_elf-san.', dropped, 5.0, ['comedy', '_fantasy', '_isekai']).
-lettura_utente(39291, 'nijiiro_days', plan_to_read, 0.0, ['comedy', '_romance', '_school', '_shoujo']).
-lettura_utente(13290, 'ningen_shikkaku', plan_to_read, 0.0, ['drama', '_historical', '_psychological', '_seinen']).
-lettura_utente(123065, 'ninkyou_tensei:_isekai_no_yakuza_hime', reading, 7.0, ['action', '_adventure', '_fantasy', '_isekai', '_reincarnation', '_seinen']).
-lettura_utente(122775, 'nito_no_taida_na_isekai_shoukougun:_saijakushoku_\"healer\"_nanoni_saikyou_wa_cheat_desu_ka?', dropped, 4.0, ['action', '_adventure', '_fantasy', '_isekai', '_reincarnation']).
-lettura_utente(90423, 'no_guns_life', plan_to_read, 0.0, ['action', '_sci-fi', '_seinen']).
-lettura_utente(147769, 'no_home', completed, 5.0, ['school', '_slice_of_life']).
-lettura_utente(29983, 'noblesse', completed, 6.0, ['action', '_adventure', '_comedy', '_school', '_supernatural']).
-lettura_utente(12569, 'not_simple', plan_to_read, 0.0, ['drama', '_seinen', '_slice_of_life']).
-lettura_utente(163356, 'ogami_tsumiki_to_ki_nichijou.', dropped, 4.0, ['anthropomorphic', '_fantasy', '_love_status_quo', '_romance', '_school', '_shounen', '_urban_fantasy']).
-lettura_utente(112774, 'ojisama_to_neko', dropped, 5.0, ['pets', '_slice_of_life']).
-lettura_utente(114121, 'ojisan_wa_kawaii_mono_ga_osuki.', on_hold, 5.0, ['comedy']).
-lettura_utente(140520, 'okiraku_ryoushu_no_tanoshii_ryouchi_bouei', dropped, 3.0, ['fantasy']).
-lettura_utente(132214, 'omniscient_reader\'s_viewpoint', on_hold, 6.0, ['action', '_adventure', '_fantasy', '_urban_fantasy']).
-lettura_utente(143441, 'omniscient_reader\'s_viewpoint', completed, 7.0, ['action', '_adventure', '_fantasy', '_urban_fantasy']).
-lettura_utente(17465, 'omoide_emanon', completed, 8.0, ['drama', '_seinen']).
-lettura_utente(164732, 'omori', dropped, 3.0, ['horror', '_psychological', '_seinen']).
-lettura_utente(8967, 'onanie_master_kurosawa', completed, 4.0, ['drama', '_psychological', '_school']).
-lettura_utente(156716, 'one_day,_suddenly,_seoul_is', on_hold, 7.0, ['survival', '_suspense']).
-lettura_utente(13, 'one_piece', reading, 7.0, ['action', '_adventure', '_fantasy', '_shounen']).
-lettura_utente(145980, 'one_piece:_nami_vs._kalifa', completed, 2.0, ['action', '_adventure', '_fantasy']).
-lettura_utente(44347, 'one_punch-man', reading, 8.0, ['action', '_comedy', '_parody', '_seinen', '_super_power']).
-lettura_utente(112592, 'oniichan_wa_oshimai!', dropped, 2.0, ['cgdct', '_comedy', '_magical_sex_shift']).
-lettura_utente(3299, 'ookami_to_koushinryou', completed, 7.0, ['adult_cast', '_adventure', '_drama', '_fantasy', '_historical', '_romance', '_seinen', '_supernatural']).
-lettura_utente(121083, 'ookami_wa_nemuranai', plan_to_read, 0.0, ['action', '_adventure', '_fantasy', '_isekai']).
-lettura_utente(35573, 'orange', plan_to_read, 0.0, ['drama', '_love_polygon', '_romance', '_school', '_sci-fi', '_shoujo', '_time_travel']).
-lettura_utente(1211, 'ore_to_akuma_no_blues', on_hold, 8.0, ['drama', '_historical', '_horror', '_psychological', '_seinen']).
-lettura_utente(11514, 'otoyomegatari', plan_to_read, 0.0, ['award_winning', '_historical', '_romance', '_seinen']).
-lettura_utente(123397, 'ou_no_kemono:_enpei_no_arcana', plan_to_read, 0.0, ['crossdressing', '_drama', '_fantasy', '_romance', '_shoujo']).
-lettura_utente(147727, 'overgeared', dropped, 4.0, ['action', '_fantasy', '_video_game']).
-lettura_utente(81667, 'overlord', plan_to_read, 0.0, ['action', '_fantasy', '_isekai']).
-lettura_utente(4632, 'oyasumi_punpun', completed, 9.0, ['drama', '_psychological', '_seinen', '_slice_of_life']).
-lettura_utente(3031, 'pandora_hearts', plan_to_read, 0.0, ['adventure', '_fantasy', '_mystery', '_shounen']).
-lettura_utente(154587, 'pick_me_up', plan_to_read, 0.0, ['action', '_fantasy', '_isekai', '_video_game']).
-lettura_utente(146750, 'pigpen', completed, 7.0, ['horror', '_psychological', '_survival', '_suspense']).
-lettura_utente(5744, 'ping_pong', plan_to_read, 0.0, ['drama', '_seinen', '_sports']).
-lettura_utente(481, 'planetes', plan_to_read, 0.0, ['adult_cast', '_award_winning', '_drama', '_psychological', '_sci-fi', '_seinen', '_slice_of_life', '_space', '_workplace']).
-lettura_utente(149871, 'player', on_hold, 6.0, ['action', '_adventure', '_fantasy', '_isekai']).
-lettura_utente(745, 'pluto', plan_to_read, 0.0, ['action', '_award_winning', '_detective', '_mystery', '_psychological', '_sci-fi', '_seinen', '_suspense']).
-lettura_utente(119260, 'ponkotsu_fuuki_iin_to_skirt-take_ga_futekisetsu_na_jk_no_hanashi', dropped, 4.0, ['comedy', '_romance', '_school', '_shounen']).
-lettura_utente(3438, 'psyren', plan_to_read, 0.0, ['action', '_adventure', '_high_stakes_game', '_psychological', '_romance', '_sci-fi', '_shounen', '_strategy_game', '_super_power', '_supernatural']).
-lettura_utente(106733, 'ragna_crimson', plan_to_read, 0.0, ['action', '_fantasy', '_shounen']).
-lettura_utente(7482, 'rainbow:_nisha_rokubou_no_shichinin', plan_to_read, 0.0, ['award_winning', '_delinquents', '_drama', '_historical', '_psychological', '_seinen']).
-lettura_utente(109229, 'raise_wa_tanin_ga_ii', reading, 8.0, ['organized_crime', '_romance', '_seinen']).
-lettura_utente(22986, 'ran_to_haiiro_no_sekai', plan_to_read, 0.0, ['drama', '_fantasy', '_romance', '_seinen', '_supernatural']).
-lettura_utente(146774, 'random_chat', completed, 3.0, ['action', '_drama', '_school']).
-lettura_utente(73271, 're:monster', dropped, 3.0, ['action', '_adventure', '_fantasy', '_isekai', '_reincarnation']).
-lettura_utente(657, 'real', plan_to_read, 0.0, ['award_winning', '_drama', '_psychological', '_seinen', '_sports', '_team_sports']).
-lettura_utente(151157, 'reality_quest', dropped, 5.0, ['action', '_school', '_supernatural']).
-lettura_utente(147924, 'reborn_as_a_scholar', completed, 6.0, ['action', '_martial_arts', '_reincarnation']).
-lettura_utente(181605, 'red_shirt', dropped, 2.0, ['action', '_drama']).
-lettura_utente(148512, 'reincarnated_as_an_unruly_heir', dropped, 5.0, ['action', '_martial_arts', '_reincarnation']).
-lettura_utente(168981, 'reincarnated_murim_lord', reading, 6.0, ['action', '_fantasy', '_martial_arts', '_reincarnation']).
-lettura_utente(161442, 'reincarnation_of_the_veteran_soldier', on_hold, 6.0, ['action', '_adult_cast', '_fantasy', '_isekai']).
-lettura_utente(78523, 'relife', dropped, 4.0, ['comedy', '_drama', '_romance', '_school', '_slice_of_life']).
-lettura_utente(158010, 'return_of_the_bloodthirsty_police', dropped, 5.0, ['action', '_organized_crime', '_reincarnation']).
-lettura_utente(146878, 'return_of_the_blossoming_blade', reading, 7.0, ['action', '_adventure', '_fantasy', '_martial_arts', '_reincarnation']).
-lettura_utente(147577, 'return_of_the_mad_demon', reading, 6.0, ['action', '_martial_arts', '_time_travel']).
-lettura_utente(149349, 'return_of_the_scholar', dropped, 3.0, ['action', '_fantasy', '_martial_arts']).
-lettura_utente(153399, 'return_of_the_war_god', reading, 6.0, ['action', '_fantasy', '_martial_arts']).
-lettura_utente(152612, 'returning_with_absolutely_nothing', on_hold, 6.0, ['action', '_fantasy', '_isekai', '_time_travel']).
-lettura_utente(157888, 'revenge_of_the_baskerville_bloodhound', dropped, 2.0, ['action', '_fantasy', '_time_travel']).
-lettura_utente(148002, 'reverse_villain', completed, 2.0, ['action', '_reincarnation', '_supernatural']).
-lettura_utente(78477, 'rikudou', plan_to_read, 0.0, ['combat_sports', '_drama', '_seinen', '_sports']).
-lettura_utente(148729, 'rooftop_swordmaster', dropped, 2.0, ['action', '_supernatural']).
-lettura_utente(148511, 'rookie_chef_with_the_magic_touch', dropped, 3.0, ['drama', '_gourmet']).
-lettura_utente(915, 'rookies', plan_to_read, 0.0, ['comedy', '_delinquents', '_drama', '_school', '_shounen', '_slice_of_life', '_sports', '_team_sports']).
-lettura_utente(104298, 'route_end', plan_to_read, 0.0, ['detective', '_mystery', '_shounen', '_suspense']).
-lettura_utente(148054, 'ruri_dragon', completed, 5.0, ['school', '_shounen', '_slice_of_life', '_supernatural']).
-lettura_utente(109339, 'saihate_no_paladin', plan_to_read, 0.0, ['action', '_adventure', '_fantasy', '_isekai', '_reincarnation']).
-lettura_utente(37755, 'saiki_kusuo_no_ψ-nan', dropped, 4.0, ['comedy', '_gag_humor', '_school', '_shounen', '_super_power', '_supernatural']).
-lettura_utente(3575, 'saikyou_densetsu_kurosawa', plan_to_read, 0.0, ['action', '_comedy', '_delinquents', '_drama', '_psychological', '_seinen', '_suspense']).
-lettura_utente(116701, 'saikyou_juzoku_tensei:_majutsu_otaku_no_risoukyou', dropped, 3.0, ['adventure', '_fantasy', '_isekai', '_reincarnation']).
-lettura_utente(159741, 'saitei_chara_ni_tensei_shita_ore_wa_ikinokoritai', dropped, 3.0, ['adventure', '_fantasy', '_isekai', '_reincarnation', '_video_game']).
-lettura_utente(131334, 'sakamoto_days', on_hold, 7.0, ['action', '_comedy', '_shounen']).
-lettura_utente(48649, 'sakamoto_desu_ga?', completed, 6.0, ['comedy', '_gag_humor', '_school', '_seinen']).
-lettura_utente(145863, 'sayonara_eri', completed, 8.0, ['drama', '_shounen']).
-lettura_utente(661, 'sayonara_zetsubou_sensei', completed, 4.0, ['award_winning', '_comedy', '_gag_humor', '_parody', '_school', '_shounen']).
-lettura_utente(145539, 'seasons_of_blossom', completed, 8.0, ['love_polygon', '_romance']).
-lettura_utente(147091, 'seihantai_na_kimi_to_boku', reading, 7.0, ['comedy', '_romance', '_school', '_shounen']).
-lettura_utente(1827, 'shaman_warrior', plan_to_read, 0.0, ['action', '_adventure', '_drama', '_fantasy', '_martial_arts']).
-lettura_utente(148655, 'shark', reading, 6.0, ['action', '_drama']).
-lettura_utente(157543, 'shibatarian', completed, 3.0, ['psychological', '_shounen', '_suspense']).
-lettura_utente(37707, 'shigatsu_wa_kimi_no_uso', completed, 9.0, ['award_winning', '_drama', '_music', '_romance', '_school', '_shounen']).
-lettura_utente(3868, 'shigurui', plan_to_read, 0.0, ['action', '_drama', '_gore', '_historical', '_martial_arts', '_samurai', '_seinen']).
-lettura_utente(117851, 'shimeji_simulation', completed, 7.0, ['school', '_slice_of_life']).
-lettura_utente(23390, 'shingeki_no_kyojin', completed, 7.0, ['action', '_award_winning', '_drama', '_gore', '_military', '_shounen', '_survival', '_suspense']).
-lettura_utente(57795, 'shingeki_no_kyojin:_before_the_fall', plan_to_read, 0.0, ['action', '_drama', '_fantasy', '_shounen', '_supernatural']).
-lettura_utente(58007, 'shingeki_no_kyojin:_kuinaki_sentaku', completed, 6.0, ['action', '_shoujo']).
-lettura_utente(146751, 'shotgun_boy', completed, 6.0, ['action', '_horror', '_psychological', '_survival', '_suspense']).
-lettura_utente(72467, 'shoujo_shuumatsu_ryokou', completed, 9.0, ['adventure', '_award_winning', '_iyashikei', '_slice_of_life']).
-lettura_utente(126699, 'shounen_no_abyss', plan_to_read, 0.0, ['drama', '_psychological', '_seinen']).
-lettura_utente(110485, 'shuumatsu_no_walküre', on_hold, 7.0, ['action', '_fantasy', '_mythology', '_seinen']).
-lettura_utente(118289, 'skip_to_loafer', dropped, 7.0, ['award_winning', '_drama', '_school', '_seinen']).
-lettura_utente(51, 'slam_dunk', completed, 8.0, ['award_winning', '_school', '_shounen', '_sports', '_team_sports']).
-lettura_utente(154009, 'slave_b', dropped, 3.0, ['action', '_adventure', '_drama', '_fantasy']).
-lettura_utente(110288, 'slime_taoshite_300-nen,_shiranai_uchi_ni_level_max_ni_nattemashita', dropped, 3.0, ['comedy', '_fantasy', '_isekai', '_reincarnation']).
-lettura_utente(3731, 'solanin', plan_to_read, 0.0, ['drama', '_seinen', '_slice_of_life']).
-lettura_utente(119184, 'solo_leveling', completed, 6.0, ['action', '_adult_cast', '_adventure', '_fantasy', '_urban_fantasy']).
-lettura_utente(121496, 'solo_leveling', completed, 6.0, ['action', '_adult_cast', '_adventure', '_fantasy', '_urban_fantasy']).
-lettura_utente(172429, 'solo_leveling:_ragnarok', reading, 7.0, ['action', '_adult_cast', '_adventure', '_fantasy', '_urban_fantasy']).
-lettura_utente(96573, 'something_about_us', completed, 7.0, ['romance', '_school']).
-lettura_utente(112268, 'sono_bisque_doll_wa_koi_wo_suru', on_hold, 6.0, ['otaku_culture', '_romance', '_school', '_seinen']).
-lettura_utente(126287, 'sousou_no_frieren', on_hold, 8.0, ['adventure', '_award_winning', '_drama', '_fantasy', '_shounen']).
-lettura_utente(119161, 'spy_x_family', reading, 7.0, ['action', '_childcare', '_comedy', '_shounen']).
-lettura_utente(93516, 'sq:_begin_w/your_name!', completed, 7.0, ['comedy', '_girls_love', '_school', '_slice_of_life']).
-lettura_utente(146909, 'sss-class_revival_hunter', on_hold, 6.0, ['action', '_adventure', '_fantasy', '_time_travel']).
-lettura_utente(146752, 'study_group', reading, 6.0, ['action', '_delinquents', '_school']).
-lettura_utente(116539, 'subete_no_jinrui_wo_hakai_suru._sorera_wa_saisei_dekinai.', plan_to_read, 0.0, ['school', '_shounen', '_strategy_game']).
-lettura_utente(110031, 'summertime_render', dropped, 3.0, ['mystery', '_shounen', '_supernatural', '_suspense', '_time_travel']).
-lettura_utente(8848, 'sun-ken_rock', dropped, 3.0, ['action', '_comedy', '_drama', '_ecchi', '_seinen']).
-lettura_utente(148467, 'super_no_ura_de_yani_suu_futari', reading, 7.0, ['adult_cast', '_love_status_quo', '_romance']).
-lettura_utente(8438, 'super-conductive_brains', completed, 5.0, ['avant_garde', '_seinen']).
-lettura_utente(1533, 'superior', completed, 4.0, ['action', '_adventure', '_drama', '_fantasy', '_romance', '_shounen']).
-lettura_utente(147276, 'surviving_romance', completed, 5.0, ['horror', '_school', '_survival', '_suspense']).
-lettura_utente(124845, 'sweet_home', completed, 9.0, ['action', '_drama', '_gore', '_horror', '_suspense']).
-lettura_utente(142600, 'takopii_no_genzai', completed, 7.0, ['drama', '_psychological', '_sci-fi', '_shounen']).
-lettura_utente(151012, 'tale_of_a_scribe_who_retires_to_the_countryside', dropped, 4.0, ['action', '_adventure', '_fantasy', '_martial_arts']).
-lettura_utente(146966, 'teenage_mercenary', reading, 6.0, ['action', '_school']).
-lettura_utente(153158, 'telework_yotabanashi', completed, 5.0, ['adult_cast', '_romance', '_seinen']).
-lettura_utente(72451, 'ten_prism', dropped, 3.0, ['action', '_adventure', '_drama', '_fantasy', '_seinen']).
-lettura_utente(111745, 'tengoku_daimakyou', dropped, 5.0, ['adventure', '_mystery', '_sci-fi', '_seinen']).
-lettura_utente(168656, 'tensei_akuma_no_saikyou_yuusha_ikusei_keikaku', dropped, 4.0, ['adventure', '_childcare', '_fantasy', '_isekai']).
-lettura_utente(113178, 'tensei_shitara_dragon_no_tamago_datta:_ibara_no_dragon_road', dropped, 4.0, ['action', '_adventure', '_fantasy', '_isekai', '_reincarnation']).
-lettura_utente(87609, 'tensei_shitara_slime_datta_ken', dropped, 3.0, ['award_winning', '_fantasy', '_isekai', '_reincarnation', '_shounen']).
-lettura_utente(11366, 'teppuu', completed, 7.0, ['action', '_combat_sports', '_drama', '_psychological', '_seinen', '_sports']).
-lettura_utente(37563, 'terra_formars', plan_to_read, 0.0, ['action', '_gore', '_horror', '_sci-fi', '_seinen', '_survival']).
-lettura_utente(148850, 'terror_man', completed, 6.0, ['action', '_supernatural']).
-lettura_utente(162700, 'the_academy\'s_genius_swordsman', dropped, 3.0, ['action', '_fantasy', '_time_travel']).
-lettura_utente(165031, 'the_apothecary_prince', dropped, 3.0, ['adventure', '_fantasy', '_isekai', '_reincarnation']).
-lettura_utente(147693, 'the_archmage_returns_after_4000_years', dropped, 5.0, ['action', '_adventure', '_fantasy', '_reincarnation']).
-lettura_utente(155284, 'the_baengri_clan\'s_unwanted_granddaughter', reading, 6.0, ['fantasy', '_time_travel', '_villainess']).
-lettura_utente(141120, 'the_boxer', completed, 9.0, ['combat_sports', '_drama', '_sports']).
-lettura_utente(8586, 'the_breaker', completed, 7.0, ['action', '_comedy', '_drama', '_martial_arts', '_school']).
-lettura_utente(22651, 'the_breaker:_new_waves', completed, 6.0, ['action', '_comedy', '_drama', '_martial_arts', '_romance', '_school']).
-lettura_utente(147569, 'the_celestial_returned_from_hell', dropped, 4.0, ['action', '_fantasy', '_urban_fantasy']).
-lettura_utente(173090, 'the_dang_clan\'s_swordmaster_heir_just_wants_a_normal_life', reading, 6.0, ['action', '_fantasy', '_martial_arts', '_reincarnation']).
-lettura_utente(157232, 'the_dark_mage\'s_return_to_enlistment', dropped, 4.0, ['action', '_fantasy', '_military']).
-lettura_utente(148421, 'the_divine_surgeon', plan_to_read, 0.0, ['drama', '_historical', '_medical', '_reincarnation', '_time_travel']).
-lettura_utente(147489, 'the_druid_of_seoul_station', dropped, 2.0, ['action', '_fantasy', '_isekai']).
-lettura_utente(152195, 'the_dungeon_cleaning_life_of_a_once_genius_hunter', dropped, 3.0, ['action', '_fantasy', '_time_travel']).
-lettura_utente(87844, 'the_fable', completed, 9.0, ['adult_cast', '_award_winning', '_comedy', '_organized_crime', '_seinen', '_suspense']).
-lettura_utente(146787, 'the_gamer', dropped, 2.0, ['action', '_fantasy', '_school']).
-lettura_utente(111996, 'the_god_of_high_school', completed, 6.0, ['action', '_adventure', '_fantasy', '_martial_arts', '_urban_fantasy']).
-lettura_utente(148454, 'the_grand_mudang_saga', on_hold, 5.0, ['action', '_fantasy', '_martial_arts', '_reincarnation']).
-lettura_utente(147272, 'the_greatest_estate_developer', dropped, 6.0, ['adventure', '_comedy', '_fantasy', '_isekai', '_reincarnation']).
-lettura_utente(150455, 'the_hero_returns', dropped, 3.0, ['action', '_fantasy', '_reincarnation', '_time_travel']).
-lettura_utente(125036, 'the_horizon', completed, 9.0, ['adventure', '_drama', '_psychological']).
-lettura_utente(154692, 'the_infinite_mage', reading, 6.0, ['action', '_adventure', '_fantasy']).
-lettura_utente(159140, 'the_knight_king_who_returned_with_a_god', dropped, 5.0, ['action', '_fantasy']).
-lettura_utente(170427, 'the_knight_only_lives_today', reading, 7.0, ['action', '_fantasy', '_time_travel']).
-lettura_utente(146827, 'the_lazy_lord_masters_the_sword', on_hold, 6.0, ['action', '_fantasy']).
-lettura_utente(134744, 'the_legend_of_the_northern_blade', completed, 8.0, ['action', '_adventure', '_fantasy', '_martial_arts']).
-lettura_utente(147536, 'the_legendary_moonlight_sculptor', dropped, 3.0, ['action', '_adventure', '_fantasy', '_video_game']).
-lettura_utente(148679, 'the_lord_of_coins', plan_to_read, 0.0, ['action', '_adventure', '_fantasy', '_time_travel']).
-lettura_utente(147322, 'the_max_level_hero_strikes_back', dropped, 2.0, ['action', '_adventure', '_fantasy']).
-lettura_utente(153509, 'the_nine_heavens_swordmaster', reading, 4.0, ['action', '_fantasy', '_martial_arts']).
-lettura_utente(148985, 'the_novel\'s_extra', dropped, 3.0, ['action', '_fantasy', '_isekai', '_reincarnation', '_school']).
-lettura_utente(165038, 'the_outcast_is_a_fighter', dropped, 3.0, ['combat_sports', '_reincarnation', '_sports']).
-lettura_utente(1320, 'the_ravages_of_time', plan_to_read, 0.0, ['action', '_adventure', '_historical', '_military']).
-lettura_utente(150422, 'the_reaper', reading, 6.0, ['action', '_fantasy', '_martial_arts']).
-lettura_utente(149305, 'the_red_book', completed, 4.0, ['horror']).
-lettura_utente(174559, 'the_regressed_mercenary_has_a_plan', dropped, 4.0, ['action', '_fantasy', '_time_travel']).
-lettura_utente(149013, 'the_return_of_the_disaster-class_hero', dropped, 4.0, ['action', '_fantasy']).
-lettura_utente(180758, 'the_returned_c-rank_tank_won\'t_die!', dropped, 2.0, ['action', '_fantasy', '_urban_fantasy']).
-lettura_utente(146761, 'the_skeleton_soldier_failed_to_defend_the_dungeon', dropped, 4.0, ['action', '_adventure', '_fantasy', '_time_travel']).
-lettura_utente(150546, 'the_slumbering_ranker', dropped, 2.0, ['action', '_fantasy', '_video_game']).
-lettura_utente(149572, 'the_stormy_inn', dropped, 4.0, ['action', '_fantasy', '_martial_arts']).
-lettura_utente(148961, 'the_superhuman_era', reading, 8.0, ['action', '_super_power']).
-lettura_utente(146949, 'the_swordmaster\'s_son', dropped, 3.0, ['action', '_adventure', '_fantasy']).
-lettura_utente(162696, 'the_terminally_ill_young_master_of_the_baek_clan', dropped, 3.0, ['action', '_fantasy', '_martial_arts']).
-lettura_utente(146856, 'the_tutorial_is_too_tough!', dropped, 4.0, ['action', '_fantasy', '_isekai', '_survival']).
-lettura_utente(147217, 'the_world_after_the_fall', on_hold, 6.0, ['action', '_fantasy']).
-lettura_utente(1408, 'the_world_is_mine', plan_to_read, 0.0, ['psychological', '_seinen']).
-lettura_utente(20647, 'thermae_romae', completed, 6.0, ['award_winning', '_comedy', '_historical', '_seinen', '_time_travel']).
-lettura_utente(109773, 'theseus_no_fune', plan_to_read, 0.0, ['drama', '_mystery', '_seinen']).
-lettura_utente(155755, 'this_is_the_law', dropped, 5.0, ['drama', '_supernatural', '_time_travel']).
-lettura_utente(3159, 'tista', completed, 4.0, ['action', '_drama', '_shounen']).
-lettura_utente(148139, 'to_not_die', on_hold, 6.0, ['action', '_drama']).
-lettura_utente(3572, 'tobaku_mokushiroku_kaiji', plan_to_read, 0.0, ['adult_cast', '_award_winning', '_drama', '_high_stakes_game', '_seinen', '_strategy_game']).
-lettura_utente(102165, 'tokidoki', completed, 7.0, ['drama', '_romance', '_school', '_shounen']).
-lettura_utente(149334, 'tokidoki_bosotto_russia-go_de_dereru_tonari_no_alya-san', on_hold, 5.0, ['comedy', '_romance', '_school']).
-lettura_utente(33327, 'tokyo_ghoul', completed, 8.0, ['action', '_fantasy', '_gore', '_horror', '_psychological', '_seinen', '_urban_fantasy']).
-lettura_utente(69879, 'tokyo-hatsu_isekai-yuki', completed, 6.0, ['comedy', '_fantasy', '_mystery', '_seinen', '_supernatural']).
-lettura_utente(130216, 'tomb_raider_king', completed, 3.0, ['action', '_adventure', '_fantasy', '_time_travel']).
-lettura_utente(912, 'tomie', completed, 2.0, ['drama', '_gore', '_horror', '_shoujo', '_supernatural']).
-lettura_utente(92149, 'tomo-chan_wa_onnanoko!', completed, 5.0, ['comedy', '_romance', '_school']).
-lettura_utente(105747, 'tondemo_skill_de_isekai_hourou_meshi', on_hold, 7.0, ['adventure', '_comedy', '_fantasy', '_gourmet', '_isekai']).
-lettura_utente(100035, 'tongari_boushi_no_atelier', plan_to_read, 7.0, ['fantasy', '_seinen']).
-lettura_utente(124154, 'toorigakari_ni_one_point_advice_shiteiku_type_no_yankee', completed, 6.0, ['comedy']).
-lettura_utente(110771, 'toshokan_no_daimajutsushi', plan_to_read, 0.0, ['fantasy', '_seinen']).
-lettura_utente(93972, 'totsukuni_no_shoujo', completed, 8.0, ['fantasy', '_shounen']).
-lettura_utente(122663, 'tower_of_god', on_hold, 6.0, ['action', '_adventure', '_drama', '_fantasy', '_mystery']).
-lettura_utente(703, 'trigun', plan_to_read, 0.0, ['action', '_adult_cast', '_adventure', '_comedy', '_sci-fi', '_shounen']).
-lettura_utente(704, 'trigun_maximum', plan_to_read, 0.0, ['action', '_adult_cast', '_adventure', '_award_winning', '_comedy', '_drama', '_sci-fi', '_seinen']).
-lettura_utente(131924, 'tsue_to_tsurugi_no_wistoria', dropped, 4.0, ['action', '_fantasy', '_school', '_shounen']).
-lettura_utente(181465, 'tsuihou_sareta_kajishi_wa_cheat_skill_de_densetsu_wo_tsukurimakuru:_konyakusha_ni_mise_wo_oidasareta_kedo,_kimama_ni_mono_tsukutteirareru_ima_no_hou_ga_shiawase_desu', dropped, 2.0, ['action', '_fantasy']).
-lettura_utente(90117, 'tsuki_ga_michibiku_isekai_douchuu', dropped, 3.0, ['adventure', '_fantasy', '_isekai']).
-lettura_utente(116367, 'tuixiu_de_yongzhemen', completed, 5.0, ['action', '_fantasy']).
-lettura_utente(14483, 'uchuu_kyoudai', plan_to_read, 0.0, ['adult_cast', '_award_winning', '_drama', '_sci-fi', '_seinen', '_space', '_workplace']).
-lettura_utente(18570, 'ultra_heaven', plan_to_read, 0.0, ['avant_garde', '_drama', '_psychological', '_sci-fi', '_seinen']).
-lettura_utente(114043, 'umarekawattemo_mata,_watashi_to_kekkon_shitekuremasu_ka', completed, 6.0, ['romance']).
-lettura_utente(142457, 'umi_ga_hashiru_end_roll', plan_to_read, 0.0, ['shoujo', '_slice_of_life']).
-lettura_utente(127127, 'umibe_no_q', plan_to_read, 0.0, ['drama', '_school', '_sci-fi', '_seinen']).
-lettura_utente(131843, 'unholy_blood', dropped, 5.0, ['action', '_romance', '_supernatural', '_vampire']).
-lettura_utente(136975, 'unmei_no_hito_ni_deau_hanashi', plan_to_read, 0.0, ['romance', '_shoujo']).
-lettura_utente(110766, 'urasekai_picnic', plan_to_read, 0.0, ['action', '_fantasy', '_mystery', '_shounen']).
-lettura_utente(172843, 'urenokori_no_dorei_elf_wo_hirotta_node,_musume_ni_suru_koto_ni_shita', on_hold, 5.0, ['childcare', '_fantasy', '_seinen']).
-lettura_utente(3468, 'usagi_drop', completed, 2.0, ['childcare', '_comedy', '_drama', '_josei', '_slice_of_life']).
-lettura_utente(9982, 'usogui', plan_to_read, 0.0, ['action', '_high_stakes_game', '_psychological', '_seinen', '_strategy_game']).
-lettura_utente(146207, 'usuzumi_no_hate', reading, 7.0, ['adventure', '_sci-fi', '_seinen']).
-lettura_utente(436, 'uzumaki', completed, 4.0, ['drama', '_horror', '_seinen', '_supernatural']).
-lettura_utente(656, 'vagabond', completed, 10.0, ['action', '_adventure', '_award_winning', '_historical', '_samurai', '_seinen']).
-lettura_utente(121151, 'vampire_dormitory', dropped, 3.0, ['crossdressing', '_romance', '_shoujo', '_supernatural', '_vampire']).
-lettura_utente(147191, 'villain_to_kill', dropped, 6.0, ['action', '_super_power']).
-lettura_utente(151550, 'villain_with_a_crush', dropped, 5.0, ['comedy', '_romance', '_super_power']).
-lettura_utente(642, 'vinland_saga', reading, 9.0, ['action', '_adventure', '_award_winning', '_drama', '_historical', '_seinen']).
-lettura_utente(139164, 'viral_hit', completed, 6.0, ['action', '_martial_arts', '_school']).
-lettura_utente(147724, 'volcanic_age', dropped, 5.0, ['action', '_adventure', '_fantasy', '_martial_arts', '_time_travel']).
-lettura_utente(15916, 'waga_tousou', completed, 5.0, ['historical']).
-lettura_utente(19790, 'wanitokagegisu', plan_to_read, 0.0, ['comedy', '_seinen', '_slice_of_life']).
-lettura_utente(131338, 'whale_star:_the_gyeongseong_mermaid', plan_to_read, 0.0, ['drama', '_historical', '_romance']).
-lettura_utente(118575, 'who_invited_you?', plan_to_read, 0.0, ['comedy', '_drama', '_romance']).
-lettura_utente(121269, 'who_made_me_a_princess', dropped, 4.0, ['drama', '_fantasy', '_reincarnation']).
-lettura_utente(103237, 'wind_breaker', dropped, 6.0, ['action', '_drama', '_sports']).
-lettura_utente(48151, 'world_trigger', plan_to_read, 0.0, ['action', '_sci-fi', '_shounen']).
-lettura_utente(89087, 'wotaku_ni_koi_wa_muzukashii', completed, 6.0, ['adult_cast', '_comedy', '_otaku_culture', '_romance', '_workplace']).
-lettura_utente(130633, 'yaiteru_futari', on_hold, 5.0, ['gourmet', '_romance', '_seinen', '_slice_of_life']).
-lettura_utente(100128, 'yakusoku_no_neverland', completed, 7.0, ['award_winning', '_mystery', '_psychological', '_shounen', '_survival', '_suspense']).
-lettura_utente(125052, 'yamada-kun_to_lv999_no_koi_wo_suru', plan_to_read, 0.0, ['romance', '_video_game']).
-lettura_utente(121480, 'yofukashi_no_uta', completed, 5.0, ['award_winning', '_romance', '_shounen', '_supernatural', '_vampire']).
-lettura_utente(4, 'yokohama_kaidashi_kikou', completed, 6.0, ['award_winning', '_iyashikei', '_sci-fi', '_seinen', '_slice_of_life']).
-lettura_utente(17910, 'yomawari_sensei', plan_to_read, 0.0, ['drama', '_psychological', '_school', '_seinen']).
-lettura_utente(152825, 'yongsa_high:_dungeon_raiders', dropped, 3.0, ['action', '_fantasy', '_school']).
-lettura_utente(164902, 'yoru_no_manimani', completed, 5.0, ['romance']).
-lettura_utente(104, 'yotsuba_to!', dropped, 5.0, ['award_winning', '_childcare', '_comedy', '_iyashikei', '_slice_of_life']).
-lettura_utente(98436, 'youjo_senki', plan_to_read, 0.0, ['action', '_fantasy', '_isekai', '_military', '_reincarnation']).
-lettura_utente(93416, 'youkai_gakkou_no_sensei_hajimemashita!', dropped, 2.0, ['comedy', '_fantasy', '_gag_humor', '_mythology', '_school', '_workplace']).
-lettura_utente(58245, 'youkai_kyoushitsu', completed, 4.0, ['horror', '_josei', '_supernatural']).
-lettura_utente(121426, 'yozakura-san_chi_no_daisakusen', dropped, 5.0, ['action', '_comedy', '_shounen']).
-lettura_utente(62547, 'yugami-kun_ni_wa_tomodachi_ga_inai', completed, 7.0, ['comedy', '_school', '_shounen', '_slice_of_life']).
-lettura_utente(94376, 'yuru_camp△', dropped, 4.0, ['cgdct', '_iyashikei', '_slice_of_life']).
-lettura_utente(107575, 'yuukyuu_no_gusha_asley_no,_kenja_no_susume:_to,_pochi_no_daibouken', dropped, 3.0, ['fantasy']).
-lettura_utente(142818, 'zeikin_de_katta_hon', on_hold, 0.0, ['seinen', '_slice_of_life', '_workplace']).
-lettura_utente(122392, 'zom_100:_zombie_ni_naru_made_ni_shitai_100_no_koto', dropped, 5.0, ['adult_cast', '_comedy', '_seinen', '_survival', '_suspense']).
+manga_genere('action', 2).
+manga_genere('adventure', 2).
+manga_genere('award_winning', 2).
+manga_genere('drama', 2).
+manga_genere('fantasy', 2).
+manga_genere('gore', 2).
+manga_genere('horror', 2).
+manga_genere('military', 2).
+manga_genere('psychological', 2).
+manga_genere('seinen', 2).
+manga_genere('action', 1706).
+manga_genere('adventure', 1706).
+manga_genere('historical', 1706).
+manga_genere('mystery', 1706).
+manga_genere('seinen', 1706).
+manga_genere('shounen', 1706).
+manga_genere('supernatural', 1706).
+manga_genere('action', 656).
+manga_genere('adventure', 656).
+manga_genere('award_winning', 656).
+manga_genere('historical', 656).
+manga_genere('samurai', 656).
+manga_genere('seinen', 656).
+manga_genere('action', 13).
+manga_genere('adventure', 13).
+manga_genere('fantasy', 13).
+manga_genere('shounen', 13).
+manga_genere('adult_cast', 1).
+manga_genere('award_winning', 1).
+manga_genere('drama', 1).
+manga_genere('mystery', 1).
+manga_genere('psychological', 1).
+manga_genere('seinen', 1).
+manga_genere('award_winning', 51).
+manga_genere('school', 51).
+manga_genere('shounen', 51).
+manga_genere('sports', 51).
+manga_genere('team_sports', 51).
+manga_genere('action', 642).
+manga_genere('adventure', 642).
+manga_genere('award_winning', 642).
+manga_genere('drama', 642).
+manga_genere('historical', 642).
+manga_genere('seinen', 642).
+manga_genere('action', 25).
+manga_genere('adventure', 25).
+manga_genere('award_winning', 25).
+manga_genere('drama', 25).
+manga_genere('fantasy', 25).
+manga_genere('military', 25).
+manga_genere('shounen', 25).
+manga_genere('comedy', 70345).
+manga_genere('seinen', 70345).
+manga_genere('action', 16765).
+manga_genere('award_winning', 16765).
+manga_genere('historical', 16765).
+manga_genere('military', 16765).
+manga_genere('seinen', 16765).
+manga_genere('drama', 4632).
+manga_genere('psychological', 4632).
+manga_genere('seinen', 4632).
+manga_genere('slice_of_life', 4632).
+manga_genere('action', 44489).
+manga_genere('anthropomorphic', 44489).
+manga_genere('drama', 44489).
+manga_genere('fantasy', 44489).
+manga_genere('seinen', 44489).
+manga_genere('award_winning', 657).
+manga_genere('drama', 657).
+manga_genere('psychological', 657).
+manga_genere('seinen', 657).
+manga_genere('sports', 657).
+manga_genere('team_sports', 657).
+manga_genere('award_winning', 3).
+manga_genere('drama', 3).
+manga_genere('historical', 3).
+manga_genere('mystery', 3).
+manga_genere('psychological', 3).
+manga_genere('sci-fi', 3).
+manga_genere('seinen', 3).
+manga_genere('combat_sports', 1303).
+manga_genere('drama', 1303).
+manga_genere('shounen', 1303).
+manga_genere('slice_of_life', 1303).
+manga_genere('sports', 1303).
+manga_genere('award_winning', 104).
+manga_genere('childcare', 104).
+manga_genere('comedy', 104).
+manga_genere('iyashikei', 104).
+manga_genere('slice_of_life', 104).
+manga_genere('drama', 34053).
+manga_genere('fantasy', 34053).
+manga_genere('mystery', 34053).
+manga_genere('shounen', 34053).
+manga_genere('supernatural', 34053).
+manga_genere('award_winning', 90125).
+manga_genere('comedy', 90125).
+manga_genere('romance', 90125).
+manga_genere('school', 90125).
+manga_genere('seinen', 90125).
+manga_genere('action', 336).
+manga_genere('award_winning', 336).
+manga_genere('comedy', 336).
+manga_genere('delinquents', 336).
+manga_genere('drama', 336).
+manga_genere('ecchi', 336).
+manga_genere('school', 336).
+manga_genere('shounen', 336).
+manga_genere('workplace', 336).
+manga_genere('award_winning', 35243).
+manga_genere('school', 35243).
+manga_genere('shounen', 35243).
+manga_genere('sports', 35243).
+manga_genere('team_sports', 35243).
+manga_genere('award_winning', 1224).
+manga_genere('childcare', 1224).
+manga_genere('drama', 1224).
+manga_genere('iyashikei', 1224).
+manga_genere('seinen', 1224).
+manga_genere('slice_of_life', 1224).
+manga_genere('strategy_game', 1224).
+manga_genere('adventure', 126287).
+manga_genere('award_winning', 126287).
+manga_genere('drama', 126287).
+manga_genere('fantasy', 126287).
+manga_genere('shounen', 126287).
+manga_genere('award_winning', 56805).
+manga_genere('drama', 56805).
+manga_genere('shounen', 56805).
+manga_genere('adventure', 21525).
+manga_genere('fantasy', 21525).
+manga_genere('romance', 21525).
+manga_genere('shoujo', 21525).
+manga_genere('drama', 144267).
+manga_genere('romance', 144267).
+manga_genere('school', 144267).
+manga_genere('adult_cast', 28).
+manga_genere('award_winning', 28).
+manga_genere('drama', 28).
+manga_genere('love_polygon', 28).
+manga_genere('music', 28).
+manga_genere('romance', 28).
+manga_genere('shoujo', 28).
+manga_genere('action', 651).
+manga_genere('adventure', 651).
+manga_genere('award_winning', 651).
+manga_genere('fantasy', 651).
+manga_genere('award_winning', 7375).
+manga_genere('drama', 7375).
+manga_genere('psychological', 7375).
+manga_genere('seinen', 7375).
+manga_genere('sports', 7375).
+manga_genere('award_winning', 85781).
+manga_genere('comedy', 85781).
+manga_genere('fantasy', 85781).
+manga_genere('gourmet', 85781).
+manga_genere('seinen', 85781).
+manga_genere('drama', 100448).
+manga_genere('shounen', 100448).
+manga_genere('action', 26).
+manga_genere('adventure', 26).
+manga_genere('fantasy', 26).
+manga_genere('shounen', 26).
+manga_genere('award_winning', 7).
+manga_genere('combat_sports', 7).
+manga_genere('shounen', 7).
+manga_genere('sports', 7).
+manga_genere('adult_cast', 14483).
+manga_genere('award_winning', 14483).
+manga_genere('drama', 14483).
+manga_genere('sci-fi', 14483).
+manga_genere('seinen', 14483).
+manga_genere('space', 14483).
+manga_genere('workplace', 14483).
+manga_genere('adventure', 91941).
+manga_genere('drama', 91941).
+manga_genere('fantasy', 91941).
+manga_genere('sci-fi', 91941).
+manga_genere('adventure', 72467).
+manga_genere('award_winning', 72467).
+manga_genere('iyashikei', 72467).
+manga_genere('slice_of_life', 72467).
+manga_genere('historical', 132678).
+manga_genere('romance', 132678).
+manga_genere('slice_of_life', 132678).
+manga_genere('action', 44347).
+manga_genere('comedy', 44347).
+manga_genere('parody', 44347).
+manga_genere('seinen', 44347).
+manga_genere('super_power', 44347).
+manga_genere('drama', 45143).
+manga_genere('music', 45143).
+manga_genere('school', 45143).
+manga_genere('shounen', 45143).
+manga_genere('adult_cast', 418).
+manga_genere('award_winning', 418).
+manga_genere('fantasy', 418).
+manga_genere('historical', 418).
+manga_genere('iyashikei', 418).
+manga_genere('mystery', 418).
+manga_genere('seinen', 418).
+manga_genere('supernatural', 418).
+manga_genere('psychological', 21).
+manga_genere('shounen', 21).
+manga_genere('supernatural', 21).
+manga_genere('suspense', 21).
+manga_genere('award_winning', 145).
+manga_genere('drama', 145).
+manga_genere('music', 145).
+manga_genere('romance', 145).
+manga_genere('shounen', 145).
+manga_genere('action', 116778).
+manga_genere('award_winning', 116778).
+manga_genere('fantasy', 116778).
+manga_genere('gore', 116778).
+manga_genere('shounen', 116778).
+manga_genere('urban_fantasy', 116778).
+manga_genere('award_winning', 129621).
+manga_genere('drama', 129621).
+manga_genere('seinen', 129621).
+manga_genere('sports', 129621).
+manga_genere('action', 1133).
+manga_genere('comedy', 1133).
+manga_genere('fantasy', 1133).
+manga_genere('gore', 1133).
+manga_genere('horror', 1133).
+manga_genere('seinen', 1133).
+manga_genere('action', 664).
+manga_genere('award_winning', 664).
+manga_genere('gore', 664).
+manga_genere('sci-fi', 664).
+manga_genere('seinen', 664).
+manga_genere('drama', 1859).
+manga_genere('iyashikei', 1859).
+manga_genere('shoujo', 1859).
+manga_genere('supernatural', 1859).
+manga_genere('fantasy', 100035).
+manga_genere('seinen', 100035).
+manga_genere('drama', 107562).
+manga_genere('historical', 107562).
+manga_genere('medical', 107562).
+manga_genere('mystery', 107562).
+manga_genere('seinen', 107562).
+manga_genere('action', 123006).
+manga_genere('detective', 123006).
+manga_genere('mystery', 123006).
+manga_genere('shounen', 123006).
+manga_genere('supernatural', 123006).
+manga_genere('girls_love', 128365).
+manga_genere('school', 128365).
+manga_genere('award_winning', 4).
+manga_genere('iyashikei', 4).
+manga_genere('sci-fi', 4).
+manga_genere('seinen', 4).
+manga_genere('slice_of_life', 4).
+manga_genere('drama', 88660).
+manga_genere('girls_love', 88660).
+manga_genere('school', 88660).
+manga_genere('drama', 145863).
+manga_genere('shounen', 145863).
+manga_genere('action', 44).
+manga_genere('comedy', 44).
+manga_genere('gag_humor', 44).
+manga_genere('historical', 44).
+manga_genere('parody', 44).
+manga_genere('samurai', 44).
+manga_genere('sci-fi', 44).
+manga_genere('shounen', 44).
+manga_genere('drama', 23900).
+manga_genere('mystery', 23900).
+manga_genere('psychological', 23900).
+manga_genere('shounen', 23900).
+manga_genere('supernatural', 23900).
+manga_genere('suspense', 23900).
+manga_genere('comedy', 78523).
+manga_genere('drama', 78523).
+manga_genere('romance', 78523).
+manga_genere('school', 78523).
+manga_genere('slice_of_life', 78523).
+manga_genere('action', 85968).
+manga_genere('adventure', 85968).
+manga_genere('award_winning', 85968).
+manga_genere('historical', 85968).
+manga_genere('seinen', 85968).
+manga_genere('action', 904).
+manga_genere('historical', 904).
+manga_genere('samurai', 904).
+manga_genere('seinen', 904).
+manga_genere('action', 745).
+manga_genere('award_winning', 745).
+manga_genere('detective', 745).
+manga_genere('mystery', 745).
+manga_genere('psychological', 745).
+manga_genere('sci-fi', 745).
+manga_genere('seinen', 745).
+manga_genere('suspense', 745).
+manga_genere('award_winning', 102256).
+manga_genere('seinen', 102256).
+manga_genere('sports', 102256).
+manga_genere('team_sports', 102256).
+manga_genere('action', 60783).
+manga_genere('award_winning', 60783).
+manga_genere('comedy', 60783).
+manga_genere('super_power', 60783).
+manga_genere('supernatural', 60783).
+manga_genere('award_winning', 107931).
+manga_genere('drama', 107931).
+manga_genere('school', 107931).
+manga_genere('seinen', 107931).
+manga_genere('visual_arts', 107931).
+manga_genere('iyashikei', 81).
+manga_genere('sci-fi', 81).
+manga_genere('shounen', 81).
+manga_genere('slice_of_life', 81).
+manga_genere('action', 9982).
+manga_genere('high_stakes_game', 9982).
+manga_genere('psychological', 9982).
+manga_genere('seinen', 9982).
+manga_genere('strategy_game', 9982).
+manga_genere('action', 756).
+manga_genere('adventure', 756).
+manga_genere('delinquents', 756).
+manga_genere('drama', 756).
+manga_genere('organized_crime', 756).
+manga_genere('psychological', 756).
+manga_genere('shoujo', 756).
+manga_genere('suspense', 756).
+manga_genere('award_winning', 118289).
+manga_genere('drama', 118289).
+manga_genere('school', 118289).
+manga_genere('seinen', 118289).
+manga_genere('romance', 114043).
+manga_genere('award_winning', 37707).
+manga_genere('drama', 37707).
+manga_genere('music', 37707).
+manga_genere('romance', 37707).
+manga_genere('school', 37707).
+manga_genere('shounen', 37707).
+manga_genere('action', 698).
+manga_genere('drama', 698).
+manga_genere('mecha', 698).
+manga_genere('mystery', 698).
+manga_genere('psychological', 698).
+manga_genere('sci-fi', 698).
+manga_genere('seinen', 698).
+manga_genere('shounen', 698).
+manga_genere('suspense', 698).
+manga_genere('adult_cast', 61579).
+manga_genere('drama', 61579).
+manga_genere('high_stakes_game', 61579).
+manga_genere('psychological', 61579).
+manga_genere('seinen', 61579).
+manga_genere('strategy_game', 61579).
+manga_genere('action', 3006).
+manga_genere('shounen', 3006).
+manga_genere('supernatural', 3006).
+manga_genere('award_winning', 13245).
+manga_genere('drama', 13245).
+manga_genere('josei', 13245).
+manga_genere('love_polygon', 13245).
+manga_genere('strategy_game', 13245).
+manga_genere('adventure', 3031).
+manga_genere('fantasy', 3031).
+manga_genere('mystery', 3031).
+manga_genere('shounen', 3031).
+manga_genere('award_winning', 11514).
+manga_genere('historical', 11514).
+manga_genere('romance', 11514).
+manga_genere('seinen', 11514).
+manga_genere('school', 92559).
+manga_genere('shounen', 92559).
+manga_genere('sports', 92559).
+manga_genere('team_sports', 92559).
+manga_genere('school', 105084).
+manga_genere('shounen', 105084).
+manga_genere('supernatural', 105084).
+manga_genere('comedy', 610).
+manga_genere('drama', 610).
+manga_genere('love_polygon', 610).
+manga_genere('romance', 610).
+manga_genere('shoujo', 610).
+manga_genere('showbiz', 610).
+manga_genere('detective', 11054).
+manga_genere('drama', 11054).
+manga_genere('historical', 11054).
+manga_genere('mystery', 11054).
+manga_genere('psychological', 11054).
+manga_genere('seinen', 11054).
+manga_genere('supernatural', 11054).
+manga_genere('adult_cast', 87844).
+manga_genere('award_winning', 87844).
+manga_genere('comedy', 87844).
+manga_genere('organized_crime', 87844).
+manga_genere('seinen', 87844).
+manga_genere('suspense', 87844).
+manga_genere('action', 23390).
+manga_genere('award_winning', 23390).
+manga_genere('drama', 23390).
+manga_genere('gore', 23390).
+manga_genere('military', 23390).
+manga_genere('shounen', 23390).
+manga_genere('survival', 23390).
+manga_genere('suspense', 23390).
+manga_genere('action', 33327).
+manga_genere('fantasy', 33327).
+manga_genere('gore', 33327).
+manga_genere('horror', 33327).
+manga_genere('psychological', 33327).
+manga_genere('seinen', 33327).
+manga_genere('urban_fantasy', 33327).
+manga_genere('action', 22).
+manga_genere('drama', 22).
+manga_genere('historical', 22).
+manga_genere('samurai', 22).
+manga_genere('shounen', 22).
+manga_genere('drama', 1325).
+manga_genere('fantasy', 1325).
+manga_genere('historical', 1325).
+manga_genere('psychological', 1325).
+manga_genere('romance', 1325).
+manga_genere('sci-fi', 1325).
+manga_genere('shounen', 1325).
+manga_genere('space', 1325).
+manga_genere('supernatural', 1325).
+manga_genere('comedy', 8157).
+manga_genere('fantasy', 8157).
+manga_genere('mythology', 8157).
+manga_genere('romance', 8157).
+manga_genere('shoujo', 8157).
+manga_genere('supernatural', 8157).
+manga_genere('award_winning', 102).
+manga_genere('drama', 102).
+manga_genere('love_polygon', 102).
+manga_genere('romance', 102).
+manga_genere('school', 102).
+manga_genere('shoujo', 102).
+manga_genere('supernatural', 102).
+manga_genere('drama', 5744).
+manga_genere('seinen', 5744).
+manga_genere('sports', 5744).
+manga_genere('adult_cast', 11327).
+manga_genere('psychological', 11327).
+manga_genere('seinen', 11327).
+manga_genere('sports', 11327).
+manga_genere('team_sports', 11327).
+manga_genere('boys_love', 101396).
+manga_genere('otaku_culture', 101396).
+manga_genere('school', 101396).
+manga_genere('seinen', 137303).
+manga_genere('slice_of_life', 137303).
+manga_genere('drama', 21498).
+manga_genere('fantasy', 21498).
+manga_genere('horror', 21498).
+manga_genere('mystery', 21498).
+manga_genere('psychological', 21498).
+manga_genere('shounen', 21498).
+manga_genere('supernatural', 21498).
+manga_genere('suspense', 21498).
+manga_genere('award_winning', 44307).
+manga_genere('josei', 44307).
+manga_genere('memoir', 44307).
+manga_genere('otaku_culture', 44307).
+manga_genere('slice_of_life', 44307).
+manga_genere('visual_arts', 44307).
+manga_genere('comedy', 30).
+manga_genere('crossdressing', 30).
+manga_genere('drama', 30).
+manga_genere('reverse_harem', 30).
+manga_genere('romance', 30).
+manga_genere('school', 30).
+manga_genere('shoujo', 30).
+manga_genere('action', 214).
+manga_genere('award_winning', 214).
+manga_genere('drama', 214).
+manga_genere('mecha', 214).
+manga_genere('military', 214).
+manga_genere('sci-fi', 214).
+manga_genere('shounen', 214).
+manga_genere('space', 214).
+manga_genere('boys_love', 79085).
+manga_genere('drama', 79085).
+manga_genere('music', 79085).
+manga_genere('school', 79085).
+manga_genere('award_winning', 85719).
+manga_genere('music', 85719).
+manga_genere('seinen', 85719).
+manga_genere('drama', 11734).
+manga_genere('music', 11734).
+manga_genere('psychological', 11734).
+manga_genere('romance', 11734).
+manga_genere('seinen', 11734).
+manga_genere('award_winning', 28393).
+manga_genere('drama', 28393).
+manga_genere('josei', 28393).
+manga_genere('love_polygon', 28393).
+manga_genere('music', 28393).
+manga_genere('romance', 28393).
+manga_genere('school', 28393).
+manga_genere('drama', 104538).
+manga_genere('romance', 104538).
+manga_genere('action', 113010).
+manga_genere('comedy', 113010).
+manga_genere('drama', 113010).
+manga_genere('mystery', 113010).
+manga_genere('romance', 113010).
+manga_genere('shounen', 113010).
+manga_genere('supernatural', 113010).
+manga_genere('vampire', 113010).
+manga_genere('adult_cast', 121504).
+manga_genere('romance', 121504).
+manga_genere('shoujo', 121504).
+manga_genere('school', 117851).
+manga_genere('slice_of_life', 117851).
+manga_genere('action', 119161).
+manga_genere('childcare', 119161).
+manga_genere('comedy', 119161).
+manga_genere('shounen', 119161).
+manga_genere('action', 56529).
+manga_genere('detective', 56529).
+manga_genere('mystery', 56529).
+manga_genere('seinen', 56529).
+manga_genere('supernatural', 56529).
+manga_genere('action', 38071).
+manga_genere('adventure', 38071).
+manga_genere('comedy', 38071).
+manga_genere('drama', 38071).
+manga_genere('reincarnation', 38071).
+manga_genere('romance', 38071).
+manga_genere('seinen', 38071).
+manga_genere('supernatural', 38071).
+manga_genere('award_winning', 114745).
+manga_genere('shounen', 114745).
+manga_genere('sports', 114745).
+manga_genere('team_sports', 114745).
+manga_genere('action', 25515).
+manga_genere('adventure', 25515).
+manga_genere('award_winning', 25515).
+manga_genere('mystery', 25515).
+manga_genere('seinen', 25515).
+manga_genere('supernatural', 25515).
+manga_genere('comedy', 46282).
+manga_genere('drama', 46282).
+manga_genere('romance', 46282).
+manga_genere('slice_of_life', 46282).
+manga_genere('fantasy', 93753).
+manga_genere('historical', 93753).
+manga_genere('shounen', 93753).
+manga_genere('urban_fantasy', 93753).
+manga_genere('vampire', 93753).
+manga_genere('romance', 88639).
+manga_genere('shoujo', 88639).
+manga_genere('supernatural', 88639).
+manga_genere('shounen', 43).
+manga_genere('sports', 43).
+manga_genere('team_sports', 43).
+manga_genere('award_winning', 1183).
+manga_genere('comedy', 1183).
+manga_genere('drama', 1183).
+manga_genere('romance', 1183).
+manga_genere('school', 1183).
+manga_genere('shounen', 1183).
+manga_genere('sports', 1183).
+manga_genere('team_sports', 1183).
+manga_genere('comedy', 7519).
+manga_genere('fantasy', 7519).
+manga_genere('harem', 7519).
+manga_genere('otaku_culture', 7519).
+manga_genere('romance', 7519).
+manga_genere('school', 7519).
+manga_genere('shounen', 7519).
+manga_genere('supernatural', 7519).
+manga_genere('drama', 97244).
+manga_genere('psychological', 97244).
+manga_genere('seinen', 97244).
+manga_genere('slice_of_life', 97244).
+manga_genere('boys_love', 112988).
+manga_genere('drama', 112988).
+manga_genere('slice_of_life', 112988).
+manga_genere('childcare', 36413).
+manga_genere('comedy', 36413).
+manga_genere('organized_crime', 36413).
+manga_genere('seinen', 36413).
+manga_genere('supernatural', 36413).
+manga_genere('girls_love', 155861).
+manga_genere('music', 155861).
+manga_genere('drama', 133431).
+manga_genere('seinen', 133431).
+manga_genere('slice_of_life', 133431).
+manga_genere('sports', 133431).
+manga_genere('action', 135496).
+manga_genere('comedy', 135496).
+manga_genere('shounen', 135496).
+manga_genere('supernatural', 135496).
+manga_genere('adult_cast', 3299).
+manga_genere('adventure', 3299).
+manga_genere('drama', 3299).
+manga_genere('fantasy', 3299).
+manga_genere('historical', 3299).
+manga_genere('romance', 3299).
+manga_genere('seinen', 3299).
+manga_genere('supernatural', 3299).
+manga_genere('award_winning', 7482).
+manga_genere('delinquents', 7482).
+manga_genere('drama', 7482).
+manga_genere('historical', 7482).
+manga_genere('psychological', 7482).
+manga_genere('seinen', 7482).
+manga_genere('adult_cast', 100323).
+manga_genere('historical', 100323).
+manga_genere('mystery', 100323).
+manga_genere('psychological', 100323).
+manga_genere('shounen', 100323).
+manga_genere('suspense', 100323).
+manga_genere('drama', 21499).
+manga_genere('horror', 21499).
+manga_genere('mystery', 21499).
+manga_genere('shounen', 21499).
+manga_genere('supernatural', 21499).
+manga_genere('action', 42).
+manga_genere('adventure', 42).
+manga_genere('fantasy', 42).
+manga_genere('martial_arts', 42).
+manga_genere('shounen', 42).
+manga_genere('action', 3285).
+manga_genere('delinquents', 3285).
+manga_genere('martial_arts', 3285).
+manga_genere('psychological', 3285).
+manga_genere('seinen', 3285).
+manga_genere('action', 6812).
+manga_genere('comedy', 6812).
+manga_genere('delinquents', 6812).
+manga_genere('school', 6812).
+manga_genere('shounen', 6812).
+manga_genere('boys_love', 119279).
+manga_genere('josei', 119279).
+manga_genere('school', 119279).
+manga_genere('slice_of_life', 119279).
+manga_genere('comedy', 29211).
+manga_genere('otaku_culture', 29211).
+manga_genere('romance', 29211).
+manga_genere('school', 29211).
+manga_genere('award_winning', 743).
+manga_genere('drama', 743).
+manga_genere('mystery', 743).
+manga_genere('psychological', 743).
+manga_genere('sci-fi', 743).
+manga_genere('seinen', 743).
+manga_genere('adventure', 1032).
+manga_genere('anthropomorphic', 1032).
+manga_genere('award_winning', 1032).
+manga_genere('comedy', 1032).
+manga_genere('kids', 1032).
+manga_genere('school', 1032).
+manga_genere('sci-fi', 1032).
+manga_genere('shounen', 1032).
+manga_genere('slice_of_life', 1032).
+manga_genere('drama', 1469).
+manga_genere('performing_arts', 1469).
+manga_genere('romance', 1469).
+manga_genere('shoujo', 1469).
+manga_genere('showbiz', 1469).
+manga_genere('childcare', 17051).
+manga_genere('comedy', 17051).
+manga_genere('iyashikei', 17051).
+manga_genere('shounen', 17051).
+manga_genere('slice_of_life', 17051).
+manga_genere('visual_arts', 17051).
+manga_genere('adult_cast', 3572).
+manga_genere('award_winning', 3572).
+manga_genere('drama', 3572).
+manga_genere('high_stakes_game', 3572).
+manga_genere('seinen', 3572).
+manga_genere('strategy_game', 3572).
+manga_genere('comedy', 87397).
+manga_genere('music', 87397).
+manga_genere('school', 87397).
+manga_genere('seinen', 87397).
+manga_genere('supernatural', 87397).
+manga_genere('comedy', 162964).
+manga_genere('harem', 162964).
+manga_genere('romance', 162964).
+manga_genere('school', 162964).
+manga_genere('shounen', 162964).
+manga_genere('showbiz', 162964).
+manga_genere('drama', 138673).
+manga_genere('shounen', 138673).
+manga_genere('action', 658).
+manga_genere('adventure', 658).
+manga_genere('drama', 658).
+manga_genere('historical', 658).
+manga_genere('martial_arts', 658).
+manga_genere('samurai', 658).
+manga_genere('seinen', 658).
+manga_genere('supernatural', 658).
+manga_genere('action', 3866).
+manga_genere('fantasy', 3866).
+manga_genere('historical', 3866).
+manga_genere('mystery', 3866).
+manga_genere('mythology', 3866).
+manga_genere('shounen', 3866).
+manga_genere('supernatural', 3866).
+manga_genere('romance', 42451).
+manga_genere('school', 42451).
+manga_genere('shounen', 42451).
+manga_genere('fantasy', 110771).
+manga_genere('seinen', 110771).
+manga_genere('romance', 121213).
+manga_genere('school', 121213).
+manga_genere('seinen', 121213).
+manga_genere('adult_cast', 419).
+manga_genere('award_winning', 419).
+manga_genere('comedy', 419).
+manga_genere('josei', 419).
+manga_genere('music', 419).
+manga_genere('romance', 419).
+manga_genere('slice_of_life', 419).
+manga_genere('adventure', 974).
+manga_genere('award_winning', 974).
+manga_genere('drama', 974).
+manga_genere('fantasy', 974).
+manga_genere('romance', 974).
+manga_genere('shoujo', 974).
+manga_genere('adult_cast', 3573).
+manga_genere('drama', 3573).
+manga_genere('high_stakes_game', 3573).
+manga_genere('strategy_game', 3573).
+manga_genere('cgdct', 94376).
+manga_genere('iyashikei', 94376).
+manga_genere('slice_of_life', 94376).
+manga_genere('award_winning', 93699).
+manga_genere('drama', 93699).
+manga_genere('historical', 93699).
+manga_genere('seinen', 93699).
+manga_genere('drama', 99314).
+manga_genere('seinen', 99314).
+manga_genere('drama', 8967).
+manga_genere('psychological', 8967).
+manga_genere('school', 8967).
+manga_genere('action', 768).
+manga_genere('sci-fi', 768).
+manga_genere('seinen', 768).
+manga_genere('comedy', 2921).
+manga_genere('romance', 2921).
+manga_genere('school', 2921).
+manga_genere('shoujo', 2921).
+manga_genere('comedy', 3082).
+manga_genere('gag_humor', 3082).
+manga_genere('school', 3082).
+manga_genere('shounen', 3082).
+manga_genere('childcare', 6164).
+manga_genere('drama', 6164).
+manga_genere('seinen', 6164).
+manga_genere('slice_of_life', 6164).
+manga_genere('action', 33031).
+manga_genere('gore', 33031).
+manga_genere('high_stakes_game', 33031).
+manga_genere('horror', 33031).
+manga_genere('psychological', 33031).
+manga_genere('shounen', 33031).
+manga_genere('supernatural', 33031).
+manga_genere('survival', 33031).
+manga_genere('drama', 142310).
+manga_genere('girls_love', 142310).
+manga_genere('school', 142310).
+manga_genere('drama', 118804).
+manga_genere('josei', 118804).
+manga_genere('action', 166372).
+manga_genere('drama', 166372).
+manga_genere('girls_love', 166372).
+manga_genere('reincarnation', 166372).
+manga_genere('seinen', 166372).
+manga_genere('supernatural', 166372).
+manga_genere('comedy', 10).
+manga_genere('drama', 10).
+manga_genere('mystery', 10).
+manga_genere('seinen', 10).
+manga_genere('supernatural', 10).
+manga_genere('cgdct', 85).
+manga_genere('comedy', 85).
+manga_genere('school', 85).
+manga_genere('slice_of_life', 85).
+manga_genere('adventure', 106).
+manga_genere('award_winning', 106).
+manga_genere('comedy', 106).
+manga_genere('fantasy', 106).
+manga_genere('mahou_shoujo', 106).
+manga_genere('romance', 106).
+manga_genere('shoujo', 106).
+manga_genere('action', 401).
+manga_genere('award_winning', 401).
+manga_genere('gore', 401).
+manga_genere('horror', 401).
+manga_genere('psychological', 401).
+manga_genere('sci-fi', 401).
+manga_genere('seinen', 401).
+manga_genere('award_winning', 1414).
+manga_genere('comedy', 1414).
+manga_genere('drama', 1414).
+manga_genere('school', 1414).
+manga_genere('shounen', 1414).
+manga_genere('comedy', 9711).
+manga_genere('drama', 9711).
+manga_genere('otaku_culture', 9711).
+manga_genere('romance', 9711).
+manga_genere('shounen', 9711).
+manga_genere('drama', 110160).
+manga_genere('high_stakes_game', 62795).
+manga_genere('psychological', 62795).
+manga_genere('shounen', 62795).
+manga_genere('strategy_game', 62795).
+manga_genere('suspense', 62795).
+manga_genere('award_winning', 87609).
+manga_genere('fantasy', 87609).
+manga_genere('isekai', 87609).
+manga_genere('reincarnation', 87609).
+manga_genere('shounen', 87609).
+manga_genere('drama', 16081).
+manga_genere('horror', 16081).
+manga_genere('mystery', 16081).
+manga_genere('psychological', 16081).
+manga_genere('shounen', 16081).
+manga_genere('boys_love', 144011).
+manga_genere('drama', 144011).
+manga_genere('action', 152024).
+manga_genere('shounen', 152024).
+manga_genere('supernatural', 152024).
+manga_genere('action', 24692).
+manga_genere('fantasy', 24692).
+manga_genere('mythology', 24692).
+manga_genere('shounen', 24692).
+manga_genere('mystery', 39325).
+manga_genere('psychological', 39325).
+manga_genere('seinen', 39325).
+manga_genere('supernatural', 39325).
+manga_genere('time_travel', 39325).
+manga_genere('boys_love', 136103).
+manga_genere('drama', 136103).
+manga_genere('fantasy', 115730).
+manga_genere('mystery', 115730).
+manga_genere('seinen', 115730).
+manga_genere('award_winning', 122906).
+manga_genere('boys_love', 122906).
+manga_genere('comedy', 122906).
+manga_genere('romance', 122906).
+manga_genere('school', 122906).
+manga_genere('shoujo', 122906).
+manga_genere('drama', 660).
+manga_genere('historical', 660).
+manga_genere('military', 660).
+manga_genere('romance', 660).
+manga_genere('shoujo', 660).
+manga_genere('action', 869).
+manga_genere('adventure', 869).
+manga_genere('award_winning', 869).
+manga_genere('comedy', 869).
+manga_genere('shounen', 869).
+manga_genere('supernatural', 869).
+manga_genere('comedy', 48347).
+manga_genere('drama', 48347).
+manga_genere('performing_arts', 48347).
+manga_genere('romance', 48347).
+manga_genere('school', 48347).
+manga_genere('shounen', 48347).
+manga_genere('sports', 48347).
+manga_genere('adult_cast', 89087).
+manga_genere('comedy', 89087).
+manga_genere('otaku_culture', 89087).
+manga_genere('romance', 89087).
+manga_genere('workplace', 89087).
+manga_genere('comedy', 104241).
+manga_genere('fantasy', 104241).
+manga_genere('shounen', 104241).
+manga_genere('adventure', 923).
+manga_genere('award_winning', 923).
+manga_genere('fantasy', 923).
+manga_genere('isekai', 923).
+manga_genere('mythology', 923).
+manga_genere('romance', 923).
+manga_genere('shoujo', 923).
+manga_genere('drama', 936).
+manga_genere('horror', 936).
+manga_genere('mystery', 936).
+manga_genere('psychological', 936).
+manga_genere('seinen', 936).
+manga_genere('supernatural', 936).
+manga_genere('drama', 3281).
+manga_genere('historical', 3281).
+manga_genere('shounen', 3281).
+manga_genere('adult_cast', 3571).
+manga_genere('drama', 3571).
+manga_genere('strategy_game', 3571).
+manga_genere('cgdct', 49835).
+manga_genere('comedy', 49835).
+manga_genere('iyashikei', 49835).
+manga_genere('workplace', 49835).
+manga_genere('award_winning', 25096).
+manga_genere('comedy', 25096).
+manga_genere('drama', 25096).
+manga_genere('school', 25096).
+manga_genere('shounen', 25096).
+manga_genere('action', 98436).
+manga_genere('fantasy', 98436).
+manga_genere('isekai', 98436).
+manga_genere('military', 98436).
+manga_genere('reincarnation', 98436).
+manga_genere('drama', 61189).
+manga_genere('fantasy', 61189).
+manga_genere('mythology', 61189).
+manga_genere('romance', 61189).
+manga_genere('shounen', 61189).
+manga_genere('urban_fantasy', 61189).
+manga_genere('fantasy', 93972).
+manga_genere('shounen', 93972).
+manga_genere('music', 100922).
+manga_genere('seinen', 100922).
+manga_genere('love_status_quo', 165876).
+manga_genere('romance', 165876).
+manga_genere('school', 165876).
+manga_genere('seinen', 165876).
+manga_genere('action', 139629).
+manga_genere('adventure', 139629).
+manga_genere('seinen', 139629).
+manga_genere('supernatural', 139629).
+manga_genere('action', 147585).
+manga_genere('fantasy', 147585).
+manga_genere('military', 147585).
+manga_genere('shounen', 147585).
+manga_genere('award_winning', 31).
+manga_genere('comedy', 31).
+manga_genere('drama', 31).
+manga_genere('romance', 31).
+manga_genere('school', 31).
+manga_genere('shoujo', 31).
+manga_genere('comedy', 320).
+manga_genere('drama', 320).
+manga_genere('love_polygon', 320).
+manga_genere('romance', 320).
+manga_genere('school', 320).
+manga_genere('shoujo', 320).
+manga_genere('super_power', 320).
+manga_genere('action', 895).
+manga_genere('mecha', 895).
+manga_genere('military', 895).
+manga_genere('romance', 895).
+manga_genere('shounen', 895).
+manga_genere('award_winning', 2895).
+manga_genere('drama', 2895).
+manga_genere('music', 2895).
+manga_genere('seinen', 2895).
+manga_genere('award_winning', 58141).
+manga_genere('romance', 58141).
+manga_genere('school', 58141).
+manga_genere('shoujo', 58141).
+manga_genere('fantasy', 62023).
+manga_genere('historical', 62023).
+manga_genere('iyashikei', 62023).
+manga_genere('mystery', 62023).
+manga_genere('seinen', 62023).
+manga_genere('supernatural', 62023).
+manga_genere('action', 81117).
+manga_genere('fantasy', 81117).
+manga_genere('gore', 81117).
+manga_genere('horror', 81117).
+manga_genere('psychological', 81117).
+manga_genere('seinen', 81117).
+manga_genere('urban_fantasy', 81117).
+manga_genere('comedy', 37755).
+manga_genere('gag_humor', 37755).
+manga_genere('school', 37755).
+manga_genere('shounen', 37755).
+manga_genere('super_power', 37755).
+manga_genere('supernatural', 37755).
+manga_genere('childcare', 40761).
+manga_genere('drama', 40761).
+manga_genere('fantasy', 40761).
+manga_genere('romance', 40761).
+manga_genere('seinen', 40761).
+manga_genere('slice_of_life', 40761).
+manga_genere('action', 123444).
+manga_genere('comedy', 123444).
+manga_genere('fantasy', 123444).
+manga_genere('supernatural', 123444).
+manga_genere('romance', 135545).
+manga_genere('school', 135545).
+manga_genere('shounen', 135545).
+manga_genere('sports', 135545).
+manga_genere('team_sports', 135545).
+manga_genere('drama', 443).
+manga_genere('psychological', 443).
+manga_genere('romance', 443).
+manga_genere('shoujo', 443).
+manga_genere('action', 736).
+manga_genere('adventure', 736).
+manga_genere('drama', 736).
+manga_genere('fantasy', 736).
+manga_genere('historical', 736).
+manga_genere('seinen', 736).
+manga_genere('supernatural', 736).
+manga_genere('award_winning', 1013).
+manga_genere('comedy', 1013).
+manga_genere('drama', 1013).
+manga_genere('love_polygon', 1013).
+manga_genere('romance', 1013).
+manga_genere('school', 1013).
+manga_genere('shounen', 1013).
+manga_genere('sports', 1013).
+manga_genere('team_sports', 1013).
+manga_genere('action', 3575).
+manga_genere('comedy', 3575).
+manga_genere('delinquents', 3575).
+manga_genere('drama', 3575).
+manga_genere('psychological', 3575).
+manga_genere('seinen', 3575).
+manga_genere('suspense', 3575).
+manga_genere('action', 10552).
+manga_genere('psychological', 10552).
+manga_genere('seinen', 10552).
+manga_genere('supernatural', 10552).
+manga_genere('suspense', 10552).
+manga_genere('adventure', 12471).
+manga_genere('comedy', 12471).
+manga_genere('fantasy', 12471).
+manga_genere('kids', 12471).
+manga_genere('sci-fi', 12471).
+manga_genere('slice_of_life', 12471).
+manga_genere('fantasy', 156681).
+manga_genere('isekai', 156681).
+manga_genere('seinen', 156681).
+manga_genere('drama', 148542).
+manga_genere('villainess', 148542).
+manga_genere('award_winning', 1600).
+manga_genere('drama', 1600).
+manga_genere('medical', 1600).
+manga_genere('shounen', 1600).
+manga_genere('award_winning', 3378).
+manga_genere('romance', 3378).
+manga_genere('school', 3378).
+manga_genere('shoujo', 3378).
+manga_genere('slice_of_life', 3378).
+manga_genere('award_winning', 15306).
+manga_genere('historical', 15306).
+manga_genere('martial_arts', 15306).
+manga_genere('samurai', 15306).
+manga_genere('seinen', 15306).
+manga_genere('slice_of_life', 15306).
+manga_genere('cgdct', 118568).
+manga_genere('comedy', 118568).
+manga_genere('music', 118568).
+manga_genere('pets', 112774).
+manga_genere('slice_of_life', 112774).
+manga_genere('boys_love', 57791).
+manga_genere('drama', 57791).
+manga_genere('slice_of_life', 57791).
+manga_genere('boys_love', 77609).
+manga_genere('slice_of_life', 77609).
+manga_genere('childcare', 84983).
+manga_genere('comedy', 84983).
+manga_genere('slice_of_life', 84983).
+manga_genere('action', 9).
+manga_genere('adventure', 9).
+manga_genere('drama', 9).
+manga_genere('fantasy', 9).
+manga_genere('shounen', 9).
+manga_genere('award_winning', 18).
+manga_genere('comedy', 18).
+manga_genere('drama', 18).
+manga_genere('love_polygon', 18).
+manga_genere('romance', 18).
+manga_genere('school', 18).
+manga_genere('shoujo', 18).
+manga_genere('showbiz', 18).
+manga_genere('slice_of_life', 18).
+manga_genere('drama', 29).
+manga_genere('josei', 29).
+manga_genere('romance', 29).
+manga_genere('school', 29).
+manga_genere('visual_arts', 29).
+manga_genere('action', 149).
+manga_genere('drama', 149).
+manga_genere('horror', 149).
+manga_genere('psychological', 149).
+manga_genere('sci-fi', 149).
+manga_genere('seinen', 149).
+manga_genere('action', 735).
+manga_genere('adult_cast', 735).
+manga_genere('drama', 735).
+manga_genere('military', 735).
+manga_genere('organized_crime', 735).
+manga_genere('seinen', 735).
+manga_genere('boys_love', 9699).
+manga_genere('school', 9699).
+manga_genere('slice_of_life', 9699).
+manga_genere('childcare', 14236).
+manga_genere('romance', 14236).
+manga_genere('shoujo', 14236).
+manga_genere('drama', 16144).
+manga_genere('horror', 16144).
+manga_genere('mystery', 16144).
+manga_genere('mythology', 16144).
+manga_genere('psychological', 16144).
+manga_genere('childcare', 16922).
+manga_genere('comedy', 16922).
+manga_genere('iyashikei', 16922).
+manga_genere('school', 16922).
+manga_genere('shoujo', 16922).
+manga_genere('slice_of_life', 16922).
+manga_genere('action', 24).
+manga_genere('adventure', 24).
+manga_genere('fantasy', 24).
+manga_genere('shounen', 24).
+manga_genere('urban_fantasy', 24).
+manga_genere('action', 79).
+manga_genere('adventure', 79).
+manga_genere('award_winning', 79).
+manga_genere('drama', 79).
+manga_genere('fantasy', 79).
+manga_genere('historical', 79).
+manga_genere('romance', 79).
+manga_genere('shoujo', 79).
+manga_genere('supernatural', 79).
+manga_genere('time_travel', 79).
+manga_genere('action', 267).
+manga_genere('adult_cast', 267).
+manga_genere('gore', 267).
+manga_genere('historical', 267).
+manga_genere('horror', 267).
+manga_genere('seinen', 267).
+manga_genere('supernatural', 267).
+manga_genere('vampire', 267).
+manga_genere('action', 583).
+manga_genere('adventure', 583).
+manga_genere('fantasy', 583).
+manga_genere('gore', 583).
+manga_genere('horror', 583).
+manga_genere('shounen', 583).
+manga_genere('action', 762).
+manga_genere('comedy', 762).
+manga_genere('crossdressing', 762).
+manga_genere('drama', 762).
+manga_genere('organized_crime', 762).
+manga_genere('romance', 762).
+manga_genere('shoujo', 762).
+manga_genere('action', 838).
+manga_genere('comedy', 838).
+manga_genere('delinquents', 838).
+manga_genere('martial_arts', 838).
+manga_genere('romance', 838).
+manga_genere('school', 838).
+manga_genere('shounen', 838).
+manga_genere('adventure', 1061).
+manga_genere('award_winning', 1061).
+manga_genere('comedy', 1061).
+manga_genere('detective', 1061).
+manga_genere('mystery', 1061).
+manga_genere('shounen', 1061).
+manga_genere('drama', 1111).
+manga_genere('historical', 1111).
+manga_genere('supernatural', 1111).
+manga_genere('drama', 1262).
+manga_genere('horror', 1262).
+manga_genere('mystery', 1262).
+manga_genere('psychological', 1262).
+manga_genere('shounen', 1262).
+manga_genere('drama', 1263).
+manga_genere('horror', 1263).
+manga_genere('mystery', 1263).
+manga_genere('psychological', 1263).
+manga_genere('boys_love', 2459).
+manga_genere('comedy', 2459).
+manga_genere('drama', 2459).
+manga_genere('shoujo', 2459).
+manga_genere('fantasy', 6520).
+manga_genere('historical', 6520).
+manga_genere('mythology', 6520).
+manga_genere('romance', 6520).
+manga_genere('shoujo', 6520).
+manga_genere('drama', 9548).
+manga_genere('horror', 9548).
+manga_genere('mystery', 9548).
+manga_genere('psychological', 9548).
+manga_genere('drama', 106809).
+manga_genere('school', 106809).
+manga_genere('seinen', 106809).
+manga_genere('adult_cast', 26704).
+manga_genere('award_winning', 26704).
+manga_genere('drama', 26704).
+manga_genere('josei', 26704).
+manga_genere('love_polygon', 26704).
+manga_genere('performing_arts', 26704).
+manga_genere('drama', 35573).
+manga_genere('love_polygon', 35573).
+manga_genere('romance', 35573).
+manga_genere('school', 35573).
+manga_genere('sci-fi', 35573).
+manga_genere('shoujo', 35573).
+manga_genere('time_travel', 35573).
+manga_genere('drama', 47022).
+manga_genere('historical', 47022).
+manga_genere('josei', 47022).
+manga_genere('music', 47022).
+manga_genere('romance', 47022).
+manga_genere('slice_of_life', 47022).
+manga_genere('comedy', 57).
+manga_genere('crossdressing', 57).
+manga_genere('drama', 57).
+manga_genere('love_polygon', 57).
+manga_genere('romance', 57).
+manga_genere('school', 57).
+manga_genere('shoujo', 57).
+manga_genere('action', 704).
+manga_genere('adult_cast', 704).
+manga_genere('adventure', 704).
+manga_genere('award_winning', 704).
+manga_genere('comedy', 704).
+manga_genere('drama', 704).
+manga_genere('sci-fi', 704).
+manga_genere('seinen', 704).
+manga_genere('action', 1047).
+manga_genere('adventure', 1047).
+manga_genere('shounen', 1047).
+manga_genere('comedy', 98379).
+manga_genere('slice_of_life', 98379).
+manga_genere('supernatural', 98379).
+manga_genere('adventure', 102343).
+manga_genere('award_winning', 102343).
+manga_genere('drama', 102343).
+manga_genere('shounen', 102343).
+manga_genere('supernatural', 102343).
+manga_genere('comedy', 5255).
+manga_genere('drama', 5255).
+manga_genere('romance', 5255).
+manga_genere('shoujo', 5255).
+manga_genere('adventure', 14790).
+manga_genere('award_winning', 14790).
+manga_genere('fantasy', 14790).
+manga_genere('shounen', 14790).
+manga_genere('drama', 15547).
+manga_genere('psychological', 15547).
+manga_genere('seinen', 15547).
+manga_genere('drama', 17910).
+manga_genere('psychological', 17910).
+manga_genere('school', 17910).
+manga_genere('seinen', 17910).
+manga_genere('boys_love', 145496).
+manga_genere('boys_love', 119392).
+manga_genere('drama', 119392).
+manga_genere('school', 119392).
+manga_genere('action', 72025).
+manga_genere('martial_arts', 72025).
+manga_genere('award_winning', 17904).
+manga_genere('comedy', 17904).
+manga_genere('crossdressing', 17904).
+manga_genere('josei', 17904).
+manga_genere('visual_arts', 17904).
+manga_genere('action', 91514).
+manga_genere('comedy', 91514).
+manga_genere('romance', 91514).
+manga_genere('school', 91514).
+manga_genere('shounen', 91514).
+manga_genere('award_winning', 1009).
+manga_genere('comedy', 1009).
+manga_genere('drama', 1009).
+manga_genere('josei', 1009).
+manga_genere('love_polygon', 1009).
+manga_genere('romance', 1009).
+manga_genere('slice_of_life', 1009).
+manga_genere('visual_arts', 1009).
+manga_genere('action', 1097).
+manga_genere('adventure', 1097).
+manga_genere('fantasy', 1097).
+manga_genere('drama', 1649).
+manga_genere('high_stakes_game', 1649).
+manga_genere('psychological', 1649).
+manga_genere('seinen', 1649).
+manga_genere('strategy_game', 1649).
+manga_genere('award_winning', 4258).
+manga_genere('childcare', 4258).
+manga_genere('drama', 4258).
+manga_genere('josei', 4258).
+manga_genere('psychological', 4258).
+manga_genere('slice_of_life', 4258).
+manga_genere('comedy', 112807).
+manga_genere('romance', 112807).
+manga_genere('school', 112807).
+manga_genere('shounen', 112807).
+manga_genere('action', 119022).
+manga_genere('comedy', 119022).
+manga_genere('fantasy', 119022).
+manga_genere('isekai', 119022).
+manga_genere('reincarnation', 119022).
+manga_genere('fantasy', 162733).
+manga_genere('organized_crime', 162733).
+manga_genere('shounen', 162733).
+manga_genere('comedy', 96044).
+manga_genere('historical', 96044).
+manga_genere('romance', 96044).
+manga_genere('shounen', 96044).
+manga_genere('slice_of_life', 96044).
+manga_genere('comedy', 103989).
+manga_genere('romance', 103989).
+manga_genere('school', 103989).
+manga_genere('shoujo', 103989).
+manga_genere('award_winning', 23571).
+manga_genere('drama', 23571).
+manga_genere('seinen', 23571).
+manga_genere('action', 39883).
+manga_genere('comedy', 39883).
+manga_genere('school', 39883).
+manga_genere('shounen', 39883).
+manga_genere('action', 113138).
+manga_genere('school', 113138).
+manga_genere('shounen', 113138).
+manga_genere('supernatural', 113138).
+manga_genere('action', 375).
+manga_genere('drama', 375).
+manga_genere('racing', 375).
+manga_genere('seinen', 375).
+manga_genere('adult_cast', 481).
+manga_genere('award_winning', 481).
+manga_genere('drama', 481).
+manga_genere('psychological', 481).
+manga_genere('sci-fi', 481).
+manga_genere('seinen', 481).
+manga_genere('slice_of_life', 481).
+manga_genere('space', 481).
+manga_genere('workplace', 481).
+manga_genere('action', 3009).
+manga_genere('adventure', 3009).
+manga_genere('shounen', 3009).
+manga_genere('adventure', 4625).
+manga_genere('award_winning', 4625).
+manga_genere('drama', 4625).
+manga_genere('mystery', 4625).
+manga_genere('seinen', 4625).
+manga_genere('sports', 4625).
+manga_genere('action', 7776).
+manga_genere('comedy', 7776).
+manga_genere('sci-fi', 7776).
+manga_genere('super_power', 7776).
+manga_genere('comedy', 128).
+manga_genere('fantasy', 128).
+manga_genere('horror', 128).
+manga_genere('josei', 128).
+manga_genere('mystery', 128).
+manga_genere('supernatural', 128).
+manga_genere('action', 445).
+manga_genere('comedy', 445).
+manga_genere('delinquents', 445).
+manga_genere('drama', 445).
+manga_genere('romance', 445).
+manga_genere('school', 445).
+manga_genere('shounen', 445).
+manga_genere('comedy', 915).
+manga_genere('delinquents', 915).
+manga_genere('drama', 915).
+manga_genere('school', 915).
+manga_genere('shounen', 915).
+manga_genere('slice_of_life', 915).
+manga_genere('sports', 915).
+manga_genere('team_sports', 915).
+manga_genere('award_winning', 10884).
+manga_genere('school', 10884).
+manga_genere('shounen', 10884).
+manga_genere('sports', 10884).
+manga_genere('team_sports', 10884).
+manga_genere('cgdct', 11593).
+manga_genere('comedy', 11593).
+manga_genere('gag_humor', 11593).
+manga_genere('girls_love', 11593).
+manga_genere('school', 11593).
+manga_genere('boys_love', 92252).
+manga_genere('drama', 92252).
+manga_genere('school', 92252).
+manga_genere('slice_of_life', 92252).
+manga_genere('anthropomorphic', 103701).
+manga_genere('award_winning', 103701).
+manga_genere('drama', 103701).
+manga_genere('psychological', 103701).
+manga_genere('shounen', 103701).
+manga_genere('slice_of_life', 103701).
+manga_genere('horror', 141833).
+manga_genere('mystery', 141833).
+manga_genere('supernatural', 141833).
+manga_genere('boys_love', 112091).
+manga_genere('slice_of_life', 112091).
+manga_genere('drama', 112115).
+manga_genere('performing_arts', 112115).
+manga_genere('shounen', 112115).
+manga_genere('showbiz', 112115).
+manga_genere('action', 24308).
+manga_genere('drama', 24308).
+manga_genere('mystery', 24308).
+manga_genere('sci-fi', 24308).
+manga_genere('shoujo', 24308).
+manga_genere('comedy', 26144).
+manga_genere('gag_humor', 26144).
+manga_genere('school', 26144).
+manga_genere('adventure', 47825).
+manga_genere('sci-fi', 47825).
+manga_genere('seinen', 47825).
+manga_genere('comedy', 62547).
+manga_genere('school', 62547).
+manga_genere('shounen', 62547).
+manga_genere('slice_of_life', 62547).
+manga_genere('drama', 158).
+manga_genere('horror', 158).
+manga_genere('mystery', 158).
+manga_genere('psychological', 158).
+manga_genere('romance', 158).
+manga_genere('shoujo', 158).
+manga_genere('supernatural', 158).
+manga_genere('action', 1075).
+manga_genere('adventure', 1075).
+manga_genere('award_winning', 1075).
+manga_genere('drama', 1075).
+manga_genere('horror', 1075).
+manga_genere('mystery', 1075).
+manga_genere('psychological', 1075).
+manga_genere('romance', 1075).
+manga_genere('sci-fi', 1075).
+manga_genere('shoujo', 1075).
+manga_genere('survival', 1075).
+manga_genere('suspense', 1075).
+manga_genere('drama', 4571).
+manga_genere('fantasy', 4571).
+manga_genere('romance', 4571).
+manga_genere('shoujo', 4571).
+manga_genere('action', 5651).
+manga_genere('delinquents', 5651).
+manga_genere('school', 5651).
+manga_genere('shounen', 5651).
+manga_genere('action', 14531).
+manga_genere('comedy', 14531).
+manga_genere('delinquents', 14531).
+manga_genere('drama', 14531).
+manga_genere('ecchi', 14531).
+manga_genere('shounen', 14531).
+manga_genere('action', 16593).
+manga_genere('drama', 16593).
+manga_genere('shoujo', 16593).
+manga_genere('cgdct', 17552).
+manga_genere('iyashikei', 17552).
+manga_genere('school', 17552).
+manga_genere('seinen', 17552).
+manga_genere('slice_of_life', 17552).
+manga_genere('drama', 107548).
+manga_genere('mystery', 107548).
+manga_genere('sci-fi', 107548).
+manga_genere('seinen', 107548).
+manga_genere('mystery', 110031).
+manga_genere('shounen', 110031).
+manga_genere('supernatural', 110031).
+manga_genere('suspense', 110031).
+manga_genere('time_travel', 110031).
+manga_genere('action', 112318).
+manga_genere('fantasy', 112318).
+manga_genere('historical', 112318).
+manga_genere('shounen', 112318).
+manga_genere('comedy', 348).
+manga_genere('drama', 348).
+manga_genere('otaku_culture', 348).
+manga_genere('school', 348).
+manga_genere('seinen', 348).
+manga_genere('slice_of_life', 348).
+manga_genere('action', 510).
+manga_genere('adventure', 510).
+manga_genere('comedy', 510).
+manga_genere('drama', 510).
+manga_genere('fantasy', 510).
+manga_genere('josei', 510).
+manga_genere('drama', 585).
+manga_genere('romance', 585).
+manga_genere('school', 585).
+manga_genere('seinen', 585).
+manga_genere('action', 731).
+manga_genere('drama', 731).
+manga_genere('gore', 731).
+manga_genere('psychological', 731).
+manga_genere('sci-fi', 731).
+manga_genere('seinen', 731).
+manga_genere('suspense', 731).
+manga_genere('adventure', 1208).
+manga_genere('boys_love', 1208).
+manga_genere('fantasy', 1208).
+manga_genere('isekai', 1208).
+manga_genere('shoujo', 1208).
+manga_genere('detective', 1461).
+manga_genere('drama', 1461).
+manga_genere('organized_crime', 1461).
+manga_genere('seinen', 1461).
+manga_genere('suspense', 1461).
+manga_genere('drama', 1802).
+manga_genere('love_polygon', 1802).
+manga_genere('romance', 1802).
+manga_genere('shoujo', 1802).
+manga_genere('showbiz', 1802).
+manga_genere('drama', 3731).
+manga_genere('seinen', 3731).
+manga_genere('slice_of_life', 3731).
+manga_genere('action', 18074).
+manga_genere('mecha', 18074).
+manga_genere('shounen', 18074).
+manga_genere('comedy', 58027).
+manga_genere('romance', 58027).
+manga_genere('school', 58027).
+manga_genere('shounen', 58027).
+manga_genere('boys_love', 132962).
+manga_genere('drama', 132962).
+manga_genere('memoir', 132962).
+manga_genere('boys_love', 103063).
+manga_genere('childcare', 103063).
+manga_genere('slice_of_life', 103063).
+manga_genere('adventure', 103897).
+manga_genere('award_winning', 103897).
+manga_genere('sci-fi', 103897).
+manga_genere('shounen', 103897).
+manga_genere('survival', 103897).
+manga_genere('suspense', 103897).
+manga_genere('action', 106204).
+manga_genere('adult_cast', 106204).
+manga_genere('fantasy', 106204).
+manga_genere('seinen', 106204).
+manga_genere('comedy', 108566).
+manga_genere('mahou_shoujo', 108566).
+manga_genere('slice_of_life', 108566).
+manga_genere('drama', 24705).
+manga_genere('psychological', 24705).
+manga_genere('romance', 24705).
+manga_genere('school', 24705).
+manga_genere('shounen', 24705).
+manga_genere('award_winning', 26736).
+manga_genere('drama', 26736).
+manga_genere('romance', 26736).
+manga_genere('shoujo', 26736).
+manga_genere('boys_love', 140409).
+manga_genere('fantasy', 140409).
+manga_genere('adventure', 4453).
+manga_genere('fantasy', 4453).
+manga_genere('horror', 15805).
+manga_genere('mystery', 15805).
+manga_genere('romance', 15805).
+manga_genere('school', 15805).
+manga_genere('shounen', 15805).
+manga_genere('supernatural', 15805).
+manga_genere('award_winning', 70801).
+manga_genere('drama', 70801).
+manga_genere('school', 70801).
+manga_genere('sci-fi', 70801).
+manga_genere('seinen', 70801).
+manga_genere('fantasy', 115122).
+manga_genere('girls_love', 115122).
+manga_genere('school', 115122).
+manga_genere('drama', 124470).
+manga_genere('fantasy', 124470).
+manga_genere('isekai', 124470).
+manga_genere('psychological', 124470).
+manga_genere('seinen', 124470).
+manga_genere('suspense', 124470).
+manga_genere('time_travel', 124470).
+manga_genere('drama', 115746).
+manga_genere('mystery', 115746).
+manga_genere('psychological', 115746).
+manga_genere('seinen', 115746).
+manga_genere('suspense', 115746).
+manga_genere('girls_love', 140295).
+manga_genere('josei', 140295).
+manga_genere('slice_of_life', 140295).
+manga_genere('drama', 46010).
+manga_genere('mystery', 46010).
+manga_genere('seinen', 46010).
+manga_genere('supernatural', 46010).
+manga_genere('award_winning', 92).
+manga_genere('drama', 92).
+manga_genere('fantasy', 92).
+manga_genere('mahou_shoujo', 92).
+manga_genere('romance', 92).
+manga_genere('shoujo', 92).
+manga_genere('action', 373).
+manga_genere('adventure', 373).
+manga_genere('drama', 373).
+manga_genere('fantasy', 373).
+manga_genere('romance', 373).
+manga_genere('shoujo', 373).
+manga_genere('comedy', 1014).
+manga_genere('drama', 1014).
+manga_genere('romance', 1014).
+manga_genere('school', 1014).
+manga_genere('shounen', 1014).
+manga_genere('sports', 1014).
+manga_genere('team_sports', 1014).
+manga_genere('action', 1218).
+manga_genere('adult_cast', 1218).
+manga_genere('drama', 1218).
+manga_genere('organized_crime', 1218).
+manga_genere('psychological', 1218).
+manga_genere('strategy_game', 1218).
+manga_genere('action', 2924).
+manga_genere('adventure', 2924).
+manga_genere('award_winning', 2924).
+manga_genere('historical', 2924).
+manga_genere('seinen', 2924).
+manga_genere('action', 53).
+manga_genere('award_winning', 53).
+manga_genere('comedy', 53).
+manga_genere('drama', 53).
+manga_genere('shounen', 53).
+manga_genere('supernatural', 53).
+manga_genere('action', 3008).
+manga_genere('adventure', 3008).
+manga_genere('organized_crime', 3008).
+manga_genere('shounen', 3008).
+manga_genere('boys_love', 104491).
+manga_genere('childcare', 104491).
+manga_genere('slice_of_life', 104491).
+manga_genere('comedy', 112694).
+manga_genere('pets', 112694).
+manga_genere('slice_of_life', 112694).
+manga_genere('drama', 58563).
+manga_genere('historical', 58563).
+manga_genere('seinen', 58563).
+manga_genere('love_polygon', 27231).
+manga_genere('romance', 27231).
+manga_genere('school', 27231).
+manga_genere('shoujo', 27231).
+manga_genere('comedy', 30315).
+manga_genere('romance', 30315).
+manga_genere('shoujo', 30315).
+manga_genere('boys_love', 1982).
+manga_genere('fantasy', 1982).
+manga_genere('shoujo', 1982).
+manga_genere('supernatural', 1982).
+manga_genere('drama', 9738).
+manga_genere('horror', 9738).
+manga_genere('mystery', 9738).
+manga_genere('psychological', 9738).
+manga_genere('award_winning', 137939).
+manga_genere('drama', 137939).
+manga_genere('historical', 137939).
+manga_genere('seinen', 137939).
+manga_genere('comedy', 67401).
+manga_genere('supernatural', 67401).
+manga_genere('comedy', 80091).
+manga_genere('love_polygon', 80091).
+manga_genere('romance', 80091).
+manga_genere('school', 80091).
+manga_genere('seinen', 80091).
+manga_genere('award_winning', 80375).
+manga_genere('slice_of_life', 80375).
+manga_genere('award_winning', 121480).
+manga_genere('romance', 121480).
+manga_genere('shounen', 121480).
+manga_genere('supernatural', 121480).
+manga_genere('vampire', 121480).
+manga_genere('drama', 436).
+manga_genere('horror', 436).
+manga_genere('seinen', 436).
+manga_genere('supernatural', 436).
+manga_genere('award_winning', 994).
+manga_genere('comedy', 994).
+manga_genere('seinen', 994).
+manga_genere('sports', 994).
+manga_genere('team_sports', 994).
+manga_genere('action', 10865).
+manga_genere('drama', 10865).
+manga_genere('fantasy', 10865).
+manga_genere('shoujo', 10865).
+manga_genere('boys_love', 102703).
+manga_genere('comedy', 112589).
+manga_genere('romance', 112589).
+manga_genere('shounen', 112589).
+manga_genere('action', 113163).
+manga_genere('detective', 113163).
+manga_genere('mystery', 113163).
+manga_genere('supernatural', 113163).
+manga_genere('romance', 125052).
+manga_genere('video_game', 125052).
+manga_genere('drama', 126146).
+manga_genere('reincarnation', 126146).
+manga_genere('seinen', 126146).
+manga_genere('showbiz', 126146).
+manga_genere('action', 131334).
+manga_genere('comedy', 131334).
+manga_genere('shounen', 131334).
+manga_genere('action', 58007).
+manga_genere('shoujo', 58007).
+manga_genere('award_winning', 661).
+manga_genere('comedy', 661).
+manga_genere('gag_humor', 661).
+manga_genere('parody', 661).
+manga_genere('school', 661).
+manga_genere('shounen', 661).
+manga_genere('adult_cast', 688).
+manga_genere('comedy', 688).
+manga_genere('drama', 688).
+manga_genere('romance', 688).
+manga_genere('seinen', 688).
+manga_genere('action', 705).
+manga_genere('horror', 705).
+manga_genere('romance', 705).
+manga_genere('supernatural', 705).
+manga_genere('vampire', 705).
+manga_genere('adventure', 929).
+manga_genere('drama', 929).
+manga_genere('fantasy', 929).
+manga_genere('historical', 929).
+manga_genere('isekai', 929).
+manga_genere('magical_sex_shift', 929).
+manga_genere('romance', 929).
+manga_genere('shoujo', 929).
+manga_genere('comedy', 1110).
+manga_genere('romance', 1110).
+manga_genere('shoujo', 1110).
+manga_genere('slice_of_life', 1110).
+manga_genere('comedy', 8144).
+manga_genere('drama', 8144).
+manga_genere('ecchi', 8144).
+manga_genere('romance', 8144).
+manga_genere('school', 8144).
+manga_genere('sci-fi', 8144).
+manga_genere('shounen', 8144).
+manga_genere('award_winning', 9546).
+manga_genere('comedy', 9546).
+manga_genere('drama', 9546).
+manga_genere('racing', 9546).
+manga_genere('shounen', 9546).
+manga_genere('action', 10443).
+manga_genere('drama', 10443).
+manga_genere('psychological', 10443).
+manga_genere('school', 10443).
+manga_genere('seinen', 10443).
+manga_genere('adult_cast', 117840).
+manga_genere('comedy', 117840).
+manga_genere('romance', 117840).
+manga_genere('seinen', 117840).
+manga_genere('workplace', 117840).
+manga_genere('comedy', 120250).
+manga_genere('seinen', 120250).
+manga_genere('slice_of_life', 120250).
+manga_genere('action', 130331).
+manga_genere('adventure', 130331).
+manga_genere('award_winning', 130331).
+manga_genere('fantasy', 130331).
+manga_genere('shounen', 130331).
+manga_genere('video_game', 130331).
+manga_genere('drama', 35733).
+manga_genere('shounen', 35733).
+manga_genere('action', 36131).
+manga_genere('comedy', 36131).
+manga_genere('fantasy', 36131).
+manga_genere('mahou_shoujo', 36131).
+manga_genere('drama', 44319).
+manga_genere('horror', 44319).
+manga_genere('mahou_shoujo', 44319).
+manga_genere('school', 44319).
+manga_genere('seinen', 44319).
+manga_genere('comedy', 45947).
+manga_genere('pets', 45947).
+manga_genere('shoujo', 45947).
+manga_genere('slice_of_life', 45947).
+manga_genere('comedy', 20242).
+manga_genere('mythology', 20242).
+manga_genere('shounen', 20242).
+manga_genere('supernatural', 20242).
+manga_genere('award_winning', 100128).
+manga_genere('mystery', 100128).
+manga_genere('psychological', 100128).
+manga_genere('shounen', 100128).
+manga_genere('survival', 100128).
+manga_genere('suspense', 100128).
+manga_genere('action', 77637).
+manga_genere('fantasy', 77637).
+manga_genere('boys_love', 84255).
+manga_genere('school', 84255).
+manga_genere('slice_of_life', 84255).
+manga_genere('award_winning', 111229).
+manga_genere('josei', 111229).
+manga_genere('mystery', 111229).
+manga_genere('girls_love', 117020).
+manga_genere('girls_love', 118625).
+manga_genere('school', 118625).
+manga_genere('comedy', 17).
+manga_genere('drama', 17).
+manga_genere('romance', 17).
+manga_genere('school', 17).
+manga_genere('shoujo', 17).
+manga_genere('award_winning', 729).
+manga_genere('historical', 729).
+manga_genere('romance', 729).
+manga_genere('seinen', 729).
+manga_genere('slice_of_life', 729).
+manga_genere('action', 770).
+manga_genere('drama', 770).
+manga_genere('martial_arts', 770).
+manga_genere('sci-fi', 770).
+manga_genere('seinen', 770).
+manga_genere('award_winning', 1297).
+manga_genere('drama', 1297).
+manga_genere('medical', 1297).
+manga_genere('psychological', 1297).
+manga_genere('seinen', 1297).
+manga_genere('action', 1630).
+manga_genere('adventure', 1630).
+manga_genere('historical', 1630).
+manga_genere('shounen', 1630).
+manga_genere('vampire', 1630).
+manga_genere('award_winning', 1695).
+manga_genere('drama', 1695).
+manga_genere('historical', 1695).
+manga_genere('military', 1695).
+manga_genere('award_winning', 3042).
+manga_genere('seinen', 3042).
+manga_genere('slice_of_life', 3042).
+manga_genere('action', 8070).
+manga_genere('adventure', 8070).
+manga_genere('fantasy', 8070).
+manga_genere('historical', 8070).
+manga_genere('mythology', 8070).
+manga_genere('shounen', 8070).
+manga_genere('comedy', 8557).
+manga_genere('drama', 8557).
+manga_genere('romance', 8557).
+manga_genere('school', 8557).
+manga_genere('shounen', 8557).
+manga_genere('slice_of_life', 8557).
+manga_genere('award_winning', 8652).
+manga_genere('boys_love', 8652).
+manga_genere('drama', 8652).
+manga_genere('psychological', 8652).
+manga_genere('shoujo', 8652).
+manga_genere('detective', 11850).
+manga_genere('shoujo', 11850).
+manga_genere('supernatural', 11850).
+manga_genere('award_winning', 10978).
+manga_genere('comedy', 10978).
+manga_genere('drama', 10978).
+manga_genere('shounen', 10978).
+manga_genere('sports', 10978).
+manga_genere('team_sports', 10978).
+manga_genere('action', 96792).
+manga_genere('fantasy', 96792).
+manga_genere('historical', 96792).
+manga_genere('shounen', 96792).
+manga_genere('pets', 21467).
+manga_genere('seinen', 21467).
+manga_genere('slice_of_life', 21467).
+manga_genere('romance', 26769).
+manga_genere('school', 26769).
+manga_genere('seinen', 26769).
+manga_genere('slice_of_life', 26769).
+manga_genere('adventure', 111745).
+manga_genere('mystery', 111745).
+manga_genere('sci-fi', 111745).
+manga_genere('seinen', 111745).
+manga_genere('childcare', 63535).
+manga_genere('comedy', 63535).
+manga_genere('gourmet', 63535).
+manga_genere('iyashikei', 63535).
+manga_genere('seinen', 63535).
+manga_genere('slice_of_life', 63535).
+manga_genere('fantasy', 80841).
+manga_genere('iyashikei', 80841).
+manga_genere('seinen', 80841).
+manga_genere('slice_of_life', 80841).
+manga_genere('comedy', 463).
+manga_genere('drama', 463).
+manga_genere('otaku_culture', 463).
+manga_genere('psychological', 463).
+manga_genere('romance', 463).
+manga_genere('shounen', 463).
+manga_genere('boys_love', 635).
+manga_genere('historical', 635).
+manga_genere('horror', 635).
+manga_genere('mystery', 635).
+manga_genere('shoujo', 635).
+manga_genere('supernatural', 635).
+manga_genere('adventure', 792).
+manga_genere('comedy', 792).
+manga_genere('detective', 792).
+manga_genere('shounen', 792).
+manga_genere('comedy', 7010).
+manga_genere('drama', 7010).
+manga_genere('historical', 7010).
+manga_genere('reincarnation', 7010).
+manga_genere('romance', 7010).
+manga_genere('shoujo', 7010).
+manga_genere('supernatural', 7010).
+manga_genere('action', 10010).
+manga_genere('childcare', 10010).
+manga_genere('comedy', 10010).
+manga_genere('delinquents', 10010).
+manga_genere('mythology', 10010).
+manga_genere('school', 10010).
+manga_genere('shounen', 10010).
+manga_genere('supernatural', 10010).
+manga_genere('drama', 89960).
+manga_genere('fantasy', 89960).
+manga_genere('isekai', 89960).
+manga_genere('psychological', 89960).
+manga_genere('seinen', 89960).
+manga_genere('suspense', 89960).
+manga_genere('time_travel', 89960).
+manga_genere('memoir', 99969).
+manga_genere('slice_of_life', 99969).
+manga_genere('romance', 24294).
+manga_genere('school', 24294).
+manga_genere('shoujo', 24294).
+manga_genere('fantasy', 21054).
+manga_genere('slice_of_life', 21054).
+manga_genere('award_winning', 36933).
+manga_genere('comedy', 36933).
+manga_genere('romance', 36933).
+manga_genere('shoujo', 36933).
+manga_genere('award_winning', 20).
+manga_genere('comedy', 20).
+manga_genere('drama', 20).
+manga_genere('shounen', 20).
+manga_genere('strategy_game', 20).
+manga_genere('supernatural', 20).
+manga_genere('action', 338).
+manga_genere('adventure', 338).
+manga_genere('drama', 338).
+manga_genere('fantasy', 338).
+manga_genere('romance', 338).
+manga_genere('sci-fi', 338).
+manga_genere('shounen', 338).
+manga_genere('supernatural', 338).
+manga_genere('action', 1101).
+manga_genere('detective', 1101).
+manga_genere('drama', 1101).
+manga_genere('psychological', 1101).
+manga_genere('shounen', 1101).
+manga_genere('suspense', 1101).
+manga_genere('award_winning', 1365).
+manga_genere('boys_love', 1365).
+manga_genere('drama', 1365).
+manga_genere('historical', 1365).
+manga_genere('shoujo', 1365).
+manga_genere('action', 3403).
+manga_genere('comedy', 3403).
+manga_genere('ecchi', 3403).
+manga_genere('fantasy', 3403).
+manga_genere('harem', 3403).
+manga_genere('romance', 3403).
+manga_genere('school', 3403).
+manga_genere('shounen', 3403).
+manga_genere('supernatural', 3403).
+manga_genere('vampire', 3403).
+manga_genere('award_winning', 4423).
+manga_genere('drama', 4423).
+manga_genere('historical', 4423).
+manga_genere('samurai', 4423).
+manga_genere('shoujo', 4423).
+manga_genere('anthropomorphic', 4945).
+manga_genere('award_winning', 4945).
+manga_genere('shounen', 4945).
+manga_genere('action', 7760).
+manga_genere('adventure', 7760).
+manga_genere('gore', 7760).
+manga_genere('martial_arts', 7760).
+manga_genere('award_winning', 8300).
+manga_genere('school', 8300).
+manga_genere('shounen', 8300).
+manga_genere('sports', 8300).
+manga_genere('adult_cast', 153158).
+manga_genere('romance', 153158).
+manga_genere('seinen', 153158).
+manga_genere('historical', 154679).
+manga_genere('romance', 154679).
+manga_genere('memoir', 107948).
+manga_genere('slice_of_life', 107948).
+manga_genere('award_winning', 20554).
+manga_genere('comedy', 20554).
+manga_genere('shoujo', 20554).
+manga_genere('slice_of_life', 20554).
+manga_genere('comedy', 27029).
+manga_genere('crossdressing', 27029).
+manga_genere('drama', 27029).
+manga_genere('harem', 27029).
+manga_genere('romance', 27029).
+manga_genere('school', 27029).
+manga_genere('shoujo', 27029).
+manga_genere('action', 48025).
+manga_genere('adventure', 48025).
+manga_genere('fantasy', 48025).
+manga_genere('shounen', 48025).
+manga_genere('fantasy', 70259).
+manga_genere('isekai', 70259).
+manga_genere('reincarnation', 70259).
+manga_genere('seinen', 70259).
+manga_genere('comedy', 80281).
+manga_genere('military', 80281).
+manga_genere('school', 80281).
+manga_genere('seinen', 80281).
+manga_genere('drama', 138407).
+manga_genere('mystery', 138407).
+manga_genere('sci-fi', 138407).
+manga_genere('adult_cast', 148467).
+manga_genere('love_status_quo', 148467).
+manga_genere('romance', 148467).
+manga_genere('comedy', 159130).
+manga_genere('gag_humor', 159130).
+manga_genere('seinen', 159130).
+manga_genere('action', 47).
+manga_genere('comedy', 47).
+manga_genere('organized_crime', 47).
+manga_genere('school', 47).
+manga_genere('shounen', 47).
+manga_genere('super_power', 47).
+manga_genere('award_winning', 339).
+manga_genere('comedy', 339).
+manga_genere('delinquents', 339).
+manga_genere('gag_humor', 339).
+manga_genere('shounen', 339).
+manga_genere('action', 872).
+manga_genere('adventure', 872).
+manga_genere('shounen', 872).
+manga_genere('supernatural', 872).
+manga_genere('action', 908).
+manga_genere('comedy', 908).
+manga_genere('fantasy', 908).
+manga_genere('shounen', 908).
+manga_genere('drama', 1258).
+manga_genere('horror', 1258).
+manga_genere('mystery', 1258).
+manga_genere('psychological', 1258).
+manga_genere('shounen', 1258).
+manga_genere('boys_love', 9296).
+manga_genere('school', 9296).
+manga_genere('slice_of_life', 9296).
+manga_genere('action', 10447).
+manga_genere('mecha', 10447).
+manga_genere('sci-fi', 10447).
+manga_genere('shounen', 10447).
+manga_genere('award_winning', 11243).
+manga_genere('drama', 11243).
+manga_genere('historical', 11243).
+manga_genere('seinen', 11243).
+manga_genere('comedy', 11652).
+manga_genere('school', 11652).
+manga_genere('shounen', 11652).
+manga_genere('sports', 11652).
+manga_genere('team_sports', 11652).
+manga_genere('comedy', 13702).
+manga_genere('romance', 13702).
+manga_genere('school', 13702).
+manga_genere('shoujo', 13702).
+manga_genere('boys_love', 112090).
+manga_genere('school', 112090).
+manga_genere('slice_of_life', 112090).
+manga_genere('adult_cast', 112922).
+manga_genere('comedy', 112922).
+manga_genere('organized_crime', 112922).
+manga_genere('school', 124094).
+manga_genere('supernatural', 124094).
+manga_genere('comedy', 19709).
+manga_genere('historical', 19709).
+manga_genere('seinen', 19709).
+manga_genere('slice_of_life', 19709).
+manga_genere('action', 41435).
+manga_genere('martial_arts', 41435).
+manga_genere('shoujo', 41435).
+manga_genere('supernatural', 41435).
+manga_genere('action', 27).
+manga_genere('drama', 27).
+manga_genere('fantasy', 27).
+manga_genere('psychological', 27).
+manga_genere('shoujo', 27).
+manga_genere('super_power', 27).
+manga_genere('supernatural', 27).
+manga_genere('action', 564).
+manga_genere('drama', 564).
+manga_genere('gore', 564).
+manga_genere('horror', 564).
+manga_genere('psychological', 564).
+manga_genere('sci-fi', 564).
+manga_genere('seinen', 564).
+manga_genere('supernatural', 564).
+manga_genere('survival', 564).
+manga_genere('detective', 674).
+manga_genere('mystery', 674).
+manga_genere('shounen', 674).
+manga_genere('supernatural', 674).
+manga_genere('action', 928).
+manga_genere('adventure', 928).
+manga_genere('kids', 928).
+manga_genere('action', 1149).
+manga_genere('drama', 1149).
+manga_genere('martial_arts', 1149).
+manga_genere('sci-fi', 1149).
+manga_genere('shounen', 1149).
+manga_genere('drama', 1257).
+manga_genere('horror', 1257).
+manga_genere('mystery', 1257).
+manga_genere('psychological', 1257).
+manga_genere('drama', 3097).
+manga_genere('fantasy', 3097).
+manga_genere('sci-fi', 3097).
+manga_genere('seinen', 3097).
+manga_genere('slice_of_life', 3097).
+manga_genere('supernatural', 3097).
+manga_genere('comedy', 7749).
+manga_genere('delinquents', 7749).
+manga_genere('school', 7749).
+manga_genere('shoujo', 7749).
+manga_genere('drama', 62671).
+manga_genere('fantasy', 62671).
+manga_genere('mahou_shoujo', 62671).
+manga_genere('psychological', 62671).
+manga_genere('award_winning', 78537).
+manga_genere('comedy', 78537).
+manga_genere('love_status_quo', 78537).
+manga_genere('romance', 78537).
+manga_genere('school', 78537).
+manga_genere('shounen', 78537).
+manga_genere('drama', 24457).
+manga_genere('fantasy', 24457).
+manga_genere('horror', 24457).
+manga_genere('mahou_shoujo', 24457).
+manga_genere('school', 24457).
+manga_genere('action', 26178).
+manga_genere('historical', 26178).
+manga_genere('shoujo', 26178).
+manga_genere('supernatural', 26178).
+manga_genere('fantasy', 44523).
+manga_genere('boys_love', 119931).
+manga_genere('drama', 119931).
+manga_genere('supernatural', 119931).
+manga_genere('adult_cast', 121303).
+manga_genere('boys_love', 121303).
+manga_genere('comedy', 121303).
+manga_genere('supernatural', 121303).
+manga_genere('workplace', 121303).
+manga_genere('action', 11).
+manga_genere('adventure', 11).
+manga_genere('fantasy', 11).
+manga_genere('martial_arts', 11).
+manga_genere('shounen', 11).
+manga_genere('award_winning', 393).
+manga_genere('detective', 393).
+manga_genere('drama', 393).
+manga_genere('mystery', 393).
+manga_genere('shounen', 393).
+manga_genere('supernatural', 393).
+manga_genere('comedy', 591).
+manga_genere('romance', 591).
+manga_genere('school', 591).
+manga_genere('shoujo', 591).
+manga_genere('action', 988).
+manga_genere('comedy', 988).
+manga_genere('drama', 988).
+manga_genere('ecchi', 988).
+manga_genere('martial_arts', 988).
+manga_genere('shounen', 988).
+manga_genere('adult_cast', 3574).
+manga_genere('drama', 3574).
+manga_genere('psychological', 3574).
+manga_genere('seinen', 3574).
+manga_genere('strategy_game', 3574).
+manga_genere('action', 95964).
+manga_genere('fantasy', 95964).
+manga_genere('shounen', 95964).
+manga_genere('super_power', 95964).
+manga_genere('urban_fantasy', 95964).
+manga_genere('vampire', 95964).
+manga_genere('comedy', 108187).
+manga_genere('iyashikei', 108187).
+manga_genere('romance', 108187).
+manga_genere('slice_of_life', 108187).
+manga_genere('drama', 108696).
+manga_genere('shounen', 108696).
+manga_genere('showbiz', 108696).
+manga_genere('visual_arts', 108696).
+manga_genere('romance', 139104).
+manga_genere('shoujo', 139104).
+manga_genere('adult_cast', 142799).
+manga_genere('comedy', 142799).
+manga_genere('crossdressing', 142799).
+manga_genere('romance', 142799).
+manga_genere('comedy', 89467).
+manga_genere('school', 89467).
+manga_genere('shounen', 89467).
+manga_genere('slice_of_life', 89467).
+manga_genere('action', 115710).
+manga_genere('shounen', 115710).
+manga_genere('supernatural', 115710).
+manga_genere('comedy', 633).
+manga_genere('romance', 633).
+manga_genere('school', 633).
+manga_genere('shoujo', 633).
+manga_genere('drama', 655).
+manga_genere('fantasy', 655).
+manga_genere('mystery', 655).
+manga_genere('reincarnation', 655).
+manga_genere('romance', 655).
+manga_genere('sci-fi', 655).
+manga_genere('shoujo', 655).
+manga_genere('space', 655).
+manga_genere('girls_love', 3102).
+manga_genere('school', 3102).
+manga_genere('seinen', 3102).
+manga_genere('drama', 1211).
+manga_genere('historical', 1211).
+manga_genere('horror', 1211).
+manga_genere('psychological', 1211).
+manga_genere('seinen', 1211).
+manga_genere('action', 3868).
+manga_genere('drama', 3868).
+manga_genere('gore', 3868).
+manga_genere('historical', 3868).
+manga_genere('martial_arts', 3868).
+manga_genere('samurai', 3868).
+manga_genere('seinen', 3868).
+manga_genere('action', 12917).
+manga_genere('adventure', 12917).
+manga_genere('comedy', 12917).
+manga_genere('supernatural', 12917).
+manga_genere('girls_love', 38105).
+manga_genere('school', 38105).
+manga_genere('drama', 41629).
+manga_genere('mystery', 41629).
+manga_genere('school', 41629).
+manga_genere('shounen', 41629).
+manga_genere('slice_of_life', 41629).
+manga_genere('adventure', 114793).
+manga_genere('fantasy', 114793).
+manga_genere('psychological', 114793).
+manga_genere('slice_of_life', 114793).
+manga_genere('action', 128594).
+manga_genere('adventure', 128594).
+manga_genere('fantasy', 128594).
+manga_genere('shounen', 128594).
+manga_genere('super_power', 128594).
+manga_genere('comedy', 117332).
+manga_genere('love_status_quo', 117332).
+manga_genere('romance', 117332).
+manga_genere('school', 117332).
+manga_genere('shounen', 117332).
+manga_genere('comedy', 121209).
+manga_genere('parody', 121209).
+manga_genere('school', 121209).
+manga_genere('supernatural', 121209).
+manga_genere('action', 573).
+manga_genere('boys_love', 573).
+manga_genere('comedy', 573).
+manga_genere('drama', 573).
+manga_genere('mystery', 573).
+manga_genere('organized_crime', 573).
+manga_genere('action', 649).
+manga_genere('award_winning', 649).
+manga_genere('drama', 649).
+manga_genere('military', 649).
+manga_genere('psychological', 649).
+manga_genere('sci-fi', 649).
+manga_genere('action', 1092).
+manga_genere('comedy', 1092).
+manga_genere('delinquents', 1092).
+manga_genere('josei', 1092).
+manga_genere('organized_crime', 1092).
+manga_genere('romance', 1092).
+manga_genere('school', 1092).
+manga_genere('slice_of_life', 1092).
+manga_genere('workplace', 1092).
+manga_genere('mecha', 1659).
+manga_genere('military', 1659).
+manga_genere('sci-fi', 1659).
+manga_genere('action', 5711).
+manga_genere('award_winning', 5711).
+manga_genere('drama', 5711).
+manga_genere('shounen', 5711).
+manga_genere('josei', 8742).
+manga_genere('performing_arts', 8742).
+manga_genere('fantasy', 15104).
+manga_genere('shounen', 15104).
+manga_genere('drama', 17517).
+manga_genere('mystery', 17517).
+manga_genere('sci-fi', 17517).
+manga_genere('seinen', 17517).
+manga_genere('action', 61097).
+manga_genere('drama', 61097).
+manga_genere('historical', 61097).
+manga_genere('shoujo', 61097).
+manga_genere('supernatural', 61097).
+manga_genere('avant_garde', 18570).
+manga_genere('drama', 18570).
+manga_genere('psychological', 18570).
+manga_genere('sci-fi', 18570).
+manga_genere('seinen', 18570).
+manga_genere('comedy', 19980).
+manga_genere('romance', 19980).
+manga_genere('school', 19980).
+manga_genere('shoujo', 19980).
+manga_genere('action', 24903).
+manga_genere('adult_cast', 24903).
+manga_genere('drama', 24903).
+manga_genere('organized_crime', 24903).
+manga_genere('seinen', 24903).
+manga_genere('comedy', 44501).
+manga_genere('love_polygon', 44501).
+manga_genere('romance', 44501).
+manga_genere('school', 44501).
+manga_genere('seinen', 44501).
+manga_genere('adventure', 98374).
+manga_genere('comedy', 98374).
+manga_genere('fantasy', 98374).
+manga_genere('mahou_shoujo', 98374).
+manga_genere('romance', 98374).
+manga_genere('shoujo', 98374).
+manga_genere('award_winning', 99007).
+manga_genere('comedy', 99007).
+manga_genere('school', 99007).
+manga_genere('shounen', 99007).
+manga_genere('comedy', 167099).
+manga_genere('romance', 167099).
+manga_genere('shounen', 167099).
+manga_genere('action', 648).
+manga_genere('drama', 648).
+manga_genere('seinen', 648).
+manga_genere('romance', 1216).
+manga_genere('shoujo', 1216).
+manga_genere('visual_arts', 1216).
+manga_genere('drama', 1260).
+manga_genere('horror', 1260).
+manga_genere('mystery', 1260).
+manga_genere('psychological', 1260).
+manga_genere('shounen', 1260).
+manga_genere('iyashikei', 3282).
+manga_genere('romance', 3282).
+manga_genere('shoujo', 3282).
+manga_genere('childcare', 5775).
+manga_genere('drama', 5775).
+manga_genere('romance', 5775).
+manga_genere('shoujo', 5775).
+manga_genere('supernatural', 5775).
+manga_genere('action', 11914).
+manga_genere('historical', 11914).
+manga_genere('shoujo', 11914).
+manga_genere('adult_cast', 13271).
+manga_genere('drama', 13271).
+manga_genere('historical', 13271).
+manga_genere('samurai', 13271).
+manga_genere('seinen', 13271).
+manga_genere('action', 151815).
+manga_genere('adventure', 151815).
+manga_genere('comedy', 151815).
+manga_genere('supernatural', 151815).
+manga_genere('horror', 55163).
+manga_genere('mystery', 55163).
+manga_genere('psychological', 55163).
+manga_genere('school', 55163).
+manga_genere('slice_of_life', 55163).
+manga_genere('survival', 55163).
+manga_genere('suspense', 55163).
+manga_genere('iyashikei', 59893).
+manga_genere('school', 59893).
+manga_genere('slice_of_life', 59893).
+manga_genere('drama', 22986).
+manga_genere('fantasy', 22986).
+manga_genere('romance', 22986).
+manga_genere('seinen', 22986).
+manga_genere('supernatural', 22986).
+manga_genere('pets', 25245).
+manga_genere('seinen', 25245).
+manga_genere('slice_of_life', 25245).
+manga_genere('comedy', 35003).
+manga_genere('harem', 35003).
+manga_genere('mystery', 35003).
+manga_genere('romance', 35003).
+manga_genere('school', 35003).
+manga_genere('shounen', 35003).
+manga_genere('supernatural', 35003).
+manga_genere('horror', 41697).
+manga_genere('mystery', 41697).
+manga_genere('shoujo', 41697).
+manga_genere('supernatural', 41697).
+manga_genere('comedy', 43857).
+manga_genere('shounen', 43857).
+manga_genere('sports', 43857).
+manga_genere('team_sports', 43857).
+manga_genere('drama', 130661).
+manga_genere('romance', 130661).
+manga_genere('visual_arts', 130661).
+manga_genere('comedy', 130934).
+manga_genere('romance', 130934).
+manga_genere('action', 133081).
+manga_genere('delinquents', 133081).
+manga_genere('school', 133081).
+manga_genere('romance', 136975).
+manga_genere('shoujo', 136975).
+manga_genere('adventure', 80385).
+manga_genere('comedy', 80385).
+manga_genere('fantasy', 80385).
+manga_genere('isekai', 80385).
+manga_genere('parody', 80385).
+manga_genere('shounen', 80385).
+manga_genere('drama', 80719).
+manga_genere('fantasy', 80719).
+manga_genere('isekai', 80719).
+manga_genere('psychological', 80719).
+manga_genere('seinen', 80719).
+manga_genere('suspense', 80719).
+manga_genere('time_travel', 80719).
+manga_genere('action', 88110).
+manga_genere('fantasy', 88110).
+manga_genere('seinen', 88110).
+manga_genere('supernatural', 88110).
+manga_genere('comedy', 1184).
+manga_genere('drama', 1184).
+manga_genere('romance', 1184).
+manga_genere('school', 1184).
+manga_genere('shounen', 1184).
+manga_genere('sports', 1184).
+manga_genere('team_sports', 1184).
+manga_genere('cgdct', 1362).
+manga_genere('comedy', 1362).
+manga_genere('iyashikei', 1362).
+manga_genere('school', 1362).
+manga_genere('slice_of_life', 1362).
+manga_genere('visual_arts', 1362).
+manga_genere('action', 1474).
+manga_genere('adventure', 1474).
+manga_genere('drama', 1474).
+manga_genere('fantasy', 1474).
+manga_genere('horror', 1474).
+manga_genere('mythology', 1474).
+manga_genere('psychological', 1474).
+manga_genere('sci-fi', 1474).
+manga_genere('shounen', 1474).
+manga_genere('super_power', 1474).
+manga_genere('supernatural', 1474).
+manga_genere('action', 3076).
+manga_genere('boys_love', 3076).
+manga_genere('comedy', 3076).
+manga_genere('fantasy', 3076).
+manga_genere('mystery', 3076).
+manga_genere('shoujo', 3076).
+manga_genere('supernatural', 3076).
+manga_genere('vampire', 3076).
+manga_genere('seinen', 10179).
+manga_genere('slice_of_life', 10179).
+manga_genere('drama', 10330).
+manga_genere('love_polygon', 10330).
+manga_genere('romance', 10330).
+manga_genere('school', 10330).
+manga_genere('shoujo', 10330).
+manga_genere('showbiz', 10330).
+manga_genere('action', 163232).
+manga_genere('fantasy', 163232).
+manga_genere('shounen', 163232).
+manga_genere('adult_cast', 152907).
+manga_genere('romance', 152907).
+manga_genere('shoujo', 152907).
+manga_genere('comedy', 8).
+manga_genere('drama', 8).
+manga_genere('fantasy', 8).
+manga_genere('music', 8).
+manga_genere('romance', 8).
+manga_genere('shoujo', 8).
+manga_genere('showbiz', 8).
+manga_genere('supernatural', 8).
+manga_genere('award_winning', 670).
+manga_genere('drama', 670).
+manga_genere('mecha', 670).
+manga_genere('psychological', 670).
+manga_genere('sci-fi', 670).
+manga_genere('seinen', 670).
+manga_genere('survival', 670).
+manga_genere('action', 1741).
+manga_genere('comedy', 1741).
+manga_genere('delinquents', 1741).
+manga_genere('school', 1741).
+manga_genere('shounen', 1741).
+manga_genere('award_winning', 4207).
+manga_genere('romance', 4207).
+manga_genere('shoujo', 4207).
+manga_genere('slice_of_life', 4207).
+manga_genere('action', 14978).
+manga_genere('adventure', 14978).
+manga_genere('comedy', 14978).
+manga_genere('drama', 14978).
+manga_genere('fantasy', 14978).
+manga_genere('josei', 14978).
+manga_genere('reincarnation', 128072).
+manga_genere('romance', 128072).
+manga_genere('supernatural', 128072).
+manga_genere('boys_love', 128995).
+manga_genere('slice_of_life', 128995).
+manga_genere('award_winning', 59519).
+manga_genere('shounen', 59519).
+manga_genere('sports', 59519).
+manga_genere('team_sports', 59519).
+manga_genere('fantasy', 62723).
+manga_genere('mythology', 62723).
+manga_genere('shounen', 62723).
+manga_genere('comedy', 84559).
+manga_genere('romance', 84559).
+manga_genere('school', 84559).
+manga_genere('shoujo', 84559).
+manga_genere('action', 83923).
+manga_genere('fantasy', 83923).
+manga_genere('supernatural', 83923).
+manga_genere('school', 163455).
+manga_genere('shounen', 163455).
+manga_genere('supernatural', 163455).
+manga_genere('drama', 104271).
+manga_genere('psychological', 104271).
+manga_genere('seinen', 104271).
+manga_genere('suspense', 104271).
+manga_genere('comedy', 105430).
+manga_genere('love_status_quo', 105430).
+manga_genere('romance', 105430).
+manga_genere('school', 105430).
+manga_genere('shounen', 105430).
+manga_genere('action', 110485).
+manga_genere('fantasy', 110485).
+manga_genere('mythology', 110485).
+manga_genere('seinen', 110485).
+manga_genere('adult_cast', 118232).
+manga_genere('drama', 118232).
+manga_genere('fantasy', 118232).
+manga_genere('historical', 118232).
+manga_genere('romance', 118232).
+manga_genere('drama', 122842).
+manga_genere('girls_love', 122842).
+manga_genere('josei', 122842).
+manga_genere('slice_of_life', 122842).
+manga_genere('romance', 128463).
+manga_genere('school', 128463).
+manga_genere('shoujo', 128463).
+manga_genere('adventure', 25916).
+manga_genere('drama', 25916).
+manga_genere('fantasy', 25916).
+manga_genere('shounen', 25916).
+manga_genere('childcare', 52043).
+manga_genere('shounen', 52043).
+manga_genere('slice_of_life', 52043).
+manga_genere('action', 442).
+manga_genere('psychological', 442).
+manga_genere('seinen', 442).
+manga_genere('shounen', 976).
+manga_genere('supernatural', 976).
+manga_genere('vampire', 976).
+manga_genere('action', 1605).
+manga_genere('award_winning', 1605).
+manga_genere('fantasy', 1605).
+manga_genere('military', 1605).
+manga_genere('shounen', 1605).
+manga_genere('comedy', 1735).
+manga_genere('gag_humor', 1735).
+manga_genere('music', 1735).
+manga_genere('seinen', 1735).
+manga_genere('drama', 4368).
+manga_genere('love_polygon', 4368).
+manga_genere('romance', 4368).
+manga_genere('school', 4368).
+manga_genere('crossdressing', 14633).
+manga_genere('drama', 14633).
+manga_genere('romance', 14633).
+manga_genere('school', 14633).
+manga_genere('shoujo', 14633).
+manga_genere('showbiz', 14633).
+manga_genere('comedy', 665).
+manga_genere('fantasy', 665).
+manga_genere('romance', 665).
+manga_genere('shoujo', 665).
+manga_genere('award_winning', 1506).
+manga_genere('love_polygon', 1506).
+manga_genere('romance', 1506).
+manga_genere('shoujo', 1506).
+manga_genere('drama', 17465).
+manga_genere('seinen', 17465).
+manga_genere('comedy', 143031).
+manga_genere('romance', 143031).
+manga_genere('school', 143031).
+manga_genere('drama', 144034).
+manga_genere('performing_arts', 144034).
+manga_genere('shounen', 144034).
+manga_genere('fantasy', 68883).
+manga_genere('mythology', 68883).
+manga_genere('romance', 68883).
+manga_genere('shoujo', 68883).
+manga_genere('comedy', 25250).
+manga_genere('ecchi', 25250).
+manga_genere('horror', 25250).
+manga_genere('seinen', 25250).
+manga_genere('action', 49865).
+manga_genere('gore', 49865).
+manga_genere('horror', 49865).
+manga_genere('mystery', 49865).
+manga_genere('seinen', 49865).
+manga_genere('supernatural', 49865).
+manga_genere('drama', 89562).
+manga_genere('romance', 89562).
+manga_genere('shoujo', 89562).
+manga_genere('comedy', 99391).
+manga_genere('iyashikei', 99391).
+manga_genere('pets', 99391).
+manga_genere('slice_of_life', 99391).
+manga_genere('romance', 103942).
+manga_genere('school', 103942).
+manga_genere('shounen', 103942).
+manga_genere('horror', 136793).
+manga_genere('shoujo', 136793).
+manga_genere('school', 116539).
+manga_genere('shounen', 116539).
+manga_genere('strategy_game', 116539).
+manga_genere('adult_cast', 159093).
+manga_genere('cgdct', 159093).
+manga_genere('comedy', 159093).
+manga_genere('music', 159093).
+manga_genere('action', 23).
+manga_genere('comedy', 23).
+manga_genere('ecchi', 23).
+manga_genere('harem', 23).
+manga_genere('martial_arts', 23).
+manga_genere('romance', 23).
+manga_genere('school', 23).
+manga_genere('shounen', 23).
+manga_genere('action', 509).
+manga_genere('adventure', 509).
+manga_genere('drama', 509).
+manga_genere('fantasy', 509).
+manga_genere('action', 7630).
+manga_genere('adult_cast', 7630).
+manga_genere('military', 7630).
+manga_genere('romance', 7630).
+manga_genere('sci-fi', 7630).
+manga_genere('shoujo', 7630).
+manga_genere('comedy', 11643).
+manga_genere('shounen', 11643).
+manga_genere('sports', 11643).
+manga_genere('team_sports', 11643).
+manga_genere('award_winning', 13897).
+manga_genere('drama', 13897).
+manga_genere('seinen', 13897).
+manga_genere('sports', 13897).
+manga_genere('team_sports', 13897).
+manga_genere('comedy', 14110).
+manga_genere('gag_humor', 14110).
+manga_genere('school', 14110).
+manga_genere('shounen', 14110).
+manga_genere('drama', 89553).
+manga_genere('shoujo', 89553).
+manga_genere('crossdressing', 59961).
+manga_genere('shounen', 59961).
+manga_genere('sports', 59961).
+manga_genere('team_sports', 59961).
+manga_genere('drama', 28899).
+manga_genere('sci-fi', 28899).
+manga_genere('seinen', 28899).
+manga_genere('comedy', 45447).
+manga_genere('love_polygon', 45447).
+manga_genere('romance', 45447).
+manga_genere('school', 45447).
+manga_genere('seinen', 45447).
+manga_genere('boys_love', 33251).
+manga_genere('supernatural', 33251).
+manga_genere('romance', 36615).
+manga_genere('school', 36615).
+manga_genere('adventure', 146207).
+manga_genere('sci-fi', 146207).
+manga_genere('seinen', 146207).
+manga_genere('action', 117044).
+manga_genere('music', 117044).
+manga_genere('shounen', 117044).
+manga_genere('action', 118166).
+manga_genere('josei', 118166).
+manga_genere('music', 118166).
+manga_genere('girls_love', 132975).
+manga_genere('school', 132975).
+manga_genere('action', 105).
+manga_genere('adventure', 105).
+manga_genere('award_winning', 105).
+manga_genere('mythology', 105).
+manga_genere('shounen', 105).
+manga_genere('supernatural', 105).
+manga_genere('drama', 544).
+manga_genere('josei', 544).
+manga_genere('psychological', 544).
+manga_genere('romance', 544).
+manga_genere('drama', 5029).
+manga_genere('romance', 5029).
+manga_genere('shoujo', 5029).
+manga_genere('drama', 13290).
+manga_genere('historical', 13290).
+manga_genere('psychological', 13290).
+manga_genere('seinen', 13290).
+manga_genere('adventure', 98578).
+manga_genere('award_winning', 98578).
+manga_genere('mystery', 98578).
+manga_genere('sci-fi', 98578).
+manga_genere('shounen', 98578).
+manga_genere('space', 98578).
+manga_genere('survival', 98578).
+manga_genere('suspense', 98578).
+manga_genere('award_winning', 107239).
+manga_genere('gourmet', 107239).
+manga_genere('iyashikei', 107239).
+manga_genere('performing_arts', 107239).
+manga_genere('shounen', 107239).
+manga_genere('slice_of_life', 107239).
+manga_genere('drama', 104829).
+manga_genere('suspense', 104829).
+manga_genere('boys_love', 37565).
+manga_genere('drama', 37565).
+manga_genere('performing_arts', 37565).
+manga_genere('seinen', 37565).
+manga_genere('boys_love', 155285).
+manga_genere('childcare', 155285).
+manga_genere('comedy', 160).
+manga_genere('gag_humor', 160).
+manga_genere('love_polygon', 160).
+manga_genere('romance', 160).
+manga_genere('school', 160).
+manga_genere('shounen', 160).
+manga_genere('award_winning', 407).
+manga_genere('drama', 407).
+manga_genere('psychological', 407).
+manga_genere('school', 407).
+manga_genere('shoujo', 407).
+manga_genere('slice_of_life', 407).
+manga_genere('adventure', 868).
+manga_genere('mystery', 868).
+manga_genere('shounen', 868).
+manga_genere('boys_love', 5454).
+manga_genere('drama', 5454).
+manga_genere('fantasy', 5454).
+manga_genere('historical', 5454).
+manga_genere('shoujo', 5454).
+manga_genere('time_travel', 5454).
+manga_genere('comedy', 5820).
+manga_genere('school', 5820).
+manga_genere('shounen', 5820).
+manga_genere('comedy', 11329).
+manga_genere('drama', 11329).
+manga_genere('strategy_game', 11329).
+manga_genere('comedy', 14721).
+manga_genere('school', 14721).
+manga_genere('seinen', 14721).
+manga_genere('action', 81667).
+manga_genere('fantasy', 81667).
+manga_genere('isekai', 81667).
+manga_genere('comedy', 57015).
+manga_genere('fantasy', 57015).
+manga_genere('romance', 57015).
+manga_genere('school', 57015).
+manga_genere('shounen', 57015).
+manga_genere('supernatural', 57015).
+manga_genere('award_winning', 23627).
+manga_genere('shounen', 23627).
+manga_genere('sports', 23627).
+manga_genere('action', 26441).
+manga_genere('adventure', 26441).
+manga_genere('comedy', 26441).
+manga_genere('fantasy', 26441).
+manga_genere('mythology', 26441).
+manga_genere('romance', 26441).
+manga_genere('action', 96581).
+manga_genere('adventure', 96581).
+manga_genere('fantasy', 96581).
+manga_genere('otaku_culture', 112268).
+manga_genere('romance', 112268).
+manga_genere('school', 112268).
+manga_genere('seinen', 112268).
+manga_genere('comedy', 119852).
+manga_genere('shounen', 119852).
+manga_genere('sports', 119852).
+manga_genere('team_sports', 119852).
+manga_genere('action', 129409).
+manga_genere('military', 129409).
+manga_genere('school', 129409).
+manga_genere('drama', 133).
+manga_genere('fantasy', 133).
+manga_genere('shoujo', 133).
+manga_genere('supernatural', 133).
+manga_genere('drama', 907).
+manga_genere('love_polygon', 907).
+manga_genere('romance', 907).
+manga_genere('shoujo', 907).
+manga_genere('supernatural', 907).
+manga_genere('comedy', 926).
+manga_genere('love_polygon', 926).
+manga_genere('romance', 926).
+manga_genere('shoujo', 926).
+manga_genere('showbiz', 926).
+manga_genere('award_winning', 1031).
+manga_genere('drama', 1031).
+manga_genere('love_polygon', 1031).
+manga_genere('romance', 1031).
+manga_genere('shoujo', 1031).
+manga_genere('historical', 1067).
+manga_genere('seinen', 1067).
+manga_genere('love_polygon', 7378).
+manga_genere('romance', 7378).
+manga_genere('school', 7378).
+manga_genere('shoujo', 7378).
+manga_genere('drama', 422).
+manga_genere('reverse_harem', 422).
+manga_genere('romance', 422).
+manga_genere('school', 422).
+manga_genere('shoujo', 422).
+manga_genere('drama', 534).
+manga_genere('mystery', 534).
+manga_genere('school', 534).
+manga_genere('shounen', 534).
+manga_genere('suspense', 534).
+manga_genere('adventure', 888).
+manga_genere('comedy', 888).
+manga_genere('fantasy', 888).
+manga_genere('historical', 888).
+manga_genere('romance', 888).
+manga_genere('shoujo', 888).
+manga_genere('action', 1023).
+manga_genere('adult_cast', 1023).
+manga_genere('detective', 1023).
+manga_genere('psychological', 1023).
+manga_genere('sci-fi', 1023).
+manga_genere('seinen', 1023).
+manga_genere('award_winning', 1388).
+manga_genere('drama', 1388).
+manga_genere('romance', 1388).
+manga_genere('shoujo', 1388).
+manga_genere('action', 1648).
+manga_genere('adventure', 1648).
+manga_genere('comedy', 1648).
+manga_genere('mecha', 1648).
+manga_genere('sci-fi', 1648).
+manga_genere('award_winning', 1668).
+manga_genere('drama', 1668).
+manga_genere('medical', 1668).
+manga_genere('psychological', 1668).
+manga_genere('seinen', 1668).
+manga_genere('award_winning', 3258).
+manga_genere('drama', 3258).
+manga_genere('seinen', 3258).
+manga_genere('slice_of_life', 3258).
+manga_genere('time_travel', 3258).
+manga_genere('award_winning', 5655).
+manga_genere('drama', 5655).
+manga_genere('mystery', 5655).
+manga_genere('seinen', 5655).
+manga_genere('supernatural', 5655).
+manga_genere('action', 5664).
+manga_genere('mythology', 5664).
+manga_genere('shounen', 5664).
+manga_genere('supernatural', 5664).
+manga_genere('fantasy', 17374).
+manga_genere('shoujo', 17374).
+manga_genere('award_winning', 21040).
+manga_genere('historical', 21040).
+manga_genere('memoir', 21040).
+manga_genere('comedy', 39291).
+manga_genere('romance', 39291).
+manga_genere('school', 39291).
+manga_genere('shoujo', 39291).
+manga_genere('adventure', 42531).
+manga_genere('comedy', 42531).
+manga_genere('fantasy', 42531).
+manga_genere('shounen', 42531).
+manga_genere('action', 44933).
+manga_genere('adult_cast', 44933).
+manga_genere('detective', 44933).
+manga_genere('drama', 44933).
+manga_genere('mystery', 44933).
+manga_genere('psychological', 44933).
+manga_genere('sci-fi', 44933).
+manga_genere('shounen', 44933).
+manga_genere('action', 75989).
+manga_genere('school', 75989).
+manga_genere('shounen', 75989).
+manga_genere('super_power', 75989).
+manga_genere('adult_cast', 142997).
+manga_genere('comedy', 142997).
+manga_genere('organized_crime', 142997).
+manga_genere('seinen', 142997).
+manga_genere('suspense', 142997).
+manga_genere('award_winning', 163882).
+manga_genere('josei', 163882).
+manga_genere('school', 163882).
+manga_genere('slice_of_life', 163882).
+manga_genere('drama', 110929).
+manga_genere('historical', 110929).
+manga_genere('medical', 110929).
+manga_genere('mystery', 110929).
+manga_genere('seinen', 110929).
+manga_genere('award_winning', 392).
+manga_genere('comedy', 392).
+manga_genere('drama', 392).
+manga_genere('josei', 392).
+manga_genere('romance', 392).
+manga_genere('drama', 1250).
+manga_genere('shoujo', 1250).
+manga_genere('drama', 1496).
+manga_genere('romance', 1496).
+manga_genere('school', 1496).
+manga_genere('shoujo', 1496).
+manga_genere('action', 3438).
+manga_genere('adventure', 3438).
+manga_genere('high_stakes_game', 3438).
+manga_genere('psychological', 3438).
+manga_genere('romance', 3438).
+manga_genere('sci-fi', 3438).
+manga_genere('shounen', 3438).
+manga_genere('strategy_game', 3438).
+manga_genere('super_power', 3438).
+manga_genere('supernatural', 3438).
+manga_genere('comedy', 3633).
+manga_genere('romance', 3633).
+manga_genere('shoujo', 3633).
+manga_genere('drama', 3941).
+manga_genere('romance', 3941).
+manga_genere('action', 10270).
+manga_genere('fantasy', 10270).
+manga_genere('josei', 10270).
+manga_genere('mystery', 10270).
+manga_genere('sci-fi', 10270).
+manga_genere('drama', 11896).
+manga_genere('fantasy', 11896).
+manga_genere('romance', 11896).
+manga_genere('shoujo', 11896).
+manga_genere('action', 14568).
+manga_genere('comedy', 14568).
+manga_genere('delinquents', 14568).
+manga_genere('shounen', 14568).
+manga_genere('boys_love', 17706).
+manga_genere('comedy', 17706).
+manga_genere('drama', 17706).
+manga_genere('drama', 94919).
+manga_genere('seinen', 94919).
+manga_genere('fantasy', 95920).
+manga_genere('romance', 95920).
+manga_genere('shoujo', 95920).
+manga_genere('comedy', 62083).
+manga_genere('drama', 62083).
+manga_genere('romance', 62083).
+manga_genere('seinen', 62083).
+manga_genere('shounen', 144695).
+manga_genere('sports', 144695).
+manga_genere('team_sports', 144695).
+manga_genere('action', 150973).
+manga_genere('seinen', 150973).
+manga_genere('romance', 26021).
+manga_genere('shoujo', 26021).
+manga_genere('action', 52277).
+manga_genere('fantasy', 52277).
+manga_genere('romance', 52277).
+manga_genere('video_game', 52277).
+manga_genere('horror', 118668).
+manga_genere('shounen', 118668).
+manga_genere('supernatural', 118668).
+manga_genere('comedy', 123681).
+manga_genere('harem', 123681).
+manga_genere('parody', 123681).
+manga_genere('romance', 123681).
+manga_genere('school', 123681).
+manga_genere('seinen', 123681).
+manga_genere('action', 871).
+manga_genere('adventure', 871).
+manga_genere('fantasy', 871).
+manga_genere('shounen', 871).
+manga_genere('adventure', 975).
+manga_genere('drama', 975).
+manga_genere('fantasy', 975).
+manga_genere('historical', 975).
+manga_genere('horror', 975).
+manga_genere('romance', 975).
+manga_genere('shoujo', 975).
+manga_genere('supernatural', 975).
+manga_genere('action', 1683).
+manga_genere('drama', 1683).
+manga_genere('historical', 1683).
+manga_genere('samurai', 1683).
+manga_genere('comedy', 2435).
+manga_genere('school', 2435).
+manga_genere('seinen', 2435).
+manga_genere('slice_of_life', 2435).
+manga_genere('adult_cast', 3713).
+manga_genere('gourmet', 3713).
+manga_genere('seinen', 3713).
+manga_genere('workplace', 3713).
+manga_genere('comedy', 4584).
+manga_genere('drama', 4584).
+manga_genere('girls_love', 4584).
+manga_genere('school', 4584).
+manga_genere('seinen', 4584).
+manga_genere('drama', 6997).
+manga_genere('romance', 6997).
+manga_genere('horror', 17541).
+manga_genere('mystery', 17541).
+manga_genere('romance', 17541).
+manga_genere('shoujo', 17541).
+manga_genere('supernatural', 17541).
+manga_genere('comedy', 98639).
+manga_genere('fantasy', 98639).
+manga_genere('parody', 98639).
+manga_genere('shounen', 98639).
+manga_genere('detective', 97179).
+manga_genere('drama', 97179).
+manga_genere('seinen', 97179).
+manga_genere('supernatural', 97179).
+manga_genere('suspense', 97179).
+manga_genere('action', 98270).
+manga_genere('gore', 98270).
+manga_genere('mystery', 98270).
+manga_genere('shounen', 98270).
+manga_genere('supernatural', 98270).
+manga_genere('shoujo', 21651).
+manga_genere('drama', 22044).
+manga_genere('fantasy', 22044).
+manga_genere('mystery', 22044).
+manga_genere('psychological', 22044).
+manga_genere('romance', 22044).
+manga_genere('school', 22044).
+manga_genere('seinen', 22044).
+manga_genere('supernatural', 22044).
+manga_genere('drama', 30779).
+manga_genere('performing_arts', 30779).
+manga_genere('school', 30779).
+manga_genere('shounen', 30779).
+manga_genere('slice_of_life', 30779).
+manga_genere('cgdct', 40481).
+manga_genere('comedy', 40481).
+manga_genere('girls_love', 40481).
+manga_genere('school', 40481).
+manga_genere('slice_of_life', 40481).
+manga_genere('drama', 142246).
+manga_genere('psychological', 142246).
+manga_genere('school', 142246).
+manga_genere('seinen', 142246).
+manga_genere('drama', 160302).
+manga_genere('girls_love', 160302).
+manga_genere('action', 162479).
+manga_genere('fantasy', 162479).
+manga_genere('gore', 162479).
+manga_genere('shounen', 162479).
+manga_genere('adventure', 118).
+manga_genere('fantasy', 118).
+manga_genere('iyashikei', 118).
+manga_genere('romance', 118).
+manga_genere('comedy', 164).
+manga_genere('crossdressing', 164).
+manga_genere('romance', 164).
+manga_genere('school', 164).
+manga_genere('shoujo', 164).
+manga_genere('showbiz', 164).
+manga_genere('action', 1456).
+manga_genere('drama', 1456).
+manga_genere('sci-fi', 1456).
+manga_genere('seinen', 1456).
+manga_genere('supernatural', 1456).
+manga_genere('action', 3986).
+manga_genere('adventure', 3986).
+manga_genere('drama', 3986).
+manga_genere('gore', 3986).
+manga_genere('high_stakes_game', 3986).
+manga_genere('sci-fi', 3986).
+manga_genere('shounen', 3986).
+manga_genere('supernatural', 3986).
+manga_genere('survival', 3986).
+manga_genere('adult_cast', 5380).
+manga_genere('award_winning', 5380).
+manga_genere('drama', 5380).
+manga_genere('historical', 5380).
+manga_genere('samurai', 5380).
+manga_genere('seinen', 5380).
+manga_genere('visual_arts', 5380).
+manga_genere('comedy', 11454).
+manga_genere('sci-fi', 11454).
+manga_genere('shounen', 11454).
+manga_genere('fantasy', 16686).
+manga_genere('josei', 16686).
+manga_genere('mystery', 16686).
+manga_genere('romance', 16686).
+manga_genere('school', 16686).
+manga_genere('supernatural', 16686).
+manga_genere('action', 122559).
+manga_genere('supernatural', 122559).
+manga_genere('childcare', 131703).
+manga_genere('sci-fi', 131703).
+manga_genere('seinen', 131703).
+manga_genere('slice_of_life', 131703).
+manga_genere('drama', 59669).
+manga_genere('sci-fi', 59669).
+manga_genere('romance', 67645).
+manga_genere('school', 67645).
+manga_genere('shoujo', 67645).
+manga_genere('sports', 67645).
+manga_genere('team_sports', 67645).
+manga_genere('crossdressing', 85802).
+manga_genere('drama', 85802).
+manga_genere('love_polygon', 85802).
+manga_genere('romance', 85802).
+manga_genere('action', 19671).
+manga_genere('comedy', 19671).
+manga_genere('drama', 19671).
+manga_genere('school', 19671).
+manga_genere('supernatural', 19671).
+manga_genere('adventure', 41847).
+manga_genere('fantasy', 41847).
+manga_genere('romance', 41847).
+manga_genere('shoujo', 41847).
+manga_genere('romance', 90334).
+manga_genere('shoujo', 90334).
+manga_genere('supernatural', 90334).
+manga_genere('drama', 115217).
+manga_genere('romance', 115217).
+manga_genere('boys_love', 115365).
+manga_genere('drama', 115365).
+manga_genere('school', 115365).
+manga_genere('action', 121544).
+manga_genere('adventure', 121544).
+manga_genere('comedy', 121544).
+manga_genere('fantasy', 121544).
+manga_genere('action', 144180).
+manga_genere('fantasy', 144180).
+manga_genere('shounen', 144180).
+manga_genere('boys_love', 160131).
+manga_genere('music', 160131).
+manga_genere('school', 160131).
+manga_genere('action', 15).
+manga_genere('adventure', 15).
+manga_genere('comedy', 15).
+manga_genere('ecchi', 15).
+manga_genere('fantasy', 15).
+manga_genere('harem', 15).
+manga_genere('martial_arts', 15).
+manga_genere('romance', 15).
+manga_genere('school', 15).
+manga_genere('shounen', 15).
+manga_genere('supernatural', 15).
+manga_genere('iyashikei', 124).
+manga_genere('sci-fi', 124).
+manga_genere('shoujo', 124).
+manga_genere('slice_of_life', 124).
+manga_genere('action', 356).
+manga_genere('adventure', 356).
+manga_genere('comedy', 356).
+manga_genere('drama', 356).
+manga_genere('fantasy', 356).
+manga_genere('romance', 356).
+manga_genere('supernatural', 356).
+manga_genere('love_polygon', 563).
+manga_genere('romance', 563).
+manga_genere('shoujo', 563).
+manga_genere('workplace', 563).
+manga_genere('comedy', 744).
+manga_genere('iyashikei', 744).
+manga_genere('psychological', 744).
+manga_genere('romance', 744).
+manga_genere('shounen', 744).
+manga_genere('slice_of_life', 744).
+manga_genere('visual_arts', 744).
+manga_genere('drama', 3064).
+manga_genere('psychological', 3064).
+manga_genere('seinen', 3064).
+manga_genere('mystery', 3486).
+manga_genere('shounen', 3486).
+manga_genere('supernatural', 3486).
+manga_genere('suspense', 3486).
+manga_genere('vampire', 3486).
+manga_genere('childcare', 3872).
+manga_genere('comedy', 3872).
+manga_genere('drama', 3872).
+manga_genere('romance', 3872).
+manga_genere('school', 3872).
+manga_genere('shoujo', 3872).
+manga_genere('award_winning', 4623).
+manga_genere('historical', 4623).
+manga_genere('horror', 4623).
+manga_genere('mystery', 4623).
+manga_genere('romance', 4623).
+manga_genere('shoujo', 4623).
+manga_genere('supernatural', 4623).
+manga_genere('drama', 4964).
+manga_genere('shoujo', 4964).
+manga_genere('action', 5685).
+manga_genere('drama', 5685).
+manga_genere('fantasy', 5685).
+manga_genere('mystery', 5685).
+manga_genere('shoujo', 5685).
+manga_genere('supernatural', 5685).
+manga_genere('award_winning', 13419).
+manga_genere('comedy', 13419).
+manga_genere('drama', 13419).
+manga_genere('historical', 13419).
+manga_genere('memoir', 13419).
+manga_genere('psychological', 13419).
+manga_genere('romance', 13419).
+manga_genere('school', 13419).
+manga_genere('seinen', 13419).
+manga_genere('slice_of_life', 13419).
+manga_genere('action', 12).
+manga_genere('adventure', 12).
+manga_genere('award_winning', 12).
+manga_genere('shounen', 12).
+manga_genere('supernatural', 12).
+manga_genere('comedy', 58).
+manga_genere('crossdressing', 58).
+manga_genere('drama', 58).
+manga_genere('performing_arts', 58).
+manga_genere('romance', 58).
+manga_genere('school', 58).
+manga_genere('shoujo', 58).
+manga_genere('slice_of_life', 58).
+manga_genere('cgdct', 371).
+manga_genere('comedy', 371).
+manga_genere('iyashikei', 371).
+manga_genere('slice_of_life', 371).
+manga_genere('award_winning', 411).
+manga_genere('drama', 411).
+manga_genere('gourmet', 411).
+manga_genere('romance', 411).
+manga_genere('school', 411).
+manga_genere('shoujo', 411).
+manga_genere('action', 616).
+manga_genere('comedy', 616).
+manga_genere('school', 616).
+manga_genere('shounen', 616).
+manga_genere('award_winning', 877).
+manga_genere('drama', 877).
+manga_genere('romance', 877).
+manga_genere('school', 877).
+manga_genere('shoujo', 877).
+manga_genere('comedy', 1271).
+manga_genere('romance', 1271).
+manga_genere('school', 1271).
+manga_genere('shoujo', 1271).
+manga_genere('action', 1349).
+manga_genere('fantasy', 1349).
+manga_genere('josei', 1349).
+manga_genere('military', 1349).
+manga_genere('mythology', 1349).
+manga_genere('action', 1721).
+manga_genere('drama', 1721).
+manga_genere('fantasy', 1721).
+manga_genere('martial_arts', 1721).
+manga_genere('school', 1721).
+manga_genere('shounen', 1721).
+manga_genere('supernatural', 1721).
+manga_genere('drama', 6888).
+manga_genere('performing_arts', 6888).
+manga_genere('psychological', 6888).
+manga_genere('seinen', 6888).
+manga_genere('drama', 7728).
+manga_genere('fantasy', 7728).
+manga_genere('psychological', 7728).
+manga_genere('seinen', 7728).
+manga_genere('supernatural', 7728).
+manga_genere('drama', 14127).
+manga_genere('psychological', 14127).
+manga_genere('school', 14127).
+manga_genere('shounen', 14127).
+manga_genere('adult_cast', 16659).
+manga_genere('high_stakes_game', 16659).
+manga_genere('seinen', 16659).
+manga_genere('strategy_game', 16659).
+manga_genere('delinquents', 70589).
+manga_genere('seinen', 70589).
+manga_genere('workplace', 70589).
+manga_genere('historical', 75929).
+manga_genere('seinen', 75929).
+manga_genere('visual_arts', 75929).
+manga_genere('fantasy', 80119).
+manga_genere('slice_of_life', 80119).
+manga_genere('drama', 23419).
+manga_genere('romance', 23419).
+manga_genere('seinen', 23419).
+manga_genere('action', 24450).
+manga_genere('adventure', 24450).
+manga_genere('drama', 24450).
+manga_genere('horror', 24450).
+manga_genere('seinen', 24450).
+manga_genere('supernatural', 24450).
+manga_genere('comedy', 39625).
+manga_genere('josei', 39625).
+manga_genere('romance', 39625).
+manga_genere('sci-fi', 39625).
+manga_genere('supernatural', 39625).
+manga_genere('ecchi', 45757).
+manga_genere('gourmet', 45757).
+manga_genere('school', 45757).
+manga_genere('shounen', 45757).
+manga_genere('fantasy', 142765).
+manga_genere('isekai', 142765).
+manga_genere('reincarnation', 142765).
+manga_genere('comedy', 92182).
+manga_genere('romance', 92182).
+manga_genere('school', 92182).
+manga_genere('comedy', 101554).
+manga_genere('gag_humor', 101554).
+manga_genere('seinen', 101554).
+manga_genere('award_winning', 103851).
+manga_genere('comedy', 103851).
+manga_genere('harem', 103851).
+manga_genere('romance', 103851).
+manga_genere('school', 103851).
+manga_genere('shounen', 103851).
+manga_genere('drama', 108032).
+manga_genere('seinen', 108032).
+manga_genere('suspense', 108032).
+manga_genere('action', 109608).
+manga_genere('drama', 109608).
+manga_genere('fantasy', 109608).
+manga_genere('seinen', 109608).
+manga_genere('romance', 113937).
+manga_genere('slice_of_life', 113937).
+manga_genere('comedy', 122448).
+manga_genere('love_status_quo', 122448).
+manga_genere('romance', 122448).
+manga_genere('school', 122448).
+manga_genere('seinen', 122448).
+manga_genere('drama', 122575).
+manga_genere('girls_love', 122575).
+manga_genere('historical', 122575).
+manga_genere('childcare', 121945).
+manga_genere('comedy', 121945).
+manga_genere('fantasy', 121945).
+manga_genere('iyashikei', 122615).
+manga_genere('slice_of_life', 122615).
+manga_genere('comedy', 133988).
+manga_genere('romance', 133988).
+manga_genere('school', 133988).
+manga_genere('drama', 135264).
+manga_genere('sci-fi', 135264).
+manga_genere('seinen', 135264).
+manga_genere('cgdct', 62509).
+manga_genere('comedy', 62509).
+manga_genere('otaku_culture', 62509).
+manga_genere('workplace', 62509).
+manga_genere('comedy', 87813).
+manga_genere('romance', 87813).
+manga_genere('shoujo', 87813).
+manga_genere('childcare', 55).
+manga_genere('comedy', 55).
+manga_genere('drama', 55).
+manga_genere('romance', 55).
+manga_genere('school', 55).
+manga_genere('shoujo', 55).
+manga_genere('boys_love', 892).
+manga_genere('drama', 892).
+manga_genere('romance', 892).
+manga_genere('school', 892).
+manga_genere('romance', 1158).
+manga_genere('seinen', 1158).
+manga_genere('slice_of_life', 1158).
+manga_genere('drama', 1766).
+manga_genere('fantasy', 1766).
+manga_genere('romance', 1766).
+manga_genere('seinen', 1766).
+manga_genere('comedy', 1978).
+manga_genere('drama', 1978).
+manga_genere('romance', 1978).
+manga_genere('school', 1978).
+manga_genere('shoujo', 1978).
+manga_genere('drama', 2598).
+manga_genere('romance', 2598).
+manga_genere('school', 2598).
+manga_genere('seinen', 2598).
+manga_genere('award_winning', 4031).
+manga_genere('historical', 4031).
+manga_genere('shounen', 4031).
+manga_genere('comedy', 4470).
+manga_genere('romance', 4470).
+manga_genere('school', 4470).
+manga_genere('shoujo', 4470).
+manga_genere('comedy', 7024).
+manga_genere('romance', 7024).
+manga_genere('shoujo', 7024).
+manga_genere('drama', 8483).
+manga_genere('ecchi', 8483).
+manga_genere('love_polygon', 8483).
+manga_genere('romance', 8483).
+manga_genere('school', 8483).
+manga_genere('shounen', 8483).
+manga_genere('action', 8848).
+manga_genere('comedy', 8848).
+manga_genere('drama', 8848).
+manga_genere('ecchi', 8848).
+manga_genere('seinen', 8848).
+manga_genere('award_winning', 11977).
+manga_genere('drama', 11977).
+manga_genere('gourmet', 11977).
+manga_genere('seinen', 11977).
+manga_genere('slice_of_life', 11977).
+manga_genere('comedy', 92149).
+manga_genere('romance', 92149).
+manga_genere('school', 92149).
+manga_genere('historical', 94676).
+manga_genere('josei', 94676).
+manga_genere('romance', 94676).
+manga_genere('time_travel', 94676).
+manga_genere('action', 107570).
+manga_genere('fantasy', 107570).
+manga_genere('historical', 107570).
+manga_genere('time_travel', 107570).
+manga_genere('action', 24302).
+manga_genere('adventure', 24302).
+manga_genere('kids', 24302).
+manga_genere('mecha', 24302).
+manga_genere('sci-fi', 24302).
+manga_genere('space', 24302).
+manga_genere('action', 28631).
+manga_genere('boys_love', 28631).
+manga_genere('drama', 28631).
+manga_genere('supernatural', 28631).
+manga_genere('boys_love', 139289).
+manga_genere('slice_of_life', 139289).
+manga_genere('drama', 118873).
+manga_genere('psychological', 118873).
+manga_genere('fantasy', 122830).
+manga_genere('isekai', 122830).
+manga_genere('reincarnation', 122830).
+manga_genere('slice_of_life', 122830).
+manga_genere('fantasy', 122851).
+manga_genere('isekai', 122851).
+manga_genere('reincarnation', 122851).
+manga_genere('anthropomorphic', 137041).
+manga_genere('comedy', 137041).
+manga_genere('slice_of_life', 137041).
+manga_genere('supernatural', 137041).
+manga_genere('action', 60511).
+manga_genere('fantasy', 60511).
+manga_genere('mythology', 60511).
+manga_genere('shounen', 60511).
+manga_genere('urban_fantasy', 60511).
+manga_genere('action', 69903).
+manga_genere('fantasy', 69903).
+manga_genere('action', 70557).
+manga_genere('delinquents', 70557).
+manga_genere('seinen', 70557).
+manga_genere('action', 80469).
+manga_genere('historical', 80469).
+manga_genere('supernatural', 80469).
+manga_genere('comedy', 24821).
+manga_genere('romance', 24821).
+manga_genere('school', 24821).
+manga_genere('shoujo', 24821).
+manga_genere('fantasy', 448).
+manga_genere('reincarnation', 448).
+manga_genere('romance', 448).
+manga_genere('shoujo', 448).
+manga_genere('fantasy', 462).
+manga_genere('horror', 462).
+manga_genere('mystery', 462).
+manga_genere('shoujo', 462).
+manga_genere('supernatural', 462).
+manga_genere('drama', 773).
+manga_genere('romance', 773).
+manga_genere('sci-fi', 773).
+manga_genere('seinen', 773).
+manga_genere('drama', 1895).
+manga_genere('historical', 1895).
+manga_genere('romance', 1895).
+manga_genere('shoujo', 1895).
+manga_genere('action', 15205).
+manga_genere('drama', 15205).
+manga_genere('fantasy', 15205).
+manga_genere('mystery', 15205).
+manga_genere('psychological', 15205).
+manga_genere('shounen', 15205).
+manga_genere('urban_fantasy', 15205).
+manga_genere('action', 99386).
+manga_genere('fantasy', 99386).
+manga_genere('video_game', 99386).
+manga_genere('drama', 106609).
+manga_genere('psychological', 106609).
+manga_genere('seinen', 106609).
+manga_genere('comedy', 108639).
+manga_genere('drama', 108639).
+manga_genere('romance', 108639).
+manga_genere('school', 108639).
+manga_genere('shoujo', 108639).
+manga_genere('drama', 114852).
+manga_genere('romance', 114852).
+manga_genere('comedy', 116482).
+manga_genere('romance', 116482).
+manga_genere('school', 116482).
+manga_genere('supernatural', 116482).
+manga_genere('comedy', 116790).
+manga_genere('horror', 116790).
+manga_genere('boys_love', 120481).
+manga_genere('school', 120481).
+manga_genere('award_winning', 122110).
+manga_genere('fantasy', 122110).
+manga_genere('josei', 122110).
+manga_genere('romance', 122110).
+manga_genere('boys_love', 127366).
+manga_genere('slice_of_life', 127366).
+manga_genere('boys_love', 132417).
+manga_genere('drama', 132417).
+manga_genere('slice_of_life', 132417).
+manga_genere('boys_love', 137146).
+manga_genere('school', 137146).
+manga_genere('boys_love', 146517).
+manga_genere('supernatural', 146517).
+manga_genere('comedy', 149804).
+manga_genere('romance', 149804).
+manga_genere('school', 149804).
+manga_genere('action', 160786).
+manga_genere('adventure', 160786).
+manga_genere('fantasy', 160786).
+manga_genere('martial_arts', 160786).
+manga_genere('shounen', 160786).
+manga_genere('action', 676).
+manga_genere('adventure', 676).
+manga_genere('award_winning', 676).
+manga_genere('fantasy', 676).
+manga_genere('historical', 676).
+manga_genere('love_polygon', 676).
+manga_genere('mythology', 676).
+manga_genere('romance', 676).
+manga_genere('shounen', 676).
+manga_genere('time_travel', 676).
+manga_genere('historical', 885).
+manga_genere('horror', 885).
+manga_genere('mystery', 885).
+manga_genere('shoujo', 885).
+manga_genere('drama', 1267).
+manga_genere('mystery', 1267).
+manga_genere('shoujo', 1267).
+manga_genere('supernatural', 1267).
+manga_genere('drama', 3576).
+manga_genere('high_stakes_game', 3576).
+manga_genere('mystery', 3576).
+manga_genere('shounen', 3576).
+manga_genere('strategy_game', 3576).
+manga_genere('suspense', 3576).
+manga_genere('action', 8094).
+manga_genere('adventure', 8094).
+manga_genere('comedy', 8094).
+manga_genere('historical', 8094).
+manga_genere('martial_arts', 8094).
+manga_genere('shounen', 8094).
+manga_genere('anthropomorphic', 8878).
+manga_genere('comedy', 8878).
+manga_genere('gag_humor', 8878).
+manga_genere('historical', 8878).
+manga_genere('seinen', 8878).
+manga_genere('horror', 11089).
+manga_genere('mystery', 11089).
+manga_genere('shoujo', 11089).
+manga_genere('supernatural', 11089).
+manga_genere('action', 13492).
+manga_genere('mythology', 13492).
+manga_genere('school', 13492).
+manga_genere('shounen', 13492).
+manga_genere('supernatural', 13492).
+manga_genere('cgdct', 13992).
+manga_genere('comedy', 13992).
+manga_genere('school', 13992).
+manga_genere('shounen', 13992).
+manga_genere('slice_of_life', 13992).
+manga_genere('fantasy', 46258).
+manga_genere('iyashikei', 46258).
+manga_genere('shounen', 46258).
+manga_genere('slice_of_life', 46258).
+manga_genere('urban_fantasy', 46258).
+manga_genere('crossdressing', 22103).
+manga_genere('romance', 22103).
+manga_genere('school', 22103).
+manga_genere('shoujo', 22103).
+manga_genere('action', 37683).
+manga_genere('drama', 37683).
+manga_genere('mecha', 37683).
+manga_genere('military', 37683).
+manga_genere('sci-fi', 37683).
+manga_genere('seinen', 37683).
+manga_genere('space', 37683).
+manga_genere('drama', 50217).
+manga_genere('romance', 50217).
+manga_genere('school', 50217).
+manga_genere('seinen', 50217).
+manga_genere('comedy', 110029).
+manga_genere('drama', 110029).
+manga_genere('love_status_quo', 110029).
+manga_genere('romance', 110029).
+manga_genere('action', 111603).
+manga_genere('detective', 111603).
+manga_genere('mystery', 111603).
+manga_genere('supernatural', 111603).
+manga_genere('girls_love', 111857).
+manga_genere('school', 111857).
+manga_genere('comedy', 113360).
+manga_genere('supernatural', 113360).
+manga_genere('love_polygon', 115848).
+manga_genere('romance', 115848).
+manga_genere('school', 115848).
+manga_genere('seinen', 115848).
+manga_genere('comedy', 116808).
+manga_genere('love_status_quo', 116808).
+manga_genere('romance', 116808).
+manga_genere('school', 116808).
+manga_genere('shounen', 116808).
+manga_genere('adult_cast', 120177).
+manga_genere('comedy', 120177).
+manga_genere('fantasy', 120177).
+manga_genere('isekai', 120177).
+manga_genere('otaku_culture', 120177).
+manga_genere('parody', 120177).
+manga_genere('girls_love', 123270).
+manga_genere('school', 123270).
+manga_genere('slice_of_life', 123270).
+manga_genere('performing_arts', 127120).
+manga_genere('school', 127120).
+manga_genere('seinen', 127120).
+manga_genere('sports', 127120).
+manga_genere('drama', 129656).
+manga_genere('girls_love', 129656).
+manga_genere('seinen', 129656).
+manga_genere('supernatural', 129656).
+manga_genere('comedy', 131443).
+manga_genere('josei', 131443).
+manga_genere('school', 131443).
+manga_genere('slice_of_life', 131443).
+manga_genere('drama', 90174).
+manga_genere('sci-fi', 90174).
+manga_genere('cgdct', 587).
+manga_genere('comedy', 587).
+manga_genere('gag_humor', 587).
+manga_genere('otaku_culture', 587).
+manga_genere('parody', 587).
+manga_genere('school', 587).
+manga_genere('slice_of_life', 587).
+manga_genere('adventure', 776).
+manga_genere('award_winning', 776).
+manga_genere('drama', 776).
+manga_genere('fantasy', 776).
+manga_genere('sci-fi', 776).
+manga_genere('shounen', 776).
+manga_genere('space', 776).
+manga_genere('comedy', 820).
+manga_genere('drama', 820).
+manga_genere('romance', 820).
+manga_genere('school', 820).
+manga_genere('shoujo', 820).
+manga_genere('showbiz', 820).
+manga_genere('boys_love', 902).
+manga_genere('drama', 902).
+manga_genere('slice_of_life', 902).
+manga_genere('psychological', 1408).
+manga_genere('seinen', 1408).
+manga_genere('adventure', 1951).
+manga_genere('boys_love', 1951).
+manga_genere('fantasy', 1951).
+manga_genere('reincarnation', 1951).
+manga_genere('romance', 1951).
+manga_genere('shoujo', 1951).
+manga_genere('supernatural', 1951).
+manga_genere('drama', 3101).
+manga_genere('shoujo', 3101).
+manga_genere('slice_of_life', 3101).
+manga_genere('drama', 7656).
+manga_genere('medical', 7656).
+manga_genere('shounen', 7656).
+manga_genere('comedy', 8677).
+manga_genere('drama', 8677).
+manga_genere('school', 8677).
+manga_genere('supernatural', 8677).
+manga_genere('boys_love', 9152).
+manga_genere('drama', 9152).
+manga_genere('historical', 9152).
+manga_genere('psychological', 9152).
+manga_genere('shoujo', 9152).
+manga_genere('action', 57249).
+manga_genere('historical', 57249).
+manga_genere('shounen', 57249).
+manga_genere('drama', 62951).
+manga_genere('sci-fi', 62951).
+manga_genere('shounen', 62951).
+manga_genere('action', 69015).
+manga_genere('drama', 69015).
+manga_genere('organized_crime', 69015).
+manga_genere('seinen', 69015).
+manga_genere('romance', 77239).
+manga_genere('school', 77239).
+manga_genere('shoujo', 77239).
+manga_genere('comedy', 75243).
+manga_genere('shounen', 83807).
+manga_genere('sports', 83807).
+manga_genere('team_sports', 83807).
+manga_genere('action', 86337).
+manga_genere('fantasy', 86337).
+manga_genere('shounen', 86337).
+manga_genere('adult_cast', 109910).
+manga_genere('comedy', 109910).
+manga_genere('gag_humor', 109910).
+manga_genere('showbiz', 109910).
+manga_genere('workplace', 109910).
+manga_genere('josei', 113667).
+manga_genere('slice_of_life', 113667).
+manga_genere('action', 115958).
+manga_genere('seinen', 115958).
+manga_genere('supernatural', 115958).
+manga_genere('comedy', 124154).
+manga_genere('horror', 128108).
+manga_genere('mystery', 128108).
+manga_genere('psychological', 128108).
+manga_genere('school', 128108).
+manga_genere('slice_of_life', 128108).
+manga_genere('comedy', 131807).
+manga_genere('romance', 131807).
+manga_genere('romance', 170269).
+manga_genere('comedy', 27327).
+manga_genere('seinen', 27327).
+manga_genere('slice_of_life', 27327).
+manga_genere('drama', 35035).
+manga_genere('romance', 35035).
+manga_genere('school', 35035).
+manga_genere('shoujo', 35035).
+manga_genere('comedy', 48397).
+manga_genere('ecchi', 48397).
+manga_genere('fantasy', 48397).
+manga_genere('isekai', 48397).
+manga_genere('seinen', 48397).
+manga_genere('strategy_game', 48397).
+manga_genere('action', 142).
+manga_genere('gore', 142).
+manga_genere('psychological', 142).
+manga_genere('seinen', 142).
+manga_genere('survival', 142).
+manga_genere('suspense', 142).
+manga_genere('comedy', 430).
+manga_genere('drama', 430).
+manga_genere('ecchi', 430).
+manga_genere('romance', 430).
+manga_genere('school', 430).
+manga_genere('shounen', 430).
+manga_genere('sports', 430).
+manga_genere('drama', 710).
+manga_genere('horror', 710).
+manga_genere('love_polygon', 710).
+manga_genere('mystery', 710).
+manga_genere('psychological', 710).
+manga_genere('romance', 710).
+manga_genere('school', 710).
+manga_genere('shoujo', 710).
+manga_genere('supernatural', 710).
+manga_genere('adventure', 3522).
+manga_genere('fantasy', 3522).
+manga_genere('mystery', 3522).
+manga_genere('shoujo', 3522).
+manga_genere('supernatural', 3522).
+manga_genere('adventure', 6140).
+manga_genere('shounen', 6140).
+manga_genere('vampire', 6140).
+manga_genere('action', 7716).
+manga_genere('detective', 7716).
+manga_genere('drama', 7716).
+manga_genere('shounen', 7716).
+manga_genere('drama', 11777).
+manga_genere('romance', 11777).
+manga_genere('school', 11777).
+manga_genere('comedy', 17207).
+manga_genere('mystery', 17207).
+manga_genere('shounen', 17207).
+manga_genere('supernatural', 17207).
+manga_genere('award_winning', 91767).
+manga_genere('romance', 91767).
+manga_genere('school', 91767).
+manga_genere('shoujo', 91767).
+manga_genere('drama', 94251).
+manga_genere('performing_arts', 94251).
+manga_genere('school', 94251).
+manga_genere('shoujo', 94251).
+manga_genere('romance', 108424).
+manga_genere('school', 108424).
+manga_genere('shoujo', 108424).
+manga_genere('action', 144241).
+manga_genere('fantasy', 144241).
+manga_genere('isekai', 144241).
+manga_genere('military', 144241).
+manga_genere('reincarnation', 144241).
+manga_genere('shounen', 144241).
+manga_genere('drama', 148554).
+manga_genere('romance', 65489).
+manga_genere('school', 65489).
+manga_genere('shoujo', 65489).
+manga_genere('supernatural', 65489).
+manga_genere('time_travel', 65489).
+manga_genere('sci-fi', 74337).
+manga_genere('seinen', 74337).
+manga_genere('comedy', 111276).
+manga_genere('iyashikei', 111276).
+manga_genere('supernatural', 111276).
+manga_genere('drama', 124520).
+manga_genere('psychological', 124520).
+manga_genere('school', 124520).
+manga_genere('seinen', 124520).
+manga_genere('slice_of_life', 124520).
+manga_genere('boys_love', 132378).
+manga_genere('fantasy', 132378).
+manga_genere('isekai', 132378).
+manga_genere('drama', 90609).
+manga_genere('historical', 90609).
+manga_genere('seinen', 90609).
+manga_genere('adventure', 104475).
+manga_genere('drama', 104475).
+manga_genere('fantasy', 104475).
+manga_genere('shounen', 104475).
+manga_genere('comedy', 107774).
+manga_genere('mystery', 107774).
+manga_genere('seinen', 107774).
+manga_genere('suspense', 107774).
+manga_genere('drama', 34091).
+manga_genere('romance', 34091).
+manga_genere('school', 34091).
+manga_genere('shoujo', 34091).
+manga_genere('adventure', 14).
+manga_genere('comedy', 14).
+manga_genere('fantasy', 14).
+manga_genere('shounen', 14).
+manga_genere('comedy', 37).
+manga_genere('drama', 37).
+manga_genere('romance', 37).
+manga_genere('school', 37).
+manga_genere('shoujo', 37).
+manga_genere('action', 696).
+manga_genere('comedy', 696).
+manga_genere('harem', 696).
+manga_genere('parody', 696).
+manga_genere('romance', 696).
+manga_genere('shounen', 696).
+manga_genere('action', 1072).
+manga_genere('award_winning', 1072).
+manga_genere('crossdressing', 1072).
+manga_genere('historical', 1072).
+manga_genere('romance', 1072).
+manga_genere('samurai', 1072).
+manga_genere('shoujo', 1072).
+manga_genere('drama', 1472).
+manga_genere('historical', 1472).
+manga_genere('romance', 1472).
+manga_genere('shoujo', 1472).
+manga_genere('boys_love', 4011).
+manga_genere('detective', 4011).
+manga_genere('drama', 4011).
+manga_genere('shoujo', 4011).
+manga_genere('drama', 6889).
+manga_genere('performing_arts', 6889).
+manga_genere('seinen', 6889).
+manga_genere('award_winning', 8947).
+manga_genere('comedy', 8947).
+manga_genere('seinen', 8947).
+manga_genere('slice_of_life', 8947).
+manga_genere('drama', 10740).
+manga_genere('military', 10740).
+manga_genere('school', 10740).
+manga_genere('sci-fi', 10740).
+manga_genere('shoujo', 10740).
+manga_genere('drama', 11072).
+manga_genere('romance', 11072).
+manga_genere('school', 11072).
+manga_genere('shoujo', 11072).
+manga_genere('award_winning', 11493).
+manga_genere('drama', 11493).
+manga_genere('historical', 11493).
+manga_genere('medical', 11493).
+manga_genere('seinen', 11493).
+manga_genere('supernatural', 11493).
+manga_genere('time_travel', 11493).
+manga_genere('comedy', 12671).
+manga_genere('shounen', 12671).
+manga_genere('slice_of_life', 12671).
+manga_genere('romance', 16034).
+manga_genere('school', 16034).
+manga_genere('shoujo', 16034).
+manga_genere('supernatural', 16034).
+manga_genere('drama', 634).
+manga_genere('love_polygon', 634).
+manga_genere('romance', 634).
+manga_genere('school', 634).
+manga_genere('shoujo', 634).
+manga_genere('sports', 634).
+manga_genere('team_sports', 634).
+manga_genere('action', 1376).
+manga_genere('drama', 1376).
+manga_genere('mystery', 1376).
+manga_genere('sci-fi', 1376).
+manga_genere('seinen', 1376).
+manga_genere('comedy', 1397).
+manga_genere('pets', 1397).
+manga_genere('seinen', 1397).
+manga_genere('slice_of_life', 1397).
+manga_genere('action', 7747).
+manga_genere('award_winning', 7747).
+manga_genere('comedy', 7747).
+manga_genere('mythology', 7747).
+manga_genere('shounen', 7747).
+manga_genere('supernatural', 7747).
+manga_genere('adventure', 9705).
+manga_genere('drama', 9705).
+manga_genere('fantasy', 9705).
+manga_genere('sci-fi', 9705).
+manga_genere('seinen', 9705).
+manga_genere('space', 9705).
+manga_genere('boys_love', 10309).
+manga_genere('drama', 10309).
+manga_genere('romance', 10309).
+manga_genere('drama', 12064).
+manga_genere('romance', 12064).
+manga_genere('school', 12064).
+manga_genere('shoujo', 12064).
+manga_genere('action', 14498).
+manga_genere('boys_love', 14498).
+manga_genere('drama', 14498).
+manga_genere('action', 14841).
+manga_genere('drama', 14841).
+manga_genere('supernatural', 14841).
+manga_genere('seinen', 56435).
+manga_genere('drama', 69841).
+manga_genere('performing_arts', 69841).
+manga_genere('seinen', 69841).
+manga_genere('slice_of_life', 69841).
+manga_genere('drama', 141215).
+manga_genere('girls_love', 141215).
+manga_genere('josei', 141215).
+manga_genere('action', 149751).
+manga_genere('delinquents', 149751).
+manga_genere('comedy', 23689).
+manga_genere('romance', 23689).
+manga_genere('school', 23689).
+manga_genere('seinen', 23689).
+manga_genere('supernatural', 23689).
+manga_genere('action', 34335).
+manga_genere('comedy', 34335).
+manga_genere('drama', 34335).
+manga_genere('romance', 34335).
+manga_genere('shounen', 34335).
+manga_genere('supernatural', 34335).
+manga_genere('boys_love', 109330).
+manga_genere('drama', 109330).
+manga_genere('school', 109330).
+manga_genere('slice_of_life', 109330).
+manga_genere('action', 110766).
+manga_genere('fantasy', 110766).
+manga_genere('mystery', 110766).
+manga_genere('shounen', 110766).
+manga_genere('cgdct', 112592).
+manga_genere('comedy', 112592).
+manga_genere('magical_sex_shift', 112592).
+manga_genere('action', 117241).
+manga_genere('fantasy', 117241).
+manga_genere('samurai', 117241).
+manga_genere('supernatural', 117241).
+manga_genere('childcare', 117954).
+manga_genere('comedy', 117954).
+manga_genere('drama', 117954).
+manga_genere('seinen', 117954).
+manga_genere('slice_of_life', 117954).
+manga_genere('comedy', 118858).
+manga_genere('horror', 118858).
+manga_genere('sci-fi', 118858).
+manga_genere('shounen', 118858).
+manga_genere('adult_cast', 120367).
+manga_genere('comedy', 120367).
+manga_genere('romance', 120367).
+manga_genere('comedy', 129361).
+manga_genere('fantasy', 129361).
+manga_genere('girls_love', 129361).
+manga_genere('school', 129361).
+manga_genere('villainess', 129361).
+manga_genere('comedy', 92472).
+manga_genere('romance', 92472).
+manga_genere('shoujo', 92472).
+manga_genere('action', 93398).
+manga_genere('comedy', 93398).
+manga_genere('drama', 93398).
+manga_genere('boys_love', 95228).
+manga_genere('performing_arts', 95228).
+manga_genere('drama', 95347).
+manga_genere('mystery', 95347).
+manga_genere('psychological', 95347).
+manga_genere('school', 95347).
+manga_genere('shounen', 95347).
+manga_genere('gourmet', 96812).
+manga_genere('iyashikei', 96812).
+manga_genere('slice_of_life', 96812).
+manga_genere('historical', 99575).
+manga_genere('mystery', 99575).
+manga_genere('romance', 99575).
+manga_genere('shoujo', 99575).
+manga_genere('comedy', 93416).
+manga_genere('fantasy', 93416).
+manga_genere('gag_humor', 93416).
+manga_genere('mythology', 93416).
+manga_genere('school', 93416).
+manga_genere('workplace', 93416).
+manga_genere('boys_love', 93695).
+manga_genere('school', 93695).
+manga_genere('fantasy', 96194).
+manga_genere('isekai', 96194).
+manga_genere('reincarnation', 96194).
+manga_genere('action', 103244).
+manga_genere('adventure', 103244).
+manga_genere('mystery', 103244).
+manga_genere('video_game', 103244).
+manga_genere('girls_love', 143990).
+manga_genere('school', 143990).
+manga_genere('shoujo', 143990).
+manga_genere('award_winning', 3993).
+manga_genere('drama', 3993).
+manga_genere('josei', 3993).
+manga_genere('romance', 3993).
+manga_genere('action', 4742).
+manga_genere('adventure', 4742).
+manga_genere('horror', 4742).
+manga_genere('sci-fi', 4742).
+manga_genere('seinen', 4742).
+manga_genere('action', 5157).
+manga_genere('combat_sports', 5157).
+manga_genere('gore', 5157).
+manga_genere('martial_arts', 5157).
+manga_genere('shounen', 5157).
+manga_genere('award_winning', 10386).
+manga_genere('gourmet', 10386).
+manga_genere('romance', 10386).
+manga_genere('school', 10386).
+manga_genere('shoujo', 10386).
+manga_genere('action', 12269).
+manga_genere('comedy', 12269).
+manga_genere('ecchi', 12269).
+manga_genere('school', 12269).
+manga_genere('shounen', 12269).
+manga_genere('comedy', 14154).
+manga_genere('romance', 14154).
+manga_genere('seinen', 14154).
+manga_genere('action', 14975).
+manga_genere('drama', 14975).
+manga_genere('sci-fi', 14975).
+manga_genere('seinen', 14975).
+manga_genere('super_power', 14975).
+manga_genere('supernatural', 14975).
+manga_genere('action', 16815).
+manga_genere('shounen', 16815).
+manga_genere('drama', 55301).
+manga_genere('historical', 55301).
+manga_genere('shounen', 55301).
+manga_genere('drama', 55377).
+manga_genere('performing_arts', 55377).
+manga_genere('psychological', 55377).
+manga_genere('seinen', 55377).
+manga_genere('supernatural', 55377).
+manga_genere('fantasy', 60977).
+manga_genere('sci-fi', 60977).
+manga_genere('urban_fantasy', 60977).
+manga_genere('mystery', 61959).
+manga_genere('shounen', 61959).
+manga_genere('supernatural', 61959).
+manga_genere('josei', 73451).
+manga_genere('supernatural', 73451).
+manga_genere('seinen', 111323).
+manga_genere('slice_of_life', 111323).
+manga_genere('drama', 114006).
+manga_genere('seinen', 114006).
+manga_genere('boys_love', 118233).
+manga_genere('comedy', 118233).
+manga_genere('comedy', 120716).
+manga_genere('girls_love', 120716).
+manga_genere('detective', 121951).
+manga_genere('mystery', 121951).
+manga_genere('shounen', 121951).
+manga_genere('action', 122147).
+manga_genere('sci-fi', 122147).
+manga_genere('seinen', 122147).
+manga_genere('romance', 128131).
+manga_genere('shoujo', 128131).
+manga_genere('girls_love', 180916).
+manga_genere('comedy', 22519).
+manga_genere('ecchi', 22519).
+manga_genere('harem', 22519).
+manga_genere('romance', 22519).
+manga_genere('school', 22519).
+manga_genere('sci-fi', 22519).
+manga_genere('shounen', 22519).
+manga_genere('supernatural', 22519).
+manga_genere('comedy', 28107).
+manga_genere('ecchi', 28107).
+manga_genere('romance', 28107).
+manga_genere('slice_of_life', 28107).
+manga_genere('action', 41733).
+manga_genere('adventure', 41733).
+manga_genere('fantasy', 41733).
+manga_genere('isekai', 41733).
+manga_genere('military', 41733).
+manga_genere('action', 47363).
+manga_genere('gore', 47363).
+manga_genere('high_stakes_game', 47363).
+manga_genere('psychological', 47363).
+manga_genere('shounen', 47363).
+manga_genere('supernatural', 47363).
+manga_genere('survival', 47363).
+manga_genere('suspense', 47363).
+manga_genere('action', 25132).
+manga_genere('fantasy', 25132).
+manga_genere('gore', 25132).
+manga_genere('shounen', 25132).
+manga_genere('action', 48151).
+manga_genere('sci-fi', 48151).
+manga_genere('shounen', 48151).
+manga_genere('fantasy', 51493).
+manga_genere('mystery', 51493).
+manga_genere('sci-fi', 51493).
+manga_genere('shounen', 51493).
+manga_genere('drama', 344).
+manga_genere('psychological', 344).
+manga_genere('sci-fi', 344).
+manga_genere('seinen', 344).
+manga_genere('supernatural', 344).
+manga_genere('comedy', 766).
+manga_genere('drama', 766).
+manga_genere('romance', 766).
+manga_genere('school', 766).
+manga_genere('shoujo', 766).
+manga_genere('drama', 1261).
+manga_genere('horror', 1261).
+manga_genere('mystery', 1261).
+manga_genere('psychological', 1261).
+manga_genere('shounen', 1261).
+manga_genere('drama', 1490).
+manga_genere('fantasy', 1490).
+manga_genere('historical', 1490).
+manga_genere('romance', 1490).
+manga_genere('shoujo', 1490).
+manga_genere('mystery', 3636).
+manga_genere('shoujo', 3636).
+manga_genere('supernatural', 3636).
+manga_genere('award_winning', 4018).
+manga_genere('drama', 4018).
+manga_genere('mystery', 4018).
+manga_genere('psychological', 4018).
+manga_genere('sci-fi', 4018).
+manga_genere('shoujo', 4018).
+manga_genere('fantasy', 4998).
+manga_genere('school', 4998).
+manga_genere('shoujo', 4998).
+manga_genere('drama', 11438).
+manga_genere('shounen', 11438).
+manga_genere('supernatural', 11438).
+manga_genere('romance', 11767).
+manga_genere('school', 11767).
+manga_genere('shoujo', 11767).
+manga_genere('drama', 143339).
+manga_genere('romance', 143339).
+manga_genere('comedy', 147091).
+manga_genere('romance', 147091).
+manga_genere('school', 147091).
+manga_genere('shounen', 147091).
+manga_genere('romance', 149674).
+manga_genere('school', 149674).
+manga_genere('shoujo', 149674).
+manga_genere('comedy', 155312).
+manga_genere('romance', 155312).
+manga_genere('school', 155312).
+manga_genere('shoujo', 155312).
+manga_genere('action', 57897).
+manga_genere('adventure', 57897).
+manga_genere('mecha', 57897).
+manga_genere('sci-fi', 57897).
+manga_genere('seinen', 57897).
+manga_genere('comedy', 72439).
+manga_genere('shounen', 72439).
+manga_genere('slice_of_life', 72439).
+manga_genere('action', 75101).
+manga_genere('adventure', 75101).
+manga_genere('fantasy', 75101).
+manga_genere('video_game', 75101).
+manga_genere('comedy', 120403).
+manga_genere('girls_love', 120403).
+manga_genere('school', 120403).
+manga_genere('adventure', 121043).
+manga_genere('fantasy', 121043).
+manga_genere('historical', 121043).
+manga_genere('mythology', 121043).
+manga_genere('seinen', 121043).
+manga_genere('organized_crime', 109229).
+manga_genere('romance', 109229).
+manga_genere('seinen', 109229).
+manga_genere('action', 109339).
+manga_genere('adventure', 109339).
+manga_genere('fantasy', 109339).
+manga_genere('isekai', 109339).
+manga_genere('reincarnation', 109339).
+manga_genere('music', 125857).
+manga_genere('shoujo', 125857).
+manga_genere('action', 131924).
+manga_genere('fantasy', 131924).
+manga_genere('school', 131924).
+manga_genere('shounen', 131924).
+manga_genere('romance', 103562).
+manga_genere('school', 103562).
+manga_genere('shoujo', 103562).
+manga_genere('action', 28833).
+manga_genere('josei', 28833).
+manga_genere('mystery', 28833).
+manga_genere('organized_crime', 28833).
+manga_genere('boys_love', 44171).
+manga_genere('drama', 366).
+manga_genere('mecha', 366).
+manga_genere('romance', 366).
+manga_genere('sci-fi', 366).
+manga_genere('seinen', 366).
+manga_genere('action', 556).
+manga_genere('drama', 556).
+manga_genere('fantasy', 556).
+manga_genere('horror', 556).
+manga_genere('sci-fi', 556).
+manga_genere('shoujo', 556).
+manga_genere('vampire', 556).
+manga_genere('drama', 1893).
+manga_genere('fantasy', 1893).
+manga_genere('horror', 1893).
+manga_genere('mythology', 1893).
+manga_genere('shoujo', 1893).
+manga_genere('supernatural', 1893).
+manga_genere('adventure', 2906).
+manga_genere('comedy', 2906).
+manga_genere('crossdressing', 2906).
+manga_genere('romance', 2906).
+manga_genere('shoujo', 2906).
+manga_genere('award_winning', 3153).
+manga_genere('mystery', 3153).
+manga_genere('shounen', 3153).
+manga_genere('action', 8641).
+manga_genere('boys_love', 8641).
+manga_genere('fantasy', 8641).
+manga_genere('supernatural', 8641).
+manga_genere('fantasy', 8840).
+manga_genere('historical', 8840).
+manga_genere('romance', 8840).
+manga_genere('shoujo', 8840).
+manga_genere('supernatural', 8840).
+manga_genere('action', 16668).
+manga_genere('adventure', 16668).
+manga_genere('award_winning', 16668).
+manga_genere('comedy', 16668).
+manga_genere('fantasy', 16668).
+manga_genere('shounen', 16668).
+manga_genere('boys_love', 64047).
+manga_genere('school', 64047).
+manga_genere('slice_of_life', 64047).
+manga_genere('adventure', 141278).
+manga_genere('fantasy', 141278).
+manga_genere('isekai', 141278).
+manga_genere('reincarnation', 141278).
+manga_genere('drama', 144804).
+manga_genere('seinen', 144804).
+manga_genere('supernatural', 144804).
+manga_genere('boys_love', 159245).
+manga_genere('crossdressing', 137982).
+manga_genere('drama', 137982).
+manga_genere('romance', 137982).
+manga_genere('school', 137982).
+manga_genere('award_winning', 140333).
+manga_genere('drama', 140333).
+manga_genere('school', 140333).
+manga_genere('shoujo', 140333).
+manga_genere('comedy', 22520).
+manga_genere('kids', 22520).
+manga_genere('sports', 22520).
+manga_genere('team_sports', 22520).
+manga_genere('adventure', 116831).
+manga_genere('fantasy', 116831).
+manga_genere('action', 121026).
+manga_genere('adventure', 121026).
+manga_genere('josei', 121026).
+manga_genere('romance', 121026).
+manga_genere('sci-fi', 121026).
+manga_genere('boys_love', 125746).
+manga_genere('comedy', 125746).
+manga_genere('crossdressing', 125746).
+manga_genere('school', 125746).
+manga_genere('fantasy', 132727).
+manga_genere('girls_love', 132727).
+manga_genere('school', 101851).
+manga_genere('seinen', 101851).
+manga_genere('slice_of_life', 101851).
+manga_genere('school', 105912).
+manga_genere('sci-fi', 105912).
+manga_genere('action', 60973).
+manga_genere('fantasy', 60973).
+manga_genere('school', 60973).
+manga_genere('sci-fi', 60973).
+manga_genere('urban_fantasy', 60973).
+manga_genere('boys_love', 68025).
+manga_genere('mystery', 68025).
+manga_genere('supernatural', 68025).
+manga_genere('comedy', 582).
+manga_genere('drama', 582).
+manga_genere('ecchi', 582).
+manga_genere('romance', 582).
+manga_genere('school', 582).
+manga_genere('seinen', 582).
+manga_genere('slice_of_life', 582).
+manga_genere('comedy', 1051).
+manga_genere('drama', 1051).
+manga_genere('music', 1051).
+manga_genere('reverse_harem', 1051).
+manga_genere('romance', 1051).
+manga_genere('shoujo', 1051).
+manga_genere('action', 1185).
+manga_genere('combat_sports', 1185).
+manga_genere('comedy', 1185).
+manga_genere('drama', 1185).
+manga_genere('romance', 1185).
+manga_genere('school', 1185).
+manga_genere('shounen', 1185).
+manga_genere('sports', 1185).
+manga_genere('adventure', 1804).
+manga_genere('comedy', 1804).
+manga_genere('romance', 1804).
+manga_genere('shounen', 1804).
+manga_genere('comedy', 3749).
+manga_genere('drama', 3749).
+manga_genere('horror', 3749).
+manga_genere('mystery', 3749).
+manga_genere('psychological', 3749).
+manga_genere('supernatural', 3749).
+manga_genere('romance', 5394).
+manga_genere('shoujo', 5394).
+manga_genere('action', 8446).
+manga_genere('drama', 8446).
+manga_genere('mystery', 8446).
+manga_genere('psychological', 8446).
+manga_genere('seinen', 8446).
+manga_genere('suspense', 8446).
+manga_genere('action', 13801).
+manga_genere('adult_cast', 13801).
+manga_genere('adventure', 13801).
+manga_genere('comedy', 13801).
+manga_genere('fantasy', 13801).
+manga_genere('historical', 13801).
+manga_genere('isekai', 13801).
+manga_genere('samurai', 13801).
+manga_genere('seinen', 13801).
+manga_genere('drama', 125699).
+manga_genere('magical_sex_shift', 125699).
+manga_genere('school', 125699).
+manga_genere('slice_of_life', 125699).
+manga_genere('fantasy', 134812).
+manga_genere('isekai', 134812).
+manga_genere('reincarnation', 134812).
+manga_genere('action', 25861).
+manga_genere('sci-fi', 25861).
+manga_genere('seinen', 25861).
+manga_genere('boys_love', 37641).
+manga_genere('comedy', 49333).
+manga_genere('fantasy', 49333).
+manga_genere('isekai', 49333).
+manga_genere('romance', 49333).
+manga_genere('action', 36).
+manga_genere('drama', 36).
+manga_genere('mahou_shoujo', 36).
+manga_genere('reincarnation', 36).
+manga_genere('romance', 36).
+manga_genere('school', 36).
+manga_genere('shoujo', 36).
+manga_genere('supernatural', 36).
+manga_genere('action', 40).
+manga_genere('adventure', 40).
+manga_genere('comedy', 40).
+manga_genere('fantasy', 40).
+manga_genere('shounen', 40).
+manga_genere('action', 74).
+manga_genere('award_winning', 74).
+manga_genere('ecchi', 74).
+manga_genere('school', 74).
+manga_genere('shounen', 74).
+manga_genere('supernatural', 74).
+manga_genere('comedy', 107).
+manga_genere('ecchi', 107).
+manga_genere('psychological', 107).
+manga_genere('romance', 107).
+manga_genere('sci-fi', 107).
+manga_genere('seinen', 107).
+manga_genere('drama', 188).
+manga_genere('fantasy', 188).
+manga_genere('josei', 188).
+manga_genere('romance', 188).
+manga_genere('boys_love', 257).
+manga_genere('drama', 257).
+manga_genere('historical', 257).
+manga_genere('adventure', 398).
+manga_genere('fantasy', 398).
+manga_genere('shounen', 398).
+manga_genere('drama', 912).
+manga_genere('gore', 912).
+manga_genere('horror', 912).
+manga_genere('shoujo', 912).
+manga_genere('supernatural', 912).
+manga_genere('action', 933).
+manga_genere('drama', 933).
+manga_genere('gore', 933).
+manga_genere('horror', 933).
+manga_genere('psychological', 933).
+manga_genere('romance', 933).
+manga_genere('seinen', 933).
+manga_genere('supernatural', 933).
+manga_genere('drama', 1264).
+manga_genere('horror', 1264).
+manga_genere('mystery', 1264).
+manga_genere('psychological', 1264).
+manga_genere('action', 3537).
+manga_genere('comedy', 3537).
+manga_genere('delinquents', 3537).
+manga_genere('romance', 3537).
+manga_genere('school', 3537).
+manga_genere('shounen', 3537).
+manga_genere('action', 3737).
+manga_genere('boys_love', 3737).
+manga_genere('fantasy', 3737).
+manga_genere('shoujo', 3737).
+manga_genere('supernatural', 3737).
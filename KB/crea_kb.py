@@ -1,56 +1,166 @@
 import csv  #oper leggere i dati da file CSV
 import os   #per costruire e gestire i percorsi dei file
+import sys  #per rendere importabili i moduli di PYTHON_DATASET
+import shutil   #per trovare l'eseguibile di SWI-Prolog
+import subprocess   #per compilare la KB e misurare i tempi di avvio con SWI-Prolog
+import time #per misurare il tempo di caricamento della KB
+import argparse #per leggere le opzioni da riga di comando
+
+#moduli interni del progetto
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'PYTHON_DATASET'))
+from strumentazione import span, configura  #durata, righe al secondo e memoria della scrittura della KB
 
 #funzione per normalizzare le stringhe per Prolog
 def safe_string(s):
     #sostituisce apici, virgolette e spazi con caratteri
     return s.replace("'", "\\'").replace('"', '\\"').replace(" ", "_").lower()
     
-#funzione principale genera un file .pl contenente i fatti
-def genera_kb_prolog(mangalist_path, top_manga_path, output_pl_path):
-    with open(output_pl_path, 'w', encoding='utf-8') as f_out:
-        
+#restituisce le righe di un CSV oppure di una cartella colonnare (DATASET/colonne/...) come dizionari di stringhe
+def leggi_righe(percorso):
+    if os.path.isdir(percorso):
+        from dataset_colonnare import iter_righe
+        for row in iter_righe(percorso):
+            #i generi arrivano come lista già divisa, gli altri valori vengono riportati al testo del CSV
+            yield {k: ', '.join(v) if isinstance(v, list) else str(v) for k, v in row.items()}
+    else:
+        with open(percorso, 'r', encoding='utf-8') as f:
+            yield from csv.DictReader(f)
+
+#scrive un blocco di fatti genere-ID normalizzati (senza underscore iniziale), con il genere come primo argomento per l'indicizzazione di Prolog
+def scrivi_fatti_genere(f_out, predicato, coppie):
+    for genere, id_manga in coppie:
+        f_out.write(f"{predicato}('{genere}', {id_manga}).\n")
+
+#genera il catalogo condiviso da tutti gli utenti: fatti manga/8 e manga_genere/2
+def genera_catalogo_prolog(top_manga_path, output_pl_path):
+    with span('kb_scrittura', file='catalogo') as misura, open(output_pl_path, 'w', encoding='utf-8') as f_out:
+        manga_genere = []
+        righe = 0
+
         #predicato generato: manga(ID, Titolo, [Generi], Mean, Rank, Pop, Stato, [Autori])
-        with open(top_manga_path, 'r', encoding='utf-8') as f_top:
-            reader = csv.DictReader(f_top)
-            for row in reader:
-                id_manga = row['ID']
-                titolo = safe_string(row['Titolo'])
-                generi = [safe_string(g) for g in row['Generi'].split(',') if g.strip()]
-                mean = row.get('Punteggio Medio', 'null')
-                rank = row.get('Rank', 'null')
-                popolarita = row.get('Popolarità', 'null')
-                stato = safe_string(row.get('Stato', 'unknown'))
-                autori = [safe_string(a) for a in row.get('Autori', '').split(',') if a.strip()]
-
-                #scrittura del fatto: manga/8
-                f_out.write(f"manga({id_manga}, '{titolo}', {generi}, {mean}, {rank}, {popolarita}, {stato}, {autori}).\n")
-
-        #predicato generato: lettura_utente(ID, Titolo, Stato, PunteggioUtente, [Generi])
-        with open(mangalist_path, 'r', encoding='utf-8') as f_manga:
-            reader = csv.DictReader(f_manga)
-            for row in reader:
-                id_manga = row['ID']
-                titolo = safe_string(row['Titolo'])
-                stato_lettura = safe_string(row.get('Stato', 'unknown'))
-                punteggio_utente = row.get('Punteggio', '0')
-                
-                #converte il punteggio in float, 0 in caso di errore
-                try:
-                    punteggio_utente = float(punteggio_utente)
-                except ValueError:
-                    punteggio_utente = 0
-
-                generi_raw = row.get('Generi', '')
-                generi = [safe_string(g) for g in generi_raw.split(',') if g.strip()]
-
-                #scrittura del fatto: lettura_utente/5
-                f_out.write(f"lettura_utente({id_manga}, '{titolo}', {stato_lettura}, {punteggio_utente}, {generi}).\n")
-
-    print(f"\nKnowledge Base Prolog salvata come '{output_pl_path}'!")
+        for row in leggi_righe(top_manga_path):
+            id_manga = row['ID']
+            titolo = safe_string(row['Titolo'])
+            generi = [safe_string(g) for g in row['Generi'].split(',') if g.strip()]
+            mean = row.get('Punteggio Medio', 'null')
+            rank = row.get('Rank', 'null')
+            popolarita = row.get('Popolarità', 'null')
+            stato = safe_string(row.get('Stato', 'unknown'))
+            autori = [safe_string(a) for a in row.get('Autori', '').split(',') if a.strip()]
+
+            #scrittura del fatto: manga/8
+            f_out.write(f"manga({id_manga}, '{titolo}', {generi}, {mean}, {rank}, {popolarita}, {stato}, {autori}).\n")
+            manga_genere.extend((safe_string(g.strip()), id_manga) for g in row['Generi'].split(',') if g.strip())
+            righe += 1
+
+        #predicato generato: manga_genere(Genere, ID)
+        scrivi_fatti_genere(f_out, 'manga_genere', manga_genere)
+        misura.imposta(righe=righe, fatti=righe + len(manga_genere), byte=f_out.tell())
+
+    print(f"\nCatalogo Prolog salvato come '{output_pl_path}'!")
+
+#genera le letture di un utente: fatti lettura/6 e letto/3 con l'utente come primo argomento, caricati da system.pl accanto al catalogo
+def genera_letture_prolog(mangalist_path, utente, output_pl_path):
+    os.makedirs(os.path.dirname(output_pl_path) or '.', exist_ok=True)
+    chiave = atomo_prolog(utente)
+    with span('kb_scrittura', file='letture') as misura, open(output_pl_path, 'w', encoding='utf-8') as f_out:
+        letto = []
+        righe = 0
+
+        #predicato generato: lettura(Utente, ID, Titolo, Stato, PunteggioUtente, [Generi])
+        for row in leggi_righe(mangalist_path):
+            id_manga = row['ID']
+            titolo = safe_string(row['Titolo'])
+            stato_lettura = safe_string(row.get('Stato', 'unknown'))
+            punteggio_utente = row.get('Punteggio', '0')
+
+            #converte il punteggio in float, 0 in caso di errore
+            try:
+                punteggio_utente = float(punteggio_utente)
+            except ValueError:
+                punteggio_utente = 0
+
+            generi_raw = row.get('Generi', '')
+            generi = [safe_string(g) for g in generi_raw.split(',') if g.strip()]
+
+            #scrittura del fatto: lettura/6
+            f_out.write(f"lettura({chiave}, {id_manga}, '{titolo}', {stato_lettura}, {punteggio_utente}, {generi}).\n")
+            letto.extend((safe_string(g.strip()), id_manga) for g in generi_raw.split(',') if g.strip())
+            righe += 1
+
+        #predicato generato: letto(Utente, Genere, ID), per tutte le voci della lista (plan_to_read compreso)
+        for genere, id_manga in letto:
+            f_out.write(f"letto({chiave}, '{genere}', {id_manga}).\n")
+        misura.imposta(utente=utente, righe=righe, fatti=righe + len(letto), byte=f_out.tell())
+
+    print(f"Letture di '{utente}' salvate come '{output_pl_path}'")
+
+#funzione principale: genera il catalogo e le letture di un utente nella cartella della KB (catalogo.pl e letture/<utente>.pl)
+def genera_kb_prolog(mangalist_path, top_manga_path, cartella_kb, utente='utente'):
+    with span('genera_kb', profila=True):
+        genera_catalogo_prolog(top_manga_path, os.path.join(cartella_kb, 'catalogo.pl'))
+        genera_letture_prolog(mangalist_path, utente, os.path.join(cartella_kb, 'letture', f'{utente}.pl'))
+    print(f"\nKnowledge Base Prolog salvata in '{cartella_kb}'!")
+
+#converte un percorso in un atomo Prolog tra apici
+def atomo_prolog(percorso):
+    return "'" + percorso.replace('\\', '/').replace("'", "\\'") + "'"
+
+#compila un file della KB in formato .qlf (caricamento veloce di SWI-Prolog), restituisce il percorso creato oppure None
+def compila_kb(output_pl_path, swipl=None):
+    swipl = swipl or shutil.which('swipl')
+    if swipl is None:
+        print("SWI-Prolog non trovato: la versione compilata non viene creata, system.pl userà il file .pl")
+        return None
+    qlf_path = os.path.splitext(output_pl_path)[0] + '.qlf'
+    #stessa codifica usata da system.pl per leggere i caratteri speciali dei titoli
+    comando = f"set_prolog_flag(encoding, utf8), qcompile({atomo_prolog(output_pl_path)})"
+    risultato = subprocess.run([swipl, '-q', '-g', comando, '-t', 'halt'], capture_output=True, text=True)
+    if risultato.returncode != 0 or not os.path.exists(qlf_path):
+        print(f"Compilazione della KB non riuscita: {risultato.stderr.strip()}")
+        return None
+    print(f"Knowledge Base compilata salvata come '{qlf_path}'!")
+    return qlf_path
+
+#misura il tempo di avvio a freddo (processo nuovo) caricando la KB testuale e quella compilata, ripetendo ogni misura più volte
+def misura_avvio(output_pl_path, ripetizioni=5, swipl=None):
+    swipl = swipl or shutil.which('swipl')
+    if swipl is None:
+        print("SWI-Prolog non trovato: impossibile misurare i tempi di avvio")
+        return None
+    qlf_path = os.path.splitext(output_pl_path)[0] + '.qlf'
+    tempi = {}
+    #il caso 'vuoto' misura solo l'avvio di swipl e viene sottratto agli altri
+    for nome, obiettivo in (('vuoto', 'true'), ('testo', f"set_prolog_flag(encoding, utf8), consult({atomo_prolog(output_pl_path)})"), ('compilata', f"load_files({atomo_prolog(qlf_path)}, [])")):
+        if nome == 'compilata' and not os.path.exists(qlf_path):
+            continue
+        misure = []
+        for _ in range(ripetizioni):
+            inizio = time.perf_counter()
+            subprocess.run([swipl, '-q', '-g', obiettivo, '-t', 'halt'], capture_output=True)
+            misure.append(time.perf_counter() - inizio)
+        tempi[nome] = min(misure)
+    print(f"Avvio di swipl senza KB: {tempi['vuoto'] * 1000:.0f} ms")
+    for nome in ('testo', 'compilata'):
+        if nome in tempi:
+            print(f"Caricamento KB {nome}: {(tempi[nome] - tempi['vuoto']) * 1000:.0f} ms (totale {tempi[nome] * 1000:.0f} ms, migliore di {ripetizioni})")
+    if 'compilata' in tempi and tempi['compilata'] > tempi['vuoto']:
+        print(f"Speedup caricamento: {(tempi['testo'] - tempi['vuoto']) / (tempi['compilata'] - tempi['vuoto']):.1f}x")
+    return tempi
 
 #main
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Genera la knowledge base Prolog dai CSV di DATASET")
+    parser.add_argument('--utente', default='utente', help="nome con cui vengono salvate le letture di mangalist.csv")
+    parser.add_argument('--utenti', help="cartella delle partizioni di ingestione_batch.py (<cartella>/<utente>/mangalist.csv) da convertire in letture/<utente>.pl")
+    parser.add_argument('--no-compila', action='store_true', help="non crea catalogo.qlf")
+    parser.add_argument('--misura', action='store_true', help="misura il tempo di avvio con il catalogo testuale e con quello compilato")
+    parser.add_argument('--metriche', help="cartella in cui salvare gli span (eventi.jsonl) e il riepilogo Prometheus (metriche.prom)")
+    parser.add_argument('--profilo', action='store_true', help="con --metriche salva anche il profilo cProfile della generazione")
+    args = parser.parse_args()
+    if args.metriche:
+        configura(args.metriche, profilo=args.profilo)
+
     #percorsi assoluti per i file CSV
     base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'DATASET'))
     mangalist_path = os.path.join(base_dir, 'mangalist.csv')
@@ -59,7 +169,20 @@ if __name__ == '__main__':
     #crea la directory di output se non esiste
     output_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'KB'))
     os.makedirs(output_dir, exist_ok=True)
-    output_pl_path = os.path.join(output_dir, 'knowledge_base.pl')
 
-    #avvia la generazione della knowledge base
-    genera_kb_prolog(mangalist_path, top_manga_path, output_pl_path)
\ No newline at end of file
+    #avvia la generazione della knowledge base (catalogo + letture dell'utente principale)
+    genera_kb_prolog(mangalist_path, top_manga_path, output_dir, args.utente)
+
+    #letture degli altri utenti scaricati con ingestione_batch.py, caricate da system.pl solo quando servono
+    if args.utenti:
+        for utente in sorted(os.listdir(args.utenti)):
+            percorso = os.path.join(args.utenti, utente, 'mangalist.csv')
+            if os.path.exists(percorso):
+                genera_letture_prolog(percorso, utente, os.path.join(output_dir, 'letture', f'{utente}.pl'))
+
+    #compila il catalogo (la parte grande e condivisa) per un avvio più veloce di system.pl
+    catalogo_path = os.path.join(output_dir, 'catalogo.pl')
+    if not args.no_compila:
+        compila_kb(catalogo_path)
+    if args.misura:
+        misura_avvio(catalogo_path)
@@ -0,0 +1,2825 @@
+lettura('utente', 3, '20th_century_boys', completed, 9.0, ['award_winning', '_drama', '_historical', '_mystery', '_psychological', '_sci-fi', '_seinen']).
+lettura('utente', 743, '21st_century_boys', completed, 0.0, ['award_winning', '_drama', '_mystery', '_psychological', '_sci-fi', '_seinen']).
+lettura('utente', 1224, '3-gatsu_no_lion', on_hold, 6.0, ['award_winning', '_childcare', '_drama', '_iyashikei', '_seinen', '_slice_of_life', '_strategy_game']).
+lettura('utente', 147337, '66,666_years:_advent_of_the_dark_mage', dropped, 4.0, ['fantasy', '_reincarnation']).
+lettura('utente', 134678, 'a_business_proposal', completed, 5.0, ['adult_cast', '_comedy', '_drama', '_romance', '_workplace']).
+lettura('utente', 148457, 'a_dance_of_swords_in_the_night', dropped, 5.0, ['action', '_fantasy', '_martial_arts']).
+lettura('utente', 41723, 'a_fairytale_for_the_demon_lord', plan_to_read, 0.0, ['action', '_adventure', '_fantasy', '_romance']).
+lettura('utente', 158496, 'a_modern_man_who_got_transmigrated_into_the_murim_world', plan_to_read, 0.0, ['action', '_fantasy', '_isekai', '_martial_arts', '_reincarnation']).
+lettura('utente', 132247, 'a_returner\'s_magic_should_be_special', completed, 6.0, ['action', '_fantasy', '_school', '_time_travel']).
+lettura('utente', 50027, 'about_death', completed, 8.0, ['psychological', '_slice_of_life', '_supernatural']).
+lettura('utente', 172750, 'absolute_regression', reading, 7.0, ['action', '_fantasy', '_martial_arts', '_time_travel']).
+lettura('utente', 174691, 'absolute_reign', reading, 7.0, ['action', '_fantasy', '_martial_arts']).
+lettura('utente', 149880, 'absolute_sword_sense', dropped, 4.0, ['action', '_fantasy', '_martial_arts', '_time_travel']).
+lettura('utente', 143991, 'after_god', plan_to_read, 0.0, ['action', '_fantasy']).
+lettura('utente', 147448, 'after_school_lessons_for_unripe_apples', dropped, 6.0, ['romance', '_school']).
+lettura('utente', 150210, 'after_ten_millennia_in_hell', dropped, 5.0, ['action', '_fantasy']).
+lettura('utente', 103939, 'aharen-san_wa_hakarenai', dropped, 3.0, ['comedy', '_love_status_quo', '_romance', '_school', '_shounen']).
+lettura('utente', 147014, 'aisha', plan_to_read, 0.0, ['drama', '_mystery', '_psychological', '_suspense']).
+lettura('utente', 49865, 'ajin', completed, 7.0, ['action', '_gore', '_horror', '_mystery', '_seinen', '_supernatural']).
+lettura('utente', 1218, 'akagi:_yami_ni_oritatta_tensai', plan_to_read, 0.0, ['action', '_adult_cast', '_drama', '_organized_crime', '_psychological', '_strategy_game']).
+lettura('utente', 21525, 'akatsuki_no_yona', plan_to_read, 0.0, ['adventure', '_fantasy', '_romance', '_shoujo']).
+lettura('utente', 664, 'akira', plan_to_read, 0.0, ['action', '_award_winning', '_gore', '_sci-fi', '_seinen']).
+lettura('utente', 24705, 'aku_no_hana', plan_to_read, 0.0, ['drama', '_psychological', '_romance', '_school', '_shounen']).
+lettura('utente', 1101, 'akumetsu', completed, 8.0, ['action', '_detective', '_drama', '_psychological', '_shounen', '_suspense']).
+lettura('utente', 125325, 'akuyaku_reijou_tensei_ojisan', dropped, 3.0, ['comedy', '_fantasy', '_school', '_seinen', '_villainess']).
+lettura('utente', 62887, 'all_you_need_is_kill', completed, 7.0, ['action', '_military', '_sci-fi', '_seinen', '_time_travel']).
+lettura('utente', 63535, 'amaama_to_inazuma', completed, 5.0, ['childcare', '_comedy', '_gourmet', '_iyashikei', '_seinen', '_slice_of_life']).
+lettura('utente', 129418, 'ame_to_kimi_to', plan_to_read, 0.0, ['comedy', '_seinen', '_slice_of_life']).
+lettura('utente', 143336, 'among_us', completed, 6.0, ['comedy', '_kids', '_sci-fi', '_space']).
+lettura('utente', 128953, 'ankoku_kishi_no_ore_desu_ga_saikyou_no_paladin_wo_mezashimasu', dropped, 2.0, ['action', '_fantasy', '_school']).
+lettura('utente', 30079, 'annarasumanara', completed, 9.0, ['drama', '_mystery', '_psychological', '_romance', '_school', '_seinen']).
+lettura('utente', 296, 'anne_freaks', completed, 5.0, ['horror', '_mystery', '_psychological']).
+lettura('utente', 102256, 'ao_ashi', plan_to_read, 0.0, ['award_winning', '_seinen', '_sports', '_team_sports']).
+lettura('utente', 13492, 'ao_no_exorcist', plan_to_read, 0.0, ['action', '_mythology', '_school', '_shounen', '_supernatural']).
+lettura('utente', 135545, 'ao_no_hako', plan_to_read, 0.0, ['romance', '_school', '_shounen', '_sports', '_team_sports']).
+lettura('utente', 14154, 'arakawa_under_the_bridge', completed, 4.0, ['comedy', '_romance', '_seinen']).
+lettura('utente', 96528, 'arifureta_shokugyou_de_sekai_saikyou', dropped, 4.0, ['action', '_adventure', '_fantasy', '_harem', '_isekai']).
+lettura('utente', 1303, 'ashita_no_joe', plan_to_read, 0.0, ['combat_sports', '_drama', '_shounen', '_slice_of_life', '_sports']).
+lettura('utente', 131084, 'assassin\'s_creed_valhalla_x_vinland_saga', completed, 4.0, ['action', '_historical', '_seinen']).
+lettura('utente', 153965, 'auto_hunting_with_my_clones', dropped, 6.0, ['action', '_fantasy']).
+lettura('utente', 141583, 'ayashimon', completed, 5.0, ['action', '_organized_crime', '_shounen', '_supernatural']).
+lettura('utente', 93350, 'ayeshah\'s_secret', completed, 7.0, ['drama']).
+lettura('utente', 85, 'azumanga_daioh', dropped, 3.0, ['cgdct', '_comedy', '_school', '_slice_of_life']).
+lettura('utente', 72299, 'baki-dou', plan_to_read, 0.0, ['action', '_gore', '_martial_arts', '_shounen']).
+lettura('utente', 115749, 'baki-dou', plan_to_read, 0.0, ['action', '_martial_arts', '_shounen']).
+lettura('utente', 5157, 'baki:_new_grappler_baki', plan_to_read, 0.0, ['action', '_combat_sports', '_gore', '_martial_arts', '_shounen']).
+lettura('utente', 9711, 'bakuman.', plan_to_read, 0.0, ['comedy', '_drama', '_otaku_culture', '_romance', '_shounen']).
+lettura('utente', 756, 'banana_fish', plan_to_read, 0.0, ['action', '_adventure', '_delinquents', '_drama', '_organized_crime', '_psychological', '_shoujo', '_suspense']).
+lettura('utente', 13568, 'barairo_no_kaibutsu', completed, 5.0, ['horror', '_psychological', '_seinen']).
+lettura('utente', 17051, 'barakamon', dropped, 4.0, ['childcare', '_comedy', '_iyashikei', '_shounen', '_slice_of_life', '_visual_arts']).
+lettura('utente', 111213, 'bastard', completed, 8.0, ['drama', '_gore', '_horror', '_mystery', '_psychological', '_romance']).
+lettura('utente', 103701, 'beastars', completed, 9.0, ['anthropomorphic', '_award_winning', '_drama', '_psychological', '_shounen', '_slice_of_life']).
+lettura('utente', 10010, 'beelzebub', plan_to_read, 0.0, ['action', '_childcare', '_comedy', '_delinquents', '_mythology', '_school', '_shounen', '_supernatural']).
+lettura('utente', 2, 'berserk', dropped, 10.0, ['action', '_adventure', '_award_winning', '_drama', '_fantasy', '_gore', '_horror', '_military', '_psychological', '_seinen']).
+lettura('utente', 92299, 'berserk:_shinen_no_kami_2', completed, 0.0, ['seinen']).
+lettura('utente', 147662, 'best_teacher_baek', reading, 7.0, ['action', '_fantasy', '_martial_arts', '_reincarnation']).
+lettura('utente', 113835, 'biao_ren', reading, 8.0, ['action', '_drama', '_historical']).
+lettura('utente', 11054, 'billy_bat', plan_to_read, 0.0, ['detective', '_drama', '_historical', '_mystery', '_psychological', '_seinen', '_supernatural']).
+lettura('utente', 168969, 'black_and_white_martial_emperor', dropped, 3.0, ['action', '_fantasy', '_martial_arts']).
+lettura('utente', 86337, 'black_clover', plan_to_read, 0.0, ['action', '_fantasy', '_shounen']).
+lettura('utente', 735, 'black_lagoon', plan_to_read, 0.0, ['action', '_adult_cast', '_drama', '_military', '_organized_crime', '_seinen']).
+lettura('utente', 149, 'blame!', completed, 6.0, ['action', '_drama', '_horror', '_psychological', '_sci-fi', '_seinen']).
+lettura('utente', 12, 'bleach', plan_to_read, 0.0, ['action', '_adventure', '_award_winning', '_shounen', '_supernatural']).
+lettura('utente', 85719, 'blue_giant', completed, 7.0, ['award_winning', '_music', '_seinen']).
+lettura('utente', 100922, 'blue_giant_supreme', plan_to_read, 0.0, ['music', '_seinen']).
+lettura('utente', 1479, 'blue_heaven', completed, 5.0, ['action', '_psychological', '_seinen']).
+lettura('utente', 114745, 'blue_lock', reading, 7.0, ['award_winning', '_shounen', '_sports', '_team_sports']).
+lettura('utente', 107931, 'blue_period', reading, 8.0, ['award_winning', '_drama', '_school', '_seinen', '_visual_arts']).
+lettura('utente', 2109, 'bokkou', completed, 5.0, ['action', '_award_winning', '_drama', '_historical', '_seinen']).
+lettura('utente', 75989, 'boku_no_hero_academia', completed, 4.0, ['action', '_school', '_shounen', '_super_power']).
+lettura('utente', 112807, 'boku_no_kokoro_no_yabai_yatsu', plan_to_read, 0.0, ['comedy', '_romance', '_school', '_shounen']).
+lettura('utente', 153950, 'boku_to_jinginaki_ojisan', completed, 4.0, ['comedy', '_shounen']).
+lettura('utente', 94919, 'bokutachi_ga_yarimashita', plan_to_read, 0.0, ['drama', '_seinen']).
+lettura('utente', 175296, 'bones', dropped, 2.0, ['action', '_fantasy', '_urban_fantasy']).
+lettura('utente', 148617, 'book_eater', dropped, 5.0, ['action', '_adventure', '_fantasy', '_school']).
+lettura('utente', 119533, 'boukensha_license_wo_hakudatsu_sareta_ossan_dakedo,_manamusume_ga_dekita_node_nonbiri_jinsei_wo_ouka_suru', on_hold, 6.0, ['action', '_adventure', '_fantasy']).
+lettura('utente', 115194, 'boukensha_ni_naritai_to_miyako_ni_deteitta_musume_ga_s-rank_ni_natteta', on_hold, 6.0, ['action', '_adventure', '_fantasy']).
+lettura('utente', 130977, 'build_king', completed, 2.0, ['action', '_adventure', '_fantasy', '_shounen']).
+lettura('utente', 23419, 'byousoku_5_centimeter', completed, 6.0, ['drama', '_romance', '_seinen']).
+lettura('utente', 103444, 'candy_&_cigarettes', completed, 5.0, ['action', '_seinen']).
+lettura('utente', 116778, 'chainsaw_man', on_hold, 8.0, ['action', '_award_winning', '_fantasy', '_gore', '_shounen', '_urban_fantasy']).
+lettura('utente', 104271, 'chi_no_wadachi', plan_to_read, 0.0, ['drama', '_psychological', '_seinen', '_suspense']).
+lettura('utente', 76813, 'chichi_to_ko', plan_to_read, 0.0, ['childcare', '_comedy', '_shounen', '_slice_of_life']).
+lettura('utente', 148428, 'child_of_the_sheath', dropped, 5.0, ['action', '_adventure', '_fantasy']).
+lettura('utente', 131403, 'choujin_x', plan_to_read, 0.0, ['action', '_seinen', '_supernatural']).
+lettura('utente', 174692, 'chronicles_of_a_doomed_prodigy', reading, 5.0, ['action', '_adventure', '_fantasy', '_martial_arts']).
+lettura('utente', 157591, 'chronicles_of_the_demon_faction', dropped, 4.0, ['action', '_fantasy', '_martial_arts', '_reincarnation']).
+lettura('utente', 177080, 'chronicles_of_the_reincarnated_demon_god', dropped, 5.0, ['action', '_fantasy', '_martial_arts', '_reincarnation']).
+lettura('utente', 583, 'claymore', plan_to_read, 0.0, ['action', '_adventure', '_fantasy', '_gore', '_horror', '_shounen']).
+lettura('utente', 36595, 'cocoon', completed, 6.0, ['drama', '_historical', '_josei']).
+lettura('utente', 5651, 'crows', plan_to_read, 0.0, ['action', '_delinquents', '_school', '_shounen']).
+lettura('utente', 127084, 'cuprum_no_hanayome', dropped, 4.0, ['comedy', '_romance', '_seinen']).
+lettura('utente', 24, 'd.gray-man', plan_to_read, 0.0, ['action', '_adventure', '_fantasy', '_shounen', '_urban_fantasy']).
+lettura('utente', 118858, 'dai_dark', on_hold, 9.0, ['comedy', '_horror', '_sci-fi', '_shounen']).
+lettura('utente', 158565, 'damedol_to_sekai_ni_hitori_dake_no_fan', dropped, 4.0, ['comedy', '_idols_(female)', '_romance']).
+lettura('utente', 135496, 'dandadan', on_hold, 8.0, ['action', '_comedy', '_shounen', '_supernatural']).
+lettura('utente', 130755, 'darwin_jihen', plan_to_read, 0.0, ['award_winning', '_sci-fi', '_seinen']).
+lettura('utente', 70801, 'dead_dead_demons_dededede_destruction', completed, 6.0, ['award_winning', '_drama', '_school', '_sci-fi', '_seinen']).
+lettura('utente', 110301, 'dead_mount_death_play', dropped, 3.0, ['action', '_fantasy', '_reincarnation', '_seinen', '_urban_fantasy']).
+lettura('utente', 21, 'death_note', completed, 7.0, ['psychological', '_shounen', '_supernatural', '_suspense']).
+lettura('utente', 149465, 'demon_devourer', dropped, 5.0, ['action', '_fantasy']).
+lettura('utente', 147847, 'descended_from_divinity', dropped, 4.0, ['action', '_fantasy', '_reincarnation']).
+lettura('utente', 148070, 'descent_of_the_demon_master', on_hold, 6.0, ['action', '_fantasy', '_martial_arts', '_reincarnation']).
+lettura('utente', 150998, 'designated_bully', dropped, 3.0, ['action', '_delinquents', '_school']).
+lettura('utente', 1474, 'devilman', completed, 5.0, ['action', '_adventure', '_drama', '_fantasy', '_horror', '_mythology', '_psychological', '_sci-fi', '_shounen', '_super_power', '_supernatural']).
+lettura('utente', 148456, 'disciple_of_the_holy_sword', on_hold, 5.0, ['action', '_adventure', '_fantasy']).
+lettura('utente', 82947, 'distant_sky', completed, 7.0, ['action', '_drama', '_horror', '_mystery', '_survival']).
+lettura('utente', 111767, 'do_chokkyuu_kareshi_x_kanojo', dropped, 3.0, ['comedy', '_romance', '_school', '_shounen']).
+lettura('utente', 151060, 'doctor,_live_again', on_hold, 6.0, ['action', '_fantasy', '_isekai', '_martial_arts', '_medical', '_reincarnation']).
+lettura('utente', 147172, 'doom_breaker', on_hold, 6.0, ['action', '_fantasy', '_time_travel']).
+lettura('utente', 1133, 'dorohedoro', completed, 10.0, ['action', '_comedy', '_fantasy', '_gore', '_horror', '_seinen']).
+lettura('utente', 156024, 'doumo,_yuusha_no_chichi_desu._kono_tabi_wa_gusoku_ga_gomeiwaku_wo_kakete,_moushiwake_arimasen.', completed, 3.0, ['action', '_adventure', '_comedy', '_fantasy']).
+lettura('utente', 40345, 'dr._frost', dropped, 4.0, ['drama', '_medical', '_psychological']).
+lettura('utente', 103897, 'dr._stone', plan_to_read, 0.0, ['adventure', '_award_winning', '_sci-fi', '_shounen', '_survival', '_suspense']).
+lettura('utente', 146618, 'drawing:_saikyou_mangaka_wa_oekaki_skill_de_isekai_musou_suru!', dropped, 2.0, ['adventure', '_fantasy', '_isekai', '_reincarnation']).
+lettura('utente', 85781, 'dungeon_meshi', plan_to_read, 0.0, ['award_winning', '_comedy', '_fantasy', '_gourmet', '_seinen']).
+lettura('utente', 152405, 'dungeon_odyssey', dropped, 4.0, ['action', '_fantasy']).
+lettura('utente', 147438, 'dungeon_reset', dropped, 5.0, ['action', '_adventure', '_fantasy']).
+lettura('utente', 147171, 'eleceed', reading, 7.0, ['action', '_super_power']).
+lettura('utente', 10970, 'emerging', completed, 4.0, ['drama', '_gore', '_horror', '_medical', '_psychological', '_seinen']).
+lettura('utente', 150204, 'ending_maker', on_hold, 6.0, ['action', '_fantasy', '_isekai', '_romance']).
+lettura('utente', 43, 'eyeshield_21', plan_to_read, 0.0, ['shounen', '_sports', '_team_sports']).
+lettura('utente', 43913, 'feng_shen_ji', completed, 8.0, ['action', '_fantasy', '_historical', '_martial_arts', '_supernatural']).
+lettura('utente', 147463, 'fff-class_trashero', dropped, 3.0, ['action', '_adventure', '_fantasy', '_isekai', '_time_travel']).
+lettura('utente', 118805, 'fight_class_3', dropped, 5.0, ['action', '_martial_arts', '_school']).
+lettura('utente', 98270, 'fire_punch', dropped, 4.0, ['action', '_gore', '_mystery', '_shounen', '_supernatural']).
+lettura('utente', 150088, 'fist_demon_of_mount_hua', dropped, 4.0, ['action', '_adventure', '_fantasy', '_martial_arts']).
+lettura('utente', 25, 'fullmetal_alchemist', plan_to_read, 0.0, ['action', '_adventure', '_award_winning', '_drama', '_fantasy', '_military', '_shounen']).
+lettura('utente', 102343, 'fumetsu_no_anata_e', on_hold, 8.0, ['adventure', '_award_winning', '_drama', '_shounen', '_supernatural']).
+lettura('utente', 112694, 'fushigi_neko_no_kyuu-chan', completed, 6.0, ['comedy', '_pets', '_slice_of_life']).
+lettura('utente', 103694, 'gal_gohan', dropped, 3.0, ['comedy', '_gourmet', '_love_status_quo', '_romance', '_school', '_seinen']).
+lettura('utente', 24903, 'gangsta.', plan_to_read, 0.0, ['action', '_adult_cast', '_drama', '_organized_crime', '_seinen']).
+lettura('utente', 564, 'gantz', dropped, 4.0, ['action', '_drama', '_gore', '_horror', '_psychological', '_sci-fi', '_seinen', '_supernatural', '_survival']).
+lettura('utente', 15010, 'gekiryuuchi', completed, 5.0, ['action', '_drama', '_martial_arts', '_psychological', '_school', '_seinen']).
+lettura('utente', 146875, 'get_schooled', on_hold, 6.0, ['drama', '_school']).
+lettura('utente', 110727, 'gigant', completed, 2.0, ['drama', '_romance', '_sci-fi', '_seinen']).
+lettura('utente', 124145, 'gilgamesh', completed, 7.0, ['action', '_adventure', '_fantasy']).
+lettura('utente', 25096, 'gin_no_saji', dropped, 5.0, ['award_winning', '_comedy', '_drama', '_school', '_shounen']).
+lettura('utente', 44, 'gintama', plan_to_read, 0.0, ['action', '_comedy', '_gag_humor', '_historical', '_parody', '_samurai', '_sci-fi', '_shounen']).
+lettura('utente', 98720, 'goblin_slayer', dropped, 5.0, ['action', '_fantasy', '_seinen']).
+lettura('utente', 106247, 'goblin_wa_mou_juubun_ni_tsuyoi', completed, 4.0, ['comedy', '_fantasy', '_shounen']).
+lettura('utente', 147532, 'god_of_blackfield', on_hold, 6.0, ['action', '_reincarnation', '_school']).
+lettura('utente', 1092, 'gokusen', dropped, 3.0, ['action', '_comedy', '_delinquents', '_josei', '_organized_crime', '_romance', '_school', '_slice_of_life', '_workplace']).
+lettura('utente', 112922, 'gokushufudou', reading, 7.0, ['adult_cast', '_comedy', '_organized_crime']).
+lettura('utente', 85968, 'golden_kamuy', dropped, 6.0, ['action', '_adventure', '_award_winning', '_historical', '_seinen']).
+lettura('utente', 1470, 'gon', completed, 7.0, ['action', '_adventure', '_award_winning', '_drama', '_seinen']).
+lettura('utente', 147530, 'gosu', completed, 7.0, ['action', '_adventure', '_historical', '_martial_arts']).
+lettura('utente', 70345, 'grand_blue', plan_to_read, 4.0, ['comedy', '_seinen']).
+lettura('utente', 11425, 'grappler_baki', reading, 7.0, ['action', '_gore', '_martial_arts', '_shounen']).
+lettura('utente', 107909, 'grashros', completed, 4.0, ['action', '_seinen']).
+lettura('utente', 36099, 'green_blood', plan_to_read, 0.0, ['action', '_historical', '_psychological', '_seinen', '_suspense']).
+lettura('utente', 336, 'gto', dropped, 3.0, ['action', '_award_winning', '_comedy', '_delinquents', '_drama', '_ecchi', '_school', '_shounen', '_workplace']).
+lettura('utente', 128783, 'gyakusatsu_happy_end', plan_to_read, 0.0, ['horror', '_mystery', '_psychological', '_supernatural', '_suspense']).
+lettura('utente', 87637, 'hai_to_gensou_no_grimgar', completed, 5.0, ['action', '_adventure', '_drama', '_fantasy', '_isekai', '_shounen']).
+lettura('utente', 35243, 'haikyuu!!', completed, 7.0, ['award_winning', '_school', '_shounen', '_sports', '_team_sports']).
+lettura('utente', 7, 'hajime_no_ippo', plan_to_read, 0.0, ['award_winning', '_combat_sports', '_shounen', '_sports']).
+lettura('utente', 146944, 'hardcore_leveling_warrior', plan_to_read, 0.0, ['action', '_adventure', '_fantasy', '_video_game']).
+lettura('utente', 147572, 'heavenly_demon_reborn!', completed, 6.0, ['action', '_fantasy', '_martial_arts', '_reincarnation']).
+lettura('utente', 162325, 'heavenly_grand_archive\'s_young_master', on_hold, 5.0, ['action', '_fantasy', '_martial_arts']).
+lettura('utente', 151667, 'hectopascal', dropped, 4.0, ['action']).
+lettura('utente', 77637, 'helck', completed, 8.0, ['action', '_fantasy']).
+lettura('utente', 61583, 'hellper', completed, 8.0, ['action', '_fantasy', '_supernatural']).
+lettura('utente', 267, 'hellsing', plan_to_read, 0.0, ['action', '_adult_cast', '_gore', '_historical', '_horror', '_seinen', '_supernatural', '_vampire']).
+lettura('utente', 151242, 'helmut', dropped, 3.0, ['action', '_fantasy']).
+lettura('utente', 176511, 'henkyou_mob_kizoku_no_uchi_ni_totsuidekita_akuyaku_reijou_ga,_mechakucha_dekiru_ii_yome_nanda_ga?', dropped, 4.0, ['fantasy', '_isekai', '_reincarnation', '_romance']).
+lettura('utente', 147290, 'hero_killer', dropped, 6.0, ['action', '_super_power']).
+lettura('utente', 1325, 'hi_no_tori_(1967)', completed, 7.0, ['drama', '_fantasy', '_historical', '_psychological', '_romance', '_sci-fi', '_shounen', '_space', '_supernatural']).
+lettura('utente', 35719, 'hibi_chouchou', dropped, 4.0, ['romance', '_school', '_shoujo']).
+lettura('utente', 116766, 'hige_wo_soru._soshite_joshikousei_wo_hirou.', dropped, 2.0, ['drama', '_romance', '_shounen']).
+lettura('utente', 12200, 'high_school_musical', completed, 3.0, ['comedy', '_romance', '_school', '_shoujo']).
+lettura('utente', 36413, 'hinamatsuri', completed, 9.0, ['childcare', '_comedy', '_organized_crime', '_seinen', '_supernatural']).
+lettura('utente', 137303, 'hirayasumi', reading, 8.0, ['seinen', '_slice_of_life']).
+lettura('utente', 143305, 'hiroware_koneko_to_moto_yakuza', completed, 5.0, ['comedy', '_pets']).
+lettura('utente', 148050, 'his_majesty\'s_secret_heroine', completed, 4.0, ['action', '_adventure', '_crossdressing', '_fantasy', '_romance']).
+lettura('utente', 2924, 'historie', plan_to_read, 0.0, ['action', '_adventure', '_award_winning', '_historical', '_seinen']).
+lettura('utente', 147643, 'hoarding_in_hell', dropped, 5.0, ['action', '_fantasy', '_isekai']).
+lettura('utente', 1149, 'hokuto_no_ken', plan_to_read, 0.0, ['action', '_drama', '_martial_arts', '_sci-fi', '_shounen']).
+lettura('utente', 3285, 'holyland', reading, 7.0, ['action', '_delinquents', '_martial_arts', '_psychological', '_seinen']).
+lettura('utente', 936, 'homunculus', completed, 7.0, ['drama', '_horror', '_mystery', '_psychological', '_seinen', '_supernatural']).
+lettura('utente', 42451, 'horimiya', completed, 5.0, ['romance', '_school', '_shounen']).
+lettura('utente', 21467, 'hoshi_mamoru_inu', plan_to_read, 0.0, ['pets', '_seinen', '_slice_of_life']).
+lettura('utente', 366, 'hoshi_no_koe', completed, 5.0, ['drama', '_mecha', '_romance', '_sci-fi', '_seinen']).
+lettura('utente', 44489, 'houseki_no_kuni', plan_to_read, 0.0, ['action', '_anthropomorphic', '_drama', '_fantasy', '_seinen']).
+lettura('utente', 151440, 'how_to_live_as_a_villain', dropped, 3.0, ['action', '_fantasy', '_isekai', '_psychological', '_survival']).
+lettura('utente', 147318, 'how_to_use_a_returner', dropped, 3.0, ['action', '_adventure', '_fantasy', '_isekai']).
+lettura('utente', 26, 'hunter_x_hunter', reading, 8.0, ['action', '_adventure', '_fantasy', '_shounen']).
+lettura('utente', 14440, 'i_am_a_hero', plan_to_read, 0.0, ['award_winning', '_drama', '_gore', '_horror', '_psychological', '_seinen']).
+lettura('utente', 153199, 'i_only_want_to_beat_you', completed, 6.0, ['comedy', '_love_status_quo', '_romance', '_school']).
+lettura('utente', 147822, 'i_stan_the_prince', dropped, 4.0, ['comedy', '_fantasy', '_romance']).
+lettura('utente', 147392, 'i\'m_the_max-level_newbie', dropped, 4.0, ['action', '_fantasy']).
+lettura('utente', 33031, 'imawa_no_kuni_no_alice', plan_to_read, 0.0, ['action', '_gore', '_high_stakes_game', '_horror', '_psychological', '_shounen', '_supernatural', '_survival']).
+lettura('utente', 171441, 'immortal,_invincible', dropped, 4.0, ['action', '_fantasy', '_martial_arts', '_reincarnation']).
+lettura('utente', 114824, 'in_the_room', completed, 4.0, ['drama', '_horror', '_seinen', '_supernatural']).
+lettura('utente', 58563, 'innocent', plan_to_read, 0.0, ['drama', '_historical', '_seinen']).
+lettura('utente', 93699, 'innocent_rouge', plan_to_read, 0.0, ['award_winning', '_drama', '_historical', '_seinen']).
+lettura('utente', 64465, 'inuyashiki', completed, 7.0, ['drama', '_gore', '_sci-fi', '_seinen']).
+lettura('utente', 90190, 'isekai_izakaya_\"nobu\"', on_hold, 6.0, ['adult_cast', '_fantasy', '_gourmet', '_isekai', '_iyashikei', '_seinen', '_workplace']).
+lettura('utente', 110621, 'isekai_omotenashi_gohan', completed, 4.0, ['fantasy', '_gourmet', '_isekai', '_slice_of_life']).
+lettura('utente', 102671, 'isekai_shokudou', completed, 6.0, ['comedy', '_fantasy', '_gourmet', '_iyashikei', '_mystery', '_seinen', '_workplace']).
+lettura('utente', 44743, 'itou_junji_kyoufu_manga_collection:_nikuiro_no_kai', completed, 6.0, ['drama', '_horror', '_psychological', '_seinen', '_supernatural', '_suspense']).
+lettura('utente', 104314, 'jagaaaaaan', dropped, 5.0, ['drama', '_gore', '_horror', '_mystery', '_seinen', '_supernatural']).
+lettura('utente', 21665, 'jigoku_no_alice', plan_to_read, 0.0, ['action', '_sci-fi', '_seinen']).
+lettura('utente', 112318, 'jigokuraku', dropped, 5.0, ['action', '_fantasy', '_historical', '_shounen']).
+lettura('utente', 106025, 'jinmen', plan_to_read, 0.0, ['gore', '_horror']).
+lettura('utente', 131703, 'jinrui_wo_metsubou_sasete_wa_ikemasen', completed, 6.0, ['childcare', '_sci-fi', '_seinen', '_slice_of_life']).
+lettura('utente', 3006, 'jojo_no_kimyou_na_bouken_part_4:_diamond_wa_kudakenai', plan_to_read, 0.0, ['action', '_shounen', '_supernatural']).
+lettura('utente', 3008, 'jojo_no_kimyou_na_bouken_part_5:_ougon_no_kaze', plan_to_read, 0.0, ['action', '_adventure', '_organized_crime', '_shounen']).
+lettura('utente', 1706, 'jojo_no_kimyou_na_bouken_part_7:_steel_ball_run', completed, 9.0, ['action', '_adventure', '_historical', '_mystery', '_seinen', '_shounen', '_supernatural']).
+lettura('utente', 25515, 'jojo_no_kimyou_na_bouken_part_8:_jojolion', completed, 8.0, ['action', '_adventure', '_award_winning', '_mystery', '_seinen', '_supernatural']).
+lettura('utente', 139629, 'jojo_no_kimyou_na_bouken_part_9:_the_jojolands', plan_to_read, 0.0, ['action', '_adventure', '_seinen', '_supernatural']).
+lettura('utente', 149983, 'judge_and_executioner', completed, 6.0, ['action', '_drama', '_psychological']).
+lettura('utente', 113138, 'jujutsu_kaisen', on_hold, 7.0, ['action', '_school', '_shounen', '_supernatural']).
+lettura('utente', 100448, 'jumyou_wo_kaitotte_moratta._ichinen_ni_tsuki,_ichimanen_de.', completed, 6.0, ['drama', '_shounen']).
+lettura('utente', 147053, 'jungle_juice', dropped, 5.0, ['action', '_fantasy']).
+lettura('utente', 125076, 'juujika_no_rokunin', on_hold, 1.0, ['gore', '_mystery', '_psychological', '_shounen', '_suspense']).
+lettura('utente', 171811, 'juvenile_detention_center', reading, 5.0, ['action', '_drama']).
+lettura('utente', 122353, 'kaette_kudasai!_akutsu-san', on_hold, 5.0, ['comedy', '_love_status_quo', '_romance']).
+lettura('utente', 119022, 'kage_no_jitsuryokusha_ni_naritakute!', dropped, 4.0, ['action', '_comedy', '_fantasy', '_isekai', '_reincarnation']).
+lettura('utente', 90125, 'kaguya-sama_wa_kokurasetai:_tensai-tachi_no_renai_zunousen', completed, 7.0, ['award_winning', '_comedy', '_romance', '_school', '_seinen']).
+lettura('utente', 127907, 'kaijuu_8-gou', dropped, 6.0, ['action', '_adult_cast', '_fantasy', '_sci-fi', '_shounen', '_urban_fantasy']).
+lettura('utente', 108948, 'kaitai_zanuff', completed, 4.0, ['horror', '_psychological', '_seinen']).
+lettura('utente', 128784, 'kami_ni_aisareta_ko', dropped, 2.0, ['fantasy', '_slice_of_life']).
+lettura('utente', 24808, 'kami_no_kodomo', completed, 3.0, ['horror', '_psychological']).
+lettura('utente', 111228, 'kami-tachi_ni_hirowareta_otoko', plan_to_read, 0.0, ['adventure', '_fantasy', '_isekai', '_iyashikei', '_reincarnation']).
+lettura('utente', 50217, 'kamisama_ga_uso_wo_tsuku.', completed, 7.0, ['drama', '_romance', '_school', '_seinen']).
+lettura('utente', 90800, 'kanojo_wa_rokurokubi', completed, 5.0, ['comedy', '_school', '_shounen', '_supernatural']).
+lettura('utente', 144267, 'kaoru_hana_wa_rin_to_saku', reading, 8.0, ['drama', '_romance', '_school']).
+lettura('utente', 55377, 'kasane', plan_to_read, 0.0, ['drama', '_performing_arts', '_psychological', '_seinen', '_supernatural']).
+lettura('utente', 119687, 'katabami_to_ougon', plan_to_read, 0.0, ['drama', '_historical', '_seinen']).
+lettura('utente', 18161, 'katanagatari', plan_to_read, 0.0, ['action', '_adventure', '_comedy', '_romance', '_samurai']).
+lettura('utente', 47, 'katekyou_hitman_reborn!', plan_to_read, 0.0, ['action', '_comedy', '_organized_crime', '_school', '_shounen', '_super_power']).
+lettura('utente', 118196, 'kawaii_dake_ja_nai_shikimori-san', dropped, 3.0, ['comedy', '_romance']).
+lettura('utente', 651, 'kaze_no_tani_no_nausicaä', plan_to_read, 0.0, ['action', '_adventure', '_award_winning', '_fantasy']).
+lettura('utente', 72025, 'kengan_ashura', completed, 6.0, ['action', '_martial_arts']).
+lettura('utente', 146979, 'kill_the_hero', dropped, 1.0, ['action', '_adventure', '_fantasy', '_time_travel']).
+lettura('utente', 96792, 'kimetsu_no_yaiba', completed, 6.0, ['action', '_fantasy', '_historical', '_shounen']).
+lettura('utente', 99314, 'kimi_no_na_wa.', completed, 6.0, ['drama', '_seinen']).
+lettura('utente', 104538, 'kimi_no_suizou_wo_tabetai', completed, 8.0, ['drama', '_romance']).
+lettura('utente', 121213, 'kimi_wa_houkago_insomnia', completed, 8.0, ['romance', '_school', '_seinen']).
+lettura('utente', 16765, 'kingdom', reading, 9.0, ['action', '_award_winning', '_historical', '_military', '_seinen']).
+lettura('utente', 131342, 'kizoku_tensei:_megumareta_umare_kara_saikyou_no_chikara_wo_eru', dropped, 3.0, ['action', '_adventure', '_fantasy', '_reincarnation']).
+lettura('utente', 80119, 'kobayashi-san_chi_no_maid_dragon', dropped, 1.0, ['fantasy', '_slice_of_life']).
+lettura('utente', 56805, 'koe_no_katachi', completed, 8.0, ['award_winning', '_drama', '_shounen']).
+lettura('utente', 7375, 'kokou_no_hito', completed, 10.0, ['award_winning', '_drama', '_psychological', '_seinen', '_sports']).
+lettura('utente', 99007, 'komi-san_wa,_comyushou_desu.', dropped, 4.0, ['award_winning', '_comedy', '_school', '_shounen']).
+lettura('utente', 116772, 'kono_yuusha_ga_ore_tueee_kuse_ni_shinchou_sugiru', dropped, 4.0, ['action', '_adventure', '_comedy', '_fantasy', '_isekai', '_shounen']).
+lettura('utente', 153492, 'koroshiya_no_oshi', dropped, 5.0, ['action', '_comedy', '_seinen']).
+lettura('utente', 138703, 'kotoshi_no_mitsuishi-san_wa_dokoka_okashii', dropped, 3.0, ['comedy', '_romance', '_school']).
+lettura('utente', 42579, 'kubera', dropped, 3.0, ['action', '_adventure', '_comedy', '_fantasy', '_romance']).
+lettura('utente', 128093, 'kuchi_ga_saketemo_kimi_ni_wa', completed, 5.0, ['fantasy', '_romance', '_shounen']).
+lettura('utente', 144453, 'kuchibeta_shokudou', on_hold, 5.0, ['comedy', '_slice_of_life']).
+lettura('utente', 121615, 'kumichou_musume_to_sewagakari', reading, 5.0, ['childcare', '_organized_crime', '_slice_of_life']).
+lettura('utente', 95012, 'kumo_desu_ga,_nani_ka?', completed, 6.0, ['action', '_adventure', '_comedy', '_fantasy', '_isekai', '_reincarnation']).
+lettura('utente', 136979, 'kuroiwa_medaka_ni_watashi_no_kawaii_ga_tsuujinai', dropped, 3.0, ['comedy', '_love_status_quo', '_romance', '_school', '_shounen']).
+lettura('utente', 3866, 'kuroshitsuji', plan_to_read, 0.0, ['action', '_fantasy', '_historical', '_mystery', '_mythology', '_shounen', '_supernatural']).
+lettura('utente', 96050, 'kuzumi-kun,_kuuki_yometemasu_ka?', completed, 4.0, ['comedy', '_romance', '_school', '_shounen']).
+lettura('utente', 117549, 'kyuujitsu_no_warumono-san', on_hold, 5.0, ['fantasy', '_iyashikei', '_slice_of_life', '_urban_fantasy']).
+lettura('utente', 156825, 'last_on_earth', dropped, 3.0, ['action', '_adventure', '_fantasy']).
+lettura('utente', 146982, 'latna_saga:_survival_of_a_sword_king', on_hold, 7.0, ['action', '_adventure', '_fantasy', '_isekai']).
+lettura('utente', 150784, 'legend_of_an_asura:_the_poison_dragon', on_hold, 6.0, ['action', '_fantasy', '_martial_arts']).
+lettura('utente', 171243, 'level_0_no_munou_tansakusha_to_sagesumaretemo_jitsu_wa_sekai_saikyou_desu:_tansaku_ranking_1-i_wa_nazo_no_hito', dropped, 2.0, ['action', '_adventure', '_fantasy', '_harem']).
+lettura('utente', 148009, 'level_up_with_the_gods', dropped, 5.0, ['action', '_adventure', '_fantasy', '_time_travel']).
+lettura('utente', 147460, 'leveling_beyond_the_max', dropped, 3.0, ['action', '_fantasy', '_isekai', '_martial_arts']).
+lettura('utente', 148137, 'leviathan', dropped, 6.0, ['action', '_fantasy', '_survival']).
+lettura('utente', 147981, 'little_rabbit_and_the_big_bad_leopard', completed, 5.0, ['anthropomorphic', '_fantasy', '_romance']).
+lettura('utente', 147389, 'log-in_murim', plan_to_read, 0.0, ['action', '_adventure', '_fantasy', '_martial_arts']).
+lettura('utente', 138673, 'look_back', plan_to_read, 0.0, ['drama', '_shounen']).
+lettura('utente', 111202, 'lookism', reading, 7.0, ['action', '_comedy', '_drama', '_school', '_supernatural']).
+lettura('utente', 132500, 'loop_7-kaime_no_akuyaku_reijou_wa,_moto_tekikoku_de_jiyuu_kimama_na_hanayome_seikatsu_wo_mankitsu_suru', dropped, 6.0, ['fantasy', '_romance', '_time_travel']).
+lettura('utente', 147317, 'lout_of_count\'s_family', dropped, 4.0, ['fantasy', '_isekai', '_reincarnation']).
+lettura('utente', 119152, 'lv2_kara_cheat_datta_motoyuusha_kouho_no_mattari_isekai_life', dropped, 5.0, ['adventure', '_fantasy', '_isekai', '_romance']).
+lettura('utente', 91941, 'made_in_abyss', plan_to_read, 0.0, ['adventure', '_drama', '_fantasy', '_sci-fi']).
+lettura('utente', 14790, 'magi', plan_to_read, 0.0, ['adventure', '_award_winning', '_fantasy', '_shounen']).
+lettura('utente', 61189, 'mahoutsukai_no_yome', on_hold, 7.0, ['drama', '_fantasy', '_mythology', '_romance', '_shounen', '_urban_fantasy']).
+lettura('utente', 160056, 'mahoutsukai_to_aka_no_pilgrim', completed, 7.0, ['adventure', '_fantasy']).
+lettura('utente', 104241, 'mairimashita!_iruma-kun', dropped, 4.0, ['comedy', '_fantasy', '_shounen']).
+lettura('utente', 1415, 'manhole', plan_to_read, 0.0, ['detective', '_horror', '_mystery', '_seinen']).
+lettura('utente', 13387, 'march_story', plan_to_read, 0.0, ['action', '_drama', '_fantasy', '_horror', '_seinen', '_supernatural']).
+lettura('utente', 124085, 'mashle', completed, 6.0, ['action', '_comedy', '_fantasy', '_gag_humor', '_parody', '_school', '_shounen']).
+lettura('utente', 3579, 'mashounen_b.t.', completed, 4.0, ['action', '_comedy', '_fantasy', '_mystery', '_psychological', '_shounen', '_supernatural']).
+lettura('utente', 848, 'master_keaton', plan_to_read, 0.0, ['adult_cast', '_adventure', '_drama', '_historical', '_military', '_mystery', '_seinen', '_slice_of_life']).
+lettura('utente', 147820, 'master_villainess_the_invincible!', dropped, 5.0, ['action', '_fantasy', '_isekai', '_martial_arts', '_villainess']).
+lettura('utente', 147455, 'masters_of_lightning_knives', on_hold, 5.0, ['action', '_martial_arts']).
+lettura('utente', 110160, 'mata,_onaji_yume_wo_miteita', completed, 6.0, ['drama']).
+lettura('utente', 147712, 'maybe_meant_to_be', reading, 6.0, ['adult_cast', '_comedy', '_romance']).
+lettura('utente', 5711, 'megumi_no_daigo', plan_to_read, 0.0, ['action', '_award_winning', '_drama', '_shounen']).
+lettura('utente', 105877, 'mobuko_no_koi', reading, 6.0, ['adult_cast', '_drama', '_romance', '_seinen']).
+lettura('utente', 104440, 'monkey_peak', plan_to_read, 0.0, ['horror', '_seinen']).
+lettura('utente', 1, 'monster', completed, 8.0, ['adult_cast', '_award_winning', '_drama', '_mystery', '_psychological', '_seinen']).
+lettura('utente', 129808, 'mookhyang:_dark_lady', reading, 7.0, ['action', '_adventure', '_fantasy', '_magical_sex_shift']).
+lettura('utente', 149141, 'mookhyang:_the_origin', completed, 6.0, ['action', '_adventure', '_fantasy']).
+lettura('utente', 124471, 'moon_you', completed, 6.0, ['comedy', '_drama', '_sci-fi', '_space']).
+lettura('utente', 147941, 'mori-chan_ken-chan', completed, 8.0, ['drama', '_memoir', '_seinen']).
+lettura('utente', 658, 'mugen_no_juunin', plan_to_read, 5.0, ['action', '_adventure', '_drama', '_historical', '_martial_arts', '_samurai', '_seinen', '_supernatural']).
+lettura('utente', 147642, 'murim_rpg_simulation', dropped, 5.0, ['action', '_adventure', '_fantasy', '_martial_arts', '_time_travel', '_video_game']).
+lettura('utente', 418, 'mushishi', plan_to_read, 0.0, ['adult_cast', '_award_winning', '_fantasy', '_historical', '_iyashikei', '_mystery', '_seinen', '_supernatural']).
+lettura('utente', 70259, 'mushoku_tensei:_isekai_ittara_honki_dasu', dropped, 2.0, ['fantasy', '_isekai', '_reincarnation', '_seinen']).
+lettura('utente', 149438, 'my_blasted_reincarnated_life', dropped, 4.0, ['action', '_fantasy', '_reincarnation']).
+lettura('utente', 148733, 'my_boss\'s_special_request', on_hold, 5.0, ['adult_cast', '_romance', '_workplace']).
+lettura('utente', 148620, 'my_dad_is_too_strong', dropped, 3.0, ['action', '_comedy', '_fantasy']).
+lettura('utente', 150203, 'my_daughter_is_the_final_boss', dropped, 3.0, ['action', '_childcare', '_fantasy', '_time_travel']).
+lettura('utente', 151111, 'my_f-rank_high_school_life', dropped, 2.0, ['action', '_school', '_super_power']).
+lettura('utente', 143627, 'my_gently_raised_beast', completed, 6.0, ['fantasy', '_romance']).
+lettura('utente', 108032, 'my_home_hero', plan_to_read, 0.0, ['drama', '_seinen', '_suspense']).
+lettura('utente', 147073, 'my_life_as_a_loser', dropped, 4.0, ['action', '_drama', '_school', '_time_travel']).
+lettura('utente', 148958, 'my_master_is_a_backseat_gamer', dropped, 2.0, ['action', '_fantasy']).
+lettura('utente', 151757, 'my_royal_awakening', completed, 6.0, ['drama', '_historical', '_reincarnation', '_time_travel']).
+lettura('utente', 147202, 'my_s-class_hunters', dropped, 3.0, ['action', '_adventure', '_fantasy', '_time_travel']).
+lettura('utente', 150561, 'mythic_item_obtained', on_hold, 6.0, ['action', '_fantasy']).
+lettura('utente', 138533, 'nan_hao_shang_feng', reading, 7.0, ['comedy', '_school']).
+lettura('utente', 28, 'nana', plan_to_read, 0.0, ['adult_cast', '_award_winning', '_drama', '_love_polygon', '_music', '_romance', '_shoujo']).
+lettura('utente', 44485, 'nanatsu_no_taizai', dropped, 1.0, ['action', '_adventure', '_award_winning', '_fantasy', '_shounen']).
+lettura('utente', 147863, 'nano_machine', dropped, 5.0, ['action', '_adventure', '_fantasy', '_martial_arts', '_sci-fi']).
+lettura('utente', 112245, 'navillera:_like_a_butterfly', plan_to_read, 0.0, ['drama', '_performing_arts']).
+lettura('utente', 102458, 'neko_no_otera_no_chion-san', plan_to_read, 0.0, ['seinen', '_slice_of_life']).
+lettura('utente', 141226, 'neko_no_te_datte_yaku_ni_tatsu', dropped, 3.0, ['comedy', '_romance', '_supernatural']).
+lettura('utente', 18753, 'nekojiru_udon', completed, 4.0, ['anthropomorphic', '_comedy', '_seinen']).
+lettura('utente', 159130, 'nick_to_lever', completed, 6.0, ['comedy', '_gag_humor', '_seinen']).
+lettura('utente', 119084, 'nihon_e_youkoso_elf-san.', dropped, 5.0, ['comedy', '_fantasy', '_isekai']).
+lettura('utente', 39291, 'nijiiro_days', plan_to_read, 0.0, ['comedy', '_romance', '_school', '_shoujo']).
+lettura('utente', 13290, 'ningen_shikkaku', plan_to_read, 0.0, ['drama', '_historical', '_psychological', '_seinen']).
+lettura('utente', 123065, 'ninkyou_tensei:_isekai_no_yakuza_hime', reading, 7.0, ['action', '_adventure', '_fantasy', '_isekai', '_reincarnation', '_seinen']).
+lettura('utente', 122775, 'nito_no_taida_na_isekai_shoukougun:_saijakushoku_\"healer\"_nanoni_saikyou_wa_cheat_desu_ka?', dropped, 4.0, ['action', '_adventure', '_fantasy', '_isekai', '_reincarnation']).
+lettura('utente', 90423, 'no_guns_life', plan_to_read, 0.0, ['action', '_sci-fi', '_seinen']).
+lettura('utente', 147769, 'no_home', completed, 5.0, ['school', '_slice_of_life']).
+lettura('utente', 29983, 'noblesse', completed, 6.0, ['action', '_adventure', '_comedy', '_school', '_supernatural']).
+lettura('utente', 12569, 'not_simple', plan_to_read, 0.0, ['drama', '_seinen', '_slice_of_life']).
+lettura('utente', 163356, 'ogami_tsumiki_to_ki_nichijou.', dropped, 4.0, ['anthropomorphic', '_fantasy', '_love_status_quo', '_romance', '_school', '_shounen', '_urban_fantasy']).
+lettura('utente', 112774, 'ojisama_to_neko', dropped, 5.0, ['pets', '_slice_of_life']).
+lettura('utente', 114121, 'ojisan_wa_kawaii_mono_ga_osuki.', on_hold, 5.0, ['comedy']).
+lettura('utente', 140520, 'okiraku_ryoushu_no_tanoshii_ryouchi_bouei', dropped, 3.0, ['fantasy']).
+lettura('utente', 132214, 'omniscient_reader\'s_viewpoint', on_hold, 6.0, ['action', '_adventure', '_fantasy', '_urban_fantasy']).
+lettura('utente', 143441, 'omniscient_reader\'s_viewpoint', completed, 7.0, ['action', '_adventure', '_fantasy', '_urban_fantasy']).
+lettura('utente', 17465, 'omoide_emanon', completed, 8.0, ['drama', '_seinen']).
+lettura('utente', 164732, 'omori', dropped, 3.0, ['horror', '_psychological', '_seinen']).
+lettura('utente', 8967, 'onanie_master_kurosawa', completed, 4.0, ['drama', '_psychological', '_school']).
+lettura('utente', 156716, 'one_day,_suddenly,_seoul_is', on_hold, 7.0, ['survival', '_suspense']).
+lettura('utente', 13, 'one_piece', reading, 7.0, ['action', '_adventure', '_fantasy', '_shounen']).
+lettura('utente', 145980, 'one_piece:_nami_vs._kalifa', completed, 2.0, ['action', '_adventure', '_fantasy']).
+lettura('utente', 44347, 'one_punch-man', reading, 8.0, ['action', '_comedy', '_parody', '_seinen', '_super_power']).
+lettura('utente', 112592, 'oniichan_wa_oshimai!', dropped, 2.0, ['cgdct', '_comedy', '_magical_sex_shift']).
+lettura('utente', 3299, 'ookami_to_koushinryou', completed, 7.0, ['adult_cast', '_adventure', '_drama', '_fantasy', '_historical', '_romance', '_seinen', '_supernatural']).
+lettura('utente', 121083, 'ookami_wa_nemuranai', plan_to_read, 0.0, ['action', '_adventure', '_fantasy', '_isekai']).
+lettura('utente', 35573, 'orange', plan_to_read, 0.0, ['drama', '_love_polygon', '_romance', '_school', '_sci-fi', '_shoujo', '_time_travel']).
+lettura('utente', 1211, 'ore_to_akuma_no_blues', on_hold, 8.0, ['drama', '_historical', '_horror', '_psychological', '_seinen']).
+lettura('utente', 11514, 'otoyomegatari', plan_to_read, 0.0, ['award_winning', '_historical', '_romance', '_seinen']).
+lettura('utente', 123397, 'ou_no_kemono:_enpei_no_arcana', plan_to_read, 0.0, ['crossdressing', '_drama', '_fantasy', '_romance', '_shoujo']).
+lettura('utente', 147727, 'overgeared', dropped, 4.0, ['action', '_fantasy', '_video_game']).
+lettura('utente', 81667, 'overlord', plan_to_read, 0.0, ['action', '_fantasy', '_isekai']).
+lettura('utente', 4632, 'oyasumi_punpun', completed, 9.0, ['drama', '_psychological', '_seinen', '_slice_of_life']).
+lettura('utente', 3031, 'pandora_hearts', plan_to_read, 0.0, ['adventure', '_fantasy', '_mystery', '_shounen']).
+lettura('utente', 154587, 'pick_me_up', plan_to_read, 0.0, ['action', '_fantasy', '_isekai', '_video_game']).
+lettura('utente', 146750, 'pigpen', completed, 7.0, ['horror', '_psychological', '_survival', '_suspense']).
+lettura('utente', 5744, 'ping_pong', plan_to_read, 0.0, ['drama', '_seinen', '_sports']).
+lettura('utente', 481, 'planetes', plan_to_read, 0.0, ['adult_cast', '_award_winning', '_drama', '_psychological', '_sci-fi', '_seinen', '_slice_of_life', '_space', '_workplace']).
+lettura('utente', 149871, 'player', on_hold, 6.0, ['action', '_adventure', '_fantasy', '_isekai']).
+lettura('utente', 745, 'pluto', plan_to_read, 0.0, ['action', '_award_winning', '_detective', '_mystery', '_psychological', '_sci-fi', '_seinen', '_suspense']).
+lettura('utente', 119260, 'ponkotsu_fuuki_iin_to_skirt-take_ga_futekisetsu_na_jk_no_hanashi', dropped, 4.0, ['comedy', '_romance', '_school', '_shounen']).
+lettura('utente', 3438, 'psyren', plan_to_read, 0.0, ['action', '_adventure', '_high_stakes_game', '_psychological', '_romance', '_sci-fi', '_shounen', '_strategy_game', '_super_power', '_supernatural']).
+lettura('utente', 106733, 'ragna_crimson', plan_to_read, 0.0, ['action', '_fantasy', '_shounen']).
+lettura('utente', 7482, 'rainbow:_nisha_rokubou_no_shichinin', plan_to_read, 0.0, ['award_winning', '_delinquents', '_drama', '_historical', '_psychological', '_seinen']).
+lettura('utente', 109229, 'raise_wa_tanin_ga_ii', reading, 8.0, ['organized_crime', '_romance', '_seinen']).
+lettura('utente', 22986, 'ran_to_haiiro_no_sekai', plan_to_read, 0.0, ['drama', '_fantasy', '_romance', '_seinen', '_supernatural']).
+lettura('utente', 146774, 'random_chat', completed, 3.0, ['action', '_drama', '_school']).
+lettura('utente', 73271, 're:monster', dropped, 3.0, ['action', '_adventure', '_fantasy', '_isekai', '_reincarnation']).
+lettura('utente', 657, 'real', plan_to_read, 0.0, ['award_winning', '_drama', '_psychological', '_seinen', '_sports', '_team_sports']).
+lettura('utente', 151157, 'reality_quest', dropped, 5.0, ['action', '_school', '_supernatural']).
+lettura('utente', 147924, 'reborn_as_a_scholar', completed, 6.0, ['action', '_martial_arts', '_reincarnation']).
+lettura('utente', 181605, 'red_shirt', dropped, 2.0, ['action', '_drama']).
+lettura('utente', 148512, 'reincarnated_as_an_unruly_heir', dropped, 5.0, ['action', '_martial_arts', '_reincarnation']).
+lettura('utente', 168981, 'reincarnated_murim_lord', reading, 6.0, ['action', '_fantasy', '_martial_arts', '_reincarnation']).
+lettura('utente', 161442, 'reincarnation_of_the_veteran_soldier', on_hold, 6.0, ['action', '_adult_cast', '_fantasy', '_isekai']).
+lettura('utente', 78523, 'relife', dropped, 4.0, ['comedy', '_drama', '_romance', '_school', '_slice_of_life']).
+lettura('utente', 158010, 'return_of_the_bloodthirsty_police', dropped, 5.0, ['action', '_organized_crime', '_reincarnation']).
+lettura('utente', 146878, 'return_of_the_blossoming_blade', reading, 7.0, ['action', '_adventure', '_fantasy', '_martial_arts', '_reincarnation']).
+lettura('utente', 147577, 'return_of_the_mad_demon', reading, 6.0, ['action', '_martial_arts', '_time_travel']).
+lettura('utente', 149349, 'return_of_the_scholar', dropped, 3.0, ['action', '_fantasy', '_martial_arts']).
+lettura('utente', 153399, 'return_of_the_war_god', reading, 6.0, ['action', '_fantasy', '_martial_arts']).
+lettura('utente', 152612, 'returning_with_absolutely_nothing', on_hold, 6.0, ['action', '_fantasy', '_isekai', '_time_travel']).
+lettura('utente', 157888, 'revenge_of_the_baskerville_bloodhound', dropped, 2.0, ['action', '_fantasy', '_time_travel']).
+lettura('utente', 148002, 'reverse_villain', completed, 2.0, ['action', '_reincarnation', '_supernatural']).
+lettura('utente', 78477, 'rikudou', plan_to_read, 0.0, ['combat_sports', '_drama', '_seinen', '_sports']).
+lettura('utente', 148729, 'rooftop_swordmaster', dropped, 2.0, ['action', '_supernatural']).
+lettura('utente', 148511, 'rookie_chef_with_the_magic_touch', dropped, 3.0, ['drama', '_gourmet']).
+lettura('utente', 915, 'rookies', plan_to_read, 0.0, ['comedy', '_delinquents', '_drama', '_school', '_shounen', '_slice_of_life', '_sports', '_team_sports']).
+lettura('utente', 104298, 'route_end', plan_to_read, 0.0, ['detective', '_mystery', '_shounen', '_suspense']).
+lettura('utente', 148054, 'ruri_dragon', completed, 5.0, ['school', '_shounen', '_slice_of_life', '_supernatural']).
+lettura('utente', 109339, 'saihate_no_paladin', plan_to_read, 0.0, ['action', '_adventure', '_fantasy', '_isekai', '_reincarnation']).
+lettura('utente', 37755, 'saiki_kusuo_no_ψ-nan', dropped, 4.0, ['comedy', '_gag_humor', '_school', '_shounen', '_super_power', '_supernatural']).
+lettura('utente', 3575, 'saikyou_densetsu_kurosawa', plan_to_read, 0.0, ['action', '_comedy', '_delinquents', '_drama', '_psychological', '_seinen', '_suspense']).
+lettura('utente', 116701, 'saikyou_juzoku_tensei:_majutsu_otaku_no_risoukyou', dropped, 3.0, ['adventure', '_fantasy', '_isekai', '_reincarnation']).
+lettura('utente', 159741, 'saitei_chara_ni_tensei_shita_ore_wa_ikinokoritai', dropped, 3.0, ['adventure', '_fantasy', '_isekai', '_reincarnation', '_video_game']).
+lettura('utente', 131334, 'sakamoto_days', on_hold, 7.0, ['action', '_comedy', '_shounen']).
+lettura('utente', 48649, 'sakamoto_desu_ga?', completed, 6.0, ['comedy', '_gag_humor', '_school', '_seinen']).
+lettura('utente', 145863, 'sayonara_eri', completed, 8.0, ['drama', '_shounen']).
+lettura('utente', 661, 'sayonara_zetsubou_sensei', completed, 4.0, ['award_winning', '_comedy', '_gag_humor', '_parody', '_school', '_shounen']).
+lettura('utente', 145539, 'seasons_of_blossom', completed, 8.0, ['love_polygon', '_romance']).
+lettura('utente', 147091, 'seihantai_na_kimi_to_boku', reading, 7.0, ['comedy', '_romance', '_school', '_shounen']).
+lettura('utente', 1827, 'shaman_warrior', plan_to_read, 0.0, ['action', '_adventure', '_drama', '_fantasy', '_martial_arts']).
+lettura('utente', 148655, 'shark', reading, 6.0, ['action', '_drama']).
+lettura('utente', 157543, 'shibatarian', completed, 3.0, ['psychological', '_shounen', '_suspense']).
+lettura('utente', 37707, 'shigatsu_wa_kimi_no_uso', completed, 9.0, ['award_winning', '_drama', '_music', '_romance', '_school', '_shounen']).
+lettura('utente', 3868, 'shigurui', plan_to_read, 0.0, ['action', '_drama', '_gore', '_historical', '_martial_arts', '_samurai', '_seinen']).
+lettura('utente', 117851, 'shimeji_simulation', completed, 7.0, ['school', '_slice_of_life']).
+lettura('utente', 23390, 'shingeki_no_kyojin', completed, 7.0, ['action', '_award_winning', '_drama', '_gore', '_military', '_shounen', '_survival', '_suspense']).
+lettura('utente', 57795, 'shingeki_no_kyojin:_before_the_fall', plan_to_read, 0.0, ['action', '_drama', '_fantasy', '_shounen', '_supernatural']).
+lettura('utente', 58007, 'shingeki_no_kyojin:_kuinaki_sentaku', completed, 6.0, ['action', '_shoujo']).
+lettura('utente', 146751, 'shotgun_boy', completed, 6.0, ['action', '_horror', '_psychological', '_survival', '_suspense']).
+lettura('utente', 72467, 'shoujo_shuumatsu_ryokou', completed, 9.0, ['adventure', '_award_winning', '_iyashikei', '_slice_of_life']).
+lettura('utente', 126699, 'shounen_no_abyss', plan_to_read, 0.0, ['drama', '_psychological', '_seinen']).
+lettura('utente', 110485, 'shuumatsu_no_walküre', on_hold, 7.0, ['action', '_fantasy', '_mythology', '_seinen']).
+lettura('utente', 118289, 'skip_to_loafer', dropped, 7.0, ['award_winning', '_drama', '_school', '_seinen']).
+lettura('utente', 51, 'slam_dunk', completed, 8.0, ['award_winning', '_school', '_shounen', '_sports', '_team_sports']).
+lettura('utente', 154009, 'slave_b', dropped, 3.0, ['action', '_adventure', '_drama', '_fantasy']).
+lettura('utente', 110288, 'slime_taoshite_300-nen,_shiranai_uchi_ni_level_max_ni_nattemashita', dropped, 3.0, ['comedy', '_fantasy', '_isekai', '_reincarnation']).
+lettura('utente', 3731, 'solanin', plan_to_read, 0.0, ['drama', '_seinen', '_slice_of_life']).
+lettura('utente', 119184, 'solo_leveling', completed, 6.0, ['action', '_adult_cast', '_adventure', '_fantasy', '_urban_fantasy']).
+lettura('utente', 121496, 'solo_leveling', completed, 6.0, ['action', '_adult_cast', '_adventure', '_fantasy', '_urban_fantasy']).
+lettura('utente', 172429, 'solo_leveling:_ragnarok', reading, 7.0, ['action', '_adult_cast', '_adventure', '_fantasy', '_urban_fantasy']).
+lettura('utente', 96573, 'something_about_us', completed, 7.0, ['romance', '_school']).
+lettura('utente', 112268, 'sono_bisque_doll_wa_koi_wo_suru', on_hold, 6.0, ['otaku_culture', '_romance', '_school', '_seinen']).
+lettura('utente', 126287, 'sousou_no_frieren', on_hold, 8.0, ['adventure', '_award_winning', '_drama', '_fantasy', '_shounen']).
+lettura('utente', 119161, 'spy_x_family', reading, 7.0, ['action', '_childcare', '_comedy', '_shounen']).
+lettura('utente', 93516, 'sq:_begin_w/your_name!', completed, 7.0, ['comedy', '_girls_love', '_school', '_slice_of_life']).
+lettura('utente', 146909, 'sss-class_revival_hunter', on_hold, 6.0, ['action', '_adventure', '_fantasy', '_time_travel']).
+lettura('utente', 146752, 'study_group', reading, 6.0, ['action', '_delinquents', '_school']).
+lettura('utente', 116539, 'subete_no_jinrui_wo_hakai_suru._sorera_wa_saisei_dekinai.', plan_to_read, 0.0, ['school', '_shounen', '_strategy_game']).
+lettura('utente', 110031, 'summertime_render', dropped, 3.0, ['mystery', '_shounen', '_supernatural', '_suspense', '_time_travel']).
+lettura('utente', 8848, 'sun-ken_rock', dropped, 3.0, ['action', '_comedy', '_drama', '_ecchi', '_seinen']).
+lettura('utente', 148467, 'super_no_ura_de_yani_suu_futari', reading, 7.0, ['adult_cast', '_love_status_quo', '_romance']).
+lettura('utente', 8438, 'super-conductive_brains', completed, 5.0, ['avant_garde', '_seinen']).
+lettura('utente', 1533, 'superior', completed, 4.0, ['action', '_adventure', '_drama', '_fantasy', '_romance', '_shounen']).
+lettura('utente', 147276, 'surviving_romance', completed, 5.0, ['horror', '_school', '_survival', '_suspense']).
+lettura('utente', 124845, 'sweet_home', completed, 9.0, ['action', '_drama', '_gore', '_horror', '_suspense']).
+lettura('utente', 142600, 'takopii_no_genzai', completed, 7.0, ['drama', '_psychological', '_sci-fi', '_shounen']).
+lettura('utente', 151012, 'tale_of_a_scribe_who_retires_to_the_countryside', dropped, 4.0, ['action', '_adventure', '_fantasy', '_martial_arts']).
+lettura('utente', 146966, 'teenage_mercenary', reading, 6.0, ['action', '_school']).
+lettura('utente', 153158, 'telework_yotabanashi', completed, 5.0, ['adult_cast', '_romance', '_seinen']).
+lettura('utente', 72451, 'ten_prism', dropped, 3.0, ['action', '_adventure', '_drama', '_fantasy', '_seinen']).
+lettura('utente', 111745, 'tengoku_daimakyou', dropped, 5.0, ['adventure', '_mystery', '_sci-fi', '_seinen']).
+lettura('utente', 168656, 'tensei_akuma_no_saikyou_yuusha_ikusei_keikaku', dropped, 4.0, ['adventure', '_childcare', '_fantasy', '_isekai']).
+lettura('utente', 113178, 'tensei_shitara_dragon_no_tamago_datta:_ibara_no_dragon_road', dropped, 4.0, ['action', '_adventure', '_fantasy', '_isekai', '_reincarnation']).
+lettura('utente', 87609, 'tensei_shitara_slime_datta_ken', dropped, 3.0, ['award_winning', '_fantasy', '_isekai', '_reincarnation', '_shounen']).
+lettura('utente', 11366, 'teppuu', completed, 7.0, ['action', '_combat_sports', '_drama', '_psychological', '_seinen', '_sports']).
+lettura('utente', 37563, 'terra_formars', plan_to_read, 0.0, ['action', '_gore', '_horror', '_sci-fi', '_seinen', '_survival']).
+lettura('utente', 148850, 'terror_man', completed, 6.0, ['action', '_supernatural']).
+lettura('utente', 162700, 'the_academy\'s_genius_swordsman', dropped, 3.0, ['action', '_fantasy', '_time_travel']).
+lettura('utente', 165031, 'the_apothecary_prince', dropped, 3.0, ['adventure', '_fantasy', '_isekai', '_reincarnation']).
+lettura('utente', 147693, 'the_archmage_returns_after_4000_years', dropped, 5.0, ['action', '_adventure', '_fantasy', '_reincarnation']).
+lettura('utente', 155284, 'the_baengri_clan\'s_unwanted_granddaughter', reading, 6.0, ['fantasy', '_time_travel', '_villainess']).
+lettura('utente', 141120, 'the_boxer', completed, 9.0, ['combat_sports', '_drama', '_sports']).
+lettura('utente', 8586, 'the_breaker', completed, 7.0, ['action', '_comedy', '_drama', '_martial_arts', '_school']).
+lettura('utente', 22651, 'the_breaker:_new_waves', completed, 6.0, ['action', '_comedy', '_drama', '_martial_arts', '_romance', '_school']).
+lettura('utente', 147569, 'the_celestial_returned_from_hell', dropped, 4.0, ['action', '_fantasy', '_urban_fantasy']).
+lettura('utente', 173090, 'the_dang_clan\'s_swordmaster_heir_just_wants_a_normal_life', reading, 6.0, ['action', '_fantasy', '_martial_arts', '_reincarnation']).
+lettura('utente', 157232, 'the_dark_mage\'s_return_to_enlistment', dropped, 4.0, ['action', '_fantasy', '_military']).
+lettura('utente', 148421, 'the_divine_surgeon', plan_to_read, 0.0, ['drama', '_historical', '_medical', '_reincarnation', '_time_travel']).
+lettura('utente', 147489, 'the_druid_of_seoul_station', dropped, 2.0, ['action', '_fantasy', '_isekai']).
+lettura('utente', 152195, 'the_dungeon_cleaning_life_of_a_once_genius_hunter', dropped, 3.0, ['action', '_fantasy', '_time_travel']).
+lettura('utente', 87844, 'the_fable', completed, 9.0, ['adult_cast', '_award_winning', '_comedy', '_organized_crime', '_seinen', '_suspense']).
+lettura('utente', 146787, 'the_gamer', dropped, 2.0, ['action', '_fantasy', '_school']).
+lettura('utente', 111996, 'the_god_of_high_school', completed, 6.0, ['action', '_adventure', '_fantasy', '_martial_arts', '_urban_fantasy']).
+lettura('utente', 148454, 'the_grand_mudang_saga', on_hold, 5.0, ['action', '_fantasy', '_martial_arts', '_reincarnation']).
+lettura('utente', 147272, 'the_greatest_estate_developer', dropped, 6.0, ['adventure', '_comedy', '_fantasy', '_isekai', '_reincarnation']).
+lettura('utente', 150455, 'the_hero_returns', dropped, 3.0, ['action', '_fantasy', '_reincarnation', '_time_travel']).
+lettura('utente', 125036, 'the_horizon', completed, 9.0, ['adventure', '_drama', '_psychological']).
+lettura('utente', 154692, 'the_infinite_mage', reading, 6.0, ['action', '_adventure', '_fantasy']).
+lettura('utente', 159140, 'the_knight_king_who_returned_with_a_god', dropped, 5.0, ['action', '_fantasy']).
+lettura('utente', 170427, 'the_knight_only_lives_today', reading, 7.0, ['action', '_fantasy', '_time_travel']).
+lettura('utente', 146827, 'the_lazy_lord_masters_the_sword', on_hold, 6.0, ['action', '_fantasy']).
+lettura('utente', 134744, 'the_legend_of_the_northern_blade', completed, 8.0, ['action', '_adventure', '_fantasy', '_martial_arts']).
+lettura('utente', 147536, 'the_legendary_moonlight_sculptor', dropped, 3.0, ['action', '_adventure', '_fantasy', '_video_game']).
+lettura('utente', 148679, 'the_lord_of_coins', plan_to_read, 0.0, ['action', '_adventure', '_fantasy', '_time_travel']).
+lettura('utente', 147322, 'the_max_level_hero_strikes_back', dropped, 2.0, ['action', '_adventure', '_fantasy']).
+lettura('utente', 153509, 'the_nine_heavens_swordmaster', reading, 4.0, ['action', '_fantasy', '_martial_arts']).
+lettura('utente', 148985, 'the_novel\'s_extra', dropped, 3.0, ['action', '_fantasy', '_isekai', '_reincarnation', '_school']).
+lettura('utente', 165038, 'the_outcast_is_a_fighter', dropped, 3.0, ['combat_sports', '_reincarnation', '_sports']).
+lettura('utente', 1320, 'the_ravages_of_time', plan_to_read, 0.0, ['action', '_adventure', '_historical', '_military']).
+lettura('utente', 150422, 'the_reaper', reading, 6.0, ['action', '_fantasy', '_martial_arts']).
+lettura('utente', 149305, 'the_red_book', completed, 4.0, ['horror']).
+lettura('utente', 174559, 'the_regressed_mercenary_has_a_plan', dropped, 4.0, ['action', '_fantasy', '_time_travel']).
+lettura('utente', 149013, 'the_return_of_the_disaster-class_hero', dropped, 4.0, ['action', '_fantasy']).
+lettura('utente', 180758, 'the_returned_c-rank_tank_won\'t_die!', dropped, 2.0, ['action', '_fantasy', '_urban_fantasy']).
+lettura('utente', 146761, 'the_skeleton_soldier_failed_to_defend_the_dungeon', dropped, 4.0, ['action', '_adventure', '_fantasy', '_time_travel']).
+lettura('utente', 150546, 'the_slumbering_ranker', dropped, 2.0, ['action', '_fantasy', '_video_game']).
+lettura('utente', 149572, 'the_stormy_inn', dropped, 4.0, ['action', '_fantasy', '_martial_arts']).
+lettura('utente', 148961, 'the_superhuman_era', reading, 8.0, ['action', '_super_power']).
+lettura('utente', 146949, 'the_swordmaster\'s_son', dropped, 3.0, ['action', '_adventure', '_fantasy']).
+lettura('utente', 162696, 'the_terminally_ill_young_master_of_the_baek_clan', dropped, 3.0, ['action', '_fantasy', '_martial_arts']).
+lettura('utente', 146856, 'the_tutorial_is_too_tough!', dropped, 4.0, ['action', '_fantasy', '_isekai', '_survival']).
+lettura('utente', 147217, 'the_world_after_the_fall', on_hold, 6.0, ['action', '_fantasy']).
+lettura('utente', 1408, 'the_world_is_mine', plan_to_read, 0.0, ['psychological', '_seinen']).
+lettura('utente', 20647, 'thermae_romae', completed, 6.0, ['award_winning', '_comedy', '_historical', '_seinen', '_time_travel']).
+lettura('utente', 109773, 'theseus_no_fune', plan_to_read, 0.0, ['drama', '_mystery', '_seinen']).
+lettura('utente', 155755, 'this_is_the_law', dropped, 5.0, ['drama', '_supernatural', '_time_travel']).
+lettura('utente', 3159, 'tista', completed, 4.0, ['action', '_drama', '_shounen']).
+lettura('utente', 148139, 'to_not_die', on_hold, 6.0, ['action', '_drama']).
+lettura('utente', 3572, 'tobaku_mokushiroku_kaiji', plan_to_read, 0.0, ['adult_cast', '_award_winning', '_drama', '_high_stakes_game', '_seinen', '_strategy_game']).
+lettura('utente', 102165, 'tokidoki', completed, 7.0, ['drama', '_romance', '_school', '_shounen']).
+lettura('utente', 149334, 'tokidoki_bosotto_russia-go_de_dereru_tonari_no_alya-san', on_hold, 5.0, ['comedy', '_romance', '_school']).
+lettura('utente', 33327, 'tokyo_ghoul', completed, 8.0, ['action', '_fantasy', '_gore', '_horror', '_psychological', '_seinen', '_urban_fantasy']).
+lettura('utente', 69879, 'tokyo-hatsu_isekai-yuki', completed, 6.0, ['comedy', '_fantasy', '_mystery', '_seinen', '_supernatural']).
+lettura('utente', 130216, 'tomb_raider_king', completed, 3.0, ['action', '_adventure', '_fantasy', '_time_travel']).
+lettura('utente', 912, 'tomie', completed, 2.0, ['drama', '_gore', '_horror', '_shoujo', '_supernatural']).
+lettura('utente', 92149, 'tomo-chan_wa_onnanoko!', completed, 5.0, ['comedy', '_romance', '_school']).
+lettura('utente', 105747, 'tondemo_skill_de_isekai_hourou_meshi', on_hold, 7.0, ['adventure', '_comedy', '_fantasy', '_gourmet', '_isekai']).
+lettura('utente', 100035, 'tongari_boushi_no_atelier', plan_to_read, 7.0, ['fantasy', '_seinen']).
+lettura('utente', 124154, 'toorigakari_ni_one_point_advice_shiteiku_type_no_yankee', completed, 6.0, ['comedy']).
+lettura('utente', 110771, 'toshokan_no_daimajutsushi', plan_to_read, 0.0, ['fantasy', '_seinen']).
+lettura('utente', 93972, 'totsukuni_no_shoujo', completed, 8.0, ['fantasy', '_shounen']).
+lettura('utente', 122663, 'tower_of_god', on_hold, 6.0, ['action', '_adventure', '_drama', '_fantasy', '_mystery']).
+lettura('utente', 703, 'trigun', plan_to_read, 0.0, ['action', '_adult_cast', '_adventure', '_comedy', '_sci-fi', '_shounen']).
+lettura('utente', 704, 'trigun_maximum', plan_to_read, 0.0, ['action', '_adult_cast', '_adventure', '_award_winning', '_comedy', '_drama', '_sci-fi', '_seinen']).
+lettura('utente', 131924, 'tsue_to_tsurugi_no_wistoria', dropped, 4.0, ['action', '_fantasy', '_school', '_shounen']).
+lettura('utente', 181465, 'tsuihou_sareta_kajishi_wa_cheat_skill_de_densetsu_wo_tsukurimakuru:_konyakusha_ni_mise_wo_oidasareta_kedo,_kimama_ni_mono_tsukutteirareru_ima_no_hou_ga_shiawase_desu', dropped, 2.0, ['action', '_fantasy']).
+lettura('utente', 90117, 'tsuki_ga_michibiku_isekai_douchuu', dropped, 3.0, ['adventure', '_fantasy', '_isekai']).
+lettura('utente', 116367, 'tuixiu_de_yongzhemen', completed, 5.0, ['action', '_fantasy']).
+lettura('utente', 14483, 'uchuu_kyoudai', plan_to_read, 0.0, ['adult_cast', '_award_winning', '_drama', '_sci-fi', '_seinen', '_space', '_workplace']).
+lettura('utente', 18570, 'ultra_heaven', plan_to_read, 0.0, ['avant_garde', '_drama', '_psychological', '_sci-fi', '_seinen']).
+lettura('utente', 114043, 'umarekawattemo_mata,_watashi_to_kekkon_shitekuremasu_ka', completed, 6.0, ['romance']).
+lettura('utente', 142457, 'umi_ga_hashiru_end_roll', plan_to_read, 0.0, ['shoujo', '_slice_of_life']).
+lettura('utente', 127127, 'umibe_no_q', plan_to_read, 0.0, ['drama', '_school', '_sci-fi', '_seinen']).
+lettura('utente', 131843, 'unholy_blood', dropped, 5.0, ['action', '_romance', '_supernatural', '_vampire']).
+lettura('utente', 136975, 'unmei_no_hito_ni_deau_hanashi', plan_to_read, 0.0, ['romance', '_shoujo']).
+lettura('utente', 110766, 'urasekai_picnic', plan_to_read, 0.0, ['action', '_fantasy', '_mystery', '_shounen']).
+lettura('utente', 172843, 'urenokori_no_dorei_elf_wo_hirotta_node,_musume_ni_suru_koto_ni_shita', on_hold, 5.0, ['childcare', '_fantasy', '_seinen']).
+lettura('utente', 3468, 'usagi_drop', completed, 2.0, ['childcare', '_comedy', '_drama', '_josei', '_slice_of_life']).
+lettura('utente', 9982, 'usogui', plan_to_read, 0.0, ['action', '_high_stakes_game', '_psychological', '_seinen', '_strategy_game']).
+lettura('utente', 146207, 'usuzumi_no_hate', reading, 7.0, ['adventure', '_sci-fi', '_seinen']).
+lettura('utente', 436, 'uzumaki', completed, 4.0, ['drama', '_horror', '_seinen', '_supernatural']).
+lettura('utente', 656, 'vagabond', completed, 10.0, ['action', '_adventure', '_award_winning', '_historical', '_samurai', '_seinen']).
+lettura('utente', 121151, 'vampire_dormitory', dropped, 3.0, ['crossdressing', '_romance', '_shoujo', '_supernatural', '_vampire']).
+lettura('utente', 147191, 'villain_to_kill', dropped, 6.0, ['action', '_super_power']).
+lettura('utente', 151550, 'villain_with_a_crush', dropped, 5.0, ['comedy', '_romance', '_super_power']).
+lettura('utente', 642, 'vinland_saga', reading, 9.0, ['action', '_adventure', '_award_winning', '_drama', '_historical', '_seinen']).
+lettura('utente', 139164, 'viral_hit', completed, 6.0, ['action', '_martial_arts', '_school']).
+lettura('utente', 147724, 'volcanic_age', dropped, 5.0, ['action', '_adventure', '_fantasy', '_martial_arts', '_time_travel']).
+lettura('utente', 15916, 'waga_tousou', completed, 5.0, ['historical']).
+lettura('utente', 19790, 'wanitokagegisu', plan_to_read, 0.0, ['comedy', '_seinen', '_slice_of_life']).
+lettura('utente', 131338, 'whale_star:_the_gyeongseong_mermaid', plan_to_read, 0.0, ['drama', '_historical', '_romance']).
+lettura('utente', 118575, 'who_invited_you?', plan_to_read, 0.0, ['comedy', '_drama', '_romance']).
+lettura('utente', 121269, 'who_made_me_a_princess', dropped, 4.0, ['drama', '_fantasy', '_reincarnation']).
+lettura('utente', 103237, 'wind_breaker', dropped, 6.0, ['action', '_drama', '_sports']).
+lettura('utente', 48151, 'world_trigger', plan_to_read, 0.0, ['action', '_sci-fi', '_shounen']).
+lettura('utente', 89087, 'wotaku_ni_koi_wa_muzukashii', completed, 6.0, ['adult_cast', '_comedy', '_otaku_culture', '_romance', '_workplace']).
+lettura('utente', 130633, 'yaiteru_futari', on_hold, 5.0, ['gourmet', '_romance', '_seinen', '_slice_of_life']).
+lettura('utente', 100128, 'yakusoku_no_neverland', completed, 7.0, ['award_winning', '_mystery', '_psychological', '_shounen', '_survival', '_suspense']).
+lettura('utente', 125052, 'yamada-kun_to_lv999_no_koi_wo_suru', plan_to_read, 0.0, ['romance', '_video_game']).
+lettura('utente', 121480, 'yofukashi_no_uta', completed, 5.0, ['award_winning', '_romance', '_shounen', '_supernatural', '_vampire']).
+lettura('utente', 4, 'yokohama_kaidashi_kikou', completed, 6.0, ['award_winning', '_iyashikei', '_sci-fi', '_seinen', '_slice_of_life']).
+lettura('utente', 17910, 'yomawari_sensei', plan_to_read, 0.0, ['drama', '_psychological', '_school', '_seinen']).
+lettura('utente', 152825, 'yongsa_high:_dungeon_raiders', dropped, 3.0, ['action', '_fantasy', '_school']).
+lettura('utente', 164902, 'yoru_no_manimani', completed, 5.0, ['romance']).
+lettura('utente', 104, 'yotsuba_to!', dropped, 5.0, ['award_winning', '_childcare', '_comedy', '_iyashikei', '_slice_of_life']).
+lettura('utente', 98436, 'youjo_senki', plan_to_read, 0.0, ['action', '_fantasy', '_isekai', '_military', '_reincarnation']).
+lettura('utente', 93416, 'youkai_gakkou_no_sensei_hajimemashita!', dropped, 2.0, ['comedy', '_fantasy', '_gag_humor', '_mythology', '_school', '_workplace']).
+lettura('utente', 58245, 'youkai_kyoushitsu', completed, 4.0, ['horror', '_josei', '_supernatural']).
+lettura('utente', 121426, 'yozakura-san_chi_no_daisakusen', dropped, 5.0, ['action', '_comedy', '_shounen']).
+lettura('utente', 62547, 'yugami-kun_ni_wa_tomodachi_ga_inai', completed, 7.0, ['comedy', '_school', '_shounen', '_slice_of_life']).
+lettura('utente', 94376, 'yuru_camp△', dropped, 4.0, ['cgdct', '_iyashikei', '_slice_of_life']).
+lettura('utente', 107575, 'yuukyuu_no_gusha_asley_no,_kenja_no_susume:_to,_pochi_no_daibouken', dropped, 3.0, ['fantasy']).
+lettura('utente', 142818, 'zeikin_de_katta_hon', on_hold, 0.0, ['seinen', '_slice_of_life', '_workplace']).
+lettura('utente', 122392, 'zom_100:_zombie_ni_naru_made_ni_shitai_100_no_koto', dropped, 5.0, ['adult_cast', '_comedy', '_seinen', '_survival', '_suspense']).
+letto('utente', 'award_winning', 3).
+letto('utente', 'drama', 3).
+letto('utente', 'historical', 3).
+letto('utente', 'mystery', 3).
+letto('utente', 'psychological', 3).
+letto('utente', 'sci-fi', 3).
+letto('utente', 'seinen', 3).
+letto('utente', 'award_winning', 743).
+letto('utente', 'drama', 743).
+letto('utente', 'mystery', 743).
+letto('utente', 'psychological', 743).
+letto('utente', 'sci-fi', 743).
+letto('utente', 'seinen', 743).
+letto('utente', 'award_winning', 1224).
+letto('utente', 'childcare', 1224).
+letto('utente', 'drama', 1224).
+letto('utente', 'iyashikei', 1224).
+letto('utente', 'seinen', 1224).
+letto('utente', 'slice_of_life', 1224).
+letto('utente', 'strategy_game', 1224).
+letto('utente', 'fantasy', 147337).
+letto('utente', 'reincarnation', 147337).
+letto('utente', 'adult_cast', 134678).
+letto('utente', 'comedy', 134678).
+letto('utente', 'drama', 134678).
+letto('utente', 'romance', 134678).
+letto('utente', 'workplace', 134678).
+letto('utente', 'action', 148457).
+letto('utente', 'fantasy', 148457).
+letto('utente', 'martial_arts', 148457).
+letto('utente', 'action', 41723).
+letto('utente', 'adventure', 41723).
+letto('utente', 'fantasy', 41723).
+letto('utente', 'romance', 41723).
+letto('utente', 'action', 158496).
+letto('utente', 'fantasy', 158496).
+letto('utente', 'isekai', 158496).
+letto('utente', 'martial_arts', 158496).
+letto('utente', 'reincarnation', 158496).
+letto('utente', 'action', 132247).
+letto('utente', 'fantasy', 132247).
+letto('utente', 'school', 132247).
+letto('utente', 'time_travel', 132247).
+letto('utente', 'psychological', 50027).
+letto('utente', 'slice_of_life', 50027).
+letto('utente', 'supernatural', 50027).
+letto('utente', 'action', 172750).
+letto('utente', 'fantasy', 172750).
+letto('utente', 'martial_arts', 172750).
+letto('utente', 'time_travel', 172750).
+letto('utente', 'action', 174691).
+letto('utente', 'fantasy', 174691).
+letto('utente', 'martial_arts', 174691).
+letto('utente', 'action', 149880).
+letto('utente', 'fantasy', 149880).
+letto('utente', 'martial_arts', 149880).
+letto('utente', 'time_travel', 149880).
+letto('utente', 'action', 143991).
+letto('utente', 'fantasy', 143991).
+letto('utente', 'romance', 147448).
+letto('utente', 'school', 147448).
+letto('utente', 'action', 150210).
+letto('utente', 'fantasy', 150210).
+letto('utente', 'comedy', 103939).
+letto('utente', 'love_status_quo', 103939).
+letto('utente', 'romance', 103939).
+letto('utente', 'school', 103939).
+letto('utente', 'shounen', 103939).
+letto('utente', 'drama', 147014).
+letto('utente', 'mystery', 147014).
+letto('utente', 'psychological', 147014).
+letto('utente', 'suspense', 147014).
+letto('utente', 'action', 49865).
+letto('utente', 'gore', 49865).
+letto('utente', 'horror', 49865).
+letto('utente', 'mystery', 49865).
+letto('utente', 'seinen', 49865).
+letto('utente', 'supernatural', 49865).
+letto('utente', 'action', 1218).
+letto('utente', 'adult_cast', 1218).
+letto('utente', 'drama', 1218).
+letto('utente', 'organized_crime', 1218).
+letto('utente', 'psychological', 1218).
+letto('utente', 'strategy_game', 1218).
+letto('utente', 'adventure', 21525).
+letto('utente', 'fantasy', 21525).
+letto('utente', 'romance', 21525).
+letto('utente', 'shoujo', 21525).
+letto('utente', 'action', 664).
+letto('utente', 'award_winning', 664).
+letto('utente', 'gore', 664).
+letto('utente', 'sci-fi', 664).
+letto('utente', 'seinen', 664).
+letto('utente', 'drama', 24705).
+letto('utente', 'psychological', 24705).
+letto('utente', 'romance', 24705).
+letto('utente', 'school', 24705).
+letto('utente', 'shounen', 24705).
+letto('utente', 'action', 1101).
+letto('utente', 'detective', 1101).
+letto('utente', 'drama', 1101).
+letto('utente', 'psychological', 1101).
+letto('utente', 'shounen', 1101).
+letto('utente', 'suspense', 1101).
+letto('utente', 'comedy', 125325).
+letto('utente', 'fantasy', 125325).
+letto('utente', 'school', 125325).
+letto('utente', 'seinen', 125325).
+letto('utente', 'villainess', 125325).
+letto('utente', 'action', 62887).
+letto('utente', 'military', 62887).
+letto('utente', 'sci-fi', 62887).
+letto('utente', 'seinen', 62887).
+letto('utente', 'time_travel', 62887).
+letto('utente', 'childcare', 63535).
+letto('utente', 'comedy', 63535).
+letto('utente', 'gourmet', 63535).
+letto('utente', 'iyashikei', 63535).
+letto('utente', 'seinen', 63535).
+letto('utente', 'slice_of_life', 63535).
+letto('utente', 'comedy', 129418).
+letto('utente', 'seinen', 129418).
+letto('utente', 'slice_of_life', 129418).
+letto('utente', 'comedy', 143336).
+letto('utente', 'kids', 143336).
+letto('utente', 'sci-fi', 143336).
+letto('utente', 'space', 143336).
+letto('utente', 'action', 128953).
+letto('utente', 'fantasy', 128953).
+letto('utente', 'school', 128953).
+letto('utente', 'drama', 30079).
+letto('utente', 'mystery', 30079).
+letto('utente', 'psychological', 30079).
+letto('utente', 'romance', 30079).
+letto('utente', 'school', 30079).
+letto('utente', 'seinen', 30079).
+letto('utente', 'horror', 296).
+letto('utente', 'mystery', 296).
+letto('utente', 'psychological', 296).
+letto('utente', 'award_winning', 102256).
+letto('utente', 'seinen', 102256).
+letto('utente', 'sports', 102256).
+letto('utente', 'team_sports', 102256).
+letto('utente', 'action', 13492).
+letto('utente', 'mythology', 13492).
+letto('utente', 'school', 13492).
+letto('utente', 'shounen', 13492).
+letto('utente', 'supernatural', 13492).
+letto('utente', 'romance', 135545).
+letto('utente', 'school', 135545).
+letto('utente', 'shounen', 135545).
+letto('utente', 'sports', 135545).
+letto('utente', 'team_sports', 135545).
+letto('utente', 'comedy', 14154).
+letto('utente', 'romance', 14154).
+letto('utente', 'seinen', 14154).
+letto('utente', 'action', 96528).
+letto('utente', 'adventure', 96528).
+letto('utente', 'fantasy', 96528).
+letto('utente', 'harem', 96528).
+letto('utente', 'isekai', 96528).
+letto('utente', 'combat_sports', 1303).
+letto('utente', 'drama', 1303).
+letto('utente', 'shounen', 1303).
+letto('utente', 'slice_of_life', 1303).
+letto('utente', 'sports', 1303).
+letto('utente', 'action', 131084).
+letto('utente', 'historical', 131084).
+letto('utente', 'seinen', 131084).
+letto('utente', 'action', 153965).
+letto('utente', 'fantasy', 153965).
+letto('utente', 'action', 141583).
+letto('utente', 'organized_crime', 141583).
+letto('utente', 'shounen', 141583).
+letto('utente', 'supernatural', 141583).
+letto('utente', 'drama', 93350).
+letto('utente', 'cgdct', 85).
+letto('utente', 'comedy', 85).
+letto('utente', 'school', 85).
+letto('utente', 'slice_of_life', 85).
+letto('utente', 'action', 72299).
+letto('utente', 'gore', 72299).
+letto('utente', 'martial_arts', 72299).
+letto('utente', 'shounen', 72299).
+letto('utente', 'action', 115749).
+letto('utente', 'martial_arts', 115749).
+letto('utente', 'shounen', 115749).
+letto('utente', 'action', 5157).
+letto('utente', 'combat_sports', 5157).
+letto('utente', 'gore', 5157).
+letto('utente', 'martial_arts', 5157).
+letto('utente', 'shounen', 5157).
+letto('utente', 'comedy', 9711).
+letto('utente', 'drama', 9711).
+letto('utente', 'otaku_culture', 9711).
+letto('utente', 'romance', 9711).
+letto('utente', 'shounen', 9711).
+letto('utente', 'action', 756).
+letto('utente', 'adventure', 756).
+letto('utente', 'delinquents', 756).
+letto('utente', 'drama', 756).
+letto('utente', 'organized_crime', 756).
+letto('utente', 'psychological', 756).
+letto('utente', 'shoujo', 756).
+letto('utente', 'suspense', 756).
+letto('utente', 'horror', 13568).
+letto('utente', 'psychological', 13568).
+letto('utente', 'seinen', 13568).
+letto('utente', 'childcare', 17051).
+letto('utente', 'comedy', 17051).
+letto('utente', 'iyashikei', 17051).
+letto('utente', 'shounen', 17051).
+letto('utente', 'slice_of_life', 17051).
+letto('utente', 'visual_arts', 17051).
+letto('utente', 'drama', 111213).
+letto('utente', 'gore', 111213).
+letto('utente', 'horror', 111213).
+letto('utente', 'mystery', 111213).
+letto('utente', 'psychological', 111213).
+letto('utente', 'romance', 111213).
+letto('utente', 'anthropomorphic', 103701).
+letto('utente', 'award_winning', 103701).
+letto('utente', 'drama', 103701).
+letto('utente', 'psychological', 103701).
+letto('utente', 'shounen', 103701).
+letto('utente', 'slice_of_life', 103701).
+letto('utente', 'action', 10010).
+letto('utente', 'childcare', 10010).
+letto('utente', 'comedy', 10010).
+letto('utente', 'delinquents', 10010).
+letto('utente', 'mythology', 10010).
+letto('utente', 'school', 10010).
+letto('utente', 'shounen', 10010).
+letto('utente', 'supernatural', 10010).
+letto('utente', 'action', 2).
+letto('utente', 'adventure', 2).
+letto('utente', 'award_winning', 2).
+letto('utente', 'drama', 2).
+letto('utente', 'fantasy', 2).
+letto('utente', 'gore', 2).
+letto('utente', 'horror', 2).
+letto('utente', 'military', 2).
+letto('utente', 'psychological', 2).
+letto('utente', 'seinen', 2).
+letto('utente', 'seinen', 92299).
+letto('utente', 'action', 147662).
+letto('utente', 'fantasy', 147662).
+letto('utente', 'martial_arts', 147662).
+letto('utente', 'reincarnation', 147662).
+letto('utente', 'action', 113835).
+letto('utente', 'drama', 113835).
+letto('utente', 'historical', 113835).
+letto('utente', 'detective', 11054).
+letto('utente', 'drama', 11054).
+letto('utente', 'historical', 11054).
+letto('utente', 'mystery', 11054).
+letto('utente', 'psychological', 11054).
+letto('utente', 'seinen', 11054).
+letto('utente', 'supernatural', 11054).
+letto('utente', 'action', 168969).
+letto('utente', 'fantasy', 168969).
+letto('utente', 'martial_arts', 168969).
+letto('utente', 'action', 86337).
+letto('utente', 'fantasy', 86337).
+letto('utente', 'shounen', 86337).
+letto('utente', 'action', 735).
+letto('utente', 'adult_cast', 735).
+letto('utente', 'drama', 735).
+letto('utente', 'military', 735).
+letto('utente', 'organized_crime', 735).
+letto('utente', 'seinen', 735).
+letto('utente', 'action', 149).
+letto('utente', 'drama', 149).
+letto('utente', 'horror', 149).
+letto('utente', 'psychological', 149).
+letto('utente', 'sci-fi', 149).
+letto('utente', 'seinen', 149).
+letto('utente', 'action', 12).
+letto('utente', 'adventure', 12).
+letto('utente', 'award_winning', 12).
+letto('utente', 'shounen', 12).
+letto('utente', 'supernatural', 12).
+letto('utente', 'award_winning', 85719).
+letto('utente', 'music', 85719).
+letto('utente', 'seinen', 85719).
+letto('utente', 'music', 100922).
+letto('utente', 'seinen', 100922).
+letto('utente', 'action', 1479).
+letto('utente', 'psychological', 1479).
+letto('utente', 'seinen', 1479).
+letto('utente', 'award_winning', 114745).
+letto('utente', 'shounen', 114745).
+letto('utente', 'sports', 114745).
+letto('utente', 'team_sports', 114745).
+letto('utente', 'award_winning', 107931).
+letto('utente', 'drama', 107931).
+letto('utente', 'school', 107931).
+letto('utente', 'seinen', 107931).
+letto('utente', 'visual_arts', 107931).
+letto('utente', 'action', 2109).
+letto('utente', 'award_winning', 2109).
+letto('utente', 'drama', 2109).
+letto('utente', 'historical', 2109).
+letto('utente', 'seinen', 2109).
+letto('utente', 'action', 75989).
+letto('utente', 'school', 75989).
+letto('utente', 'shounen', 75989).
+letto('utente', 'super_power', 75989).
+letto('utente', 'comedy', 112807).
+letto('utente', 'romance', 112807).
+letto('utente', 'school', 112807).
+letto('utente', 'shounen', 112807).
+letto('utente', 'comedy', 153950).
+letto('utente', 'shounen', 153950).
+letto('utente', 'drama', 94919).
+letto('utente', 'seinen', 94919).
+letto('utente', 'action', 175296).
+letto('utente', 'fantasy', 175296).
+letto('utente', 'urban_fantasy', 175296).
+letto('utente', 'action', 148617).
+letto('utente', 'adventure', 148617).
+letto('utente', 'fantasy', 148617).
+letto('utente', 'school', 148617).
+letto('utente', 'action', 119533).
+letto('utente', 'adventure', 119533).
+letto('utente', 'fantasy', 119533).
+letto('utente', 'action', 115194).
+letto('utente', 'adventure', 115194).
+letto('utente', 'fantasy', 115194).
+letto('utente', 'action', 130977).
+letto('utente', 'adventure', 130977).
+letto('utente', 'fantasy', 130977).
+letto('utente', 'shounen', 130977).
+letto('utente', 'drama', 23419).
+letto('utente', 'romance', 23419).
+letto('utente', 'seinen', 23419).
+letto('utente', 'action', 103444).
+letto('utente', 'seinen', 103444).
+letto('utente', 'action', 116778).
+letto('utente', 'award_winning', 116778).
+letto('utente', 'fantasy', 116778).
+letto('utente', 'gore', 116778).
+letto('utente', 'shounen', 116778).
+letto('utente', 'urban_fantasy', 116778).
+letto('utente', 'drama', 104271).
+letto('utente', 'psychological', 104271).
+letto('utente', 'seinen', 104271).
+letto('utente', 'suspense', 104271).
+letto('utente', 'childcare', 76813).
+letto('utente', 'comedy', 76813).
+letto('utente', 'shounen', 76813).
+letto('utente', 'slice_of_life', 76813).
+letto('utente', 'action', 148428).
+letto('utente', 'adventure', 148428).
+letto('utente', 'fantasy', 148428).
+letto('utente', 'action', 131403).
+letto('utente', 'seinen', 131403).
+letto('utente', 'supernatural', 131403).
+letto('utente', 'action', 174692).
+letto('utente', 'adventure', 174692).
+letto('utente', 'fantasy', 174692).
+letto('utente', 'martial_arts', 174692).
+letto('utente', 'action', 157591).
+letto('utente', 'fantasy', 157591).
+letto('utente', 'martial_arts', 157591).
+letto('utente', 'reincarnation', 157591).
+letto('utente', 'action', 177080).
+letto('utente', 'fantasy', 177080).
+letto('utente', 'martial_arts', 177080).
+letto('utente', 'reincarnation', 177080).
+letto('utente', 'action', 583).
+letto('utente', 'adventure', 583).
+letto('utente', 'fantasy', 583).
+letto('utente', 'gore', 583).
+letto('utente', 'horror', 583).
+letto('utente', 'shounen', 583).
+letto('utente', 'drama', 36595).
+letto('utente', 'historical', 36595).
+letto('utente', 'josei', 36595).
+letto('utente', 'action', 5651).
+letto('utente', 'delinquents', 5651).
+letto('utente', 'school', 5651).
+letto('utente', 'shounen', 5651).
+letto('utente', 'comedy', 127084).
+letto('utente', 'romance', 127084).
+letto('utente', 'seinen', 127084).
+letto('utente', 'action', 24).
+letto('utente', 'adventure', 24).
+letto('utente', 'fantasy', 24).
+letto('utente', 'shounen', 24).
+letto('utente', 'urban_fantasy', 24).
+letto('utente', 'comedy', 118858).
+letto('utente', 'horror', 118858).
+letto('utente', 'sci-fi', 118858).
+letto('utente', 'shounen', 118858).
+letto('utente', 'comedy', 158565).
+letto('utente', 'idols_(female)', 158565).
+letto('utente', 'romance', 158565).
+letto('utente', 'action', 135496).
+letto('utente', 'comedy', 135496).
+letto('utente', 'shounen', 135496).
+letto('utente', 'supernatural', 135496).
+letto('utente', 'award_winning', 130755).
+letto('utente', 'sci-fi', 130755).
+letto('utente', 'seinen', 130755).
+letto('utente', 'award_winning', 70801).
+letto('utente', 'drama', 70801).
+letto('utente', 'school', 70801).
+letto('utente', 'sci-fi', 70801).
+letto('utente', 'seinen', 70801).
+letto('utente', 'action', 110301).
+letto('utente', 'fantasy', 110301).
+letto('utente', 'reincarnation', 110301).
+letto('utente', 'seinen', 110301).
+letto('utente', 'urban_fantasy', 110301).
+letto('utente', 'psychological', 21).
+letto('utente', 'shounen', 21).
+letto('utente', 'supernatural', 21).
+letto('utente', 'suspense', 21).
+letto('utente', 'action', 149465).
+letto('utente', 'fantasy', 149465).
+letto('utente', 'action', 147847).
+letto('utente', 'fantasy', 147847).
+letto('utente', 'reincarnation', 147847).
+letto('utente', 'action', 148070).
+letto('utente', 'fantasy', 148070).
+letto('utente', 'martial_arts', 148070).
+letto('utente', 'reincarnation', 148070).
+letto('utente', 'action', 150998).
+letto('utente', 'delinquents', 150998).
+letto('utente', 'school', 150998).
+letto('utente', 'action', 1474).
+letto('utente', 'adventure', 1474).
+letto('utente', 'drama', 1474).
+letto('utente', 'fantasy', 1474).
+letto('utente', 'horror', 1474).
+letto('utente', 'mythology', 1474).
+letto('utente', 'psychological', 1474).
+letto('utente', 'sci-fi', 1474).
+letto('utente', 'shounen', 1474).
+letto('utente', 'super_power', 1474).
+letto('utente', 'supernatural', 1474).
+letto('utente', 'action', 148456).
+letto('utente', 'adventure', 148456).
+letto('utente', 'fantasy', 148456).
+letto('utente', 'action', 82947).
+letto('utente', 'drama', 82947).
+letto('utente', 'horror', 82947).
+letto('utente', 'mystery', 82947).
+letto('utente', 'survival', 82947).
+letto('utente', 'comedy', 111767).
+letto('utente', 'romance', 111767).
+letto('utente', 'school', 111767).
+letto('utente', 'shounen', 111767).
+letto('utente', 'action', 151060).
+letto('utente', 'fantasy', 151060).
+letto('utente', 'isekai', 151060).
+letto('utente', 'martial_arts', 151060).
+letto('utente', 'medical', 151060).
+letto('utente', 'reincarnation', 151060).
+letto('utente', 'action', 147172).
+letto('utente', 'fantasy', 147172).
+letto('utente', 'time_travel', 147172).
+letto('utente', 'action', 1133).
+letto('utente', 'comedy', 1133).
+letto('utente', 'fantasy', 1133).
+letto('utente', 'gore', 1133).
+letto('utente', 'horror', 1133).
+letto('utente', 'seinen', 1133).
+letto('utente', 'action', 156024).
+letto('utente', 'adventure', 156024).
+letto('utente', 'comedy', 156024).
+letto('utente', 'fantasy', 156024).
+letto('utente', 'drama', 40345).
+letto('utente', 'medical', 40345).
+letto('utente', 'psychological', 40345).
+letto('utente', 'adventure', 103897).
+letto('utente', 'award_winning', 103897).
+letto('utente', 'sci-fi', 103897).
+letto('utente', 'shounen', 103897).
+letto('utente', 'survival', 103897).
+letto('utente', 'suspense', 103897).
+letto('utente', 'adventure', 146618).
+letto('utente', 'fantasy', 146618).
+letto('utente', 'isekai', 146618).
+letto('utente', 'reincarnation', 146618).
+letto('utente', 'award_winning', 85781).
+letto('utente', 'comedy', 85781).
+letto('utente', 'fantasy', 85781).
+letto('utente', 'gourmet', 85781).
+letto('utente', 'seinen', 85781).
+letto('utente', 'action', 152405).
+letto('utente', 'fantasy', 152405).
+letto('utente', 'action', 147438).
+letto('utente', 'adventure', 147438).
+letto('utente', 'fantasy', 147438).
+letto('utente', 'action', 147171).
+letto('utente', 'super_power', 147171).
+letto('utente', 'drama', 10970).
+letto('utente', 'gore', 10970).
+letto('utente', 'horror', 10970).
+letto('utente', 'medical', 10970).
+letto('utente', 'psychological', 10970).
+letto('utente', 'seinen', 10970).
+letto('utente', 'action', 150204).
+letto('utente', 'fantasy', 150204).
+letto('utente', 'isekai', 150204).
+letto('utente', 'romance', 150204).
+letto('utente', 'shounen', 43).
+letto('utente', 'sports', 43).
+letto('utente', 'team_sports', 43).
+letto('utente', 'action', 43913).
+letto('utente', 'fantasy', 43913).
+letto('utente', 'historical', 43913).
+letto('utente', 'martial_arts', 43913).
+letto('utente', 'supernatural', 43913).
+letto('utente', 'action', 147463).
+letto('utente', 'adventure', 147463).
+letto('utente', 'fantasy', 147463).
+letto('utente', 'isekai', 147463).
+letto('utente', 'time_travel', 147463).
+letto('utente', 'action', 118805).
+letto('utente', 'martial_arts', 118805).
+letto('utente', 'school', 118805).
+letto('utente', 'action', 98270).
+letto('utente', 'gore', 98270).
+letto('utente', 'mystery', 98270).
+letto('utente', 'shounen', 98270).
+letto('utente', 'supernatural', 98270).
+letto('utente', 'action', 150088).
+letto('utente', 'adventure', 150088).
+letto('utente', 'fantasy', 150088).
+letto('utente', 'martial_arts', 150088).
+letto('utente', 'action', 25).
+letto('utente', 'adventure', 25).
+letto('utente', 'award_winning', 25).
+letto('utente', 'drama', 25).
+letto('utente', 'fantasy', 25).
+letto('utente', 'military', 25).
+letto('utente', 'shounen', 25).
+letto('utente', 'adventure', 102343).
+letto('utente', 'award_winning', 102343).
+letto('utente', 'drama', 102343).
+letto('utente', 'shounen', 102343).
+letto('utente', 'supernatural', 102343).
+letto('utente', 'comedy', 112694).
+letto('utente', 'pets', 112694).
+letto('utente', 'slice_of_life', 112694).
+letto('utente', 'comedy', 103694).
+letto('utente', 'gourmet', 103694).
+letto('utente', 'love_status_quo', 103694).
+letto('utente', 'romance', 103694).
+letto('utente', 'school', 103694).
+letto('utente', 'seinen', 103694).
+letto('utente', 'action', 24903).
+letto('utente', 'adult_cast', 24903).
+letto('utente', 'drama', 24903).
+letto('utente', 'organized_crime', 24903).
+letto('utente', 'seinen', 24903).
+letto('utente', 'action', 564).
+letto('utente', 'drama', 564).
+letto('utente', 'gore', 564).
+letto('utente', 'horror', 564).
+letto('utente', 'psychological', 564).
+letto('utente', 'sci-fi', 564).
+letto('utente', 'seinen', 564).
+letto('utente', 'supernatural', 564).
+letto('utente', 'survival', 564).
+letto('utente', 'action', 15010).
+letto('utente', 'drama', 15010).
+letto('utente', 'martial_arts', 15010).
+letto('utente', 'psychological', 15010).
+letto('utente', 'school', 15010).
+letto('utente', 'seinen', 15010).
+letto('utente', 'drama', 146875).
+letto('utente', 'school', 146875).
+letto('utente', 'drama', 110727).
+letto('utente', 'romance', 110727).
+letto('utente', 'sci-fi', 110727).
+letto('utente', 'seinen', 110727).
+letto('utente', 'action', 124145).
+letto('utente', 'adventure', 124145).
+letto('utente', 'fantasy', 124145).
+letto('utente', 'award_winning', 25096).
+letto('utente', 'comedy', 25096).
+letto('utente', 'drama', 25096).
+letto('utente', 'school', 25096).
+letto('utente', 'shounen', 25096).
+letto('utente', 'action', 44).
+letto('utente', 'comedy', 44).
+letto('utente', 'gag_humor', 44).
+letto('utente', 'historical', 44).
+letto('utente', 'parody', 44).
+letto('utente', 'samurai', 44).
+letto('utente', 'sci-fi', 44).
+letto('utente', 'shounen', 44).
+letto('utente', 'action', 98720).
+letto('utente', 'fantasy', 98720).
+letto('utente', 'seinen', 98720).
+letto('utente', 'comedy', 106247).
+letto('utente', 'fantasy', 106247).
+letto('utente', 'shounen', 106247).
+letto('utente', 'action', 147532).
+letto('utente', 'reincarnation', 147532).
+letto('utente', 'school', 147532).
+letto('utente', 'action', 1092).
+letto('utente', 'comedy', 1092).
+letto('utente', 'delinquents', 1092).
+letto('utente', 'josei', 1092).
+letto('utente', 'organized_crime', 1092).
+letto('utente', 'romance', 1092).
+letto('utente', 'school', 1092).
+letto('utente', 'slice_of_life', 1092).
+letto('utente', 'workplace', 1092).
+letto('utente', 'adult_cast', 112922).
+letto('utente', 'comedy', 112922).
+letto('utente', 'organized_crime', 112922).
+letto('utente', 'action', 85968).
+letto('utente', 'adventure', 85968).
+letto('utente', 'award_winning', 85968).
+letto('utente', 'historical', 85968).
+letto('utente', 'seinen', 85968).
+letto('utente', 'action', 1470).
+letto('utente', 'adventure', 1470).
+letto('utente', 'award_winning', 1470).
+letto('utente', 'drama', 1470).
+letto('utente', 'seinen', 1470).
+letto('utente', 'action', 147530).
+letto('utente', 'adventure', 147530).
+letto('utente', 'historical', 147530).
+letto('utente', 'martial_arts', 147530).
+letto('utente', 'comedy', 70345).
+letto('utente', 'seinen', 70345).
+letto('utente', 'action', 11425).
+letto('utente', 'gore', 11425).
+letto('utente', 'martial_arts', 11425).
+letto('utente', 'shounen', 11425).
+letto('utente', 'action', 107909).
+letto('utente', 'seinen', 107909).
+letto('utente', 'action', 36099).
+letto('utente', 'historical', 36099).
+letto('utente', 'psychological', 36099).
+letto('utente', 'seinen', 36099).
+letto('utente', 'suspense', 36099).
+letto('utente', 'action', 336).
+letto('utente', 'award_winning', 336).
+letto('utente', 'comedy', 336).
+letto('utente', 'delinquents', 336).
+letto('utente', 'drama', 336).
+letto('utente', 'ecchi', 336).
+letto('utente', 'school', 336).
+letto('utente', 'shounen', 336).
+letto('utente', 'workplace', 336).
+letto('utente', 'horror', 128783).
+letto('utente', 'mystery', 128783).
+letto('utente', 'psychological', 128783).
+letto('utente', 'supernatural', 128783).
+letto('utente', 'suspense', 128783).
+letto('utente', 'action', 87637).
+letto('utente', 'adventure', 87637).
+letto('utente', 'drama', 87637).
+letto('utente', 'fantasy', 87637).
+letto('utente', 'isekai', 87637).
+letto('utente', 'shounen', 87637).
+letto('utente', 'award_winning', 35243).
+letto('utente', 'school', 35243).
+letto('utente', 'shounen', 35243).
+letto('utente', 'sports', 35243).
+letto('utente', 'team_sports', 35243).
+letto('utente', 'award_winning', 7).
+letto('utente', 'combat_sports', 7).
+letto('utente', 'shounen', 7).
+letto('utente', 'sports', 7).
+letto('utente', 'action', 146944).
+letto('utente', 'adventure', 146944).
+letto('utente', 'fantasy', 146944).
+letto('utente', 'video_game', 146944).
+letto('utente', 'action', 147572).
+letto('utente', 'fantasy', 147572).
+letto('utente', 'martial_arts', 147572).
+letto('utente', 'reincarnation', 147572).
+letto('utente', 'action', 162325).
+letto('utente', 'fantasy', 162325).
+letto('utente', 'martial_arts', 162325).
+letto('utente', 'action', 151667).
+letto('utente', 'action', 77637).
+letto('utente', 'fantasy', 77637).
+letto('utente', 'action', 61583).
+letto('utente', 'fantasy', 61583).
+letto('utente', 'supernatural', 61583).
+letto('utente', 'action', 267).
+letto('utente', 'adult_cast', 267).
+letto('utente', 'gore', 267).
+letto('utente', 'historical', 267).
+letto('utente', 'horror', 267).
+letto('utente', 'seinen', 267).
+letto('utente', 'supernatural', 267).
+letto('utente', 'vampire', 267).
+letto('utente', 'action', 151242).
+letto('utente', 'fantasy', 151242).
+letto('utente', 'fantasy', 176511).
+letto('utente', 'isekai', 176511).
+letto('utente', 'reincarnation', 176511).
+letto('utente', 'romance', 176511).
+letto('utente', 'action', 147290).
+letto('utente', 'super_power', 147290).
+letto('utente', 'drama', 1325).
+letto('utente', 'fantasy', 1325).
+letto('utente', 'historical', 1325).
+letto('utente', 'psychological', 1325).
+letto('utente', 'romance', 1325).
+letto('utente', 'sci-fi', 1325).
+letto('utente', 'shounen', 1325).
+letto('utente', 'space', 1325).
+letto('utente', 'supernatural', 1325).
+letto('utente', 'romance', 35719).
+letto('utente', 'school', 35719).
+letto('utente', 'shoujo', 35719).
+letto('utente', 'drama', 116766).
+letto('utente', 'romance', 116766).
+letto('utente', 'shounen', 116766).
+letto('utente', 'comedy', 12200).
+letto('utente', 'romance', 12200).
+letto('utente', 'school', 12200).
+letto('utente', 'shoujo', 12200).
+letto('utente', 'childcare', 36413).
+letto('utente', 'comedy', 36413).
+letto('utente', 'organized_crime', 36413).
+letto('utente', 'seinen', 36413).
+letto('utente', 'supernatural', 36413).
+letto('utente', 'seinen', 137303).
+letto('utente', 'slice_of_life', 137303).
+letto('utente', 'comedy', 143305).
+letto('utente', 'pets', 143305).
+letto('utente', 'action', 148050).
+letto('utente', 'adventure', 148050).
+letto('utente', 'crossdressing', 148050).
+letto('utente', 'fantasy', 148050).
+letto('utente', 'romance', 148050).
+letto('utente', 'action', 2924).
+letto('utente', 'adventure', 2924).
+letto('utente', 'award_winning', 2924).
+letto('utente', 'historical', 2924).
+letto('utente', 'seinen', 2924).
+letto('utente', 'action', 147643).
+letto('utente', 'fantasy', 147643).
+letto('utente', 'isekai', 147643).
+letto('utente', 'action', 1149).
+letto('utente', 'drama', 1149).
+letto('utente', 'martial_arts', 1149).
+letto('utente', 'sci-fi', 1149).
+letto('utente', 'shounen', 1149).
+letto('utente', 'action', 3285).
+letto('utente', 'delinquents', 3285).
+letto('utente', 'martial_arts', 3285).
+letto('utente', 'psychological', 3285).
+letto('utente', 'seinen', 3285).
+letto('utente', 'drama', 936).
+letto('utente', 'horror', 936).
+letto('utente', 'mystery', 936).
+letto('utente', 'psychological', 936).
+letto('utente', 'seinen', 936).
+letto('utente', 'supernatural', 936).
+letto('utente', 'romance', 42451).
+letto('utente', 'school', 42451).
+letto('utente', 'shounen', 42451).
+letto('utente', 'pets', 21467).
+letto('utente', 'seinen', 21467).
+letto('utente', 'slice_of_life', 21467).
+letto('utente', 'drama', 366).
+letto('utente', 'mecha', 366).
+letto('utente', 'romance', 366).
+letto('utente', 'sci-fi', 366).
+letto('utente', 'seinen', 366).
+letto('utente', 'action', 44489).
+letto('utente', 'anthropomorphic', 44489).
+letto('utente', 'drama', 44489).
+letto('utente', 'fantasy', 44489).
+letto('utente', 'seinen', 44489).
+letto('utente', 'action', 151440).
+letto('utente', 'fantasy', 151440).
+letto('utente', 'isekai', 151440).
+letto('utente', 'psychological', 151440).
+letto('utente', 'survival', 151440).
+letto('utente', 'action', 147318).
+letto('utente', 'adventure', 147318).
+letto('utente', 'fantasy', 147318).
+letto('utente', 'isekai', 147318).
+letto('utente', 'action', 26).
+letto('utente', 'adventure', 26).
+letto('utente', 'fantasy', 26).
+letto('utente', 'shounen', 26).
+letto('utente', 'award_winning', 14440).
+letto('utente', 'drama', 14440).
+letto('utente', 'gore', 14440).
+letto('utente', 'horror', 14440).
+letto('utente', 'psychological', 14440).
+letto('utente', 'seinen', 14440).
+letto('utente', 'comedy', 153199).
+letto('utente', 'love_status_quo', 153199).
+letto('utente', 'romance', 153199).
+letto('utente', 'school', 153199).
+letto('utente', 'comedy', 147822).
+letto('utente', 'fantasy', 147822).
+letto('utente', 'romance', 147822).
+letto('utente', 'action', 147392).
+letto('utente', 'fantasy', 147392).
+letto('utente', 'action', 33031).
+letto('utente', 'gore', 33031).
+letto('utente', 'high_stakes_game', 33031).
+letto('utente', 'horror', 33031).
+letto('utente', 'psychological', 33031).
+letto('utente', 'shounen', 33031).
+letto('utente', 'supernatural', 33031).
+letto('utente', 'survival', 33031).
+letto('utente', 'action', 171441).
+letto('utente', 'fantasy', 171441).
+letto('utente', 'martial_arts', 171441).
+letto('utente', 'reincarnation', 171441).
+letto('utente', 'drama', 114824).
+letto('utente', 'horror', 114824).
+letto('utente', 'seinen', 114824).
+letto('utente', 'supernatural', 114824).
+letto('utente', 'drama', 58563).
+letto('utente', 'historical', 58563).
+letto('utente', 'seinen', 58563).
+letto('utente', 'award_winning', 93699).
+letto('utente', 'drama', 93699).
+letto('utente', 'historical', 93699).
+letto('utente', 'seinen', 93699).
+letto('utente', 'drama', 64465).
+letto('utente', 'gore', 64465).
+letto('utente', 'sci-fi', 64465).
+letto('utente', 'seinen', 64465).
+letto('utente', 'adult_cast', 90190).
+letto('utente', 'fantasy', 90190).
+letto('utente', 'gourmet', 90190).
+letto('utente', 'isekai', 90190).
+letto('utente', 'iyashikei', 90190).
+letto('utente', 'seinen', 90190).
+letto('utente', 'workplace', 90190).
+letto('utente', 'fantasy', 110621).
+letto('utente', 'gourmet', 110621).
+letto('utente', 'isekai', 110621).
+letto('utente', 'slice_of_life', 110621).
+letto('utente', 'comedy', 102671).
+letto('utente', 'fantasy', 102671).
+letto('utente', 'gourmet', 102671).
+letto('utente', 'iyashikei', 102671).
+letto('utente', 'mystery', 102671).
+letto('utente', 'seinen', 102671).
+letto('utente', 'workplace', 102671).
+letto('utente', 'drama', 44743).
+letto('utente', 'horror', 44743).
+letto('utente', 'psychological', 44743).
+letto('utente', 'seinen', 44743).
+letto('utente', 'supernatural', 44743).
+letto('utente', 'suspense', 44743).
+letto('utente', 'drama', 104314).
+letto('utente', 'gore', 104314).
+letto('utente', 'horror', 104314).
+letto('utente', 'mystery', 104314).
+letto('utente', 'seinen', 104314).
+letto('utente', 'supernatural', 104314).
+letto('utente', 'action', 21665).
+letto('utente', 'sci-fi', 21665).
+letto('utente', 'seinen', 21665).
+letto('utente', 'action', 112318).
+letto('utente', 'fantasy', 112318).
+letto('utente', 'historical', 112318).
+letto('utente', 'shounen', 112318).
+letto('utente', 'gore', 106025).
+letto('utente', 'horror', 106025).
+letto('utente', 'childcare', 131703).
+letto('utente', 'sci-fi', 131703).
+letto('utente', 'seinen', 131703).
+letto('utente', 'slice_of_life', 131703).
+letto('utente', 'action', 3006).
+letto('utente', 'shounen', 3006).
+letto('utente', 'supernatural', 3006).
+letto('utente', 'action', 3008).
+letto('utente', 'adventure', 3008).
+letto('utente', 'organized_crime', 3008).
+letto('utente', 'shounen', 3008).
+letto('utente', 'action', 1706).
+letto('utente', 'adventure', 1706).
+letto('utente', 'historical', 1706).
+letto('utente', 'mystery', 1706).
+letto('utente', 'seinen', 1706).
+letto('utente', 'shounen', 1706).
+letto('utente', 'supernatural', 1706).
+letto('utente', 'action', 25515).
+letto('utente', 'adventure', 25515).
+letto('utente', 'award_winning', 25515).
+letto('utente', 'mystery', 25515).
+letto('utente', 'seinen', 25515).
+letto('utente', 'supernatural', 25515).
+letto('utente', 'action', 139629).
+letto('utente', 'adventure', 139629).
+letto('utente', 'seinen', 139629).
+letto('utente', 'supernatural', 139629).
+letto('utente', 'action', 149983).
+letto('utente', 'drama', 149983).
+letto('utente', 'psychological', 149983).
+letto('utente', 'action', 113138).
+letto('utente', 'school', 113138).
+letto('utente', 'shounen', 113138).
+letto('utente', 'supernatural', 113138).
+letto('utente', 'drama', 100448).
+letto('utente', 'shounen', 100448).
+letto('utente', 'action', 147053).
+letto('utente', 'fantasy', 147053).
+letto('utente', 'gore', 125076).
+letto('utente', 'mystery', 125076).
+letto('utente', 'psychological', 125076).
+letto('utente', 'shounen', 125076).
+letto('utente', 'suspense', 125076).
+letto('utente', 'action', 171811).
+letto('utente', 'drama', 171811).
+letto('utente', 'comedy', 122353).
+letto('utente', 'love_status_quo', 122353).
+letto('utente', 'romance', 122353).
+letto('utente', 'action', 119022).
+letto('utente', 'comedy', 119022).
+letto('utente', 'fantasy', 119022).
+letto('utente', 'isekai', 119022).
+letto('utente', 'reincarnation', 119022).
+letto('utente', 'award_winning', 90125).
+letto('utente', 'comedy', 90125).
+letto('utente', 'romance', 90125).
+letto('utente', 'school', 90125).
+letto('utente', 'seinen', 90125).
+letto('utente', 'action', 127907).
+letto('utente', 'adult_cast', 127907).
+letto('utente', 'fantasy', 127907).
+letto('utente', 'sci-fi', 127907).
+letto('utente', 'shounen', 127907).
+letto('utente', 'urban_fantasy', 127907).
+letto('utente', 'horror', 108948).
+letto('utente', 'psychological', 108948).
+letto('utente', 'seinen', 108948).
+letto('utente', 'fantasy', 128784).
+letto('utente', 'slice_of_life', 128784).
+letto('utente', 'horror', 24808).
+letto('utente', 'psychological', 24808).
+letto('utente', 'adventure', 111228).
+letto('utente', 'fantasy', 111228).
+letto('utente', 'isekai', 111228).
+letto('utente', 'iyashikei', 111228).
+letto('utente', 'reincarnation', 111228).
+letto('utente', 'drama', 50217).
+letto('utente', 'romance', 50217).
+letto('utente', 'school', 50217).
+letto('utente', 'seinen', 50217).
+letto('utente', 'comedy', 90800).
+letto('utente', 'school', 90800).
+letto('utente', 'shounen', 90800).
+letto('utente', 'supernatural', 90800).
+letto('utente', 'drama', 144267).
+letto('utente', 'romance', 144267).
+letto('utente', 'school', 144267).
+letto('utente', 'drama', 55377).
+letto('utente', 'performing_arts', 55377).
+letto('utente', 'psychological', 55377).
+letto('utente', 'seinen', 55377).
+letto('utente', 'supernatural', 55377).
+letto('utente', 'drama', 119687).
+letto('utente', 'historical', 119687).
+letto('utente', 'seinen', 119687).
+letto('utente', 'action', 18161).
+letto('utente', 'adventure', 18161).
+letto('utente', 'comedy', 18161).
+letto('utente', 'romance', 18161).
+letto('utente', 'samurai', 18161).
+letto('utente', 'action', 47).
+letto('utente', 'comedy', 47).
+letto('utente', 'organized_crime', 47).
+letto('utente', 'school', 47).
+letto('utente', 'shounen', 47).
+letto('utente', 'super_power', 47).
+letto('utente', 'comedy', 118196).
+letto('utente', 'romance', 118196).
+letto('utente', 'action', 651).
+letto('utente', 'adventure', 651).
+letto('utente', 'award_winning', 651).
+letto('utente', 'fantasy', 651).
+letto('utente', 'action', 72025).
+letto('utente', 'martial_arts', 72025).
+letto('utente', 'action', 146979).
+letto('utente', 'adventure', 146979).
+letto('utente', 'fantasy', 146979).
+letto('utente', 'time_travel', 146979).
+letto('utente', 'action', 96792).
+letto('utente', 'fantasy', 96792).
+letto('utente', 'historical', 96792).
+letto('utente', 'shounen', 96792).
+letto('utente', 'drama', 99314).
+letto('utente', 'seinen', 99314).
+letto('utente', 'drama', 104538).
+letto('utente', 'romance', 104538).
+letto('utente', 'romance', 121213).
+letto('utente', 'school', 121213).
+letto('utente', 'seinen', 121213).
+letto('utente', 'action', 16765).
+letto('utente', 'award_winning', 16765).
+letto('utente', 'historical', 16765).
+letto('utente', 'military', 16765).
+letto('utente', 'seinen', 16765).
+letto('utente', 'action', 131342).
+letto('utente', 'adventure', 131342).
+letto('utente', 'fantasy', 131342).
+letto('utente', 'reincarnation', 131342).
+letto('utente', 'fantasy', 80119).
+letto('utente', 'slice_of_life', 80119).
+letto('utente', 'award_winning', 56805).
+letto('utente', 'drama', 56805).
+letto('utente', 'shounen', 56805).
+letto('utente', 'award_winning', 7375).
+letto('utente', 'drama', 7375).
+letto('utente', 'psychological', 7375).
+letto('utente', 'seinen', 7375).
+letto('utente', 'sports', 7375).
+letto('utente', 'award_winning', 99007).
+letto('utente', 'comedy', 99007).
+letto('utente', 'school', 99007).
+letto('utente', 'shounen', 99007).
+letto('utente', 'action', 116772).
+letto('utente', 'adventure', 116772).
+letto('utente', 'comedy', 116772).
+letto('utente', 'fantasy', 116772).
+letto('utente', 'isekai', 116772).
+letto('utente', 'shounen', 116772).
+letto('utente', 'action', 153492).
+letto('utente', 'comedy', 153492).
+letto('utente', 'seinen', 153492).
+letto('utente', 'comedy', 138703).
+letto('utente', 'romance', 138703).
+letto('utente', 'school', 138703).
+letto('utente', 'action', 42579).
+letto('utente', 'adventure', 42579).
+letto('utente', 'comedy', 42579).
+letto('utente', 'fantasy', 42579).
+letto('utente', 'romance', 42579).
+letto('utente', 'fantasy', 128093).
+letto('utente', 'romance', 128093).
+letto('utente', 'shounen', 128093).
+letto('utente', 'comedy', 144453).
+letto('utente', 'slice_of_life', 144453).
+letto('utente', 'childcare', 121615).
+letto('utente', 'organized_crime', 121615).
+letto('utente', 'slice_of_life', 121615).
+letto('utente', 'action', 95012).
+letto('utente', 'adventure', 95012).
+letto('utente', 'comedy', 95012).
+letto('utente', 'fantasy', 95012).
+letto('utente', 'isekai', 95012).
+letto('utente', 'reincarnation', 95012).
+letto('utente', 'comedy', 136979).
+letto('utente', 'love_status_quo', 136979).
+letto('utente', 'romance', 136979).
+letto('utente', 'school', 136979).
+letto('utente', 'shounen', 136979).
+letto('utente', 'action', 3866).
+letto('utente', 'fantasy', 3866).
+letto('utente', 'historical', 3866).
+letto('utente', 'mystery', 3866).
+letto('utente', 'mythology', 3866).
+letto('utente', 'shounen', 3866).
+letto('utente', 'supernatural', 3866).
+letto('utente', 'comedy', 96050).
+letto('utente', 'romance', 96050).
+letto('utente', 'school', 96050).
+letto('utente', 'shounen', 96050).
+letto('utente', 'fantasy', 117549).
+letto('utente', 'iyashikei', 117549).
+letto('utente', 'slice_of_life', 117549).
+letto('utente', 'urban_fantasy', 117549).
+letto('utente', 'action', 156825).
+letto('utente', 'adventure', 156825).
+letto('utente', 'fantasy', 156825).
+letto('utente', 'action', 146982).
+letto('utente', 'adventure', 146982).
+letto('utente', 'fantasy', 146982).
+letto('utente', 'isekai', 146982).
+letto('utente', 'action', 150784).
+letto('utente', 'fantasy', 150784).
+letto('utente', 'martial_arts', 150784).
+letto('utente', 'action', 171243).
+letto('utente', 'adventure', 171243).
+letto('utente', 'fantasy', 171243).
+letto('utente', 'harem', 171243).
+letto('utente', 'action', 148009).
+letto('utente', 'adventure', 148009).
+letto('utente', 'fantasy', 148009).
+letto('utente', 'time_travel', 148009).
+letto('utente', 'action', 147460).
+letto('utente', 'fantasy', 147460).
+letto('utente', 'isekai', 147460).
+letto('utente', 'martial_arts', 147460).
+letto('utente', 'action', 148137).
+letto('utente', 'fantasy', 148137).
+letto('utente', 'survival', 148137).
+letto('utente', 'anthropomorphic', 147981).
+letto('utente', 'fantasy', 147981).
+letto('utente', 'romance', 147981).
+letto('utente', 'action', 147389).
+letto('utente', 'adventure', 147389).
+letto('utente', 'fantasy', 147389).
+letto('utente', 'martial_arts', 147389).
+letto('utente', 'drama', 138673).
+letto('utente', 'shounen', 138673).
+letto('utente', 'action', 111202).
+letto('utente', 'comedy', 111202).
+letto('utente', 'drama', 111202).
+letto('utente', 'school', 111202).
+letto('utente', 'supernatural', 111202).
+letto('utente', 'fantasy', 132500).
+letto('utente', 'romance', 132500).
+letto('utente', 'time_travel', 132500).
+letto('utente', 'fantasy', 147317).
+letto('utente', 'isekai', 147317).
+letto('utente', 'reincarnation', 147317).
+letto('utente', 'adventure', 119152).
+letto('utente', 'fantasy', 119152).
+letto('utente', 'isekai', 119152).
+letto('utente', 'romance', 119152).
+letto('utente', 'adventure', 91941).
+letto('utente', 'drama', 91941).
+letto('utente', 'fantasy', 91941).
+letto('utente', 'sci-fi', 91941).
+letto('utente', 'adventure', 14790).
+letto('utente', 'award_winning', 14790).
+letto('utente', 'fantasy', 14790).
+letto('utente', 'shounen', 14790).
+letto('utente', 'drama', 61189).
+letto('utente', 'fantasy', 61189).
+letto('utente', 'mythology', 61189).
+letto('utente', 'romance', 61189).
+letto('utente', 'shounen', 61189).
+letto('utente', 'urban_fantasy', 61189).
+letto('utente', 'adventure', 160056).
+letto('utente', 'fantasy', 160056).
+letto('utente', 'comedy', 104241).
+letto('utente', 'fantasy', 104241).
+letto('utente', 'shounen', 104241).
+letto('utente', 'detective', 1415).
+letto('utente', 'horror', 1415).
+letto('utente', 'mystery', 1415).
+letto('utente', 'seinen', 1415).
+letto('utente', 'action', 13387).
+letto('utente', 'drama', 13387).
+letto('utente', 'fantasy', 13387).
+letto('utente', 'horror', 13387).
+letto('utente', 'seinen', 13387).
+letto('utente', 'supernatural', 13387).
+letto('utente', 'action', 124085).
+letto('utente', 'comedy', 124085).
+letto('utente', 'fantasy', 124085).
+letto('utente', 'gag_humor', 124085).
+letto('utente', 'parody', 124085).
+letto('utente', 'school', 124085).
+letto('utente', 'shounen', 124085).
+letto('utente', 'action', 3579).
+letto('utente', 'comedy', 3579).
+letto('utente', 'fantasy', 3579).
+letto('utente', 'mystery', 3579).
+letto('utente', 'psychological', 3579).
+letto('utente', 'shounen', 3579).
+letto('utente', 'supernatural', 3579).
+letto('utente', 'adult_cast', 848).
+letto('utente', 'adventure', 848).
+letto('utente', 'drama', 848).
+letto('utente', 'historical', 848).
+letto('utente', 'military', 848).
+letto('utente', 'mystery', 848).
+letto('utente', 'seinen', 848).
+letto('utente', 'slice_of_life', 848).
+letto('utente', 'action', 147820).
+letto('utente', 'fantasy', 147820).
+letto('utente', 'isekai', 147820).
+letto('utente', 'martial_arts', 147820).
+letto('utente', 'villainess', 147820).
+letto('utente', 'action', 147455).
+letto('utente', 'martial_arts', 147455).
+letto('utente', 'drama', 110160).
+letto('utente', 'adult_cast', 147712).
+letto('utente', 'comedy', 147712).
+letto('utente', 'romance', 147712).
+letto('utente', 'action', 5711).
+letto('utente', 'award_winning', 5711).
+letto('utente', 'drama', 5711).
+letto('utente', 'shounen', 5711).
+letto('utente', 'adult_cast', 105877).
+letto('utente', 'drama', 105877).
+letto('utente', 'romance', 105877).
+letto('utente', 'seinen', 105877).
+letto('utente', 'horror', 104440).
+letto('utente', 'seinen', 104440).
+letto('utente', 'adult_cast', 1).
+letto('utente', 'award_winning', 1).
+letto('utente', 'drama', 1).
+letto('utente', 'mystery', 1).
+letto('utente', 'psychological', 1).
+letto('utente', 'seinen', 1).
+letto('utente', 'action', 129808).
+letto('utente', 'adventure', 129808).
+letto('utente', 'fantasy', 129808).
+letto('utente', 'magical_sex_shift', 129808).
+letto('utente', 'action', 149141).
+letto('utente', 'adventure', 149141).
+letto('utente', 'fantasy', 149141).
+letto('utente', 'comedy', 124471).
+letto('utente', 'drama', 124471).
+letto('utente', 'sci-fi', 124471).
+letto('utente', 'space', 124471).
+letto('utente', 'drama', 147941).
+letto('utente', 'memoir', 147941).
+letto('utente', 'seinen', 147941).
+letto('utente', 'action', 658).
+letto('utente', 'adventure', 658).
+letto('utente', 'drama', 658).
+letto('utente', 'historical', 658).
+letto('utente', 'martial_arts', 658).
+letto('utente', 'samurai', 658).
+letto('utente', 'seinen', 658).
+letto('utente', 'supernatural', 658).
+letto('utente', 'action', 147642).
+letto('utente', 'adventure', 147642).
+letto('utente', 'fantasy', 147642).
+letto('utente', 'martial_arts', 147642).
+letto('utente', 'time_travel', 147642).
+letto('utente', 'video_game', 147642).
+letto('utente', 'adult_cast', 418).
+letto('utente', 'award_winning', 418).
+letto('utente', 'fantasy', 418).
+letto('utente', 'historical', 418).
+letto('utente', 'iyashikei', 418).
+letto('utente', 'mystery', 418).
+letto('utente', 'seinen', 418).
+letto('utente', 'supernatural', 418).
+letto('utente', 'fantasy', 70259).
+letto('utente', 'isekai', 70259).
+letto('utente', 'reincarnation', 70259).
+letto('utente', 'seinen', 70259).
+letto('utente', 'action', 149438).
+letto('utente', 'fantasy', 149438).
+letto('utente', 'reincarnation', 149438).
+letto('utente', 'adult_cast', 148733).
+letto('utente', 'romance', 148733).
+letto('utente', 'workplace', 148733).
+letto('utente', 'action', 148620).
+letto('utente', 'comedy', 148620).
+letto('utente', 'fantasy', 148620).
+letto('utente', 'action', 150203).
+letto('utente', 'childcare', 150203).
+letto('utente', 'fantasy', 150203).
+letto('utente', 'time_travel', 150203).
+letto('utente', 'action', 151111).
+letto('utente', 'school', 151111).
+letto('utente', 'super_power', 151111).
+letto('utente', 'fantasy', 143627).
+letto('utente', 'romance', 143627).
+letto('utente', 'drama', 108032).
+letto('utente', 'seinen', 108032).
+letto('utente', 'suspense', 108032).
+letto('utente', 'action', 147073).
+letto('utente', 'drama', 147073).
+letto('utente', 'school', 147073).
+letto('utente', 'time_travel', 147073).
+letto('utente', 'action', 148958).
+letto('utente', 'fantasy', 148958).
+letto('utente', 'drama', 151757).
+letto('utente', 'historical', 151757).
+letto('utente', 'reincarnation', 151757).
+letto('utente', 'time_travel', 151757).
+letto('utente', 'action', 147202).
+letto('utente', 'adventure', 147202).
+letto('utente', 'fantasy', 147202).
+letto('utente', 'time_travel', 147202).
+letto('utente', 'action', 150561).
+letto('utente', 'fantasy', 150561).
+letto('utente', 'comedy', 138533).
+letto('utente', 'school', 138533).
+letto('utente', 'adult_cast', 28).
+letto('utente', 'award_winning', 28).
+letto('utente', 'drama', 28).
+letto('utente', 'love_polygon', 28).
+letto('utente', 'music', 28).
+letto('utente', 'romance', 28).
+letto('utente', 'shoujo', 28).
+letto('utente', 'action', 44485).
+letto('utente', 'adventure', 44485).
+letto('utente', 'award_winning', 44485).
+letto('utente', 'fantasy', 44485).
+letto('utente', 'shounen', 44485).
+letto('utente', 'action', 147863).
+letto('utente', 'adventure', 147863).
+letto('utente', 'fantasy', 147863).
+letto('utente', 'martial_arts', 147863).
+letto('utente', 'sci-fi', 147863).
+letto('utente', 'drama', 112245).
+letto('utente', 'performing_arts', 112245).
+letto('utente', 'seinen', 102458).
+letto('utente', 'slice_of_life', 102458).
+letto('utente', 'comedy', 141226).
+letto('utente', 'romance', 141226).
+letto('utente', 'supernatural', 141226).
+letto('utente', 'anthropomorphic', 18753).
+letto('utente', 'comedy', 18753).
+letto('utente', 'seinen', 18753).
+letto('utente', 'comedy', 159130).
+letto('utente', 'gag_humor', 159130).
+letto('utente', 'seinen', 159130).
+letto('utente', 'comedy', 119084).
+letto('utente', 'fantasy', 119084).
+letto('utente', 'isekai', 119084).
+letto('utente', 'comedy', 39291).
+letto('utente', 'romance', 39291).
+letto('utente', 'school', 39291).
+letto('utente', 'shoujo', 39291).
+letto('utente', 'drama', 13290).
+letto('utente', 'historical', 13290).
+letto('utente', 'psychological', 13290).
+letto('utente', 'seinen', 13290).
+letto('utente', 'action', 123065).
+letto('utente', 'adventure', 123065).
+letto('utente', 'fantasy', 123065).
+letto('utente', 'isekai', 123065).
+letto('utente', 'reincarnation', 123065).
+letto('utente', 'seinen', 123065).
+letto('utente', 'action', 122775).
+letto('utente', 'adventure', 122775).
+letto('utente', 'fantasy', 122775).
+letto('utente', 'isekai', 122775).
+letto('utente', 'reincarnation', 122775).
+letto('utente', 'action', 90423).
+letto('utente', 'sci-fi', 90423).
+letto('utente', 'seinen', 90423).
+letto('utente', 'school', 147769).
+letto('utente', 'slice_of_life', 147769).
+letto('utente', 'action', 29983).
+letto('utente', 'adventure', 29983).
+letto('utente', 'comedy', 29983).
+letto('utente', 'school', 29983).
+letto('utente', 'supernatural', 29983).
+letto('utente', 'drama', 12569).
+letto('utente', 'seinen', 12569).
+letto('utente', 'slice_of_life', 12569).
+letto('utente', 'anthropomorphic', 163356).
+letto('utente', 'fantasy', 163356).
+letto('utente', 'love_status_quo', 163356).
+letto('utente', 'romance', 163356).
+letto('utente', 'school', 163356).
+letto('utente', 'shounen', 163356).
+letto('utente', 'urban_fantasy', 163356).
+letto('utente', 'pets', 112774).
+letto('utente', 'slice_of_life', 112774).
+letto('utente', 'comedy', 114121).
+letto('utente', 'fantasy', 140520).
+letto('utente', 'action', 132214).
+letto('utente', 'adventure', 132214).
+letto('utente', 'fantasy', 132214).
+letto('utente', 'urban_fantasy', 132214).
+letto('utente', 'action', 143441).
+letto('utente', 'adventure', 143441).
+letto('utente', 'fantasy', 143441).
+letto('utente', 'urban_fantasy', 143441).
+letto('utente', 'drama', 17465).
+letto('utente', 'seinen', 17465).
+letto('utente', 'horror', 164732).
+letto('utente', 'psychological', 164732).
+letto('utente', 'seinen', 164732).
+letto('utente', 'drama', 8967).
+letto('utente', 'psychological', 8967).
+letto('utente', 'school', 8967).
+letto('utente', 'survival', 156716).
+letto('utente', 'suspense', 156716).
+letto('utente', 'action', 13).
+letto('utente', 'adventure', 13).
+letto('utente', 'fantasy', 13).
+letto('utente', 'shounen', 13).
+letto('utente', 'action', 145980).
+letto('utente', 'adventure', 145980).
+letto('utente', 'fantasy', 145980).
+letto('utente', 'action', 44347).
+letto('utente', 'comedy', 44347).
+letto('utente', 'parody', 44347).
+letto('utente', 'seinen', 44347).
+letto('utente', 'super_power', 44347).
+letto('utente', 'cgdct', 112592).
+letto('utente', 'comedy', 112592).
+letto('utente', 'magical_sex_shift', 112592).
+letto('utente', 'adult_cast', 3299).
+letto('utente', 'adventure', 3299).
+letto('utente', 'drama', 3299).
+letto('utente', 'fantasy', 3299).
+letto('utente', 'historical', 3299).
+letto('utente', 'romance', 3299).
+letto('utente', 'seinen', 3299).
+letto('utente', 'supernatural', 3299).
+letto('utente', 'action', 121083).
+letto('utente', 'adventure', 121083).
+letto('utente', 'fantasy', 121083).
+letto('utente', 'isekai', 121083).
+letto('utente', 'drama', 35573).
+letto('utente', 'love_polygon', 35573).
+letto('utente', 'romance', 35573).
+letto('utente', 'school', 35573).
+letto('utente', 'sci-fi', 35573).
+letto('utente', 'shoujo', 35573).
+letto('utente', 'time_travel', 35573).
+letto('utente', 'drama', 1211).
+letto('utente', 'historical', 1211).
+letto('utente', 'horror', 1211).
+letto('utente', 'psychological', 1211).
+letto('utente', 'seinen', 1211).
+letto('utente', 'award_winning', 11514).
+letto('utente', 'historical', 11514).
+letto('utente', 'romance', 11514).
+letto('utente', 'seinen', 11514).
+letto('utente', 'crossdressing', 123397).
+letto('utente', 'drama', 123397).
+letto('utente', 'fantasy', 123397).
+letto('utente', 'romance', 123397).
+letto('utente', 'shoujo', 123397).
+letto('utente', 'action', 147727).
+letto('utente', 'fantasy', 147727).
+letto('utente', 'video_game', 147727).
+letto('utente', 'action', 81667).
+letto('utente', 'fantasy', 81667).
+letto('utente', 'isekai', 81667).
+letto('utente', 'drama', 4632).
+letto('utente', 'psychological', 4632).
+letto('utente', 'seinen', 4632).
+letto('utente', 'slice_of_life', 4632).
+letto('utente', 'adventure', 3031).
+letto('utente', 'fantasy', 3031).
+letto('utente', 'mystery', 3031).
+letto('utente', 'shounen', 3031).
+letto('utente', 'action', 154587).
+letto('utente', 'fantasy', 154587).
+letto('utente', 'isekai', 154587).
+letto('utente', 'video_game', 154587).
+letto('utente', 'horror', 146750).
+letto('utente', 'psychological', 146750).
+letto('utente', 'survival', 146750).
+letto('utente', 'suspense', 146750).
+letto('utente', 'drama', 5744).
+letto('utente', 'seinen', 5744).
+letto('utente', 'sports', 5744).
+letto('utente', 'adult_cast', 481).
+letto('utente', 'award_winning', 481).
+letto('utente', 'drama', 481).
+letto('utente', 'psychological', 481).
+letto('utente', 'sci-fi', 481).
+letto('utente', 'seinen', 481).
+letto('utente', 'slice_of_life', 481).
+letto('utente', 'space', 481).
+letto('utente', 'workplace', 481).
+letto('utente', 'action', 149871).
+letto('utente', 'adventure', 149871).
+letto('utente', 'fantasy', 149871).
+letto('utente', 'isekai', 149871).
+letto('utente', 'action', 745).
+letto('utente', 'award_winning', 745).
+letto('utente', 'detective', 745).
+letto('utente', 'mystery', 745).
+letto('utente', 'psychological', 745).
+letto('utente', 'sci-fi', 745).
+letto('utente', 'seinen', 745).
+letto('utente', 'suspense', 745).
+letto('utente', 'comedy', 119260).
+letto('utente', 'romance', 119260).
+letto('utente', 'school', 119260).
+letto('utente', 'shounen', 119260).
+letto('utente', 'action', 3438).
+letto('utente', 'adventure', 3438).
+letto('utente', 'high_stakes_game', 3438).
+letto('utente', 'psychological', 3438).
+letto('utente', 'romance', 3438).
+letto('utente', 'sci-fi', 3438).
+letto('utente', 'shounen', 3438).
+letto('utente', 'strategy_game', 3438).
+letto('utente', 'super_power', 3438).
+letto('utente', 'supernatural', 3438).
+letto('utente', 'action', 106733).
+letto('utente', 'fantasy', 106733).
+letto('utente', 'shounen', 106733).
+letto('utente', 'award_winning', 7482).
+letto('utente', 'delinquents', 7482).
+letto('utente', 'drama', 7482).
+letto('utente', 'historical', 7482).
+letto('utente', 'psychological', 7482).
+letto('utente', 'seinen', 7482).
+letto('utente', 'organized_crime', 109229).
+letto('utente', 'romance', 109229).
+letto('utente', 'seinen', 109229).
+letto('utente', 'drama', 22986).
+letto('utente', 'fantasy', 22986).
+letto('utente', 'romance', 22986).
+letto('utente', 'seinen', 22986).
+letto('utente', 'supernatural', 22986).
+letto('utente', 'action', 146774).
+letto('utente', 'drama', 146774).
+letto('utente', 'school', 146774).
+letto('utente', 'action', 73271).
+letto('utente', 'adventure', 73271).
+letto('utente', 'fantasy', 73271).
+letto('utente', 'isekai', 73271).
+letto('utente', 'reincarnation', 73271).
+letto('utente', 'award_winning', 657).
+letto('utente', 'drama', 657).
+letto('utente', 'psychological', 657).
+letto('utente', 'seinen', 657).
+letto('utente', 'sports', 657).
+letto('utente', 'team_sports', 657).
+letto('utente', 'action', 151157).
+letto('utente', 'school', 151157).
+letto('utente', 'supernatural', 151157).
+letto('utente', 'action', 147924).
+letto('utente', 'martial_arts', 147924).
+letto('utente', 'reincarnation', 147924).
+letto('utente', 'action', 181605).
+letto('utente', 'drama', 181605).
+letto('utente', 'action', 148512).
+letto('utente', 'martial_arts', 148512).
+letto('utente', 'reincarnation', 148512).
+letto('utente', 'action', 168981).
+letto('utente', 'fantasy', 168981).
+letto('utente', 'martial_arts', 168981).
+letto('utente', 'reincarnation', 168981).
+letto('utente', 'action', 161442).
+letto('utente', 'adult_cast', 161442).
+letto('utente', 'fantasy', 161442).
+letto('utente', 'isekai', 161442).
+letto('utente', 'comedy', 78523).
+letto('utente', 'drama', 78523).
+letto('utente', 'romance', 78523).
+letto('utente', 'school', 78523).
+letto('utente', 'slice_of_life', 78523).
+letto('utente', 'action', 158010).
+letto('utente', 'organized_crime', 158010).
+letto('utente', 'reincarnation', 158010).
+letto('utente', 'action', 146878).
+letto('utente', 'adventure', 146878).
+letto('utente', 'fantasy', 146878).
+letto('utente', 'martial_arts', 146878).
+letto('utente', 'reincarnation', 146878).
+letto('utente', 'action', 147577).
+letto('utente', 'martial_arts', 147577).
+letto('utente', 'time_travel', 147577).
+letto('utente', 'action', 149349).
+letto('utente', 'fantasy', 149349).
+letto('utente', 'martial_arts', 149349).
+letto('utente', 'action', 153399).
+letto('utente', 'fantasy', 153399).
+letto('utente', 'martial_arts', 153399).
+letto('utente', 'action', 152612).
+letto('utente', 'fantasy', 152612).
+letto('utente', 'isekai', 152612).
+letto('utente', 'time_travel', 152612).
+letto('utente', 'action', 157888).
+letto('utente', 'fantasy', 157888).
+letto('utente', 'time_travel', 157888).
+letto('utente', 'action', 148002).
+letto('utente', 'reincarnation', 148002).
+letto('utente', 'supernatural', 148002).
+letto('utente', 'combat_sports', 78477).
+letto('utente', 'drama', 78477).
+letto('utente', 'seinen', 78477).
+letto('utente', 'sports', 78477).
+letto('utente', 'action', 148729).
+letto('utente', 'supernatural', 148729).
+letto('utente', 'drama', 148511).
+letto('utente', 'gourmet', 148511).
+letto('utente', 'comedy', 915).
+letto('utente', 'delinquents', 915).
+letto('utente', 'drama', 915).
+letto('utente', 'school', 915).
+letto('utente', 'shounen', 915).
+letto('utente', 'slice_of_life', 915).
+letto('utente', 'sports', 915).
+letto('utente', 'team_sports', 915).
+letto('utente', 'detective', 104298).
+letto('utente', 'mystery', 104298).
+letto('utente', 'shounen', 104298).
+letto('utente', 'suspense', 104298).
+letto('utente', 'school', 148054).
+letto('utente', 'shounen', 148054).
+letto('utente', 'slice_of_life', 148054).
+letto('utente', 'supernatural', 148054).
+letto('utente', 'action', 109339).
+letto('utente', 'adventure', 109339).
+letto('utente', 'fantasy', 109339).
+letto('utente', 'isekai', 109339).
+letto('utente', 'reincarnation', 109339).
+letto('utente', 'comedy', 37755).
+letto('utente', 'gag_humor', 37755).
+letto('utente', 'school', 37755).
+letto('utente', 'shounen', 37755).
+letto('utente', 'super_power', 37755).
+letto('utente', 'supernatural', 37755).
+letto('utente', 'action', 3575).
+letto('utente', 'comedy', 3575).
+letto('utente', 'delinquents', 3575).
+letto('utente', 'drama', 3575).
+letto('utente', 'psychological', 3575).
+letto('utente', 'seinen', 3575).
+letto('utente', 'suspense', 3575).
+letto('utente', 'adventure', 116701).
+letto('utente', 'fantasy', 116701).
+letto('utente', 'isekai', 116701).
+letto('utente', 'reincarnation', 116701).
+letto('utente', 'adventure', 159741).
+letto('utente', 'fantasy', 159741).
+letto('utente', 'isekai', 159741).
+letto('utente', 'reincarnation', 159741).
+letto('utente', 'video_game', 159741).
+letto('utente', 'action', 131334).
+letto('utente', 'comedy', 131334).
+letto('utente', 'shounen', 131334).
+letto('utente', 'comedy', 48649).
+letto('utente', 'gag_humor', 48649).
+letto('utente', 'school', 48649).
+letto('utente', 'seinen', 48649).
+letto('utente', 'drama', 145863).
+letto('utente', 'shounen', 145863).
+letto('utente', 'award_winning', 661).
+letto('utente', 'comedy', 661).
+letto('utente', 'gag_humor', 661).
+letto('utente', 'parody', 661).
+letto('utente', 'school', 661).
+letto('utente', 'shounen', 661).
+letto('utente', 'love_polygon', 145539).
+letto('utente', 'romance', 145539).
+letto('utente', 'comedy', 147091).
+letto('utente', 'romance', 147091).
+letto('utente', 'school', 147091).
+letto('utente', 'shounen', 147091).
+letto('utente', 'action', 1827).
+letto('utente', 'adventure', 1827).
+letto('utente', 'drama', 1827).
+letto('utente', 'fantasy', 1827).
+letto('utente', 'martial_arts', 1827).
+letto('utente', 'action', 148655).
+letto('utente', 'drama', 148655).
+letto('utente', 'psychological', 157543).
+letto('utente', 'shounen', 157543).
+letto('utente', 'suspense', 157543).
+letto('utente', 'award_winning', 37707).
+letto('utente', 'drama', 37707).
+letto('utente', 'music', 37707).
+letto('utente', 'romance', 37707).
+letto('utente', 'school', 37707).
+letto('utente', 'shounen', 37707).
+letto('utente', 'action', 3868).
+letto('utente', 'drama', 3868).
+letto('utente', 'gore', 3868).
+letto('utente', 'historical', 3868).
+letto('utente', 'martial_arts', 3868).
+letto('utente', 'samurai', 3868).
+letto('utente', 'seinen', 3868).
+letto('utente', 'school', 117851).
+letto('utente', 'slice_of_life', 117851).
+letto('utente', 'action', 23390).
+letto('utente', 'award_winning', 23390).
+letto('utente', 'drama', 23390).
+letto('utente', 'gore', 23390).
+letto('utente', 'military', 23390).
+letto('utente', 'shounen', 23390).
+letto('utente', 'survival', 23390).
+letto('utente', 'suspense', 23390).
+letto('utente', 'action', 57795).
+letto('utente', 'drama', 57795).
+letto('utente', 'fantasy', 57795).
+letto('utente', 'shounen', 57795).
+letto('utente', 'supernatural', 57795).
+letto('utente', 'action', 58007).
+letto('utente', 'shoujo', 58007).
+letto('utente', 'action', 146751).
+letto('utente', 'horror', 146751).
+letto('utente', 'psychological', 146751).
+letto('utente', 'survival', 146751).
+letto('utente', 'suspense', 146751).
+letto('utente', 'adventure', 72467).
+letto('utente', 'award_winning', 72467).
+letto('utente', 'iyashikei', 72467).
+letto('utente', 'slice_of_life', 72467).
+letto('utente', 'drama', 126699).
+letto('utente', 'psychological', 126699).
+letto('utente', 'seinen', 126699).
+letto('utente', 'action', 110485).
+letto('utente', 'fantasy', 110485).
+letto('utente', 'mythology', 110485).
+letto('utente', 'seinen', 110485).
+letto('utente', 'award_winning', 118289).
+letto('utente', 'drama', 118289).
+letto('utente', 'school', 118289).
+letto('utente', 'seinen', 118289).
+letto('utente', 'award_winning', 51).
+letto('utente', 'school', 51).
+letto('utente', 'shounen', 51).
+letto('utente', 'sports', 51).
+letto('utente', 'team_sports', 51).
+letto('utente', 'action', 154009).
+letto('utente', 'adventure', 154009).
+letto('utente', 'drama', 154009).
+letto('utente', 'fantasy', 154009).
+letto('utente', 'comedy', 110288).
+letto('utente', 'fantasy', 110288).
+letto('utente', 'isekai', 110288).
+letto('utente', 'reincarnation', 110288).
+letto('utente', 'drama', 3731).
+letto('utente', 'seinen', 3731).
+letto('utente', 'slice_of_life', 3731).
+letto('utente', 'action', 119184).
+letto('utente', 'adult_cast', 119184).
+letto('utente', 'adventure', 119184).
+letto('utente', 'fantasy', 119184).
+letto('utente', 'urban_fantasy', 119184).
+letto('utente', 'action', 121496).
+letto('utente', 'adult_cast', 121496).
+letto('utente', 'adventure', 121496).
+letto('utente', 'fantasy', 121496).
+letto('utente', 'urban_fantasy', 121496).
+letto('utente', 'action', 172429).
+letto('utente', 'adult_cast', 172429).
+letto('utente', 'adventure', 172429).
+letto('utente', 'fantasy', 172429).
+letto('utente', 'urban_fantasy', 172429).
+letto('utente', 'romance', 96573).
+letto('utente', 'school', 96573).
+letto('utente', 'otaku_culture', 112268).
+letto('utente', 'romance', 112268).
+letto('utente', 'school', 112268).
+letto('utente', 'seinen', 112268).
+letto('utente', 'adventure', 126287).
+letto('utente', 'award_winning', 126287).
+letto('utente', 'drama', 126287).
+letto('utente', 'fantasy', 126287).
+letto('utente', 'shounen', 126287).
+letto('utente', 'action', 119161).
+letto('utente', 'childcare', 119161).
+letto('utente', 'comedy', 119161).
+letto('utente', 'shounen', 119161).
+letto('utente', 'comedy', 93516).
+letto('utente', 'girls_love', 93516).
+letto('utente', 'school', 93516).
+letto('utente', 'slice_of_life', 93516).
+letto('utente', 'action', 146909).
+letto('utente', 'adventure', 146909).
+letto('utente', 'fantasy', 146909).
+letto('utente', 'time_travel', 146909).
+letto('utente', 'action', 146752).
+letto('utente', 'delinquents', 146752).
+letto('utente', 'school', 146752).
+letto('utente', 'school', 116539).
+letto('utente', 'shounen', 116539).
+letto('utente', 'strategy_game', 116539).
+letto('utente', 'mystery', 110031).
+letto('utente', 'shounen', 110031).
+letto('utente', 'supernatural', 110031).
+letto('utente', 'suspense', 110031).
+letto('utente', 'time_travel', 110031).
+letto('utente', 'action', 8848).
+letto('utente', 'comedy', 8848).
+letto('utente', 'drama', 8848).
+letto('utente', 'ecchi', 8848).
+letto('utente', 'seinen', 8848).
+letto('utente', 'adult_cast', 148467).
+letto('utente', 'love_status_quo', 148467).
+letto('utente', 'romance', 148467).
+letto('utente', 'avant_garde', 8438).
+letto('utente', 'seinen', 8438).
+letto('utente', 'action', 1533).
+letto('utente', 'adventure', 1533).
+letto('utente', 'drama', 1533).
+letto('utente', 'fantasy', 1533).
+letto('utente', 'romance', 1533).
+letto('utente', 'shounen', 1533).
+letto('utente', 'horror', 147276).
+letto('utente', 'school', 147276).
+letto('utente', 'survival', 147276).
+letto('utente', 'suspense', 147276).
+letto('utente', 'action', 124845).
+letto('utente', 'drama', 124845).
+letto('utente', 'gore', 124845).
+letto('utente', 'horror', 124845).
+letto('utente', 'suspense', 124845).
+letto('utente', 'drama', 142600).
+letto('utente', 'psychological', 142600).
+letto('utente', 'sci-fi', 142600).
+letto('utente', 'shounen', 142600).
+letto('utente', 'action', 151012).
+letto('utente', 'adventure', 151012).
+letto('utente', 'fantasy', 151012).
+letto('utente', 'martial_arts', 151012).
+letto('utente', 'action', 146966).
+letto('utente', 'school', 146966).
+letto('utente', 'adult_cast', 153158).
+letto('utente', 'romance', 153158).
+letto('utente', 'seinen', 153158).
+letto('utente', 'action', 72451).
+letto('utente', 'adventure', 72451).
+letto('utente', 'drama', 72451).
+letto('utente', 'fantasy', 72451).
+letto('utente', 'seinen', 72451).
+letto('utente', 'adventure', 111745).
+letto('utente', 'mystery', 111745).
+letto('utente', 'sci-fi', 111745).
+letto('utente', 'seinen', 111745).
+letto('utente', 'adventure', 168656).
+letto('utente', 'childcare', 168656).
+letto('utente', 'fantasy', 168656).
+letto('utente', 'isekai', 168656).
+letto('utente', 'action', 113178).
+letto('utente', 'adventure', 113178).
+letto('utente', 'fantasy', 113178).
+letto('utente', 'isekai', 113178).
+letto('utente', 'reincarnation', 113178).
+letto('utente', 'award_winning', 87609).
+letto('utente', 'fantasy', 87609).
+letto('utente', 'isekai', 87609).
+letto('utente', 'reincarnation', 87609).
+letto('utente', 'shounen', 87609).
+letto('utente', 'action', 11366).
+letto('utente', 'combat_sports', 11366).
+letto('utente', 'drama', 11366).
+letto('utente', 'psychological', 11366).
+letto('utente', 'seinen', 11366).
+letto('utente', 'sports', 11366).
+letto('utente', 'action', 37563).
+letto('utente', 'gore', 37563).
+letto('utente', 'horror', 37563).
+letto('utente', 'sci-fi', 37563).
+letto('utente', 'seinen', 37563).
+letto('utente', 'survival', 37563).
+letto('utente', 'action', 148850).
+letto('utente', 'supernatural', 148850).
+letto('utente', 'action', 162700).
+letto('utente', 'fantasy', 162700).
+letto('utente', 'time_travel', 162700).
+letto('utente', 'adventure', 165031).
+letto('utente', 'fantasy', 165031).
+letto('utente', 'isekai', 165031).
+letto('utente', 'reincarnation', 165031).
+letto('utente', 'action', 147693).
+letto('utente', 'adventure', 147693).
+letto('utente', 'fantasy', 147693).
+letto('utente', 'reincarnation', 147693).
+letto('utente', 'fantasy', 155284).
+letto('utente', 'time_travel', 155284).
+letto('utente', 'villainess', 155284).
+letto('utente', 'combat_sports', 141120).
+letto('utente', 'drama', 141120).
+letto('utente', 'sports', 141120).
+letto('utente', 'action', 8586).
+letto('utente', 'comedy', 8586).
+letto('utente', 'drama', 8586).
+letto('utente', 'martial_arts', 8586).
+letto('utente', 'school', 8586).
+letto('utente', 'action', 22651).
+letto('utente', 'comedy', 22651).
+letto('utente', 'drama', 22651).
+letto('utente', 'martial_arts', 22651).
+letto('utente', 'romance', 22651).
+letto('utente', 'school', 22651).
+letto('utente', 'action', 147569).
+letto('utente', 'fantasy', 147569).
+letto('utente', 'urban_fantasy', 147569).
+letto('utente', 'action', 173090).
+letto('utente', 'fantasy', 173090).
+letto('utente', 'martial_arts', 173090).
+letto('utente', 'reincarnation', 173090).
+letto('utente', 'action', 157232).
+letto('utente', 'fantasy', 157232).
+letto('utente', 'military', 157232).
+letto('utente', 'drama', 148421).
+letto('utente', 'historical', 148421).
+letto('utente', 'medical', 148421).
+letto('utente', 'reincarnation', 148421).
+letto('utente', 'time_travel', 148421).
+letto('utente', 'action', 147489).
+letto('utente', 'fantasy', 147489).
+letto('utente', 'isekai', 147489).
+letto('utente', 'action', 152195).
+letto('utente', 'fantasy', 152195).
+letto('utente', 'time_travel', 152195).
+letto('utente', 'adult_cast', 87844).
+letto('utente', 'award_winning', 87844).
+letto('utente', 'comedy', 87844).
+letto('utente', 'organized_crime', 87844).
+letto('utente', 'seinen', 87844).
+letto('utente', 'suspense', 87844).
+letto('utente', 'action', 146787).
+letto('utente', 'fantasy', 146787).
+letto('utente', 'school', 146787).
+letto('utente', 'action', 111996).
+letto('utente', 'adventure', 111996).
+letto('utente', 'fantasy', 111996).
+letto('utente', 'martial_arts', 111996).
+letto('utente', 'urban_fantasy', 111996).
+letto('utente', 'action', 148454).
+letto('utente', 'fantasy', 148454).
+letto('utente', 'martial_arts', 148454).
+letto('utente', 'reincarnation', 148454).
+letto('utente', 'adventure', 147272).
+letto('utente', 'comedy', 147272).
+letto('utente', 'fantasy', 147272).
+letto('utente', 'isekai', 147272).
+letto('utente', 'reincarnation', 147272).
+letto('utente', 'action', 150455).
+letto('utente', 'fantasy', 150455).
+letto('utente', 'reincarnation', 150455).
+letto('utente', 'time_travel', 150455).
+letto('utente', 'adventure', 125036).
+letto('utente', 'drama', 125036).
+letto('utente', 'psychological', 125036).
+letto('utente', 'action', 154692).
+letto('utente', 'adventure', 154692).
+letto('utente', 'fantasy', 154692).
+letto('utente', 'action', 159140).
+letto('utente', 'fantasy', 159140).
+letto('utente', 'action', 170427).
+letto('utente', 'fantasy', 170427).
+letto('utente', 'time_travel', 170427).
+letto('utente', 'action', 146827).
+letto('utente', 'fantasy', 146827).
+letto('utente', 'action', 134744).
+letto('utente', 'adventure', 134744).
+letto('utente', 'fantasy', 134744).
+letto('utente', 'martial_arts', 134744).
+letto('utente', 'action', 147536).
+letto('utente', 'adventure', 147536).
+letto('utente', 'fantasy', 147536).
+letto('utente', 'video_game', 147536).
+letto('utente', 'action', 148679).
+letto('utente', 'adventure', 148679).
+letto('utente', 'fantasy', 148679).
+letto('utente', 'time_travel', 148679).
+letto('utente', 'action', 147322).
+letto('utente', 'adventure', 147322).
+letto('utente', 'fantasy', 147322).
+letto('utente', 'action', 153509).
+letto('utente', 'fantasy', 153509).
+letto('utente', 'martial_arts', 153509).
+letto('utente', 'action', 148985).
+letto('utente', 'fantasy', 148985).
+letto('utente', 'isekai', 148985).
+letto('utente', 'reincarnation', 148985).
+letto('utente', 'school', 148985).
+letto('utente', 'combat_sports', 165038).
+letto('utente', 'reincarnation', 165038).
+letto('utente', 'sports', 165038).
+letto('utente', 'action', 1320).
+letto('utente', 'adventure', 1320).
+letto('utente', 'historical', 1320).
+letto('utente', 'military', 1320).
+letto('utente', 'action', 150422).
+letto('utente', 'fantasy', 150422).
+letto('utente', 'martial_arts', 150422).
+letto('utente', 'horror', 149305).
+letto('utente', 'action', 174559).
+letto('utente', 'fantasy', 174559).
+letto('utente', 'time_travel', 174559).
+letto('utente', 'action', 149013).
+letto('utente', 'fantasy', 149013).
+letto('utente', 'action', 180758).
+letto('utente', 'fantasy', 180758).
+letto('utente', 'urban_fantasy', 180758).
+letto('utente', 'action', 146761).
+letto('utente', 'adventure', 146761).
+letto('utente', 'fantasy', 146761).
+letto('utente', 'time_travel', 146761).
+letto('utente', 'action', 150546).
+letto('utente', 'fantasy', 150546).
+letto('utente', 'video_game', 150546).
+letto('utente', 'action', 149572).
+letto('utente', 'fantasy', 149572).
+letto('utente', 'martial_arts', 149572).
+letto('utente', 'action', 148961).
+letto('utente', 'super_power', 148961).
+letto('utente', 'action', 146949).
+letto('utente', 'adventure', 146949).
+letto('utente', 'fantasy', 146949).
+letto('utente', 'action', 162696).
+letto('utente', 'fantasy', 162696).
+letto('utente', 'martial_arts', 162696).
+letto('utente', 'action', 146856).
+letto('utente', 'fantasy', 146856).
+letto('utente', 'isekai', 146856).
+letto('utente', 'survival', 146856).
+letto('utente', 'action', 147217).
+letto('utente', 'fantasy', 147217).
+letto('utente', 'psychological', 1408).
+letto('utente', 'seinen', 1408).
+letto('utente', 'award_winning', 20647).
+letto('utente', 'comedy', 20647).
+letto('utente', 'historical', 20647).
+letto('utente', 'seinen', 20647).
+letto('utente', 'time_travel', 20647).
+letto('utente', 'drama', 109773).
+letto('utente', 'mystery', 109773).
+letto('utente', 'seinen', 109773).
+letto('utente', 'drama', 155755).
+letto('utente', 'supernatural', 155755).
+letto('utente', 'time_travel', 155755).
+letto('utente', 'action', 3159).
+letto('utente', 'drama', 3159).
+letto('utente', 'shounen', 3159).
+letto('utente', 'action', 148139).
+letto('utente', 'drama', 148139).
+letto('utente', 'adult_cast', 3572).
+letto('utente', 'award_winning', 3572).
+letto('utente', 'drama', 3572).
+letto('utente', 'high_stakes_game', 3572).
+letto('utente', 'seinen', 3572).
+letto('utente', 'strategy_game', 3572).
+letto('utente', 'drama', 102165).
+letto('utente', 'romance', 102165).
+letto('utente', 'school', 102165).
+letto('utente', 'shounen', 102165).
+letto('utente', 'comedy', 149334).
+letto('utente', 'romance', 149334).
+letto('utente', 'school', 149334).
+letto('utente', 'action', 33327).
+letto('utente', 'fantasy', 33327).
+letto('utente', 'gore', 33327).
+letto('utente', 'horror', 33327).
+letto('utente', 'psychological', 33327).
+letto('utente', 'seinen', 33327).
+letto('utente', 'urban_fantasy', 33327).
+letto('utente', 'comedy', 69879).
+letto('utente', 'fantasy', 69879).
+letto('utente', 'mystery', 69879).
+letto('utente', 'seinen', 69879).
+letto('utente', 'supernatural', 69879).
+letto('utente', 'action', 130216).
+letto('utente', 'adventure', 130216).
+letto('utente', 'fantasy', 130216).
+letto('utente', 'time_travel', 130216).
+letto('utente', 'drama', 912).
+letto('utente', 'gore', 912).
+letto('utente', 'horror', 912).
+letto('utente', 'shoujo', 912).
+letto('utente', 'supernatural', 912).
+letto('utente', 'comedy', 92149).
+letto('utente', 'romance', 92149).
+letto('utente', 'school', 92149).
+letto('utente', 'adventure', 105747).
+letto('utente', 'comedy', 105747).
+letto('utente', 'fantasy', 105747).
+letto('utente', 'gourmet', 105747).
+letto('utente', 'isekai', 105747).
+letto('utente', 'fantasy', 100035).
+letto('utente', 'seinen', 100035).
+letto('utente', 'comedy', 124154).
+letto('utente', 'fantasy', 110771).
+letto('utente', 'seinen', 110771).
+letto('utente', 'fantasy', 93972).
+letto('utente', 'shounen', 93972).
+letto('utente', 'action', 122663).
+letto('utente', 'adventure', 122663).
+letto('utente', 'drama', 122663).
+letto('utente', 'fantasy', 122663).
+letto('utente', 'mystery', 122663).
+letto('utente', 'action', 703).
+letto('utente', 'adult_cast', 703).
+letto('utente', 'adventure', 703).
+letto('utente', 'comedy', 703).
+letto('utente', 'sci-fi', 703).
+letto('utente', 'shounen', 703).
+letto('utente', 'action', 704).
+letto('utente', 'adult_cast', 704).
+letto('utente', 'adventure', 704).
+letto('utente', 'award_winning', 704).
+letto('utente', 'comedy', 704).
+letto('utente', 'drama', 704).
+letto('utente', 'sci-fi', 704).
+letto('utente', 'seinen', 704).
+letto('utente', 'action', 131924).
+letto('utente', 'fantasy', 131924).
+letto('utente', 'school', 131924).
+letto('utente', 'shounen', 131924).
+letto('utente', 'action', 181465).
+letto('utente', 'fantasy', 181465).
+letto('utente', 'adventure', 90117).
+letto('utente', 'fantasy', 90117).
+letto('utente', 'isekai', 90117).
+letto('utente', 'action', 116367).
+letto('utente', 'fantasy', 116367).
+letto('utente', 'adult_cast', 14483).
+letto('utente', 'award_winning', 14483).
+letto('utente', 'drama', 14483).
+letto('utente', 'sci-fi', 14483).
+letto('utente', 'seinen', 14483).
+letto('utente', 'space', 14483).
+letto('utente', 'workplace', 14483).
+letto('utente', 'avant_garde', 18570).
+letto('utente', 'drama', 18570).
+letto('utente', 'psychological', 18570).
+letto('utente', 'sci-fi', 18570).
+letto('utente', 'seinen', 18570).
+letto('utente', 'romance', 114043).
+letto('utente', 'shoujo', 142457).
+letto('utente', 'slice_of_life', 142457).
+letto('utente', 'drama', 127127).
+letto('utente', 'school', 127127).
+letto('utente', 'sci-fi', 127127).
+letto('utente', 'seinen', 127127).
+letto('utente', 'action', 131843).
+letto('utente', 'romance', 131843).
+letto('utente', 'supernatural', 131843).
+letto('utente', 'vampire', 131843).
+letto('utente', 'romance', 136975).
+letto('utente', 'shoujo', 136975).
+letto('utente', 'action', 110766).
+letto('utente', 'fantasy', 110766).
+letto('utente', 'mystery', 110766).
+letto('utente', 'shounen', 110766).
+letto('utente', 'childcare', 172843).
+letto('utente', 'fantasy', 172843).
+letto('utente', 'seinen', 172843).
+letto('utente', 'childcare', 3468).
+letto('utente', 'comedy', 3468).
+letto('utente', 'drama', 3468).
+letto('utente', 'josei', 3468).
+letto('utente', 'slice_of_life', 3468).
+letto('utente', 'action', 9982).
+letto('utente', 'high_stakes_game', 9982).
+letto('utente', 'psychological', 9982).
+letto('utente', 'seinen', 9982).
+letto('utente', 'strategy_game', 9982).
+letto('utente', 'adventure', 146207).
+letto('utente', 'sci-fi', 146207).
+letto('utente', 'seinen', 146207).
+letto('utente', 'drama', 436).
+letto('utente', 'horror', 436).
+letto('utente', 'seinen', 436).
+letto('utente', 'supernatural', 436).
+letto('utente', 'action', 656).
+letto('utente', 'adventure', 656).
+letto('utente', 'award_winning', 656).
+letto('utente', 'historical', 656).
+letto('utente', 'samurai', 656).
+letto('utente', 'seinen', 656).
+letto('utente', 'crossdressing', 121151).
+letto('utente', 'romance', 121151).
+letto('utente', 'shoujo', 121151).
+letto('utente', 'supernatural', 121151).
+letto('utente', 'vampire', 121151).
+letto('utente', 'action', 147191).
+letto('utente', 'super_power', 147191).
+letto('utente', 'comedy', 151550).
+letto('utente', 'romance', 151550).
+letto('utente', 'super_power', 151550).
+letto('utente', 'action', 642).
+letto('utente', 'adventure', 642).
+letto('utente', 'award_winning', 642).
+letto('utente', 'drama', 642).
+letto('utente', 'historical', 642).
+letto('utente', 'seinen', 642).
+letto('utente', 'action', 139164).
+letto('utente', 'martial_arts', 139164).
+letto('utente', 'school', 139164).
+letto('utente', 'action', 147724).
+letto('utente', 'adventure', 147724).
+letto('utente', 'fantasy', 147724).
+letto('utente', 'martial_arts', 147724).
+letto('utente', 'time_travel', 147724).
+letto('utente', 'historical', 15916).
+letto('utente', 'comedy', 19790).
+letto('utente', 'seinen', 19790).
+letto('utente', 'slice_of_life', 19790).
+letto('utente', 'drama', 131338).
+letto('utente', 'historical', 131338).
+letto('utente', 'romance', 131338).
+letto('utente', 'comedy', 118575).
+letto('utente', 'drama', 118575).
+letto('utente', 'romance', 118575).
+letto('utente', 'drama', 121269).
+letto('utente', 'fantasy', 121269).
+letto('utente', 'reincarnation', 121269).
+letto('utente', 'action', 103237).
+letto('utente', 'drama', 103237).
+letto('utente', 'sports', 103237).
+letto('utente', 'action', 48151).
+letto('utente', 'sci-fi', 48151).
+letto('utente', 'shounen', 48151).
+letto('utente', 'adult_cast', 89087).
+letto('utente', 'comedy', 89087).
+letto('utente', 'otaku_culture', 89087).
+letto('utente', 'romance', 89087).
+letto('utente', 'workplace', 89087).
+letto('utente', 'gourmet', 130633).
+letto('utente', 'romance', 130633).
+letto('utente', 'seinen', 130633).
+letto('utente', 'slice_of_life', 130633).
+letto('utente', 'award_winning', 100128).
+letto('utente', 'mystery', 100128).
+letto('utente', 'psychological', 100128).
+letto('utente', 'shounen', 100128).
+letto('utente', 'survival', 100128).
+letto('utente', 'suspense', 100128).
+letto('utente', 'romance', 125052).
+letto('utente', 'video_game', 125052).
+letto('utente', 'award_winning', 121480).
+letto('utente', 'romance', 121480).
+letto('utente', 'shounen', 121480).
+letto('utente', 'supernatural', 121480).
+letto('utente', 'vampire', 121480).
+letto('utente', 'award_winning', 4).
+letto('utente', 'iyashikei', 4).
+letto('utente', 'sci-fi', 4).
+letto('utente', 'seinen', 4).
+letto('utente', 'slice_of_life', 4).
+letto('utente', 'drama', 17910).
+letto('utente', 'psychological', 17910).
+letto('utente', 'school', 17910).
+letto('utente', 'seinen', 17910).
+letto('utente', 'action', 152825).
+letto('utente', 'fantasy', 152825).
+letto('utente', 'school', 152825).
+letto('utente', 'romance', 164902).
+letto('utente', 'award_winning', 104).
+letto('utente', 'childcare', 104).
+letto('utente', 'comedy', 104).
+letto('utente', 'iyashikei', 104).
+letto('utente', 'slice_of_life', 104).
+letto('utente', 'action', 98436).
+letto('utente', 'fantasy', 98436).
+letto('utente', 'isekai', 98436).
+letto('utente', 'military', 98436).
+letto('utente', 'reincarnation', 98436).
+letto('utente', 'comedy', 93416).
+letto('utente', 'fantasy', 93416).
+letto('utente', 'gag_humor', 93416).
+letto('utente', 'mythology', 93416).
+letto('utente', 'school', 93416).
+letto('utente', 'workplace', 93416).
+letto('utente', 'horror', 58245).
+letto('utente', 'josei', 58245).
+letto('utente', 'supernatural', 58245).
+letto('utente', 'action', 121426).
+letto('utente', 'comedy', 121426).
+letto('utente', 'shounen', 121426).
+letto('utente', 'comedy', 62547).
+letto('utente', 'school', 62547).
+letto('utente', 'shounen', 62547).
+letto('utente', 'slice_of_life', 62547).
+letto('utente', 'cgdct', 94376).
+letto('utente', 'iyashikei', 94376).
+letto('utente', 'slice_of_life', 94376).
+letto('utente', 'fantasy', 107575).
+letto('utente', 'seinen', 142818).
+letto('utente', 'slice_of_life', 142818).
+letto('utente', 'workplace', 142818).
+letto('utente', 'adult_cast', 122392).
+letto('utente', 'comedy', 122392).
+letto('utente', 'seinen', 122392).
+letto('utente', 'survival', 122392).
+letto('utente', 'suspense', 122392).
@@ -0,0 +1,319 @@
+import os   #per costruire i percorsi di DATASET e della KB
+import re   #per leggere i fatti della KB nella verifica di parità
+import time #per misurare il throughput in utenti al secondo
+import shutil   #per trovare l'eseguibile di SWI-Prolog
+import subprocess   #per interrogare system.pl nella verifica di parità
+import argparse #per leggere le opzioni da riga di comando
+from collections import Counter #per l'istogramma dei generi nella verifica di parità
+import numpy as np  #per valutare le regole come maschere e conteggi vettoriali
+
+#moduli interni del progetto
+from crea_kb import safe_string, leggi_righe    #stessa normalizzazione dei fatti Prolog e lettura di CSV o cartelle colonnari
+
+#raccomandatori di system.pl (candidato/2) riprodotti dal motore
+REGOLE = ['random', 'qualita_nascosto', 'plan_to_read', 'premiato', 'misto']
+
+#normalizza un genere come i fatti manga_genere/2 e letto_genere/2 di crea_kb.py
+def normalizza_genere(genere):
+    return safe_string(genere.strip())
+
+#catalogo dei manga (fatti manga/8 e manga_genere/2) con i generi come matrice booleana manga x generi
+class Catalogo:
+    def __init__(self, righe):
+        self.generi = []
+        self.codice = {}
+        self.ids = []
+        self.titoli = []
+        self.stati = []
+        self.autori = []
+        mean, pop, celle = [], [], []
+        for riga in righe:
+            posizione = len(self.ids)
+            self.ids.append(int(riga['ID']))
+            self.titoli.append(riga['Titolo'])
+            self.stati.append(riga.get('Stato', ''))
+            self.autori.append(riga.get('Autori', ''))
+            mean.append(float(riga['Punteggio Medio']) if riga.get('Punteggio Medio') else np.nan)
+            pop.append(float(riga['Popolarità']) if riga.get('Popolarità') else np.nan)
+            celle.extend((posizione, self.codifica(g)) for g in riga['Generi'].split(',') if g.strip())
+        self.ids = np.array(self.ids, dtype=np.int64)
+        self.mean = np.array(mean)
+        self.pop = np.array(pop)
+        self.matrice = np.zeros((len(self.ids), len(self.generi)), dtype=bool)
+        if celle:
+            righe_celle, colonne_celle = zip(*celle)
+            self.matrice[list(righe_celle), list(colonne_celle)] = True
+        #posizione nel catalogo di ogni ID
+        self.posizione = {manga_id: i for i, manga_id in enumerate(self.ids.tolist())}
+        #generi presenti nel catalogo (findall su manga_genere/2)
+        self.generi_catalogo = len(self.generi)
+
+    #restituisce il codice di un genere aggiungendolo al vocabolario se è nuovo (le liste utente possono avere generi assenti dal catalogo)
+    def codifica(self, genere):
+        genere = normalizza_genere(genere)
+        if genere not in self.codice:
+            self.codice[genere] = len(self.generi)
+            self.generi.append(genere)
+        return self.codice[genere]
+
+    #matrice manga x generi allargata con colonne vuote fino a n generi
+    def matrice_generi(self, n):
+        if n == self.matrice.shape[1]:
+            return self.matrice
+        return np.pad(self.matrice, ((0, 0), (0, n - self.matrice.shape[1])))
+
+#liste di lettura di più utenti (fatti lettura_utente/5 e letto_genere/2) codificate rispetto a un catalogo
+class Utenti:
+    def __init__(self, catalogo, letture):
+        self.catalogo = catalogo
+        self.nomi = list(letture)
+        voci = [(u, int(riga['ID']), riga['Titolo'], safe_string(riga.get('Stato', 'unknown')), [catalogo.codifica(g) for g in riga['Generi'].split(',') if g.strip()])
+                for u, nome in enumerate(self.nomi) for riga in letture[nome]]
+        n_generi = len(catalogo.generi)
+        n_utenti = len(self.nomi)
+
+        #istogramma dei generi letti escludendo plan_to_read (genere_letto/1 e frequenza_generi/1)
+        self.istogramma = np.zeros((n_utenti, n_generi), dtype=np.int32)
+        utenti_generi = [(u, g) for u, _, _, stato, generi in voci if stato != 'plan_to_read' for g in generi]
+        if utenti_generi:
+            np.add.at(self.istogramma, tuple(np.array(utenti_generi).T), 1)
+
+        #manga del catalogo presenti nella lista, con qualsiasi stato (\+ lettura_utente(ID, _, _, _, _))
+        self.letto = np.zeros((n_utenti, len(catalogo.ids)), dtype=bool)
+        presenti = [(u, catalogo.posizione[manga_id]) for u, manga_id, _, _, _ in voci if manga_id in catalogo.posizione]
+        if presenti:
+            self.letto[tuple(np.array(presenti).T)] = True
+
+        #voci plan_to_read: utente, ID, titolo e generi della voce nella lista
+        plan = [v for v in voci if v[3] == 'plan_to_read']
+        self.plan_utente = np.array([v[0] for v in plan], dtype=np.int64)
+        self.plan_ids = np.array([v[1] for v in plan], dtype=np.int64)
+        self.plan_titoli = [v[2] for v in plan]
+        self.plan_generi = np.zeros((len(plan), n_generi), dtype=bool)
+        for i, v in enumerate(plan):
+            self.plan_generi[i, v[4]] = True
+
+    #generi letti almeno 10 volte (generi_dominanti/1)
+    def dominanti(self):
+        return self.istogramma >= 10
+
+#candidati di ogni raccomandatore come maschera booleana utenti x manga del catalogo (per plan_to_read: una maschera sulle voci plan_to_read di tutti gli utenti)
+def candidati(utenti, tipo):
+    catalogo = utenti.catalogo
+    n_generi = utenti.istogramma.shape[1]
+    #i conteggi sono prodotti matriciali 0/1 in float32 (BLAS), esatti finché i generi sono meno di 2^24
+    generi_manga = catalogo.matrice_generi(n_generi).astype(np.float32)
+    dominanti = utenti.dominanti()
+    #numero di generi dominanti di ciascun manga per ciascun utente
+    in_comune = dominanti.astype(np.float32) @ generi_manga.T
+    non_letto = ~utenti.letto
+    if tipo == 'random':
+        return (in_comune > 0) & non_letto
+    if tipo == 'qualita_nascosto':
+        #i confronti con NaN sono falsi come number/1 per i valori mancanti
+        with np.errstate(invalid='ignore'):
+            qualita = (catalogo.mean >= 8) & (catalogo.pop > 1500)
+        return (in_comune > 0) & non_letto & qualita
+    if tipo == 'premiato':
+        premiati = generi_manga[:, catalogo.codice['award_winning']] > 0 if 'award_winning' in catalogo.codice else np.zeros(len(catalogo.ids), dtype=bool)
+        return (in_comune >= 2) & non_letto & premiati
+    if tipo == 'misto':
+        #generi del catalogo mai letti dall'utente
+        mai_letti = (utenti.istogramma == 0)
+        mai_letti[:, catalogo.generi_catalogo:] = False
+        nuovi = mai_letti.astype(np.float32) @ generi_manga.T
+        return (in_comune > 0) & (nuovi > 0) & non_letto
+    if tipo == 'plan_to_read':
+        n_tot = utenti.plan_generi.sum(axis=1)
+        n_comune = (utenti.plan_generi & dominanti[utenti.plan_utente]).sum(axis=1)
+        return (n_tot > 0) & (2 * n_comune >= n_tot)
+    raise ValueError(f"Raccomandatore sconosciuto: {tipo}")
+
+#candidati come coppie (utente, ID) ordinate per utente
+def coppie_candidati(utenti, tipo):
+    maschera = candidati(utenti, tipo)
+    if tipo == 'plan_to_read':
+        return utenti.plan_utente[maschera], utenti.plan_ids[maschera]
+    righe, colonne = np.nonzero(maschera)
+    return righe, utenti.catalogo.ids[colonne]
+
+#raggruppa le coppie (utente, ID) in una lista di ID per ciascun utente
+def per_utente(utenti, righe, ids):
+    risultato = [[] for _ in utenti.nomi]
+    for u, manga_id in zip(righe.tolist(), ids.tolist()):
+        risultato[u].append(manga_id)
+    return risultato
+
+#ID candidati di ciascun utente, senza duplicati e ordinati come candidati/2 di system.pl
+def id_candidati(utenti, tipo):
+    righe, ids = coppie_candidati(utenti, tipo)
+    ordine = np.lexsort((ids, righe))
+    return [sorted(set(lista)) for lista in per_utente(utenti, righe[ordine], ids[ordine])]
+
+#estrae fino a k candidati distinti a caso per ogni utente (campiona/3): una chiave casuale per coppia, poi i primi k di ogni utente
+def campiona(utenti, tipo, k=5, seed=None):
+    righe, ids = coppie_candidati(utenti, tipo)
+    rng = np.random.default_rng(seed)
+    ordine = np.lexsort((rng.random(len(righe)), righe))
+    righe, ids = righe[ordine], ids[ordine]
+    #posizione di ogni coppia all'interno del gruppo del proprio utente
+    rango = np.arange(len(righe)) - np.searchsorted(righe, righe)
+    tieni = rango < k
+    return per_utente(utenti, righe[tieni], ids[tieni])
+
+#punteggio di compatibilità di ogni genere per ogni utente (valuta_genere/3): 3 se letto almeno 20 volte, 2 se 10, 1 se 5
+def punteggi_generi(utenti):
+    h = utenti.istogramma
+    return (h >= 5).astype(np.int8) + (h >= 10) + (h >= 20)
+
+#valuta una lista di generi per tutti gli utenti (valuta_compatibilita/1), restituisce MOLTO, ABBASTANZA o POCO per ciascun utente
+def valuta_compatibilita(utenti, generi):
+    if not generi:
+        return ['POCO'] * len(utenti.nomi)
+    punteggi = punteggi_generi(utenti)
+    colonne = [utenti.catalogo.codice.get(normalizza_genere(g)) for g in generi]
+    somma = sum(punteggi[:, c].astype(np.int32) if c is not None else 0 for c in colonne)
+    media = np.asarray(somma) / len(generi)
+    return np.where(media >= 2, 'MOLTO', np.where(media >= 1, 'ABBASTANZA', 'POCO')).tolist()
+
+#carica catalogo e liste degli utenti (CSV o cartelle colonnari), letture: dizionario nome -> percorso della lista
+def carica(percorso_catalogo, letture):
+    catalogo = Catalogo(leggi_righe(percorso_catalogo))
+    return Utenti(catalogo, {nome: list(leggi_righe(percorso)) for nome, percorso in letture.items()})
+
+#genera n utenti sintetici campionando dal catalogo con la stessa dimensione e distribuzione degli stati della lista reale
+def utenti_sintetici(catalogo, lista_reale, n, seed=42):
+    rng = np.random.default_rng(seed)
+    stati = [riga['Stato'] for riga in lista_reale]
+    generi = [', '.join(catalogo.generi[c] for c in np.flatnonzero(riga)) for riga in catalogo.matrice]
+    letture = {}
+    for u in range(n):
+        scelti = rng.choice(len(catalogo.ids), size=min(len(stati), len(catalogo.ids)), replace=False)
+        letture[f'sintetico_{u}'] = [{'ID': catalogo.ids[i], 'Titolo': catalogo.titoli[i], 'Generi': generi[i], 'Stato': stati[j]} for j, i in enumerate(scelti)]
+    return Utenti(catalogo, letture)
+
+#valuta tutte le regole su tutti gli utenti e stampa il throughput
+def misura_throughput(utenti, k=5):
+    inizio = time.perf_counter()
+    for tipo in REGOLE:
+        campiona(utenti, tipo, k)
+    punteggi_generi(utenti)
+    durata = time.perf_counter() - inizio
+    print(f"{len(utenti.nomi)} utenti, {len(REGOLE)} regole: {durata:.3f} s ({len(utenti.nomi) / durata:.0f} utenti/s)")
+    return durata
+
+#valutazione di riferimento: traduzione letterale delle regole di system.pl sui fatti di catalogo.pl e letture/<utente>.pl, senza NumPy
+def riferimento_da_kb(percorso_catalogo_pl, percorso_letture_pl):
+    manga, manga_genere, lettura, letto_genere = {}, [], {}, []
+    atomo = r"'((?:[^'\\]|\\.)*)'"
+    with open(percorso_catalogo_pl, 'r', encoding='utf-8') as f:
+        for linea in f:
+            if linea.startswith('manga_genere('):
+                g, i = re.match(r"manga_genere\(" + atomo + r", (\d+)\)\.", linea).groups()
+                manga_genere.append((g, int(i)))
+            elif linea.startswith('manga('):
+                i, _, mean, _, pop = re.match(r"manga\((\d+), " + atomo + r", \[.*?\], ([^,]*), ([^,]*), ([^,]*),", linea).groups()
+                manga[int(i)] = (float(mean) if mean.strip() else None, float(pop) if pop.strip() else None)
+    with open(percorso_letture_pl, 'r', encoding='utf-8') as f:
+        for linea in f:
+            if linea.startswith('letto('):
+                g, i = re.match(r"letto\(" + atomo + r", " + atomo + r", (\d+)\)\.", linea).groups()[1:]
+                letto_genere.append((g, int(i)))
+            elif linea.startswith('lettura('):
+                i, _, stato = re.match(r"lettura\(" + atomo + r", (\d+), " + atomo + r", ([^,]+),", linea).groups()[1:]
+                lettura[int(i)] = stato
+
+    frequenze = Counter(g for g, i in letto_genere if lettura.get(i) != 'plan_to_read')
+    dominanti = {g for g, c in frequenze.items() if c >= 10}
+    per_manga = {}
+    for g, i in manga_genere:
+        per_manga.setdefault(i, set()).add(g)
+    per_lettura = {}
+    for g, i in letto_genere:
+        per_lettura.setdefault(i, set()).add(g)
+    mai_letti = {g for g, _ in manga_genere} - set(frequenze)
+
+    risultati = {
+        'random': sorted(i for i, gs in per_manga.items() if gs & dominanti and i not in lettura),
+        'qualita_nascosto': sorted(i for i, gs in per_manga.items() if gs & dominanti and i not in lettura and manga[i][0] is not None and manga[i][0] >= 8 and manga[i][1] is not None and manga[i][1] > 1500),
+        'premiato': sorted(i for i, gs in per_manga.items() if 'award_winning' in gs and i not in lettura and len(gs & dominanti) >= 2),
+        'misto': sorted(i for i, gs in per_manga.items() if gs & dominanti and gs & mai_letti and i not in lettura),
+        'plan_to_read': sorted(i for i, stato in lettura.items() if stato == 'plan_to_read' and per_lettura.get(i) and len(per_lettura[i] & dominanti) / len(per_lettura[i]) >= 0.5),
+    }
+    return risultati, dict(frequenze)
+
+#stessi risultati chiesti a SWI-Prolog caricando system.pl, None se swipl non è installato
+def riferimento_da_prolog(percorso_system):
+    swipl = shutil.which('swipl')
+    if swipl is None:
+        return None
+    obiettivo = ("forall(member(T, [" + ', '.join(REGOLE) + "]), (candidati(T, C), C =.. [_|Ids], format('~w ~w~n', [T, Ids]))), "
+                 "frequenza_generi(F), forall(member(G-N, F), format('freq ~w ~w~n', [G, N]))")
+    percorso = os.path.abspath(percorso_system).replace('\\', '/')
+    risultato = subprocess.run([swipl, '-q', '-g', f"consult('{percorso}')", '-g', obiettivo, '-t', 'halt'], capture_output=True, text=True, encoding='utf-8')
+    risultati, frequenze = {}, {}
+    for linea in risultato.stdout.splitlines():
+        nome, valore = linea.split(' ', 1)
+        if nome == 'freq':
+            genere, conta = valore.rsplit(' ', 1)
+            frequenze[genere] = int(conta)
+        else:
+            risultati[nome] = [int(i) for i in valore.strip('[]').split(',') if i]
+    return risultati, frequenze
+
+#confronta il motore con un riferimento, restituisce il numero di differenze
+def confronta(utenti, riferimento, nome):
+    risultati, frequenze = riferimento
+    differenze = 0
+    for tipo in REGOLE:
+        motore = id_candidati(utenti, tipo)[0]
+        atteso = sorted(risultati.get(tipo, []))
+        esito = 'ok' if motore == atteso else 'DIVERSO'
+        differenze += motore != atteso
+        print(f"    [{nome}] {tipo}: {len(motore)} candidati ({esito})")
+    istogramma = {g: int(c) for g, c in zip(utenti.catalogo.generi, utenti.istogramma[0]) if c > 0}
+    differenze += istogramma != frequenze
+    print(f"    [{nome}] frequenza_generi: {len(istogramma)} generi ({'ok' if istogramma == frequenze else 'DIVERSO'})")
+    return differenze
+
+#verifica di parità tra il motore NumPy e le regole di system.pl sulla KB distribuita con il progetto (utente predefinito)
+def verifica(percorso_catalogo, percorso_lista, cartella_kb):
+    utenti = carica(percorso_catalogo, {'utente': percorso_lista})
+    print(f"Verifica di parità su '{cartella_kb}'")
+    differenze = confronta(utenti, riferimento_da_kb(os.path.join(cartella_kb, 'catalogo.pl'), os.path.join(cartella_kb, 'letture', 'utente.pl')), 'fatti KB')
+    percorso_system = os.path.join(cartella_kb, 'system.pl')
+    prolog = riferimento_da_prolog(percorso_system)
+    if prolog is None:
+        #i fatti letti da Python non sostituiscono le regole: senza SWI-Prolog la parità con system.pl resta non verificata
+        print("    SWI-Prolog non trovato: confronto con system.pl saltato")
+    else:
+        differenze += confronta(utenti, prolog, 'system.pl')
+    if differenze:
+        print(f"Parità NON verificata: {differenze} differenze")
+    elif prolog is None:
+        print("Nessuna differenza con i fatti della KB, parità con system.pl non verificata (richiede SWI-Prolog, vedi tests/test_regole_kb.py)")
+    else:
+        print("Parità con system.pl verificata")
+    return differenze
+
+#main
+if __name__ == '__main__':
+    base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'DATASET'))
+    kb_dir = os.path.abspath(os.path.dirname(__file__))
+    parser = argparse.ArgumentParser(description="Motore NumPy delle raccomandazioni di system.pl")
+    parser.add_argument('--catalogo', default=os.path.join(base_dir, 'top_manga.csv'), help="top_manga.csv o cartella colonnare")
+    parser.add_argument('--lista', default=os.path.join(base_dir, 'mangalist.csv'), help="mangalist.csv o cartella colonnare")
+    parser.add_argument('--verifica', action='store_true', help="confronta il motore con catalogo.pl + letture/utente.pl e, se disponibile, con SWI-Prolog")
+    parser.add_argument('--utenti-sintetici', type=int, default=0, help="misura il throughput su N utenti generati dal catalogo")
+    parser.add_argument('-k', type=int, default=5, help="raccomandazioni per utente")
+    args = parser.parse_args()
+
+    if args.verifica:
+        verifica(args.catalogo, args.lista, kb_dir)
+    elif args.utenti_sintetici:
+        utenti = carica(args.catalogo, {'utente': args.lista})
+        misura_throughput(utenti_sintetici(utenti.catalogo, list(leggi_righe(args.lista)), args.utenti_sintetici), args.k)
+    else:
+        utenti = carica(args.catalogo, {'utente': args.lista})
+        for tipo in REGOLE:
+            print(f"{tipo}: {campiona(utenti, tipo, args.k)[0]}")
@@ -0,0 +1,147 @@
+import os   #per costruire i percorsi del worker Prolog
+import json #per il protocollo a righe JSON con i worker
+import time #per misurare la latenza di ogni richiesta
+import queue    #per distribuire le richieste ai worker liberi
+import shutil   #per trovare l'eseguibile di SWI-Prolog
+import argparse #per leggere le opzioni da riga di comando
+import threading    #un thread per worker legge le risposte mentre gli altri lavorano
+import subprocess   #per avviare i processi SWI-Prolog
+from collections import deque   #per conservare le ultime righe di stderr di ogni worker
+from statistics import mean, quantiles   #per il riepilogo delle latenze
+
+#file Prolog eseguito da ogni worker (carica system.pl e risponde alle richieste JSON)
+WORKER_PL = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'worker_pool.pl')
+
+#un processo SWI-Prolog con la KB già caricata, comunica tramite una riga JSON per richiesta e una per risposta
+class WorkerProlog:
+    def __init__(self, comando):
+        self.processo = subprocess.Popen(comando, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, encoding='utf-8', bufsize=1)
+        #stderr viene letto di continuo da un thread (così il worker non si blocca a pipe piena), restano le ultime righe per i messaggi di errore
+        self.stderr = deque(maxlen=50)
+        self.lettore = threading.Thread(target=self.stderr.extend, args=(self.processo.stderr,), daemon=True)
+        self.lettore.start()
+
+    #invia una richiesta e attende la risposta, restituendo anche la latenza in millisecondi
+    def interroga(self, richiesta):
+        inizio = time.perf_counter()
+        try:
+            self.processo.stdin.write(json.dumps(richiesta, ensure_ascii=False) + '\n')
+            self.processo.stdin.flush()
+            linea = self.processo.stdout.readline()
+        except OSError:   #BrokenPipeError se il worker è già terminato
+            linea = ''
+        latenza = (time.perf_counter() - inizio) * 1000
+        if not linea:
+            return {'id': richiesta.get('id'), 'ok': False, 'errore': 'worker terminato'}, latenza
+        return json.loads(linea), latenza
+
+    #ultime righe scritte dal worker su stderr (es. errori di caricamento di system.pl)
+    def errori(self):
+        #a processo terminato attende che il thread abbia letto tutto stderr
+        if self.processo.poll() is not None:
+            self.lettore.join(timeout=1)
+        return ''.join(self.stderr).strip()
+
+    #chiudere stdin fa terminare il ciclo servi/0 del worker
+    def chiudi(self):
+        if self.processo.poll() is None:
+            try:
+                self.processo.stdin.close()
+            except OSError:   #BrokenPipeError se il worker è già terminato
+                pass
+            self.processo.wait()
+
+#pool di N worker caldi: la KB viene caricata una volta per worker all'avvio e poi riusata per tutte le richieste
+class PoolProlog:
+    def __init__(self, workers=None, swipl=None, comando=None):
+        workers = workers or os.cpu_count() or 1
+        if comando is None:
+            swipl = swipl or shutil.which('swipl')
+            if swipl is None:
+                raise RuntimeError("SWI-Prolog non trovato: installare swipl per usare il pool")
+            comando = [swipl, '-q', '-g', 'servi', '-t', 'halt', WORKER_PL]
+        inizio = time.perf_counter()
+        self.workers = [WorkerProlog(comando) for _ in range(workers)]
+        #il primo ping attende il caricamento della KB in tutti i worker, se un worker non risponde il pool non viene avviato
+        for i, worker in enumerate(self.workers):
+            risposta, _ = worker.interroga({'id': 'ping', 'query': 'ping'})
+            if not risposta.get('ok'):
+                self.chiudi()
+                raise RuntimeError(f"Worker Prolog {i} non avviato ({risposta.get('errore')}):\n{worker.errori()}")
+        self.avvio = time.perf_counter() - inizio
+        print(f"Pool Prolog pronto: {workers} worker in {self.avvio:.2f} s")
+
+    #esegue un lotto di richieste sui worker liberi, restituisce le risposte nell'ordine delle richieste con la latenza di ciascuna
+    def interroga(self, richieste):
+        da_fare = queue.Queue()
+        for i, richiesta in enumerate(richieste):
+            da_fare.put((i, dict(richiesta, id=richiesta.get('id', i))))
+        risposte = [None] * len(richieste)
+
+        #ogni thread possiede un worker e prende la prossima richiesta appena il suo worker è libero
+        def esegui(worker):
+            while True:
+                try:
+                    i, richiesta = da_fare.get_nowait()
+                except queue.Empty:
+                    return
+                risposta, latenza = worker.interroga(richiesta)
+                risposta['ms'] = round(latenza, 3)
+                risposte[i] = risposta
+
+        thread = [threading.Thread(target=esegui, args=(worker,)) for worker in self.workers]
+        for t in thread:
+            t.start()
+        for t in thread:
+            t.join()
+        return risposte
+
+    def chiudi(self):
+        for worker in self.workers:
+            worker.chiudi()
+
+#stampa latenza per richiesta (media, mediana, p95) e throughput di un lotto
+def stampa_latenze(risposte, durata):
+    if not risposte:
+        print("Nessuna richiesta eseguita")
+        return
+    latenze = [r['ms'] for r in risposte]
+    errori = len([r for r in risposte if not r.get('ok')])
+    p50, p95 = (quantiles(latenze, n=100)[49], quantiles(latenze, n=100)[94]) if len(latenze) > 1 else (latenze[0], latenze[0])
+    print(f"Richieste: {len(risposte)} ({errori} errori) in {durata:.2f} s, {len(risposte) / durata:.1f} richieste/s")
+    print(f"Latenza per richiesta: media {mean(latenze):.1f} ms, mediana {p50:.1f} ms, p95 {p95:.1f} ms")
+
+#main: esegue un lotto di richieste lette da un file JSONL oppure un lotto dimostrativo con tutte le regole
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Pool di worker SWI-Prolog con la KB già caricata")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help="processi SWI-Prolog")
+    parser.add_argument('--richieste', help="file JSONL con una richiesta per riga (query: campiona, candidati, frequenze, compatibilita, ricarica; utente facoltativo)")
+    parser.add_argument('--utenti', nargs='*', default=[], help="utenti (file in KB/letture) su cui ripetere il lotto dimostrativo")
+    parser.add_argument('--ripeti', type=int, default=20, help="ripetizioni del lotto dimostrativo")
+    parser.add_argument('-k', type=int, default=5, help="raccomandazioni per richiesta nel lotto dimostrativo")
+    parser.add_argument('--output', help="salva le risposte in un file JSONL")
+    args = parser.parse_args()
+
+    if args.richieste:
+        with open(args.richieste, 'r', encoding='utf-8') as f:
+            richieste = [json.loads(riga) for riga in f if riga.strip()]
+    else:
+        richieste = [{'query': 'campiona', 'regola': regola, 'k': args.k} for _ in range(args.ripeti) for regola in ['random', 'qualita_nascosto', 'plan_to_read', 'premiato', 'misto']]
+        richieste += [{'query': 'frequenze'}, {'query': 'compatibilita', 'generi': ['action', 'drama', 'slice of life']}]
+        #stesso lotto per ciascun utente indicato, servito dallo stesso catalogo caricato una sola volta per worker
+        if args.utenti:
+            richieste = [dict(richiesta, utente=utente) for utente in args.utenti for richiesta in richieste]
+
+    pool = PoolProlog(workers=args.workers)
+    try:
+        inizio = time.perf_counter()
+        risposte = pool.interroga(richieste)
+        stampa_latenze(risposte, time.perf_counter() - inizio)
+    finally:
+        pool.chiudi()
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            for risposta in risposte:
+                f.write(json.dumps(risposta, ensure_ascii=False) + '\n')
+        print(f"Risposte salvate in '{args.output}'")
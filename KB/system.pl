@@ -1,105 +1,318 @@
 % imposta la codifica dei caratteri a UTF-8 per gestire i caratteri speciali (altrimenti gli accenti non escono correttamente nel menu)
 :- set_prolog_flag(encoding, utf8).
 
-% carica la KB
-:- consult('knowledge_base.pl').
+% cartella di system.pl, usata per trovare catalogo e letture indipendentemente dalla cartella di avvio
+:- dynamic cartella_kb/1.
+
+% carica il catalogo condiviso: usa la versione compilata (catalogo.qlf, creata da crea_kb.py) se è più recente di catalogo.pl e di top_manga.csv, altrimenti consulta catalogo.pl
+carica_kb :-
+    prolog_load_context(directory, Dir),
+    retractall(cartella_kb(_)),
+    assertz(cartella_kb(Dir)),
+    directory_file_path(Dir, 'catalogo.qlf', Qlf),
+    directory_file_path(Dir, 'catalogo.pl', Pl),
+    (   kb_compilata_aggiornata(Dir, Qlf),
+        catch(load_files(Qlf, []), _, fail)
+    ->  true
+    ;   consult(Pl)
+    ).
+
+% vero se il file .qlf esiste ed è più recente di tutti i file da cui dipende (quelli mancanti vengono ignorati)
+kb_compilata_aggiornata(Dir, Qlf) :-
+    exists_file(Qlf),
+    time_file(Qlf, TempoQlf),
+    forall(( member(Sorgente, ['catalogo.pl', '../DATASET/top_manga.csv']),
+             directory_file_path(Dir, Sorgente, Percorso),
+             exists_file(Percorso) ),
+           ( time_file(Percorso, Tempo), Tempo =< TempoQlf )).
+
+:- carica_kb.
+
+% letture di tutti gli utenti caricati con l'utente come primo argomento: il catalogo è uno solo e ogni utente aggiunge solo le proprie letture
+:- dynamic lettura/6.
+:- dynamic letto/3.
+:- dynamic utente_corrente/1.
+% utenti le cui letture sono in memoria (anche con letture/<utente>.pl vuoto, che non produce fatti lettura/6)
+:- dynamic utente_caricato/1.
+
+% viste sulle letture dell'utente corrente, usate da tutte le regole
+lettura_utente(ID, Titolo, Stato, Punteggio, Generi) :-
+    utente_corrente(Utente),
+    lettura(Utente, ID, Titolo, Stato, Punteggio, Generi).
+
+letto_genere(Genere, ID) :-
+    utente_corrente(Utente),
+    letto(Utente, Genere, ID).
+
+% utente corrente, oppure nessuno se non è stato ancora scelto
+utente_attivo(Utente) :-
+    ( utente_corrente(Corrente) -> Utente = Corrente ; Utente = nessuno ).
+
+% file con le letture di un utente (letture/<utente>.pl accanto a system.pl, generato da crea_kb.py)
+file_letture(Utente, File) :-
+    cartella_kb(Dir),
+    format(atom(Nome), 'letture/~w.pl', [Utente]),
+    directory_file_path(Dir, Nome, File).
+
+% carica (o ricarica) le letture di un utente leggendo il file fatto per fatto, senza toccare il catalogo né gli altri utenti
+carica_utente(Utente) :-
+    file_letture(Utente, File),
+    carica_utente(Utente, File).
+
+carica_utente(Utente, File) :-
+    scarica_utente(Utente),
+    setup_call_cleanup(open(File, read, Stream, [encoding(utf8)]),
+                       carica_fatti(Stream, Utente),
+                       close(Stream)),
+    assertz(utente_caricato(Utente)).
+
+carica_fatti(Stream, Utente) :-
+    read_term(Stream, Termine, []),
+    (   Termine == end_of_file
+    ->  true
+    ;   registra_fatto(Termine, Utente),
+        carica_fatti(Stream, Utente)
+    ).
+
+% i fatti vengono registrati con il nome richiesto, così lo stesso file può essere caricato anche sotto un altro utente
+registra_fatto(lettura(_, ID, Titolo, Stato, Punteggio, Generi), Utente) :- !,
+    assertz(lettura(Utente, ID, Titolo, Stato, Punteggio, Generi)).
+registra_fatto(letto(_, Genere, ID), Utente) :- !,
+    assertz(letto(Utente, Genere, ID)).
+registra_fatto(_, _).
+
+% rimuove dalla memoria le letture e il profilo di un utente
+scarica_utente(Utente) :-
+    retractall(utente_caricato(Utente)),
+    retractall(lettura(Utente, _, _, _, _, _)),
+    retractall(letto(Utente, _, _)),
+    invalida_cache_utente(Utente).
+
+% rende Utente l'utente corrente, caricando le sue letture da letture/<utente>.pl se non sono già in memoria
+% i candidati memorizzati dell'utente precedente (grandi quanto il catalogo) vengono liberati, il suo profilo dei generi resta
+usa_utente(Utente) :-
+    (   utente_caricato(Utente)
+    ->  true
+    ;   file_letture(Utente, File), exists_file(File)
+    ->  carica_utente(Utente, File)
+    ;   existence_error(utente, Utente)
+    ),
+    utente_attivo(Precedente),
+    (   Precedente \== Utente
+    ->  retractall(cache_candidati(Precedente, _, _))
+    ;   true
+    ),
+    retractall(utente_corrente(_)),
+    assertz(utente_corrente(Utente)).
+
+% all'avvio usa l'utente predefinito, se esiste
+utente_predefinito :-
+    (   utente_predefinito(Utente)
+    ->  usa_utente(Utente)
+    ;   true
+    ).
+
+% utente predefinito: 'utente' (letture di mangalist.csv) se presente, altrimenti il primo file in letture/
+utente_predefinito(Utente) :-
+    cartella_kb(Dir),
+    directory_file_path(Dir, letture, Cartella),
+    exists_directory(Cartella),
+    directory_files(Cartella, File),
+    (   memberchk('utente.pl', File)
+    ->  Utente = utente
+    ;   member(Nome, File), file_name_extension(Utente, pl, Nome)
+    ),
+    !.
+
+:- initialization(utente_predefinito).
 
 % verifica se un genere è stato letto almeno 10 volte.
 over_10(_-N) :- N >= 10.
 
-% estrae i generi associati ai manga già letti (escludendo quelli in plan_to_read), normalizza per rimuovere eventuali underscore iniziali dai nomi dei generi
-genere_letto(GenerePulito) :-
-    lettura_utente(_, _, Stato, _, Generi),
-    Stato \= plan_to_read,
-    member(Genere, Generi),
-    normalizza_genere(Genere, GenerePulito).
+% estrae i generi associati ai manga già letti (escludendo quelli in plan_to_read) dai fatti letto_genere/2, già normalizzati da crea_kb.py
+genere_letto(Genere) :-
+    letto_genere(Genere, ID),
+    \+ lettura_utente(ID, _, plan_to_read, _, _).
 
 % rimuove underscore iniziale dal nome dei generi
 normalizza_genere(Genere, GenerePulito) :-
     atom_chars(Genere, ['_'|Rest]) -> atom_chars(GenerePulito, Rest) ;
     GenerePulito = Genere.
 
+% profilo dei generi di ogni utente memorizzato dopo il primo calcolo (istogramma e versione ordinata per frequenza)
+:- dynamic cache_frequenze/2.
+:- dynamic cache_generi_ordinati/2.
+
 % calcola la frequenza con cui ciascun genere è stato letto (escludendo plan_to_read), ritornando una lista ordinata alfabeticamwente
+% l'istogramma viene costruito in un solo passaggio (msort + clumped) e riusato da tutte le regole finché la cache non viene invalidata
 frequenza_generi(Frequenze) :-
+    utente_attivo(Utente),
+    cache_frequenze(Utente, Memorizzate), !,
+    Frequenze = Memorizzate.
+frequenza_generi(Frequenze) :-
+    utente_attivo(Utente),
     findall(Genere, genere_letto(Genere), ListaGeneri),
-    sort(ListaGeneri, GeneriUnici),
-    findall(Genere-Conta,(member(Genere, GeneriUnici),aggregate_all(count, genere_letto(Genere), Conta)),Frequenze).
+    msort(ListaGeneri, GeneriOrdinati),
+    clumped(GeneriOrdinati, Frequenze),
+    assertz(cache_frequenze(Utente, Frequenze)).
 
 % ordina i generi letti in base alla loro frequenza, in ordine decrescente
 generi_ordinati(GeneriOrdinati) :-
+    utente_attivo(Utente),
+    cache_generi_ordinati(Utente, Memorizzati), !,
+    GeneriOrdinati = Memorizzati.
+generi_ordinati(GeneriOrdinati) :-
+    utente_attivo(Utente),
     frequenza_generi(Frequenze),
-    sort(2, @>=, Frequenze, GeneriOrdinati).
+    sort(2, @>=, Frequenze, GeneriOrdinati),
+    assertz(cache_generi_ordinati(Utente, GeneriOrdinati)).
 
-% raccomanda manga non ancora letti che hanno voto maggiore o uguale a 8, poco popolari (un valore alto=poco popolare, mentre uno basso=molto popolare), che condividono almeno un genere letto 10 volte
-manga_qualita_nascosto(Output) :-
+% generi letti almeno 10 volte, in ordine di frequenza decrescente
+generi_dominanti(GeneriForti) :-
     generi_ordinati(Generi),
-    member(Genere-Count, Generi), % basta un genere in comune
-    Count >= 10,
-    findall(ID-Titolo,(manga(ID, Titolo, GeneriManga, Mean, _, Pop, _, _),number(Mean), Mean >= 8,number(Pop), Pop > 1500,member(Genere, GeneriManga),\+ lettura_utente(ID, _, _, _, _)),Candidati),
-    list_to_set(Candidati, Unici),
-    random_permutation(Unici, Mischiati),
-    member(ID-Titolo, Mischiati),
-    manga(ID, _, _, _, _, _, Stato, Autori),
-    formatta_output_nome(Titolo, Autori, Stato, Output).
+    include(over_10, Generi, Dominanti),
+    maplist(arg(1), Dominanti, GeneriForti).
+
+% svuota il profilo e i candidati memorizzati dell'utente corrente, va chiamato ogni volta che cambiano le sue letture
+invalida_cache_generi :-
+    utente_attivo(Utente),
+    invalida_cache_utente(Utente).
+
+invalida_cache_utente(Utente) :-
+    retractall(cache_frequenze(Utente, _)),
+    retractall(cache_generi_ordinati(Utente, _)),
+    retractall(cache_candidati(Utente, _, _)).
+
+% raccomanda manga non ancora letti che hanno voto maggiore o uguale a 8, poco popolari (un valore alto=poco popolare, mentre uno basso=molto popolare), che condividono almeno un genere letto 10 volte
+candidato(qualita_nascosto, ID) :-
+    generi_dominanti(GeneriForti),
+    member(Genere, GeneriForti), % basta un genere in comune
+    manga_genere(Genere, ID),
+    manga(ID, _, _, Mean, _, Pop, _, _),
+    number(Mean), Mean >= 8,
+    number(Pop), Pop > 1500,
+    \+ lettura_utente(ID, _, _, _, _).
 
 % suggerisce manga presenti nella lista plan_to_read che condividono almeno il 50% dei generi letti almeno 10 volte
-consiglia_plan_to_read(Output) :-
-    generi_ordinati(Generi),
-    include(over_10, Generi, Dominanti),
-    maplist(arg(1), Dominanti, GeneriForti),
-    lettura_utente(_, Titolo, plan_to_read, _, GeneriPlan),
-    intersection(GeneriPlan, GeneriForti, Comune),
-    length(Comune, NComune),
-    length(GeneriPlan, NTot),
+candidato(plan_to_read, ID) :-
+    generi_dominanti(GeneriForti),
+    lettura_utente(ID, _, plan_to_read, _, _),
+    aggregate_all(count, letto_genere(_, ID), NTot),
     NTot > 0,
+    aggregate_all(count, (member(Genere, GeneriForti), letto_genere(Genere, ID)), NComune),
     Ratio is NComune / NTot,
-    Ratio >= 0.5,
-    formatta_nome_manga(Titolo, Output).
+    Ratio >= 0.5.
 
 % suggerisce manga non ancora lettio che hanno un premio e con almeno 2 generi preferiti
-manga_premiato(Output) :-
-    generi_ordinati(Generi),
-    include(over_10, Generi, Dominanti),
-    maplist(arg(1), Dominanti, GeneriForti),
-    manga(ID, Titolo, GeneriManga, _, _, _, Stato, Autori),
-    member(award_winning, GeneriManga),
+candidato(premiato, ID) :-
+    generi_dominanti(GeneriForti),
+    manga_genere(award_winning, ID),
     \+ lettura_utente(ID, _, _, _, _),
-    normalizza_lista(GeneriManga, Puliti),
-    intersection(Puliti, GeneriForti, Comune),
-    length(Comune, NComune),
-    NComune >= 2,
-    formatta_output_nome(Titolo, Autori, Stato, Output).
+    aggregate_all(count, (member(Genere, GeneriForti), manga_genere(Genere, ID)), NComune),
+    NComune >= 2.
 
 % suggerisce manga non ancora letti che combinano generi letti almeno 10 volte con quelli mai letti
-manga_misto_generi_nuovi(Output) :-
-    findall(Genere, (manga(_, _, Generi, _, _, _, _, _), member(Genere, Generi)), TuttiGeneri),
+candidato(misto, ID) :-
+    findall(Genere, manga_genere(Genere, _), TuttiGeneri),
     sort(TuttiGeneri, GeneriTotali),
+    generi_dominanti(GeneriDominanti),
+    % i generi letti sono le chiavi dell'istogramma (già ordinate e senza duplicati)
     frequenza_generi(Freq),
-    include(over_10, Freq, GeneriFrequenti),
-    maplist(arg(1), GeneriFrequenti, GeneriDominanti),
-    findall(GenereLetto, genere_letto(GenereLetto), GeneriLetti),
-    sort(GeneriLetti, GeneriUtente),
+    pairs_keys(Freq, GeneriUtente),
     subtract(GeneriTotali, GeneriUtente, GeneriMaiLetti),
-    manga(ID, Titolo, GeneriManga, _, _, _, Stato, Autori),
-    normalizza_lista(GeneriManga, Normalizzati),
-    intersection(Normalizzati, GeneriDominanti, ComuneLetti),
-    intersection(Normalizzati, GeneriMaiLetti, ComuneNuovi),
-    ComuneLetti \= [],
-    ComuneNuovi \= [],
-    \+ lettura_utente(ID, _, _, _, _),
+    member(GenereDominante, GeneriDominanti),
+    manga_genere(GenereDominante, ID),
+    once((member(GenereNuovo, GeneriMaiLetti), manga_genere(GenereNuovo, ID))),
+    \+ lettura_utente(ID, _, _, _, _).
+
+% suggerisce un manga non letto che condivide almeno un genere con i generi letti frequentemente (almeno 10 volte).
+candidato(random, ID) :-
+    generi_dominanti(GeneriForti),
+    member(Genere, GeneriForti),
+    manga_genere(Genere, ID),
+    \+ lettura_utente(ID, _, _, _, _).
+
+% insieme dei candidati di un raccomandatore senza duplicati, memorizzato come termine c(ID1, ..., IDn) così l'i-esimo si legge con arg/3 in tempo costante
+:- dynamic cache_candidati/3.
+
+candidati(Tipo, Termine) :-
+    utente_attivo(Utente),
+    cache_candidati(Utente, Tipo, Memorizzato), !,
+    Termine = Memorizzato.
+candidati(Tipo, Termine) :-
+    utente_attivo(Utente),
+    findall(ID, candidato(Tipo, ID), IDs),
+    sort(IDs, Unici),
+    Termine =.. [c|Unici],
+    assertz(cache_candidati(Utente, Tipo, Termine)).
+
+% formatta un candidato: i plan_to_read usano il titolo della lista, gli altri anche autori e stato del catalogo
+output_candidato(plan_to_read, ID, Output) :- !,
+    lettura_utente(ID, Titolo, _, _, _),
+    formatta_nome_manga(Titolo, Output).
+output_candidato(_, ID, Output) :-
+    manga(ID, Titolo, _, _, _, _, Stato, Autori),
     formatta_output_nome(Titolo, Autori, Stato, Output).
 
+% enumera tutti i candidati di un raccomandatore, ognuno una sola volta e in ordine casuale
+raccomanda(Tipo, Output) :-
+    candidati(Tipo, Termine),
+    Termine =.. [_|IDs],
+    random_permutation(IDs, Mischiati),
+    member(ID, Mischiati),
+    output_candidato(Tipo, ID, Output).
+
+raccomanda_random(Output) :- raccomanda(random, Output).
+manga_qualita_nascosto(Output) :- raccomanda(qualita_nascosto, Output).
+consiglia_plan_to_read(Output) :- raccomanda(plan_to_read, Output).
+manga_premiato(Output) :- raccomanda(premiato, Output).
+manga_misto_generi_nuovi(Output) :- raccomanda(misto, Output).
+
+% estrae K candidati distinti a caso: il lavoro dipende da K e non dal numero di candidati
+campiona(Tipo, K, Campione) :-
+    campiona_id(Tipo, K, IDs),
+    maplist(output_candidato(Tipo), IDs, Campione).
+
+% come campiona/3 ma restituisce gli ID (usato anche dai worker di pool_prolog.py)
+campiona_id(Tipo, K, IDs) :-
+    candidati(Tipo, Termine),
+    functor(Termine, _, N),
+    indici_casuali(K, N, Indici),
+    random_permutation(Indici, Mischiati),
+    findall(ID, (member(I, Mischiati), arg(I, Termine, ID)), IDs).
+
+% sceglie min(K, N) indici distinti tra 1 e N con l'algoritmo di Floyd
+indici_casuali(K, N, Indici) :-
+    KEffettivo is min(K, N),
+    Inizio is N - KEffettivo + 1,
+    indici_floyd(Inizio, N, [], Indici).
+
+indici_floyd(J, N, Scelti, Scelti) :- J > N, !.
+indici_floyd(J, N, Scelti, Indici) :-
+    random_between(1, J, T),
+    ( memberchk(T, Scelti) -> Nuovo = J ; Nuovo = T ),
+    J1 is J + 1,
+    indici_floyd(J1, N, [Nuovo|Scelti], Indici).
+
 % valuta il grado di compatibilità tra un elenco di generi dati in base a quante volte ha letto quei generi
 valuta_compatibilita(GeneriForniti) :-
+    compatibilita(GeneriForniti, _, Giudizio),
+    (
+        Giudizio == molto -> writeln('Questo manga è MOLTO compatibile con i tuoi gusti!')
+    ;   Giudizio == abbastanza -> writeln('Questo manga è ABBASTANZA compatibile con i tuoi gusti.')
+    ;   writeln('Questo manga è POCO compatibile con i tuoi gusti.')
+    ).
+
+% punteggio medio dei generi forniti e giudizio (molto, abbastanza, poco) senza stampare nulla
+compatibilita(GeneriForniti, Media, Giudizio) :-
     frequenza_generi(Frequenze),
     maplist(valuta_genere(Frequenze), GeneriForniti, Punteggi),
     sum_list(Punteggi, Somma),
     length(Punteggi, N),
     (N =:= 0 -> Media = 0 ; Media is Somma / N),
-    (
-        Media >= 2 -> writeln('Questo manga è MOLTO compatibile con i tuoi gusti!')
-    ;   Media >= 1 -> writeln('Questo manga è ABBASTANZA compatibile con i tuoi gusti.')
-    ;   writeln('Questo manga è POCO compatibile con i tuoi gusti.')
+    (   Media >= 2 -> Giudizio = molto
+    ;   Media >= 1 -> Giudizio = abbastanza
+    ;   Giudizio = poco
     ).
 
 % normalizza il nome del genere in input e assegna un punteggio in base alla frequenza di lettura
@@ -112,18 +325,6 @@ valuta_genere(Frequenze, Genere, Punteggio) :-
         ; Punteggio = 0 )
     ;   Punteggio = 0 ).
 
-% suggerisce un manga non letto che condivide almeno un genere con i generi letti frequentemente (almeno 10 volte).
-raccomanda_random(Output) :-
-    generi_ordinati(Generi),
-    member(Genere-Count, Generi),
-    Count >= 10,
-    findall(ID-Titolo,(manga(ID, Titolo, GeneriManga, _, _, _, _, _),member(Genere, GeneriManga),\+ lettura_utente(ID, _, _, _, _)), Candidati),
-    list_to_set(Candidati, Unici),
-    random_permutation(Unici, Mischiati),
-    member(ID-Titolo, Mischiati),
-    manga(ID, _, _, _, _, _, Stato, Autori),
-    formatta_output_nome(Titolo, Autori, Stato, Output).
-
 % interazione con l’utente: chiede il titolo di un manga e verifica se è stato letto.
 ha_letto_manga :-
     write('Inserisci il nome del manga: '),
@@ -152,13 +353,6 @@ sostituisci_underscore_spazio(Char, Char).
 stampa_lista([]).
 stampa_lista([X|Xs]) :- writeln(X), stampa_lista(Xs).
 
-% estrae i primi N elementi da una lista, nell’ordine originale
-primi_n(0, _, []) :- !.
-primi_n(_, [], []) :- !.
-primi_n(N, [X|Xs], [X|Ys]) :-
-    N1 is N - 1,
-    primi_n(N1, Xs, Ys).
-
 % converte una stringa sostituendo tutti gli spazi con underscore
 normalize_input(Originale, Normalizzato) :-
     atom_chars(Originale, Chars),
@@ -181,12 +375,6 @@ formatta_output_nome(TitoloRaw, Autori, Stato, Output) :-
     atomic_list_concat(AutoriFormattati, ', ', AutoriConcat),
     format(atom(Output), 'NOME MANGA: ~w - AUTORE/I: ~w - STATO: ~w', [TitoloFormattato, AutoriConcat, Stato]).
 
-% applica normalizzazione (rimozione underscore iniziale) a ciascun genere nella lista di input
-normalizza_lista([], []).
-normalizza_lista([G|Gs], [GN|GNs]) :-
-    normalizza_genere(G, GN),
-    normalizza_lista(Gs, GNs).
-
 % mostra il menu principale del sistema di raccomandazione e gestisce gli input.
 menu :-
     writeln(''),
@@ -212,46 +400,31 @@ esegui_scelta(1) :-
 
 esegui_scelta(2) :-
     writeln('       Manga consigliati in base ai tuoi gusti (randomizzati)      '),
-    findall(Titolo, raccomanda_random(Titolo), Tutti),
-    list_to_set(Tutti, Unici),
-    random_permutation(Unici, Mischiati),
-    primi_n(5, Mischiati, Top5),
+    campiona(random, 5, Top5),
     stampa_lista(Top5), nl,
     menu.
 
 esegui_scelta(3) :-
     writeln('       Manga di qualità poco popolari (randomizzati)       '),
-    findall(Titolo, manga_qualita_nascosto(Titolo), Tutti),
-    list_to_set(Tutti, Unici),
-    random_permutation(Unici, Mischiati),
-    primi_n(5, Mischiati, Top5),
+    campiona(qualita_nascosto, 5, Top5),
     stampa_lista(Top5), nl,
     menu.
 
 esegui_scelta(4) :-
     writeln('       Consigliati tra i PLAN_TO_READ (randomizzati)       '),
-    findall(Titolo, consiglia_plan_to_read(Titolo), Tutti),
-    list_to_set(Tutti, Unici),
-    random_permutation(Unici, Mischiati),
-    primi_n(5, Mischiati, Top5),
+    campiona(plan_to_read, 5, Top5),
     stampa_lista(Top5), nl,
     menu.
 
 esegui_scelta(5) :-
     writeln('       Manga premiati nei tuoi generi preferiti (randomizzati)     '),
-    findall(Titolo, manga_premiato(Titolo), Tutti),
-    list_to_set(Tutti, Unici),
-    random_permutation(Unici, Mischiati),
-    primi_n(5, Mischiati, Top5),
+    campiona(premiato, 5, Top5),
     stampa_lista(Top5), nl,
     menu.
 
 esegui_scelta(6) :-
     writeln('       Manga che mischiano generi già letti e generi mai letti (randomizzati)      '),
-    findall(Titolo, manga_misto_generi_nuovi(Titolo), Tutti),
-    list_to_set(Tutti, Unici),
-    random_permutation(Unici, Mischiati),
-    primi_n(5, Mischiati, Top5),
+    campiona(misto, 5, Top5),
     stampa_lista(Top5), nl,
     menu.
 
@@ -0,0 +1,106 @@
+% worker usato da pool_prolog.py: carica system.pl una sola volta, poi legge richieste JSON (una per riga) da stdin e risponde con una riga JSON su stdout
+:- set_prolog_flag(encoding, utf8).
+:- use_module(library(http/json)).
+:- ensure_loaded('system.pl').
+
+% ciclo principale: termina quando stdin viene chiuso
+servi :-
+    set_stream(user_input, encoding(utf8)),
+    set_stream(user_output, encoding(utf8)),
+    servi_richieste.
+
+servi_richieste :-
+    json_read_dict(user_input, Richiesta, [end_of_file(fine)]),
+    (   Richiesta == fine
+    ->  true
+    ;   rispondi(Richiesta, Risposta),
+        json_write_dict(user_output, Risposta, [width(0)]),
+        nl(user_output),
+        flush_output(user_output),
+        servi_richieste
+    ).
+
+% esegue una richiesta, gli errori diventano risposte con ok = false così il worker resta attivo
+rispondi(Richiesta, Risposta) :-
+    ( get_dict(id, Richiesta, Id) -> true ; Id = null ),
+    catch(
+        (   esegui(Richiesta, Risultato)
+        ->  Risposta = _{id: Id, ok: true, risultato: Risultato}
+        ;   Risposta = _{id: Id, ok: false, errore: "nessuna soluzione"}
+        ),
+        Errore,
+        ( term_string(Errore, Testo), Risposta = _{id: Id, ok: false, errore: Testo} )
+    ).
+
+% il campo utente (facoltativo) sceglie l'utente su cui eseguire la richiesta, le sue letture vengono caricate solo la prima volta
+% senza il campo la richiesta usa sempre l'utente predefinito, non quello servito per ultimo dal worker: il risultato non dipende dal worker che la riceve
+esegui(Richiesta, Risultato) :-
+    (   get_dict(utente, Richiesta, UtenteTesto)
+    ->  atom_string(Utente, UtenteTesto),
+        usa_utente(Utente)
+    ;   utente_predefinito(Utente)
+    ->  usa_utente(Utente)
+    ;   true
+    ),
+    get_dict(query, Richiesta, QueryTesto),
+    atom_string(Query, QueryTesto),
+    esegui(Query, Richiesta, Risultato).
+
+% verifica che il worker sia pronto: fallisce (o dà errore) se il catalogo non è stato caricato
+esegui(ping, _, "pong") :-
+    manga(_, _, _, _, _, _, _, _),
+    !.
+
+% rilegge da letture/<utente>.pl le letture dell'utente corrente (dopo un aggiornamento del file)
+esegui(ricarica, _, "ok") :-
+    utente_corrente(Utente),
+    carica_utente(Utente).
+
+% K raccomandazioni distinte a caso di una regola (campiona_id/3)
+esegui(campiona, Richiesta, Manga) :-
+    regola(Richiesta, Tipo),
+    ( get_dict(k, Richiesta, K) -> true ; K = 5 ),
+    campiona_id(Tipo, K, IDs),
+    maplist(manga_json(Tipo), IDs, Manga).
+
+% tutti i candidati di una regola (candidati/2)
+esegui(candidati, Richiesta, Manga) :-
+    regola(Richiesta, Tipo),
+    candidati(Tipo, Termine),
+    Termine =.. [_|IDs],
+    maplist(manga_json(Tipo), IDs, Manga).
+
+% generi letti ordinati per frequenza (generi_ordinati/1)
+esegui(frequenze, _, Frequenze) :-
+    generi_ordinati(Generi),
+    findall(_{genere: Genere, conta: Conta}, member(Genere-Conta, Generi), Frequenze).
+
+% compatibilità di una lista di generi (compatibilita/3), i generi vengono normalizzati come nel menu
+esegui(compatibilita, Richiesta, _{media: Media, giudizio: Giudizio}) :-
+    get_dict(generi, Richiesta, GeneriTesto),
+    maplist(genere_da_testo, GeneriTesto, Generi),
+    compatibilita(Generi, Media, Giudizio).
+
+regola(Richiesta, Tipo) :-
+    get_dict(regola, Richiesta, TipoTesto),
+    atom_string(Tipo, TipoTesto).
+
+genere_da_testo(Testo, Genere) :-
+    split_string(Testo, "", " ", [Pulito]),
+    string_lower(Pulito, Minuscolo),
+    atom_string(Atomo, Minuscolo),
+    normalize_input(Atomo, Genere).
+
+% dati strutturati di un manga: i plan_to_read dalla lista dell'utente, gli altri dal catalogo
+manga_json(plan_to_read, ID, _{id: ID, titolo: Titolo}) :- !,
+    lettura_utente(ID, TitoloRaw, _, _, _),
+    formatta_titolo(TitoloRaw, Titolo).
+manga_json(_, ID, _{id: ID, titolo: Titolo, autori: Autori, stato: Stato}) :-
+    manga(ID, TitoloRaw, _, _, _, _, Stato, AutoriRaw),
+    formatta_titolo(TitoloRaw, Titolo),
+    maplist(autore_leggibile, AutoriRaw, Autori).
+
+% toglie l'underscore iniziale lasciato da crea_kb.py e sostituisce gli altri con spazi
+autore_leggibile(AutoreRaw, Autore) :-
+    normalizza_genere(AutoreRaw, Pulito),
+    formatta_titolo(Pulito, Autore).
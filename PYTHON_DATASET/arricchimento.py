@@ -0,0 +1,29 @@
+import csv  #usato per leggere il catalogo locale top_manga.csv
+import json #usato per decodificare i dettagli salvati nella cache
+import os   #usato per gestire percorsi nel filesystem
+import urllib.parse #usato per estrarre l'ID del manga dall'URL salvato in cache
+
+#costruisce l'indice in memoria ID -> (mean, rank, popolarità) dal catalogo locale e dai dettagli già presenti in cache
+def costruisci_indice(percorso_catalogo=os.path.join('DATASET', 'top_manga.csv'), cache=None):
+    indice = {}
+    #il catalogo contiene già mean, rank e popolarità dei manga della classifica
+    if percorso_catalogo and os.path.exists(percorso_catalogo):
+        with open(percorso_catalogo, 'r', encoding='utf-8') as f:
+            for row in csv.DictReader(f):
+                indice[int(row['ID'])] = (row['Punteggio Medio'], row['Rank'], row['Popolarità'])
+    da_catalogo = len(indice)
+
+    #i dettagli ancora freschi in cache sono più aggiornati del catalogo, quindi lo sovrascrivono
+    if cache is not None:
+        for url, corpo in cache.voci_fresche('/v2/manga/'):
+            percorso = urllib.parse.urlparse(url).path
+            manga_id = percorso.rstrip('/').split('/')[-1]
+            if not manga_id.isdigit():
+                #esclude ad esempio /v2/manga/ranking
+                continue
+            dati = json.loads(corpo)
+            if 'mean' in dati or 'rank' in dati or 'popularity' in dati:
+                indice[int(manga_id)] = (dati.get('mean', ''), dati.get('rank', ''), dati.get('popularity', ''))
+
+    print(f"Indice locale: {len(indice)} manga ({da_catalogo} dal catalogo, {len(indice) - da_catalogo} aggiunti dalla cache)")
+    return indice
@@ -0,0 +1,158 @@
+import sqlite3  #usato per salvare le risposte dell'API in un file locale
+import json #usato per decodificare il corpo delle risposte salvate
+import time #usato per calcolare la scadenza (TTL) delle voci
+import os   #usato per creare la cartella del file di cache
+import threading    #usato per condividere la cache tra più thread in modo sicuro
+import urllib.parse #usato per costruire la chiave (URL + parametri) e riconoscere l'endpoint
+import requests #usato per le richieste di rete quando la voce manca o è scaduta
+from strumentazione import get_misurato #latenza di ogni richiesta che va in rete
+
+#TTL predefinito (secondi) per ciascun endpoint, vale il prefisso più lungo che corrisponde al percorso
+TTL_ENDPOINT = {
+    #la classifica cambia lentamente
+    '/v2/manga/ranking': 24 * 3600,
+    #la lista dell'utente può cambiare più spesso
+    '/v2/users/': 3600,
+    #mean, rank e popolarità del singolo manga cambiano molto poco da un giorno all'altro
+    '/v2/manga/': 7 * 24 * 3600,
+}
+
+#risposta ricostruita dalla cache, espone gli stessi attributi usati dagli script di requests.Response
+class RispostaCache:
+    #permette agli script di sapere che la risposta non è passata dalla rete
+    da_cache = True
+
+    def __init__(self, corpo, status_code=200):
+        self.status_code = status_code
+        self.text = corpo
+
+    def json(self):
+        return json.loads(self.text)
+
+#cache su disco delle risposte GET, con TTL per endpoint, rivalidazione condizionale, eviction LRU e contatori hit/miss
+class CacheAPI:
+    def __init__(self, percorso=os.path.join('DATASET', 'cache_api.sqlite'), dimensione_massima=256 * 1024 * 1024, ttl=None):
+        cartella = os.path.dirname(percorso)
+        if cartella:
+            os.makedirs(cartella, exist_ok=True)
+        #una sola connessione condivisa tra i thread, protetta dal lock
+        self.conn = sqlite3.connect(percorso, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("""CREATE TABLE IF NOT EXISTS risposte (
+            chiave TEXT PRIMARY KEY,
+            corpo TEXT NOT NULL,
+            etag TEXT,
+            last_modified TEXT,
+            salvato REAL NOT NULL,
+            ultimo_accesso REAL NOT NULL,
+            dimensione INTEGER NOT NULL)""")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_accesso ON risposte(ultimo_accesso)")
+        self.conn.commit()
+        self.lock = threading.Lock()
+        self.dimensione_massima = dimensione_massima
+        #i TTL passati sovrascrivono quelli predefiniti
+        self.ttl = dict(TTL_ENDPOINT)
+        if ttl:
+            self.ttl.update(ttl)
+        self.totale = self.conn.execute("SELECT COALESCE(SUM(dimensione), 0) FROM risposte").fetchone()[0]
+        #contatori
+        self.hit = 0
+        self.miss = 0
+        self.rivalidati = 0
+        self.rimossi = 0
+
+    #la chiave è l'URL completo con i parametri in ordine stabile
+    def chiave(self, url, params=None):
+        if not params:
+            return url
+        return url + ('&' if '?' in url else '?') + urllib.parse.urlencode(sorted(params.items()))
+
+    #restituisce il TTL dell'endpoint a cui appartiene l'URL
+    def ttl_per(self, url):
+        percorso = urllib.parse.urlparse(url).path
+        for prefisso in sorted(self.ttl, key=len, reverse=True):
+            if percorso.startswith(prefisso):
+                return self.ttl[prefisso]
+        return 0
+
+    #GET attraverso la cache: se la voce è fresca non tocca la rete, se è scaduta prova la rivalidazione condizionale
+    def get(self, url, headers=None, params=None, session=None, limiter=None):
+        chiave = self.chiave(url, params)
+        adesso = time.time()
+        with self.lock:
+            riga = self.conn.execute("SELECT corpo, etag, last_modified, salvato FROM risposte WHERE chiave = ?", (chiave,)).fetchone()
+            if riga and adesso - riga[3] < self.ttl_per(url):
+                self.hit += 1
+                self.conn.execute("UPDATE risposte SET ultimo_accesso = ? WHERE chiave = ?", (adesso, chiave))
+                self.conn.commit()
+                return RispostaCache(riga[0])
+
+        #voce assente o scaduta: aggiunge gli header condizionali se l'API li aveva forniti
+        headers_richiesta = dict(headers or {})
+        if riga and riga[1]:
+            headers_richiesta['If-None-Match'] = riga[1]
+        if riga and riga[2]:
+            headers_richiesta['If-Modified-Since'] = riga[2]
+        if limiter is not None:
+            limiter.acquire()
+        get = session.get if session is not None else requests.get
+        response = get_misurato(get, url, headers=headers_richiesta, params=params)
+
+        with self.lock:
+            if riga and response.status_code == 304:
+                #il contenuto non è cambiato: rinnova solo la scadenza
+                self.rivalidati += 1
+                self.conn.execute("UPDATE risposte SET salvato = ?, ultimo_accesso = ? WHERE chiave = ?", (adesso, adesso, chiave))
+                self.conn.commit()
+                return RispostaCache(riga[0])
+            self.miss += 1
+            if response.status_code == 200:
+                self.salva(chiave, response, adesso)
+        return response
+
+    #salva (o sostituisce) una risposta e applica l'eviction, va chiamata con il lock acquisito
+    def salva(self, chiave, response, adesso):
+        corpo = response.text
+        dimensione = len(corpo.encode('utf-8'))
+        precedente = self.conn.execute("SELECT dimensione FROM risposte WHERE chiave = ?", (chiave,)).fetchone()
+        if precedente:
+            self.totale -= precedente[0]
+        self.conn.execute("INSERT OR REPLACE INTO risposte VALUES (?, ?, ?, ?, ?, ?, ?)", (chiave, corpo, response.headers.get('ETag'), response.headers.get('Last-Modified'), adesso, adesso, dimensione))
+        self.totale += dimensione
+        self.rimuovi_eccesso()
+        self.conn.commit()
+
+    #rimuove le voci usate meno di recente finché la cache non rientra nella dimensione massima
+    def rimuovi_eccesso(self):
+        if self.totale <= self.dimensione_massima:
+            return
+        da_rimuovere = []
+        for chiave, dimensione in self.conn.execute("SELECT chiave, dimensione FROM risposte ORDER BY ultimo_accesso"):
+            if self.totale <= self.dimensione_massima:
+                break
+            da_rimuovere.append((chiave,))
+            self.totale -= dimensione
+        self.conn.executemany("DELETE FROM risposte WHERE chiave = ?", da_rimuovere)
+        self.rimossi += len(da_rimuovere)
+
+    #scorre le risposte ancora fresche il cui percorso inizia con il prefisso indicato, restituendo coppie (url, corpo)
+    def voci_fresche(self, prefisso):
+        adesso = time.time()
+        with self.lock:
+            righe = self.conn.execute("SELECT chiave, corpo, salvato FROM risposte WHERE chiave LIKE ?", ('%' + prefisso + '%',)).fetchall()
+        for chiave, corpo, salvato in righe:
+            if urllib.parse.urlparse(chiave).path.startswith(prefisso) and adesso - salvato < self.ttl_per(chiave):
+                yield chiave, corpo
+
+    #restituisce i contatori della cache
+    def statistiche(self):
+        return {'hit': self.hit, 'miss': self.miss, 'rivalidati': self.rivalidati, 'rimossi': self.rimossi, 'byte': self.totale}
+
+    #stampa un riepilogo dei contatori
+    def stampa_statistiche(self):
+        richieste = self.hit + self.miss + self.rivalidati
+        percentuale = (self.hit + self.rivalidati) / richieste * 100 if richieste else 0
+        print(f"Cache API: {self.hit} hit, {self.miss} miss, {self.rivalidati} rivalidati, {self.rimossi} rimossi ({percentuale:.1f}% senza download)")
+
+    def chiudi(self):
+        self.conn.close()
@@ -0,0 +1,121 @@
+import os   #usato per leggere l'indirizzo dell'API dalle variabili d'ambiente
+import email.utils  #usato per leggere Retry-After quando è una data HTTP
+import threading    #usato per proteggere lo stato del limitatore condiviso tra più thread
+import time #usato per misurare il tempo trascorso e attendere la ricarica dei token
+import requests #usato per creare la sessione HTTP persistente
+from requests.adapters import HTTPAdapter   #usato per dimensionare il pool di connessioni keep-alive
+from strumentazione import span, endpoint, get_misurato   #latenza delle richieste e numero di tentativi
+
+#indirizzo base dell'API, MAL_API_BASE permette di puntare i download a un server locale (es. BENCHMARK/api_locale.py)
+API_BASE = os.environ.get('MAL_API_BASE', 'https://api.myanimelist.net').rstrip('/')
+#indirizzo base di autorizzazione e token OAuth, MAL_AUTH_BASE permette di ottenere il token dallo stesso server locale
+AUTH_BASE = os.environ.get('MAL_AUTH_BASE', 'https://myanimelist.net').rstrip('/')
+#attesa iniziale tra i retry per gli errori 5xx, raddoppiata a ogni tentativo (MAL_RETRY_RITARDO, es. 0.05 contro il server locale)
+RITARDO_RETRY = float(os.environ.get('MAL_RETRY_RITARDO', 2))
+
+#richiesta non andata a buon fine nemmeno dopo i retry (o con un errore non ritentabile): chi scarica le pagine la solleva, così un download interrotto non risulta completato
+class ErroreAPI(Exception):
+    def __init__(self, response, url=None):
+        self.response = response
+        super().__init__(f"risposta {response.status_code}" + (f" da {url}" if url else ""))
+
+#limitatore token-bucket condiviso: ogni richiesta consuma un token, i token si ricaricano a velocità costante fino alla capacità massima
+class TokenBucket:
+    def __init__(self, rate=5.0, capacita=None):
+        #token generati al secondo, corrisponde alla quota di richieste consentita dall'API
+        self.rate = float(rate)
+        #numero massimo di token accumulabili (dimensione del burst)
+        self.capacita = float(capacita) if capacita is not None else max(1.0, self.rate)
+        self.token = self.capacita
+        self.ultimo = time.monotonic()
+        self.lock = threading.Lock()
+
+    #attende finché non è disponibile un token e lo consuma
+    def acquire(self):
+        while True:
+            with self.lock:
+                adesso = time.monotonic()
+                #ricarica i token maturati dall'ultima richiesta
+                self.token = min(self.capacita, self.token + (adesso - self.ultimo) * self.rate)
+                self.ultimo = adesso
+                if self.token >= 1:
+                    self.token -= 1
+                    return
+                attesa = (1 - self.token) / self.rate
+            #l'attesa avviene fuori dal lock così gli altri thread possono ricalcolare il proprio turno
+            time.sleep(attesa)
+
+    #dopo un 429 tutti i thread che condividono il limitatore attendono Retry-After: i token vanno in debito per la durata della pausa
+    #più 429 contemporanei non sommano le pause, vale la più lunga
+    def pausa(self, secondi):
+        with self.lock:
+            adesso = time.monotonic()
+            self.token = min(self.capacita, self.token + (adesso - self.ultimo) * self.rate)
+            self.ultimo = adesso
+            self.token = min(self.token, -secondi * self.rate)
+
+#crea una sessione HTTP con connessioni keep-alive riutilizzate da tutti i thread
+def crea_sessione(pool=10):
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool, pool_maxsize=pool)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+#secondi indicati da Retry-After (numero di secondi oppure data HTTP), predefinito se l'header manca o non è valido
+def attesa_retry_after(response, predefinito):
+    valore = getattr(response, 'headers', {}).get('Retry-After')
+    if valore is None:
+        return predefinito
+    try:
+        return max(0.0, float(valore))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, email.utils.parsedate_to_datetime(valore).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return predefinito
+
+#effettua le richieste GET con retry: gli errori 5xx vengono ritentati con attesa esponenziale, i 429 dopo il tempo indicato da Retry-After
+#con il limitatore condiviso la pausa di un 429 vale per tutti i thread, così la quota non viene superata di nuovo subito dopo
+#esauriti i tentativi restituisce l'ultima risposta ricevuta (429 o 5xx), il chiamante la tratta come un errore
+#lo span http_con_retry misura la richiesta completa (tentativi e attese comprese), ogni tentativo in rete è uno span http_richiesta
+def request_with_retry(url, headers, params=None, max_retries=5, session=None, limiter=None, cache=None):
+    #tempo iniziale tra i retry
+    delay = RITARDO_RETRY
+    #usa la sessione keep-alive se fornita, altrimenti una connessione nuova per richiesta
+    get = session.get if session is not None else requests.get
+    with span('http_con_retry', endpoint=endpoint(url)) as misura:
+        for attempt in range(max_retries):
+            misura.imposta(tentativi=attempt + 1)
+            if cache is not None:
+                #la cache va in rete (passando dal limitatore) solo per le voci nuove o scadute
+                response = cache.get(url, headers=headers, params=params, session=session, limiter=limiter)
+            else:
+                #attende il proprio turno nel limitatore condiviso (rispetta la quota API)
+                if limiter is not None:
+                    limiter.acquire()
+                response = get_misurato(get, url, headers=headers, params=params)
+            misura.etichetta(codice=str(response.status_code))
+            misura.imposta(da_cache=getattr(response, 'da_cache', False))
+            if response.status_code == 200:
+                return response
+            elif response.status_code == 429 or response.status_code >= 500:
+                #senza Retry-After anche il 429 usa l'attesa esponenziale
+                attesa = attesa_retry_after(response, delay) if response.status_code == 429 else delay
+                print(f"Errore API: {response.status_code}, ritento tra {attesa:g} secondi...")
+                misura.imposta(attesa_secondi=misura.valori.get('attesa_secondi', 0) + attesa)
+                if response.status_code == 429 and limiter is not None:
+                    #l'attesa avviene nel limitatore al prossimo acquire, insieme a quella degli altri thread
+                    limiter.pausa(attesa)
+                else:
+                    time.sleep(attesa)
+                #raddoppia il tempo di attesa a ogni tentativo
+                delay *= 2
+            else:
+                print(f"Errore API irreversibile: {response.status_code}")
+                print(response.text)
+                return response
+        print("Numero massimo di tentativi raggiunto.")
+        misura.etichetta(codice='esauriti')
+        return response
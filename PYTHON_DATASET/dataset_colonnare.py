@@ -0,0 +1,144 @@
+import json #usato per salvare lo schema (tipi, categorie e vocabolario dei generi)
+import os   #usato per gestire percorsi e cartelle del formato colonnare
+import argparse #usato per leggere le opzioni da riga di comando del convertitore
+import numpy as np  #usato per salvare e leggere le colonne tipizzate in formato .npy (memory-mapped)
+import pandas as pd #usato per leggere velocemente i CSV da convertire
+
+#formato colonnare: per ogni CSV una cartella con un file .npy per colonna e uno schema.json
+#  - colonne numeriche tipizzate (int32/int8 con -1 per i valori mancanti, float32 con NaN)
+#  - colonne categoriche salvate come codici interi + elenco delle categorie nello schema
+#  - generi salvati come bitmask (una riga di parole uint64 per manga) + vocabolario nello schema
+#  - testi liberi salvati come byte UTF-8 concatenati + offset (letti solo se richiesti)
+
+#tipo di ogni colonna dei CSV del progetto, le colonne non elencate vengono salvate come testo
+SCHEMI = {
+    'dataset_ml.csv': {'ID': 'int32', 'Titolo': 'testo', 'Generi': 'generi', 'Punteggio_Utente': 'int8', 'Stato_Utente': 'categoria', 'Punteggio_Medio': 'float32', 'Rank': 'int32', 'Popolarita': 'int32'},
+    'mangalist.csv': {'ID': 'int32', 'Titolo': 'testo', 'Generi': 'generi', 'Punteggio': 'int8', 'Stato': 'categoria'},
+    'top_manga.csv': {'ID': 'int32', 'Titolo': 'testo', 'Generi': 'generi', 'Punteggio Medio': 'float32', 'Rank': 'int32', 'Popolarità': 'int32', 'Stato': 'categoria', 'Autori': 'testo'},
+}
+
+#valore usato nelle colonne intere per i dati mancanti
+MANCANTE = -1
+
+#cartella colonnare predefinita per un CSV di DATASET (es. DATASET/dataset_ml.csv -> DATASET/colonne/dataset_ml)
+def cartella_colonnare(percorso_csv):
+    nome = os.path.splitext(os.path.basename(percorso_csv))[0]
+    return os.path.join(os.path.dirname(percorso_csv), 'colonne', nome)
+
+#divide la stringa dei generi come fanno gli script originali
+def dividi_generi(testo):
+    return [g.strip() for g in testo.split(',') if g.strip()]
+
+#converte un CSV nel formato colonnare, restituisce la cartella creata
+def converti_csv(percorso_csv, cartella=None, schema=None):
+    cartella = cartella or cartella_colonnare(percorso_csv)
+    schema = schema or SCHEMI.get(os.path.basename(percorso_csv), {})
+    df = pd.read_csv(percorso_csv, dtype=str, keep_default_na=False)
+    os.makedirs(cartella, exist_ok=True)
+    meta = {'righe': len(df), 'colonne': {}}
+
+    for i, nome in enumerate(df.columns):
+        tipo = schema.get(nome, 'testo')
+        #il nome del file usa la posizione della colonna, il nome originale resta nello schema
+        base = os.path.join(cartella, f'c{i}')
+        info = {'tipo': tipo, 'file': f'c{i}'}
+        valori = df[nome]
+        if tipo in ('int32', 'int8'):
+            np.save(base + '.npy', pd.to_numeric(valori, errors='coerce').fillna(MANCANTE).to_numpy().astype(tipo))
+        elif tipo == 'float32':
+            np.save(base + '.npy', pd.to_numeric(valori, errors='coerce').to_numpy(dtype=np.float32))
+        elif tipo == 'categoria':
+            codici, categorie = pd.factorize(valori, sort=True)
+            np.save(base + '.npy', codici.astype(np.int16))
+            info['categorie'] = [str(c) for c in categorie]
+        elif tipo == 'generi':
+            liste = valori.map(dividi_generi)
+            vocabolario = sorted({g for lista in liste for g in lista})
+            codice = {g: c for c, g in enumerate(vocabolario)}
+            esplosi = liste.explode().dropna()
+            righe = esplosi.index.to_numpy()
+            codici = esplosi.map(codice).to_numpy(dtype=np.int64)
+            bitmask = np.zeros((len(df), max(1, (len(vocabolario) + 63) // 64)), dtype=np.uint64)
+            #imposta il bit del genere nella parola corrispondente
+            np.bitwise_or.at(bitmask, (righe, codici // 64), np.left_shift(np.uint64(1), (codici % 64).astype(np.uint64)))
+            np.save(base + '.npy', bitmask)
+            info['vocabolario'] = vocabolario
+        else:
+            codificati = [v.encode('utf-8') for v in valori]
+            offset = np.zeros(len(codificati) + 1, dtype=np.int64)
+            np.cumsum([len(b) for b in codificati], out=offset[1:])
+            np.save(base + '.dati.npy', np.frombuffer(b''.join(codificati), dtype=np.uint8))
+            np.save(base + '.offset.npy', offset)
+        meta['colonne'][nome] = info
+
+    with open(os.path.join(cartella, 'schema.json'), 'w', encoding='utf-8') as f:
+        json.dump(meta, f, ensure_ascii=False, indent=2)
+    print(f"Convertito '{percorso_csv}' in '{cartella}' ({len(df)} righe, {len(df.columns)} colonne)")
+    return cartella
+
+#vero se la cartella colonnare esiste ed è più recente del CSV di origine
+def aggiornato(percorso_csv, cartella=None):
+    schema = os.path.join(cartella or cartella_colonnare(percorso_csv), 'schema.json')
+    return os.path.exists(schema) and os.path.getmtime(schema) >= os.path.getmtime(percorso_csv)
+
+#legge lo schema di una cartella colonnare
+def leggi_schema(cartella):
+    with open(os.path.join(cartella, 'schema.json'), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+#carica una sola colonna: array numerico, codici di categoria, bitmask dei generi oppure lista di stringhe per i testi
+#i file numerici vengono aperti in memory-map, quindi il costo iniziale non dipende dal numero di righe
+def carica_colonna(cartella, nome, mmap=True, schema=None):
+    schema = schema or leggi_schema(cartella)
+    info = schema['colonne'][nome]
+    base = os.path.join(cartella, info['file'])
+    modo = 'r' if mmap else None
+    if info['tipo'] == 'testo':
+        dati = np.load(base + '.dati.npy', mmap_mode=modo)
+        offset = np.load(base + '.offset.npy')
+        return [bytes(dati[offset[i]:offset[i + 1]]).decode('utf-8') for i in range(len(offset) - 1)]
+    return np.load(base + '.npy', mmap_mode=modo)
+
+#carica solo le colonne richieste, restituisce un dizionario nome -> valori
+def carica_colonne(cartella, colonne=None, mmap=True):
+    schema = leggi_schema(cartella)
+    return {nome: carica_colonna(cartella, nome, mmap, schema) for nome in (colonne or schema['colonne'])}
+
+#espande la bitmask dei generi in una matrice 0/1 (righe x generi del vocabolario)
+def generi_a_matrice(bitmask, n_generi):
+    #ogni parola uint64 viene letta come 8 byte little-endian e scompattata bit per bit
+    byte = np.ascontiguousarray(bitmask).astype('<u8').view(np.uint8).reshape(len(bitmask), -1)
+    return np.unpackbits(byte, axis=1, bitorder='little')[:, :n_generi]
+
+#scorre le righe come dizionari con valori nativi (generi come lista di nomi), utile per chi genera testo come crea_kb
+def iter_righe(cartella, colonne=None):
+    schema = leggi_schema(cartella)
+    colonne = colonne or list(schema['colonne'])
+    valori = {}
+    for nome in colonne:
+        info = schema['colonne'][nome]
+        dati = carica_colonna(cartella, nome, schema=schema)
+        if info['tipo'] == 'categoria':
+            valori[nome] = [info['categorie'][c] if c >= 0 else '' for c in dati]
+        elif info['tipo'] == 'generi':
+            vocabolario = info['vocabolario']
+            matrice = generi_a_matrice(dati, len(vocabolario))
+            valori[nome] = [[vocabolario[c] for c in np.flatnonzero(riga)] for riga in matrice]
+        elif info['tipo'] == 'float32':
+            #la conversione in testo usa la rappresentazione più corta del float32 (es. 9.47 e non 9.470000267), i valori interi tornano interi come nell'API
+            valori[nome] = ['' if v == 'nan' else (int(float(v)) if float(v).is_integer() else float(v)) for v in dati.astype(str)]
+        elif info['tipo'] in ('int32', 'int8'):
+            valori[nome] = ['' if v == MANCANTE else int(v) for v in dati]
+        else:
+            valori[nome] = dati
+    for i in range(schema['righe']):
+        yield {nome: valori[nome][i] for nome in colonne}
+
+#main: converte i CSV presenti in DATASET (o quelli indicati)
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Converte i CSV di DATASET nel formato colonnare tipizzato")
+    parser.add_argument('csv', nargs='*', default=[os.path.join('DATASET', nome) for nome in SCHEMI], help="CSV da convertire")
+    args = parser.parse_args()
+    for percorso in args.csv:
+        if os.path.exists(percorso):
+            converti_csv(percorso)
@@ -0,0 +1,111 @@
+import argparse #usato per leggere le opzioni da riga di comando
+import csv  #usato per leggere il file con username e token
+import json #usato per salvare il riepilogo dell'ingestione
+import os   #usato per gestire le cartelle di output per utente
+import time #usato per misurare latenza per utente e throughput complessivo
+from concurrent.futures import ThreadPoolExecutor   #usato per elaborare più utenti in parallelo
+
+#moduli interni del progetto
+from connessione_api import TokenBucket, crea_sessione  #limitatore globale e pool di connessioni condiviso
+from cache_api import CacheAPI  #cache locale delle risposte dell'API
+from arricchimento import costruisci_indice #indice locale ID -> mean, rank, popolarità
+from user_estesa import iter_user_mangalist_extended, save_pages_to_csv as salva_estesa #lista estesa (dataset_ml.csv)
+from user_manga import iter_user_mangalist, save_pages_to_csv as salva_semplice   #lista semplice (mangalist.csv)
+from strumentazione import span, configura  #durata e memoria dell'ingestione e di ogni utente
+
+#legge il file degli utenti: CSV con intestazione username,access_token (le righe che iniziano con # vengono ignorate)
+def leggi_utenti(percorso):
+    with open(percorso, 'r', encoding='utf-8') as f:
+        righe = (riga for riga in f if riga.strip() and not riga.startswith('#'))
+        return [(row['username'].strip(), row['access_token'].strip()) for row in csv.DictReader(righe)]
+
+#avvolge il generatore di pagine contando le righe che lo attraversano
+class ContaRighe:
+    def __init__(self, pagine):
+        self.pagine = pagine
+        self.totale = 0
+
+    def __iter__(self):
+        for pagina in self.pagine:
+            self.totale += len(pagina)
+            yield pagina
+
+#scarica la lista di un singolo utente nella sua partizione di output, restituisce le statistiche dell'utente
+def ingerisci_utente(username, access_token, tipo, cartella, session, limiter, cache, indice, workers_dettagli):
+    inizio = time.perf_counter()
+    partizione = os.path.join(cartella, username)
+    if tipo == 'estesa':
+        righe = ContaRighe(iter_user_mangalist_extended(username, access_token, workers=workers_dettagli, session=session, limiter=limiter, cache=cache, indice=indice))
+        salva, filename = salva_estesa, 'dataset_ml.csv'
+    else:
+        righe = ContaRighe(iter_user_mangalist(username, access_token, cache=cache, session=session, limiter=limiter))
+        salva, filename = salva_semplice, 'mangalist.csv'
+    errore = None
+    with span('ingestione_utente', tipo=tipo) as misura:
+        try:
+            #le pagine vengono scritte nella partizione dell'utente man mano che arrivano, il file sostituisce quello precedente solo a download completato
+            #una pagina non scaricata solleva ErroreAPI: l'utente risulta in errore e la partizione precedente resta invariata
+            salva(righe, filename=filename, folder=partizione)
+        except Exception as e:
+            errore = str(e)
+            print(f"Errore per l'utente {username}: {e}")
+        misura.imposta(utente=username, righe=righe.totale, errore=errore)
+    latenza = time.perf_counter() - inizio
+    return {'username': username, 'manga': righe.totale, 'secondi': round(latenza, 3), 'errore': errore}
+
+#elabora tutti gli utenti con un pool di worker che condividono sessione, limitatore e cache
+def ingestione_batch(utenti, tipo='estesa', cartella=os.path.join('DATASET', 'utenti'), workers=4, workers_dettagli=1, richieste_al_secondo=5, usa_cache=True, usa_catalogo=True):
+    #un solo pool di connessioni keep-alive per tutti i thread (utenti e dettagli)
+    session = crea_sessione(pool=workers * max(workers_dettagli, 1))
+    #un solo limitatore: la quota API vale per tutto il processo, non per il singolo utente
+    limiter = TokenBucket(rate=richieste_al_secondo)
+    cache = CacheAPI() if usa_cache else None
+    indice = costruisci_indice(cache=cache) if usa_catalogo and tipo == 'estesa' else None
+
+    inizio = time.perf_counter()
+    with span('ingestione', profila=True, tipo=tipo) as misura, ThreadPoolExecutor(max_workers=workers) as executor:
+        #map mantiene l'ordine del file di input nel riepilogo
+        risultati = list(executor.map(lambda utente: ingerisci_utente(utente[0], utente[1], tipo, cartella, session, limiter, cache, indice, workers_dettagli), utenti))
+        misura.imposta(utenti=len(utenti), righe=sum(r['manga'] for r in risultati))
+    durata = time.perf_counter() - inizio
+    session.close()
+
+    #riepilogo: latenza per utente e throughput complessivo
+    print("\nRiepilogo ingestione")
+    for r in risultati:
+        stato = f"ERRORE: {r['errore']}" if r['errore'] else "ok"
+        print(f"    {r['username']}: {r['manga']} manga in {r['secondi']:.1f} s ({stato})")
+    totale_manga = sum(r['manga'] for r in risultati)
+    completati = len([r for r in risultati if not r['errore']])
+    print(f"Utenti completati: {completati}/{len(risultati)} in {durata:.1f} s")
+    print(f"Throughput: {totale_manga / durata if durata > 0 else 0:.2f} manga/s, {len(risultati) / durata if durata > 0 else 0:.3f} utenti/s")
+    if cache is not None:
+        cache.stampa_statistiche()
+        cache.chiudi()
+
+    riepilogo = {'tipo': tipo, 'secondi': round(durata, 3), 'manga': totale_manga, 'utenti': risultati}
+    os.makedirs(cartella, exist_ok=True)
+    with open(os.path.join(cartella, 'riepilogo_batch.json'), 'w', encoding='utf-8') as f:
+        json.dump(riepilogo, f, indent=2, ensure_ascii=False)
+    return riepilogo
+
+#main
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Ingestione batch delle liste manga di più utenti MyAnimeList")
+    parser.add_argument('file_utenti', help="CSV con intestazione username,access_token")
+    parser.add_argument('--tipo', choices=['estesa', 'semplice'], default='estesa', help="estesa = dataset_ml.csv, semplice = mangalist.csv")
+    parser.add_argument('--cartella', default=os.path.join('DATASET', 'utenti'), help="cartella delle partizioni per utente")
+    parser.add_argument('--workers', type=int, default=4, help="utenti elaborati in parallelo")
+    parser.add_argument('--workers-dettagli', type=int, default=1, help="thread per i dettagli dei manga di ciascun utente")
+    parser.add_argument('--rps', type=float, default=5, help="richieste al secondo consentite per l'intero processo")
+    parser.add_argument('--no-cache', action='store_true', help="scarica tutto dalla rete ignorando la cache locale")
+    parser.add_argument('--no-catalogo', action='store_true', help="non usa top_manga.csv per evitare le richieste di dettaglio")
+    parser.add_argument('--metriche', help="cartella in cui salvare gli span (eventi.jsonl) e il riepilogo Prometheus (metriche.prom)")
+    parser.add_argument('--profilo', action='store_true', help="con --metriche salva anche il profilo cProfile dell'ingestione")
+    args = parser.parse_args()
+
+    if args.metriche:
+        configura(args.metriche, profilo=args.profilo)
+    utenti = leggi_utenti(args.file_utenti)
+    print(f"Utenti da elaborare: {len(utenti)}")
+    ingestione_batch(utenti, tipo=args.tipo, cartella=args.cartella, workers=args.workers, workers_dettagli=args.workers_dettagli, richieste_al_secondo=args.rps, usa_cache=not args.no_cache, usa_catalogo=not args.no_catalogo)
@@ -0,0 +1,56 @@
+import json #usato per serializzare ogni checkpoint su una singola riga
+import os   #usato per forzare la scrittura su disco e rimuovere il journal
+
+#journal append-only dei checkpoint: ogni riga JSON contiene le righe di una pagina insieme all'offset da cui riprendere,
+#così pagina e offset vengono scritti con un'unica append e una riga troncata da un crash viene semplicemente scartata
+class JournalCheckpoint:
+    def __init__(self, percorso):
+        self.percorso = percorso
+        self.file = None
+
+    #rilegge il journal in un solo passaggio lineare producendo (righe della pagina, offset successivo) per ogni checkpoint valido
+    def leggi(self):
+        if not os.path.exists(self.percorso):
+            return
+        validi = 0
+        pagine = 0
+        offset = 0
+        with open(self.percorso, 'rb') as f:
+            for linea in f:
+                #l'ultima riga può essere incompleta se il processo si è interrotto durante la scrittura
+                if not linea.endswith(b'\n'):
+                    break
+                try:
+                    record = json.loads(linea)
+                except ValueError:
+                    break
+                validi += len(linea)
+                pagine += 1
+                offset = record['offset']
+                yield record['righe'], offset
+        #elimina l'eventuale coda incompleta così le nuove pagine vengono accodate a un file valido
+        if validi < os.path.getsize(self.percorso):
+            with open(self.percorso, 'r+b') as f:
+                f.truncate(validi)
+        if pagine:
+            print(f"Ripresa dal journal '{self.percorso}': {pagine} pagine già scaricate, offset {offset}")
+
+    #accoda le righe di una pagina e l'offset successivo, scrivendo solo i dati nuovi
+    def aggiungi(self, righe, offset):
+        if self.file is None:
+            os.makedirs(os.path.dirname(self.percorso) or '.', exist_ok=True)
+            self.file = open(self.percorso, 'a', encoding='utf-8')
+        self.file.write(json.dumps({'offset': offset, 'righe': righe}, ensure_ascii=False) + '\n')
+        self.file.flush()
+        os.fsync(self.file.fileno())
+
+    def chiudi(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    #rimuove il journal a download completato
+    def rimuovi(self):
+        self.chiudi()
+        if os.path.exists(self.percorso):
+            os.remove(self.percorso)
@@ -0,0 +1,25 @@
+import csv  #usato per scrivere le righe in formato CSV
+import os   #usato per creare la cartella di destinazione e sostituire il file in modo atomico
+
+#scrive su CSV le pagine di righe prodotte da un generatore, una pagina alla volta, senza tenerle tutte in memoria
+#le righe vanno in un file temporaneo che sostituisce quello finale solo se il generatore termina senza errori,
+#così un download interrotto lascia al suo posto il CSV precedente
+#restituisce il numero di righe scritte
+def scrivi_csv_incrementale(pagine, filepath, fieldnames):
+    os.makedirs(os.path.dirname(filepath) or '.', exist_ok=True)
+    temporaneo = filepath + '.tmp'
+    totale = 0
+    try:
+        with open(temporaneo, mode='w', newline='', encoding='utf-8') as file:
+            writer = csv.DictWriter(file, fieldnames=fieldnames)
+            writer.writeheader()
+            for pagina in pagine:
+                writer.writerows(pagina)
+                #rende subito visibili su disco le righe della pagina
+                file.flush()
+                totale += len(pagina)
+    except BaseException:
+        os.remove(temporaneo)
+        raise
+    os.replace(temporaneo, filepath)
+    return totale
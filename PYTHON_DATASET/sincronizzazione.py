@@ -0,0 +1,111 @@
+import csv  #usato per leggere e riscrivere il dataset esistente
+import json #usato per salvare il watermark dell'ultima sincronizzazione
+import os   #usato per gestire percorsi e sostituire i file in modo atomico
+from datetime import datetime   #usato per confrontare le date di modifica restituite dall'API
+
+#file che conserva, per ogni utente, il watermark di ciascun dataset sincronizzato
+def percorso_stato(username, folder='DATASET'):
+    return os.path.join(folder, f'sync_{username}.json')
+
+#legge il watermark (updated_at più recente già importato) del file indicato, None se non è mai stato sincronizzato
+def carica_watermark(username, filename, folder='DATASET'):
+    percorso = percorso_stato(username, folder)
+    if not os.path.exists(percorso):
+        return None
+    with open(percorso, 'r', encoding='utf-8') as f:
+        return json.load(f).get(filename)
+
+#salva il nuovo watermark del file indicato, la scrittura avviene su un file temporaneo poi rinominato
+def salva_watermark(username, filename, watermark, folder='DATASET'):
+    percorso = percorso_stato(username, folder)
+    stato = {}
+    if os.path.exists(percorso):
+        with open(percorso, 'r', encoding='utf-8') as f:
+            stato = json.load(f)
+    stato[filename] = watermark
+    os.makedirs(folder, exist_ok=True)
+    with open(percorso + '.tmp', 'w', encoding='utf-8') as f:
+        json.dump(stato, f, indent=2)
+    os.replace(percorso + '.tmp', percorso)
+
+#vero se la data a è successiva alla data b (formato ISO 8601 dell'API)
+def piu_recente(a, b):
+    return datetime.fromisoformat(a) > datetime.fromisoformat(b)
+
+#scorre la lista ordinata per data di modifica (più recenti prima) fermandosi alla prima voce più vecchia del watermark
+#le voci con la stessa data del watermark vengono riscaricate: updated_at ha la risoluzione del secondo e unisci_per_id le sovrascrive senza duplicarle
+#get_pagina(params) esegue la richiesta di una pagina, restituisce (voci modificate, nuovo watermark) oppure (None, watermark) in caso di errore
+def scarica_modifiche(fields, watermark, get_pagina, limit=100, max_manga=25000):
+    modificate = []
+    nuovo_watermark = watermark
+    for offset in range(0, max_manga, limit):
+        params = {
+            'limit': limit,
+            'offset': offset,
+            'fields': fields,
+            'sort': 'list_updated_at'
+        }
+        response = get_pagina(params)
+        if not response or response.status_code != 200:
+            print("Sincronizzazione interrotta, il dataset non viene modificato.")
+            return None, watermark
+
+        data = response.json().get('data', [])
+        if not data:
+            break
+        for entry in data:
+            aggiornato = entry.get('list_status', {}).get('updated_at')
+            #le voci successive sono tutte più vecchie: la parte rimanente della lista è già nel dataset
+            if watermark and aggiornato and piu_recente(watermark, aggiornato):
+                print(f"Raggiunto il watermark {watermark} a offset {offset}")
+                return modificate, nuovo_watermark
+            modificate.append(entry)
+            if aggiornato and (nuovo_watermark is None or piu_recente(aggiornato, nuovo_watermark)):
+                nuovo_watermark = aggiornato
+        print(f"Recuperate {len(data)} voci da offset {offset}")
+    return modificate, nuovo_watermark
+
+#raccoglie gli ID ancora presenti nella lista dell'utente con pagine grandi e campi minimi, serve a rilevare le cancellazioni
+def id_nella_lista(get_pagina, limit=1000, max_manga=25000):
+    presenti = set()
+    for offset in range(0, max_manga, limit):
+        response = get_pagina({'limit': limit, 'offset': offset, 'fields': 'id'})
+        if not response or response.status_code != 200:
+            return None
+        data = response.json().get('data', [])
+        if not data:
+            break
+        presenti.update(str(entry.get('node', {}).get('id', '')) for entry in data)
+    return presenti
+
+#unisce al CSV esistente le righe nuove o aggiornate e rimuove quelle cancellate usando l'ID come chiave
+#se id_presenti è indicato vengono tenute solo le righe il cui ID compare nella lista attuale dell'utente
+def unisci_per_id(filepath, fieldnames, aggiornate, rimossi=(), id_presenti=None):
+    righe = {}
+    if os.path.exists(filepath):
+        with open(filepath, 'r', encoding='utf-8', newline='') as f:
+            for row in csv.DictReader(f):
+                righe[row['ID']] = row
+    prima = set(righe)
+
+    for row in aggiornate:
+        righe[str(row['ID'])] = row
+    for manga_id in rimossi:
+        righe.pop(str(manga_id), None)
+    if id_presenti is not None:
+        righe = {manga_id: row for manga_id, row in righe.items() if manga_id in id_presenti}
+
+    inseriti = len(set(righe) - prima)
+    cancellati = len(prima - set(righe))
+    aggiornati = len([row for row in aggiornate if str(row['ID']) in prima and str(row['ID']) in righe])
+
+    #stesso ordinamento della lista MAL (per titolo, senza distinguere maiuscole e minuscole)
+    ordinate = sorted(righe.values(), key=lambda row: str(row['Titolo']).lower())
+    os.makedirs(os.path.dirname(filepath) or '.', exist_ok=True)
+    with open(filepath + '.tmp', mode='w', newline='', encoding='utf-8') as file:
+        writer = csv.DictWriter(file, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(ordinate)
+    os.replace(filepath + '.tmp', filepath)
+    print(f"\nFile aggiornato: '{filepath}' ({inseriti} inseriti, {aggiornati} aggiornati, {cancellati} rimossi, {len(ordinate)} totali)")
+    return inseriti, aggiornati, cancellati
@@ -0,0 +1,233 @@
+import os   #usato per la cartella delle metriche e le variabili d'ambiente che la passano ai processi figli
+import json #usato per scrivere un evento per riga (JSONL)
+import time #usato per tempo reale e tempo CPU degli span
+import atexit   #usato per esportare il file Prometheus alla fine del processo
+import argparse #usato per leggere le opzioni da riga di comando (riepilogo di una cartella di metriche)
+import cProfile #usato per il profilo facoltativo delle fasi principali
+import threading    #usato per scrivere gli eventi di più thread senza mescolare le righe
+import functools    #usato per il decoratore strumentato
+from contextlib import contextmanager   #usato per gli span come context manager
+
+try:
+    import resource #per il picco di memoria residente del processo (solo Linux/macOS)
+except ImportError:
+    resource = None
+
+#la configurazione passa dalle variabili d'ambiente, così anche i processi di joblib (griglia e cross-validation) scrivono nella stessa cartella
+VARIABILE_CARTELLA = 'STRUMENTAZIONE_CARTELLA'
+VARIABILE_PROFILO = 'STRUMENTAZIONE_PROFILO'
+
+#stato del processo: file degli eventi aperto alla prima scrittura (uno per processo) e profilo attivo
+stato = {'pid': None, 'file': None, 'profilo_attivo': False, 'contatore': 0}
+lock = threading.Lock()
+
+#attiva la strumentazione: gli eventi vanno in <cartella>/eventi.jsonl, alla fine del processo viene scritto <cartella>/metriche.prom
+#profilo = salva anche un file cProfile per ogni fase principale in <cartella>/profili/
+def configura(cartella, profilo=False):
+    os.makedirs(cartella, exist_ok=True)
+    os.environ[VARIABILE_CARTELLA] = os.path.abspath(cartella)
+    if profilo:
+        os.environ[VARIABILE_PROFILO] = '1'
+    atexit.register(esporta_prometheus, os.path.abspath(cartella))
+    print(f"Strumentazione attiva: eventi in '{os.path.join(cartella, 'eventi.jsonl')}'" + (", profili cProfile delle fasi" if profilo else ""))
+
+def attiva():
+    return bool(os.environ.get(VARIABILE_CARTELLA))
+
+#memoria residente attuale e picco del processo in MB (None se non disponibili)
+def memoria():
+    attuale = picco = None
+    try:
+        with open('/proc/self/statm', 'r') as f:
+            attuale = int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 1024 / 1024
+    except (OSError, ValueError, AttributeError):
+        pass
+    if resource is not None:
+        picco = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    return attuale, picco
+
+#accoda un evento al file del processo, ogni riga viene scritta per intero con una sola write
+def scrivi_evento(evento):
+    with lock:
+        if stato['pid'] != os.getpid():
+            #processo nuovo (avviato o fork): apre il proprio file in append
+            stato['pid'] = os.getpid()
+            stato['file'] = open(os.path.join(os.environ[VARIABILE_CARTELLA], 'eventi.jsonl'), 'a', encoding='utf-8')
+        stato['file'].write(json.dumps(evento, ensure_ascii=False, default=str) + '\n')
+        stato['file'].flush()
+
+#span in corso: le etichette finiscono anche nel file Prometheus (valori con pochi casi possibili, es. modello o endpoint), i valori solo negli eventi JSONL
+class Span:
+    def __init__(self, nome, etichette):
+        self.nome = nome
+        self.etichette = etichette
+        self.valori = {}
+
+    def etichetta(self, **etichette):
+        self.etichette.update(etichette)
+
+    def imposta(self, **valori):
+        self.valori.update(valori)
+
+#registra un evento già misurato altrove (es. i tempi dei fold restituiti da cross_validate)
+def registra(nome, secondi, etichette=None, **valori):
+    if not attiva():
+        return
+    evento = {'span': nome, 'etichette': etichette or {}, 'ts': round(time.time(), 3), 'pid': os.getpid(), 'secondi': round(secondi, 6)}
+    if valori.get('righe') and secondi > 0:
+        valori['righe_al_secondo'] = round(valori['righe'] / secondi, 1)
+    evento.update(valori)
+    scrivi_evento(evento)
+
+#misura tempo reale, tempo CPU del processo e memoria di un blocco di codice
+#profila = fase principale: con la profilazione attiva salva il profilo cProfile del blocco (solo lo span più esterno, un profilo alla volta per processo)
+#cProfile registra solo il thread che lo attiva: nei thread di lavoro conviene profilare lo span esterno che li contiene
+#senza strumentazione attiva lo span non misura nulla
+@contextmanager
+def span(nome, profila=False, **etichette):
+    corrente = Span(nome, etichette)
+    if not attiva():
+        yield corrente
+        return
+    profilo = None
+    if profila and os.environ.get(VARIABILE_PROFILO):
+        #verifica e prenotazione del profilo sotto lock: con più thread un solo span alla volta può attivarlo
+        with lock:
+            libero = not stato['profilo_attivo']
+            stato['profilo_attivo'] = True
+        if libero:
+            profilo = cProfile.Profile()
+            profilo.enable()
+    _, picco_iniziale = memoria()
+    inizio, cpu = time.perf_counter(), time.process_time()
+    errore = None
+    try:
+        yield corrente
+    except BaseException as e:
+        errore = type(e).__name__
+        raise
+    finally:
+        secondi = time.perf_counter() - inizio
+        cpu = time.process_time() - cpu
+        if profilo is not None:
+            profilo.disable()
+            cartella = os.path.join(os.environ[VARIABILE_CARTELLA], 'profili')
+            os.makedirs(cartella, exist_ok=True)
+            with lock:
+                stato['profilo_attivo'] = False
+                stato['contatore'] += 1
+                contatore = stato['contatore']
+            profilo.dump_stats(os.path.join(cartella, f"{nome}_{os.getpid()}_{contatore}.prof"))
+        attuale, picco = memoria()
+        valori = {'cpu_secondi': round(cpu, 6), 'rss_mb': round(attuale, 1) if attuale else None, 'picco_rss_mb': round(picco, 1) if picco else None,
+                  'aumento_picco_mb': round(picco - picco_iniziale, 1) if picco and picco_iniziale else None}
+        if errore:
+            valori['errore'] = errore
+        registra(nome, secondi, corrente.etichette, **dict(valori, **corrente.valori))
+
+#decoratore: ogni chiamata della funzione è uno span (nome predefinito: nome della funzione)
+def strumentato(nome=None, profila=False, **etichette):
+    def decoratore(funzione):
+        @functools.wraps(funzione)
+        def avvolta(*args, **kwargs):
+            with span(nome or funzione.__name__, profila=profila, **etichette):
+                return funzione(*args, **kwargs)
+        return avvolta
+    return decoratore
+
+#percorso dell'endpoint senza parti variabili (ID e nome utente), usato come etichetta delle richieste HTTP
+def endpoint(url):
+    import urllib.parse #solo per le richieste HTTP
+    parti = urllib.parse.urlparse(url).path.strip('/').split('/')
+    if parti[:2] == ['v2', 'users']:
+        return '/v2/users/<utente>/' + '/'.join(parti[3:])
+    if parti[:2] == ['v2', 'manga'] and parti[-1].isdigit():
+        return '/v2/manga/<id>'
+    return '/' + '/'.join(parti)
+
+#esegue una GET misurandone la latenza, con endpoint e codice di risposta come etichette
+def get_misurato(get, url, **kwargs):
+    with span('http_richiesta', endpoint=endpoint(url)) as s:
+        response = get(url, **kwargs)
+        s.etichetta(codice=str(response.status_code))
+    return response
+
+#legge gli eventi di tutti i processi
+def leggi_eventi(cartella):
+    percorso = os.path.join(cartella, 'eventi.jsonl')
+    if not os.path.exists(percorso):
+        return []
+    with open(percorso, 'r', encoding='utf-8') as f:
+        return [json.loads(riga) for riga in f if riga.strip()]
+
+#raggruppa gli eventi per span ed etichette
+def aggrega(eventi):
+    gruppi = {}
+    for evento in eventi:
+        chiave = (evento['span'], tuple(sorted(evento.get('etichette', {}).items())))
+        gruppi.setdefault(chiave, []).append(evento)
+    return gruppi
+
+#quantile di una lista già ordinata (interpolazione lineare)
+def quantile(ordinati, q):
+    posizione = (len(ordinati) - 1) * q
+    basso = int(posizione)
+    alto = min(basso + 1, len(ordinati) - 1)
+    return ordinati[basso] + (ordinati[alto] - ordinati[basso]) * (posizione - basso)
+
+#scrive <cartella>/metriche.prom nel formato testuale di Prometheus a partire dagli eventi di tutti i processi:
+#durata (summary con quantili 0.5, 0.95 e 0.99), tempo CPU e righe (contatori) e picco di memoria (gauge) per span ed etichette
+def esporta_prometheus(cartella):
+    gruppi = aggrega(leggi_eventi(cartella))
+    if not gruppi:
+        return
+    def etichette(coppie, **altre):
+        tutte = [('span', coppie[0])] + list(coppie[1]) + list(altre.items())
+        return '{' + ','.join(f'{k}="' + str(v).replace('\\', '\\\\').replace('"', '\\"') + '"' for k, v in tutte) + '}'
+
+    righe = ['# HELP manga_span_secondi Durata degli span (tempo reale)', '# TYPE manga_span_secondi summary']
+    for chiave, eventi in sorted(gruppi.items()):
+        durate = sorted(e['secondi'] for e in eventi)
+        for q in (0.5, 0.95, 0.99):
+            righe.append(f"manga_span_secondi{etichette(chiave, quantile=q)} {quantile(durate, q):.6f}")
+        righe.append(f"manga_span_secondi_sum{etichette(chiave)} {sum(durate):.6f}")
+        righe.append(f"manga_span_secondi_count{etichette(chiave)} {len(durate)}")
+    righe += ['# HELP manga_span_cpu_secondi_total Tempo CPU del processo durante gli span', '# TYPE manga_span_cpu_secondi_total counter']
+    for chiave, eventi in sorted(gruppi.items()):
+        cpu = [e['cpu_secondi'] for e in eventi if e.get('cpu_secondi') is not None]
+        if cpu:
+            righe.append(f"manga_span_cpu_secondi_total{etichette(chiave)} {sum(cpu):.6f}")
+    righe += ['# HELP manga_span_righe_total Righe elaborate negli span', '# TYPE manga_span_righe_total counter']
+    for chiave, eventi in sorted(gruppi.items()):
+        conteggio = [e['righe'] for e in eventi if e.get('righe') is not None]
+        if conteggio:
+            righe.append(f"manga_span_righe_total{etichette(chiave)} {sum(conteggio)}")
+    righe += ['# HELP manga_span_picco_rss_mb Picco di memoria residente del processo alla fine degli span', '# TYPE manga_span_picco_rss_mb gauge']
+    for chiave, eventi in sorted(gruppi.items()):
+        picchi = [e['picco_rss_mb'] for e in eventi if e.get('picco_rss_mb') is not None]
+        if picchi:
+            righe.append(f"manga_span_picco_rss_mb{etichette(chiave)} {max(picchi):.1f}")
+    temporaneo = os.path.join(cartella, 'metriche.prom.tmp')
+    with open(temporaneo, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(righe) + '\n')
+    os.replace(temporaneo, os.path.join(cartella, 'metriche.prom'))
+
+#stampa gli span ordinati per tempo totale, per trovare le fasi più costose
+def stampa_riepilogo(cartella, n=20):
+    gruppi = aggrega(leggi_eventi(cartella))
+    print(f"{'span':<48} {'n':>7} {'totale (s)':>11} {'media (ms)':>11} {'p95 (ms)':>10} {'CPU (s)':>9}")
+    for (nome, coppie), eventi in sorted(gruppi.items(), key=lambda g: -sum(e['secondi'] for e in g[1]))[:n]:
+        durate = sorted(e['secondi'] for e in eventi)
+        descrizione = nome + (' ' + ','.join(f'{k}={v}' for k, v in coppie) if coppie else '')
+        cpu = sum(e.get('cpu_secondi') or 0 for e in eventi)
+        print(f"{descrizione[:48]:<48} {len(durate):>7} {sum(durate):>11.3f} {sum(durate) / len(durate) * 1000:>11.2f} {quantile(durate, 0.95) * 1000:>10.2f} {cpu:>9.3f}")
+
+#main: riepilogo degli span di una cartella e nuova esportazione del file Prometheus
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Riepilogo degli span registrati (eventi.jsonl) e esportazione Prometheus")
+    parser.add_argument('cartella', help="cartella passata con --metriche")
+    parser.add_argument('-n', type=int, default=20, help="span da mostrare")
+    args = parser.parse_args()
+    esporta_prometheus(args.cartella)
+    stampa_riepilogo(args.cartella, args.n)
+    print(f"\nFile Prometheus: '{os.path.join(args.cartella, 'metriche.prom')}', profili (se presenti) in '{os.path.join(args.cartella, 'profili')}' (python -m pstats)")
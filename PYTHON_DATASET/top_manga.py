@@ -4,9 +4,11 @@ import secrets  #usato per generare stringhe casuali sicure (in PKCE)
 import string   #usato per creare il code_verifier (PKCE)
 from http.server import HTTPServer, BaseHTTPRequestHandler  #usato per creare il server locale per ricevere l'OAuth code
 import urllib.parse #usato per costruire URL con parametri
-import csv  #usato per scrivere e salvare file in formato CSV
 import time #usato per gestire pause tra richieste (rate limiting)
 import os   #usato per gestire percorsi e directory nel filesystem
+from cache_api import CacheAPI  #cache locale delle risposte dell'API
+from connessione_api import request_with_retry, ErroreAPI, API_BASE, AUTH_BASE    #richieste con retry (5xx e 429) e indirizzi dell'API e del token (sostituibili con MAL_API_BASE e MAL_AUTH_BASE)
+from scrittura_csv import scrivi_csv_incrementale   #scrittura del CSV pagina per pagina
 
 #credenziali dell'applicazione, ottenute dal sito myanimelist.net/apiconfig
 #ID dell'applicazione fornito da MAL
@@ -42,13 +44,13 @@ class OAuthCallbackHandler(BaseHTTPRequestHandler):
 
 #costruisce l’URL di autorizzazione e lo apre nel browser dell’utente
 def open_authorization_url(code_verifier):
-    auth_url = (f"https://myanimelist.net/v1/oauth2/authorize?"f"response_type=code&client_id={CLIENT_ID}&state=1234&"f"redirect_uri={urllib.parse.quote(REDIRECT_URI)}&"f"code_challenge={code_verifier}&code_challenge_method=plain")
+    auth_url = (f"{AUTH_BASE}/v1/oauth2/authorize?"f"response_type=code&client_id={CLIENT_ID}&state=1234&"f"redirect_uri={urllib.parse.quote(REDIRECT_URI)}&"f"code_challenge={code_verifier}&code_challenge_method=plain")
     print("\nSto aprendo il browser per autorizzare...")
     webbrowser.open(auth_url)
 
 #scambio del codice per ottenere un token di accesso, fa una richiesta(una POST) per ottenere l'access token da MyAnimeList dopo l'autenticazione dell'utente
 def get_access_token(auth_code, code_verifier):
-    token_url = 'https://myanimelist.net/v1/oauth2/token'
+    token_url = f'{AUTH_BASE}/v1/oauth2/token'
     data = {
         'client_id': CLIENT_ID,
         'client_secret': CLIENT_SECRET,
@@ -70,14 +72,18 @@ def get_access_token(auth_code, code_verifier):
         print(response.status_code, response.text)
         return None
 
-#estrae la classifica dei manga (Top 1000 dei manga, modificare max_manga permette di cambiare la Top estratta)
-def get_top_manga(access_token, max_manga=1000):
+#colonne del file top_manga.csv
+FIELDNAMES = ["ID", "Titolo", "Generi", "Punteggio Medio","Rank", "Popolarità", "Stato", "Autori"]
+
+#generatore che estrae la classifica dei manga pagina per pagina (Top 1000 dei manga, modificare max_manga permette di cambiare la Top estratta)
+#ogni pagina viene prodotta appena scaricata, così la memoria usata non dipende dalla dimensione del catalogo
+def iter_top_manga(access_token, max_manga=1000, cache=None):
     #richiama l’endpoint manga/ranking
-    api_url = "https://api.myanimelist.net/v2/manga/ranking"
+    api_url = f"{API_BASE}/v2/manga/ranking"
     headers = {
         "Authorization": f"Bearer {access_token}"
     }
-    all_manga = []
+    totale = 0
     #MAL permette un massimo di 500 per questo tipo di richiesta, diverso da quello della lista utente
     limit = 500 
     fields = ("id,title,mean,rank,popularity,status,genres,authors{first_name,last_name}")
@@ -90,46 +96,55 @@ def get_top_manga(access_token, max_manga=1000):
             #id, titolo, mean, rank, popolarità, status, generi, autori
             "fields": fields 
         }
-        response = requests.get(api_url, headers=headers, params=params)
+        #con la cache attiva la pagina viene scaricata solo se nuova o scaduta, gli errori 5xx e 429 vengono ritentati
+        response = request_with_retry(api_url, headers, params, cache=cache)
         if response.status_code == 200:
             data = response.json().get('data', [])
-            all_manga.extend(data)
             print(f"Recuperati {len(data)} manga da offset {offset}")
+            totale += len(data)
+            yield data
         else:
-            print(f"Errore: {response.status_code}")
+            #una pagina mancante renderebbe la classifica incompleta: il download viene interrotto con un errore
             print(response.text)
-            break
-        #aspetta 1 secondo tra le richieste per evitare rate-limit.
-        time.sleep(1)  
-    print(f"\nTotale manga recuperati: {len(all_manga)}")
+            raise ErroreAPI(response, api_url)
+        #aspetta 1 secondo tra le richieste per evitare rate-limit (non serve se la pagina arriva dalla cache)
+        if not getattr(response, 'da_cache', False):
+            time.sleep(1)  
+    print(f"\nTotale manga recuperati: {totale}")
+
+#estrae la classifica e la restituisce come lista (per cataloghi grandi usare iter_top_manga con save_manga_pages_to_csv)
+def get_top_manga(access_token, max_manga=1000, cache=None):
+    all_manga = []
+    for pagina in iter_top_manga(access_token, max_manga=max_manga, cache=cache):
+        all_manga.extend(pagina)
     return all_manga
 
-#salvataggio in CSV
-def save_manga_to_csv(manga_list, filename="top_manga.csv", folder="DATASET"):
-    #crea la cartella se non esiste
-    os.makedirs(folder, exist_ok=True)
+#converte un manga restituito dall'API in una riga del CSV
+def manga_to_row(manga):
+    node = manga['node']
+    manga_id = node.get('id', '')
+    title = node.get('title', '')
+    genres_list = node.get('genres', [])
+    genres = ", ".join([genre['name'] for genre in genres_list])
+    mean = node.get('mean', '')
+    rank = node.get('rank', '')
+    popularity = node.get('popularity', '')
+    status = node.get('status', '')
+    authors_list = node.get('authors', [])
+    authors = ", ".join([f"{author['node']['first_name']} {author['node']['last_name']}" for author in authors_list])
+    return dict(zip(FIELDNAMES, [manga_id, title, genres, mean,rank, popularity, status, authors]))
+
+#salvataggio in streaming: ogni pagina prodotta dal generatore viene convertita e scritta appena arriva
+def save_manga_pages_to_csv(pagine, filename="top_manga.csv", folder="DATASET"):
     filepath = os.path.join(folder, filename)
-    with open(filepath, mode="w", newline='', encoding="utf-8") as file:
-        writer = csv.writer(file)
-        #scrive l'intestazione
-        writer.writerow(["ID", "Titolo", "Generi", "Punteggio Medio","Rank", "Popolarità", "Stato", "Autori"])
-        #salva
-        for manga in manga_list:
-            node = manga['node']
-            manga_id = node.get('id', '')
-            title = node.get('title', '')
-            genres_list = node.get('genres', [])
-            genres = ", ".join([genre['name'] for genre in genres_list])
-            mean = node.get('mean', '')
-            rank = node.get('rank', '')
-            popularity = node.get('popularity', '')
-            status = node.get('status', '')
-            authors_list = node.get('authors', [])
-            authors = ", ".join([f"{author['node']['first_name']} {author['node']['last_name']}" for author in authors_list])
-            writer.writerow([manga_id, title, genres, mean,rank, popularity, status, authors])
-    
+    righe = ([manga_to_row(manga) for manga in pagina] for pagina in pagine)
+    scrivi_csv_incrementale(righe, filepath, FIELDNAMES)
     print(f"\nFile CSV salvato come '{filepath}'")
 
+#salvataggio in CSV
+def save_manga_to_csv(manga_list, filename="top_manga.csv", folder="DATASET"):
+    save_manga_pages_to_csv([manga_list], filename, folder)
+
 #main
 def main():
     #genera il code_verifier
@@ -150,10 +165,14 @@ def main():
     access_token = get_access_token(auth_code, code_verifier)   
 
     if access_token:
-        #scarica i manga top
-        manga_data = get_top_manga(access_token)
-        #salva il dataset
-        save_manga_to_csv(manga_data)   
+        #scarica i manga top e salva il dataset pagina per pagina
+        cache = CacheAPI()
+        try:
+            save_manga_pages_to_csv(iter_top_manga(access_token, cache=cache))
+        except ErroreAPI as e:
+            print(f"Download interrotto: {e}")
+        cache.stampa_statistiche()
+        cache.chiudi()
 
 #main
 if __name__ == "__main__":
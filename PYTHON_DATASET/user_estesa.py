@@ -4,9 +4,16 @@ import secrets  #usato per generare stringhe casuali sicure (in PKCE)
 import string   #usato per creare il code_verifier (PKCE)
 from http.server import HTTPServer, BaseHTTPRequestHandler  #usato per creare il server locale per ricevere l'OAuth code
 import urllib.parse #usato per costruire URL con parametri
-import csv  #usato per scrivere e salvare file in formato CSV
 import time #usato per gestire pause tra richieste (rate limiting)
 import os   #usato per gestire percorsi e directory nel filesystem
+import argparse #usato per leggere le opzioni da riga di comando (modalità concorrente)
+from concurrent.futures import ThreadPoolExecutor   #usato per scaricare in parallelo i dettagli dei manga
+from connessione_api import TokenBucket, crea_sessione, request_with_retry, ErroreAPI, API_BASE, AUTH_BASE  #limitatore condiviso, sessione HTTP keep-alive, richieste con retry e indirizzi dell'API
+from cache_api import CacheAPI  #cache locale delle risposte dell'API
+from arricchimento import costruisci_indice #indice locale ID -> mean, rank, popolarità
+from journal import JournalCheckpoint  #journal append-only per riprendere un download interrotto
+from scrittura_csv import scrivi_csv_incrementale   #scrittura del CSV pagina per pagina
+from sincronizzazione import carica_watermark, salva_watermark, scarica_modifiche, id_nella_lista, unisci_per_id   #sincronizzazione incrementale per ID
 
 #credenziali dell'applicazione, ottenute dal sito myanimelist.net/apiconfig
 #ID dell'applicazione fornito da MAL
@@ -42,13 +49,13 @@ class OAuthCallbackHandler(BaseHTTPRequestHandler):
 
 #costruisce l’URL di autorizzazione e lo apre nel browser dell’utente
 def open_authorization_url(code_verifier):
-    auth_url = (f"https://myanimelist.net/v1/oauth2/authorize?"f"response_type=code&client_id={CLIENT_ID}&state=1234&"f"redirect_uri={urllib.parse.quote(REDIRECT_URI)}&"f"code_challenge={code_verifier}&code_challenge_method=plain")
+    auth_url = (f"{AUTH_BASE}/v1/oauth2/authorize?"f"response_type=code&client_id={CLIENT_ID}&state=1234&"f"redirect_uri={urllib.parse.quote(REDIRECT_URI)}&"f"code_challenge={code_verifier}&code_challenge_method=plain")
     print("\nSto aprendo il browser per autorizzare...")
     webbrowser.open(auth_url)
 
 #scambio del codice per ottenere un token di accesso, fa una richiesta (una POST) per ottenere l'access token da MyAnimeList dopo l'autenticazione dell'utente
 def get_access_token(auth_code, code_verifier):
-    token_url = 'https://myanimelist.net/v1/oauth2/token'
+    token_url = f'{AUTH_BASE}/v1/oauth2/token'
     data = {
         'client_id': CLIENT_ID,
         'client_secret': CLIENT_SECRET,
@@ -70,124 +77,212 @@ def get_access_token(auth_code, code_verifier):
         print(response.status_code, response.text)
         return None
 
+#colonne del file dataset_ml.csv
+FIELDNAMES = ['ID', 'Titolo', 'Generi', 'Punteggio_Utente', 'Stato_Utente', 'Punteggio_Medio', 'Rank', 'Popolarita']
+
+#salva su CSV le pagine prodotte da un generatore man mano che arrivano
+def save_pages_to_csv(pagine, filename='dataset_ml.csv', folder='DATASET'):
+    filepath = os.path.join(folder, filename)
+    totale = scrivi_csv_incrementale(pagine, filepath, FIELDNAMES)
+    print(f"\nFile salvato: '{filepath}' con {totale} manga.")
+
 #salva i dati raccolti in un file CSV
 def save_to_csv(manga_list, filename='dataset_ml.csv', folder='DATASET'):
-    os.makedirs(folder, exist_ok=True)
-    filepath = os.path.join(folder, filename)
-    with open(filepath, mode='w', newline='', encoding='utf-8') as file:
-        writer = csv.DictWriter(file, fieldnames=['ID', 'Titolo', 'Generi', 'Punteggio_Utente', 'Stato_Utente', 'Punteggio_Medio', 'Rank', 'Popolarita'])
-        writer.writeheader()
-        writer.writerows(manga_list)
-    print(f"\nFile salvato: '{filepath}' con {len(manga_list)} manga.")
-
-#effettua le richieste GET con retry
-def request_with_retry(url, headers, params=None, max_retries=5):
-    #tempo iniziale tra i retry
-    delay = 2
-    for attempt in range(max_retries):
-        response = requests.get(url, headers=headers, params=params)
-        if response.status_code == 200:
-            return response
-        elif response.status_code >= 500:
-            print(f"Errore API: {response.status_code}, ritento tra {delay} secondi...")
-            time.sleep(delay)
-            #raddoppia il tempo di attesa a ogni tentativo
-            delay *= 2  
+    save_pages_to_csv([manga_list], filename, folder)
+
+#richiede i dati aggiuntivi di un singolo manga (utile per ML)
+def get_manga_extra(manga_id, headers, session=None, limiter=None, cache=None):
+    manga_extra_url = f'{API_BASE}/v2/manga/{manga_id}?fields=mean,rank,popularity'
+    extra_response = request_with_retry(manga_extra_url, headers, session=session, limiter=limiter, cache=cache)
+
+    if extra_response and extra_response.status_code == 200:
+        extra_data = extra_response.json()
+        return extra_data.get('mean', ''), extra_data.get('rank', ''), extra_data.get('popularity', '')
+    return '', '', ''
+
+#converte una voce della lista restituita dall'API nella parte utente della riga del dataset, None se la voce va esclusa
+def estrai_voce(entry):
+    node = entry.get('node', {})
+    list_status = entry.get('list_status', {})
+    
+    if not list_status:
+        #ignora se non ci sono dati utente
+        return None
+
+    user_status = list_status.get('status', '')
+    if user_status == 'plan_to_read':
+        #ignora i manga che l'utente vuole solo leggere in futuro
+        return None
+
+    manga_id = node.get('id', '')
+    title = node.get('title', '')
+    genres_list = node.get('genres', [])
+    genres = ", ".join([genre['name'] for genre in genres_list])
+    score = list_status.get('score', '')
+    return {'ID': manga_id,'Titolo': title,'Generi': genres,'Punteggio_Utente': score,'Stato_Utente': user_status}
+
+#completa le voci con mean, rank e popolarità prendendoli dall'indice locale o, se mancano, dall'API
+def completa_dettagli(voci, headers, session, limiter, executor, cache, indice, conteggio):
+    #richiede i dati aggiuntivi solo per i manga assenti dall'indice locale, map mantiene l'ordine della pagina anche in parallelo
+    mancanti = [voce for voce in voci if indice is None or voce['ID'] not in indice]
+    scarica_extra = lambda voce: get_manga_extra(voce['ID'], headers, session=session, limiter=limiter, cache=cache)
+    extras = iter(executor.map(scarica_extra, mancanti) if executor is not None else map(scarica_extra, mancanti))
+    conteggio['evitate'] += len(voci) - len(mancanti)
+    conteggio['richieste'] += len(mancanti)
+    for voce in voci:
+        if indice is not None and voce['ID'] in indice:
+            mean_score, rank, popularity = indice[voce['ID']]
         else:
-            print(f"Errore API irreversibile: {response.status_code}")
-            print(response.text)
-            return response
-    print("Numero massimo di tentativi raggiunto.")
-    return None
-
-#scarica la lista manga dell'utente con le info estese
-def get_user_mangalist_extended(username, access_token, max_manga=25000):
-    base_url = f'https://api.myanimelist.net/v2/users/{username}/mangalist'
+            mean_score, rank, popularity = next(extras)
+        voce.update({'Punteggio_Medio': mean_score,'Rank': rank,'Popolarita': popularity})
+    return voci
+
+#generatore che produce la lista estesa pagina per pagina (una lista di righe per pagina), la memoria usata non dipende dalla lunghezza della lista
+#con workers > 1 i dettagli di ogni pagina vengono scaricati in parallelo, se viene passato un indice locale (vedi arricchimento.py) i manga già presenti non richiedono il dettaglio via API
+def iter_user_mangalist_extended(username, access_token, max_manga=25000, workers=1, richieste_al_secondo=5, session=None, limiter=None, cache=None, indice=None):
+    base_url = f'{API_BASE}/v2/users/{username}/mangalist'
     headers = {
         'Authorization': f'Bearer {access_token}'
     }
-    all_manga = []
+    inizio = time.perf_counter()
+
+    #in modalità concorrente servono una sessione keep-alive e un limitatore condiviso tra i thread
+    executor = None
+    sessione_propria = False
+    if workers > 1:
+        if session is None:
+            session = crea_sessione(pool=workers)
+            sessione_propria = True
+        if limiter is None:
+            limiter = TokenBucket(rate=richieste_al_secondo)
+        executor = ThreadPoolExecutor(max_workers=workers)
+
     #limite massimo per richiesta
     limit = 100 
     fields = "id,title,genres,list_status{score,status}"
 
-    #gestione dell'offset in caso di crash o interruzione
-    offset_file = f'last_offset_{username}.txt'
-    start_offset = 0
-    if os.path.exists(offset_file):
-        with open(offset_file, 'r') as f:
-            start_offset = int(f.read().strip())
-
-    for offset in range(start_offset, max_manga, limit):
-        params = {
-            'limit': limit,
-            'offset': offset,
-            'fields': fields
-        }
-        response = request_with_retry(base_url, headers, params)
-
-        if not response or response.status_code != 200:
-            break
-
-        data = response.json().get('data', [])
-        if not data:
-            print(f"Fine dei dati a offset {offset}")
-            break
-
-        for entry in data:
-            node = entry.get('node', {})
-            list_status = entry.get('list_status', {})
-            
-            if not list_status:
-                #ignora se non ci sono dati utente
-                continue    
-
-            user_status = list_status.get('status', '')
-            if user_status == 'plan_to_read':
-                #ignora i manga che l'utente vuole solo leggere in futuro
-                continue    
-
-            manga_id = node.get('id', '')
-            title = node.get('title', '')
-            genres_list = node.get('genres', [])
-            genres = ", ".join([genre['name'] for genre in genres_list])
-            score = list_status.get('score', '')
-
-            #richiede i dati aggiuntivi per ogni manga (utile per ML)
-            manga_extra_url = f'https://api.myanimelist.net/v2/manga/{manga_id}?fields=mean,rank,popularity'
-            extra_response = request_with_retry(manga_extra_url, headers)
-
-            if extra_response and extra_response.status_code == 200:
-                extra_data = extra_response.json()
-                mean_score = extra_data.get('mean', '')
-                rank = extra_data.get('rank', '')
-                popularity = extra_data.get('popularity', '')
-            else:
-                mean_score = ''
-                rank = ''
-                popularity = ''
+    #gestione del checkpoint in caso di crash o interruzione: il journal contiene le pagine già scaricate e l'offset da cui riprendere
+    journal = JournalCheckpoint(os.path.join('DATASET', f'journal_{username}.jsonl'))
+    #conteggio dei dettagli presi dall'indice locale invece che dalla rete
+    conteggio = {'evitate': 0, 'richieste': 0}
+    totale = 0
+    try:
+        #riprende le pagine già salvate con una sola lettura lineare del journal
+        start_offset = 0
+        for righe, offset in journal.leggi():
+            start_offset = offset
+            totale += len(righe)
+            yield righe
 
-            all_manga.append({'ID': manga_id,'Titolo': title,'Generi': genres,'Punteggio_Utente': score,'Stato_Utente': user_status,'Punteggio_Medio': mean_score,'Rank': rank,'Popolarita': popularity})
-            
-        print(f"Recuperati {len(data)} manga da offset {offset}")
+        for offset in range(start_offset, max_manga, limit):
+            params = {
+                'limit': limit,
+                'offset': offset,
+                'fields': fields
+            }
+            response = request_with_retry(base_url, headers, params, session=session, limiter=limiter, cache=cache)
 
-        #salvataggio parziale e aggiornamento offset (utile in caso la connessione viene interrotta per qualche motivo)
-        save_to_csv(all_manga, filename=f'temp_{username}.csv')
-        with open(offset_file, 'w') as f:
-            f.write(str(offset + limit))
+            #una pagina mancante renderebbe la lista incompleta: il download viene interrotto con un errore e il journal resta per riprenderlo
+            if response.status_code != 200:
+                raise ErroreAPI(response, base_url)
 
-        #aspetta 1 secondo tra le richieste per evitare rate-limit.
-        time.sleep(1)   
+            data = response.json().get('data', [])
+            if not data:
+                print(f"Fine dei dati a offset {offset}")
+                break
 
-    #rimuove il file di offset se il download è completato
-    if os.path.exists(offset_file):
-        os.remove(offset_file)
+            voci = [voce for voce in (estrai_voce(entry) for entry in data) if voce is not None]
+            completa_dettagli(voci, headers, session, limiter, executor, cache, indice, conteggio)
+            print(f"Recuperati {len(data)} manga da offset {offset}")
 
-    print(f"\nTotale manga recuperati per {username}: {len(all_manga)}")
+            #checkpoint (utile in caso la connessione viene interrotta per qualche motivo): accoda solo la pagina nuova insieme all'offset successivo
+            journal.aggiungi(voci, offset + limit)
+            totale += len(voci)
+            yield voci
+
+            #aspetta 1 secondo tra le richieste per evitare rate-limit (in modalità concorrente se ne occupa il limitatore, le pagine in cache non toccano la rete)
+            if limiter is None and not getattr(response, 'da_cache', False):
+                time.sleep(1)   
+    finally:
+        journal.chiudi()
+        if executor is not None:
+            executor.shutdown()
+        if sessione_propria:
+            session.close()
+
+    #il download è completato (un errore esce prima con ErroreAPI), il journal non serve più
+    journal.rimuovi()
+
+    durata = time.perf_counter() - inizio
+    print(f"\nTotale manga recuperati per {username}: {totale}")
+    if indice is not None:
+        print(f"Richieste di dettaglio evitate grazie all'indice locale: {conteggio['evitate']} su {conteggio['evitate'] + conteggio['richieste']}")
+    print(f"Tempo impiegato: {durata:.1f} s ({totale / durata if durata > 0 else 0:.2f} manga/s)")
+
+#scarica la lista manga dell'utente con le info estese e la restituisce come lista (per liste grandi usare iter_user_mangalist_extended con save_pages_to_csv)
+def get_user_mangalist_extended(username, access_token, max_manga=25000, workers=1, richieste_al_secondo=5, session=None, limiter=None, cache=None, indice=None):
+    all_manga = []
+    for pagina in iter_user_mangalist_extended(username, access_token, max_manga=max_manga, workers=workers, richieste_al_secondo=richieste_al_secondo, session=session, limiter=limiter, cache=cache, indice=indice):
+        all_manga.extend(pagina)
     return all_manga
 
+#sincronizzazione incrementale: scarica solo le voci modificate dopo l'ultimo watermark, ne completa i dettagli e le unisce per ID a dataset_ml.csv
+#le voci passate a plan_to_read (o senza dati utente) vengono rimosse, con cancellazioni=True anche quelle tolte dalla lista
+def sync_user_mangalist_extended(username, access_token, filename='dataset_ml.csv', folder='DATASET', cancellazioni=False, max_manga=25000, workers=1, richieste_al_secondo=5, cache=None, indice=None):
+    base_url = f'{API_BASE}/v2/users/{username}/mangalist'
+    headers = {
+        'Authorization': f'Bearer {access_token}'
+    }
+    fields = "id,title,genres,list_status{score,status,updated_at}"
+    session = crea_sessione(pool=max(workers, 1))
+    limiter = TokenBucket(rate=richieste_al_secondo) if workers > 1 else None
+    executor = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+    conteggio = {'evitate': 0, 'richieste': 0}
+    try:
+        #le pagine della lista non passano dalla cache, servono le modifiche più recenti
+        get_pagina = lambda params: request_with_retry(base_url, headers, params, session=session, limiter=limiter)
+        watermark = carica_watermark(username, filename, folder)
+        modificate, nuovo_watermark = scarica_modifiche(fields, watermark, get_pagina, max_manga=max_manga)
+        if modificate is None:
+            return None
+
+        voci, rimossi = [], []
+        for entry in modificate:
+            voce = estrai_voce(entry)
+            if voce is None:
+                rimossi.append(entry.get('node', {}).get('id', ''))
+            else:
+                voci.append(voce)
+        completa_dettagli(voci, headers, session, limiter, executor, cache, indice, conteggio)
+
+        #senza watermark la lista è stata letta per intero, quindi conosce già tutti gli ID presenti
+        id_presenti = None
+        if watermark is None:
+            id_presenti = {str(entry.get('node', {}).get('id', '')) for entry in modificate}
+        elif cancellazioni:
+            id_presenti = id_nella_lista(get_pagina, max_manga=max_manga)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        session.close()
+
+    esito = unisci_per_id(os.path.join(folder, filename), FIELDNAMES, voci, rimossi=rimossi, id_presenti=id_presenti)
+    if nuovo_watermark:
+        salva_watermark(username, filename, nuovo_watermark, folder)
+    print(f"Richieste di dettaglio: {conteggio['richieste']} (evitate {conteggio['evitate']})")
+    return esito
+
 #main
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Scarica la lista manga estesa di un utente MyAnimeList")
+    parser.add_argument('--workers', type=int, default=1, help="thread per i dettagli dei manga (1 = sequenziale)")
+    parser.add_argument('--rps', type=float, default=5, help="richieste al secondo consentite in modalità concorrente")
+    parser.add_argument('--no-cache', action='store_true', help="scarica tutto dalla rete ignorando la cache locale")
+    parser.add_argument('--no-catalogo', action='store_true', help="non usa top_manga.csv per evitare le richieste di dettaglio")
+    parser.add_argument('--incrementale', action='store_true', help="scarica solo le voci modificate dall'ultima sincronizzazione")
+    parser.add_argument('--cancellazioni', action='store_true', help="in modalità incrementale rimuove anche le voci cancellate dalla lista")
+    args = parser.parse_args()
+
     username = input("Inserisci il tuo username di MyAnimeList: ")
     code_verifier = generate_code_verifier()
     open_authorization_url(code_verifier)
@@ -200,18 +295,20 @@ if __name__ == '__main__':
     if auth_code:
         access_token = get_access_token(auth_code, code_verifier)
         if access_token:
-            manga_data = get_user_mangalist_extended(username, access_token)
-            save_to_csv(manga_data)
-            
-            #rimuove il file temporaneo se il download è completato
-            temp_file = os.path.join('DATASET', f'temp_{username}.csv')
-            if os.path.exists(temp_file):
-                try:
-                    os.remove(temp_file)
-                    print(f"File temporaneo rimosso: {temp_file}")
-                except Exception as e:
-                    print(f"Impossibile eliminare il file temporaneo: {e}")
+            cache = None if args.no_cache else CacheAPI()
+            indice = None if args.no_catalogo else costruisci_indice(cache=cache)
+            if args.incrementale:
+                #aggiorna dataset_ml.csv con le sole modifiche
+                sync_user_mangalist_extended(username, access_token, cancellazioni=args.cancellazioni, workers=args.workers, richieste_al_secondo=args.rps, cache=cache, indice=indice)
             else:
-                print(f"File temporaneo non trovato: {temp_file}")
+                #le righe vengono scritte su disco pagina per pagina
+                pagine = iter_user_mangalist_extended(username, access_token, workers=args.workers, richieste_al_secondo=args.rps, cache=cache, indice=indice)
+                try:
+                    save_pages_to_csv(pagine)
+                except ErroreAPI as e:
+                    print(f"Download interrotto: {e}, rieseguire per riprendere dal journal")
+            if cache is not None:
+                cache.stampa_statistiche()
+                cache.chiudi()
     else:
         print("Autorizzazione non completata.")
\ No newline at end of file
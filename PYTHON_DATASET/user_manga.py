@@ -1,6 +1,5 @@
 import requests #usato per effettuare le richieste HTTP (per le API)
 import secrets  #usato per generare stringhe casuali sicure (usato nel PKCE)
-import csv  #usato per scrivere e salvare file in formato CSV
 import time #usato per gestire pause tra richieste (rate limiting)
 import string   #usato per creare il code_verifier (PKCE)
 import webbrowser   #usato per aprire automaticamente un URL nel browser
@@ -8,6 +7,11 @@ from http.server import HTTPServer, BaseHTTPRequestHandler  #usato per creare il
 import urllib.parse #usato per costruire URL con parametri
 import pandas as pd #usato per manipolare il file CSV
 import os   #usato per gestire percorsi e directory nel filesystem
+import argparse #usato per leggere le opzioni da riga di comando (sincronizzazione incrementale)
+from cache_api import CacheAPI  #cache locale delle risposte dell'API
+from connessione_api import request_with_retry, ErroreAPI, API_BASE, AUTH_BASE    #richieste con retry (5xx e 429) e indirizzi dell'API e del token (sostituibili con MAL_API_BASE e MAL_AUTH_BASE)
+from scrittura_csv import scrivi_csv_incrementale   #scrittura del CSV pagina per pagina
+from sincronizzazione import carica_watermark, salva_watermark, scarica_modifiche, id_nella_lista, unisci_per_id   #sincronizzazione incrementale per ID
 
 #credenziali dell'applicazione, ottenute dal sito myanimelist.net/apiconfig
 #ID dell'applicazione fornito da MAL
@@ -43,13 +47,13 @@ class OAuthCallbackHandler(BaseHTTPRequestHandler):
 
 #costruisce l’URL di autorizzazione e lo apre nel browser dell’utente
 def open_authorization_url(code_verifier):
-    auth_url = (f"https://myanimelist.net/v1/oauth2/authorize?"f"response_type=code&client_id={CLIENT_ID}&state=1234&"f"redirect_uri={urllib.parse.quote(REDIRECT_URI)}&"f"code_challenge={code_verifier}&code_challenge_method=plain")
+    auth_url = (f"{AUTH_BASE}/v1/oauth2/authorize?"f"response_type=code&client_id={CLIENT_ID}&state=1234&"f"redirect_uri={urllib.parse.quote(REDIRECT_URI)}&"f"code_challenge={code_verifier}&code_challenge_method=plain")
     print("\nSto aprendo il browser per autorizzare...")
     webbrowser.open(auth_url)
 
 #scambio del codice per ottenere un token di accesso, fa una richiesta(una POST) per ottenere l'access token da MyAnimeList dopo l'autenticazione dell'utente
 def get_access_token(auth_code, code_verifier):
-    token_url = 'https://myanimelist.net/v1/oauth2/token'
+    token_url = f'{AUTH_BASE}/v1/oauth2/token'
     data = {
         'client_id': CLIENT_ID,
         'client_secret': CLIENT_SECRET,
@@ -71,14 +75,35 @@ def get_access_token(auth_code, code_verifier):
         print(response.status_code, response.text)
         return None
 
-#recupero della lista manga dell’utente (ho impostato il limite a 25k cosi da poter estrarre liste come quelle dell'utente Stark700)
-def get_user_mangalist(username, access_token, max_manga=25000):
-    base_url = f'https://api.myanimelist.net/v2/users/{username}/mangalist'
+#colonne del file mangalist.csv
+FIELDNAMES = ['ID', 'Titolo', 'Generi', 'Punteggio', 'Stato']
+
+#converte una voce della lista restituita dall'API in una riga del CSV, None se la voce non ha dati utente
+def estrai_voce(entry):
+    node = entry.get('node', {})
+    list_status = entry.get('list_status', {})
+    if not list_status:
+        #se non c'è list_status, salta il manga, questo avviene per quei manga che attualmente non possono essere estratti da MAL
+        return None
+    #estrae ID, titolo, genere, punteggio e stato per ogni manga
+    manga_id = node.get('id', '')
+    title = node.get('title', '')
+    genres_list = node.get('genres', [])
+    genres = ", ".join([genre['name'] for genre in genres_list])
+    score = list_status.get('score', '')
+    status = list_status.get('status', '')
+    return {'ID': manga_id,'Titolo': title,'Generi': genres,'Punteggio': score,'Stato': status}
+
+#generatore che recupera la lista manga dell’utente pagina per pagina (ho impostato il limite a 25k cosi da poter estrarre liste come quelle dell'utente Stark700)
+#ogni pagina viene prodotta appena scaricata, così la memoria usata non dipende dalla lunghezza della lista
+#session e limiter permettono di condividere connessioni e quota API con altri download (vedi ingestione_batch.py)
+def iter_user_mangalist(username, access_token, max_manga=25000, cache=None, session=None, limiter=None):
+    base_url = f'{API_BASE}/v2/users/{username}/mangalist'
     headers = {
         #usa l’access token per interrogare l’endpoint dell’utente
         'Authorization': f'Bearer {access_token}'
     }
-    all_manga = []
+    totale = 0
     #massimo per singola richiesta, altrimenti il sito blocca la richiesta e/o dispositivo momentaneamente 
     limit = 100
     fields = "id,title,genres,list_status{score,status}"
@@ -90,53 +115,81 @@ def get_user_mangalist(username, access_token, max_manga=25000):
             'offset': offset,
             'fields': fields
         }
-        response = requests.get(base_url, headers=headers, params=params)
+        #con la cache attiva la pagina viene scaricata solo se nuova o scaduta, gli errori 5xx e 429 vengono ritentati
+        response = request_with_retry(base_url, headers, params, session=session, limiter=limiter, cache=cache)
         if response.status_code == 200:
             data = response.json().get('data', [])
             if not data:
                 print(f"Fine dei dati a offset {offset}")
                 break
-            for entry in data:
-                node = entry.get('node', {})
-                list_status = entry.get('list_status', {})
-                if not list_status:
-                    #se non c'è list_status, salta il manga, questo avviene per quei manga che attualmente non possono essere estratti da MAL
-                    continue
-                #estrae ID, titolo, genere, punteggio e stato per ogni manga
-                manga_id = node.get('id', '')
-                title = node.get('title', '')
-                genres_list = node.get('genres', [])
-                genres = ", ".join([genre['name'] for genre in genres_list])
-                score = list_status.get('score', '')
-                status = list_status.get('status', '')
-
-                all_manga.append({'ID': manga_id,'Titolo': title,'Generi': genres,'Punteggio': score,'Stato': status})
+            voci = [voce for voce in (estrai_voce(entry) for entry in data) if voce is not None]
             print(f"Recuperati {len(data)} manga da offset {offset}")
+            totale += len(voci)
+            yield voci
         else:
-            print(f"Errore: {response.status_code}")
+            #una pagina mancante renderebbe la lista incompleta: il download viene interrotto con un errore
             print(response.text)
-            break
+            raise ErroreAPI(response, base_url)
+
+        #aspetta 1 secondo tra le richieste per evitare rate-limit. Anche per evitare che il dispositivo venga contrassegnato come possibile Bot (non serve se la pagina arriva dalla cache o se la quota è gestita dal limitatore)
+        if limiter is None and not getattr(response, 'da_cache', False):
+            time.sleep(1)
 
-        #aspetta 1 secondo tra le richieste per evitare rate-limit. Anche per evitare che il dispositivo venga contrassegnato come possibile Bot
-        time.sleep(1)
+    print(f"\nTotale manga recuperati per {username}: {totale}")
 
-    print(f"\nTotale manga recuperati per {username}: {len(all_manga)}")
+#recupera la lista manga dell’utente e la restituisce come lista (per liste grandi usare iter_user_mangalist con save_pages_to_csv)
+def get_user_mangalist(username, access_token, max_manga=25000, cache=None, session=None, limiter=None):
+    all_manga = []
+    for pagina in iter_user_mangalist(username, access_token, max_manga=max_manga, cache=cache, session=session, limiter=limiter):
+        all_manga.extend(pagina)
     return all_manga
 
-#slvataggio del dataset in CSV, salva l’intera lista di manga in un file CSV nella cartella DATASET
-def save_to_csv(manga_list, filename='mangalist.csv', folder='DATASET'):
-    #crea la cartella se non esiste
-    os.makedirs(folder, exist_ok=True)
+#sincronizzazione incrementale: scarica solo le voci modificate dopo l'ultimo watermark e le unisce per ID a mangalist.csv
+#alla prima esecuzione (nessun watermark) scorre tutta la lista; con cancellazioni=True verifica anche le voci rimosse dalla lista
+def sync_user_mangalist(username, access_token, filename='mangalist.csv', folder='DATASET', cancellazioni=False, max_manga=25000):
+    base_url = f'{API_BASE}/v2/users/{username}/mangalist'
+    headers = {
+        'Authorization': f'Bearer {access_token}'
+    }
+    fields = "id,title,genres,list_status{score,status,updated_at}"
+    #le pagine della sincronizzazione non passano dalla cache, servono le modifiche più recenti
+    get_pagina = lambda params: request_with_retry(base_url, headers, params)
+
+    watermark = carica_watermark(username, filename, folder)
+    modificate, nuovo_watermark = scarica_modifiche(fields, watermark, get_pagina, max_manga=max_manga)
+    if modificate is None:
+        return None
+    righe = [voce for voce in (estrai_voce(entry) for entry in modificate) if voce is not None]
+
+    #senza watermark la lista è stata letta per intero, quindi conosce già tutti gli ID presenti
+    id_presenti = None
+    if watermark is None:
+        id_presenti = {str(entry.get('node', {}).get('id', '')) for entry in modificate}
+    elif cancellazioni:
+        id_presenti = id_nella_lista(get_pagina, max_manga=max_manga)
+
+    esito = unisci_per_id(os.path.join(folder, filename), FIELDNAMES, righe, id_presenti=id_presenti)
+    if nuovo_watermark:
+        salva_watermark(username, filename, nuovo_watermark, folder)
+    return esito
+
+#salvataggio in streaming: scrive nella cartella DATASET le pagine prodotte da un generatore man mano che arrivano
+def save_pages_to_csv(pagine, filename='mangalist.csv', folder='DATASET'):
     filepath = os.path.join(folder, filename)
+    totale = scrivi_csv_incrementale(pagine, filepath, FIELDNAMES)
+    print(f"\nFile CSV salvato come '{filepath}' con {totale} manga.")
 
-    with open(filepath, mode='w', newline='', encoding='utf-8') as file:
-        writer = csv.DictWriter(file, fieldnames=['ID', 'Titolo', 'Generi', 'Punteggio', 'Stato'])
-        writer.writeheader()
-        writer.writerows(manga_list)
-    print(f"\nFile CSV salvato come '{filepath}' con {len(manga_list)} manga.")
+#slvataggio del dataset in CSV, salva l’intera lista di manga in un file CSV nella cartella DATASET
+def save_to_csv(manga_list, filename='mangalist.csv', folder='DATASET'):
+    save_pages_to_csv([manga_list], filename, folder)
 
 #main
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Scarica la lista manga di un utente MyAnimeList")
+    parser.add_argument('--incrementale', action='store_true', help="scarica solo le voci modificate dall'ultima sincronizzazione")
+    parser.add_argument('--cancellazioni', action='store_true', help="in modalità incrementale rimuove anche le voci cancellate dalla lista")
+    args = parser.parse_args()
+
     #chiede l'username
     username = input("Inserisci il nome utente di MyAnimeList: ")
     code_verifier = generate_code_verifier()
@@ -153,10 +206,18 @@ if __name__ == '__main__':
         #ottiene il token
         access_token = get_access_token(auth_code, code_verifier)
         if access_token:
-            #recupera la lista manga dell'utente
-            manga_data = get_user_mangalist(username, access_token)
-            #salva tutto in CSV.
-            save_to_csv(manga_data)
-            input_csv = 'mangalist.csv'
+            if args.incrementale:
+                #aggiorna mangalist.csv con le sole modifiche
+                sync_user_mangalist(username, access_token, cancellazioni=args.cancellazioni)
+            else:
+                #recupera la lista manga dell'utente
+                cache = CacheAPI()
+                #salva in CSV ogni pagina appena scaricata
+                try:
+                    save_pages_to_csv(iter_user_mangalist(username, access_token, cache=cache))
+                except ErroreAPI as e:
+                    print(f"Download interrotto: {e}")
+                cache.stampa_statistiche()
+                cache.chiudi()
     else:
         print("Autorizzazione non completata.")
\ No newline at end of file
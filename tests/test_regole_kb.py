@@ -0,0 +1,128 @@
+import os   #usato per i percorsi dei file della KB di prova
+import sys  #usato per rendere importabili i moduli di KB
+import csv  #usato per scrivere catalogo e lista di prova
+import shutil   #usato per trovare SWI-Prolog e copiare system.pl
+import subprocess   #usato per interrogare system.pl
+import pytest   #usato per i test e per saltare quelli che richiedono SWI-Prolog
+
+CARTELLA_KB = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'KB')
+sys.path.append(CARTELLA_KB)
+from crea_kb import genera_catalogo_prolog, genera_letture_prolog   #stessi fatti usati dal sistema
+from motore_numpy import carica, id_candidati, campiona, valuta_compatibilita, riferimento_da_kb, riferimento_da_prolog  #motore NumPy da confrontare con le regole
+
+#lista di prova: letture (esclusi i plan_to_read) action 10, drama 10, romance 20, comedy 5 -> generi dominanti action, drama, romance
+LISTA = (
+    [(i, f'letto {i}', 'Action, Drama', 8, 'completed') for i in range(1, 11)] +
+    [(i, f'letto {i}', 'Romance', 7, 'completed') for i in range(11, 31)] +
+    [(i, f'letto {i}', 'Comedy', 5, 'dropped') for i in range(31, 36)] +
+    [
+        (200, 'piano 200', 'Action, Horror', 0, 'plan_to_read'),           #metà dei generi dominanti: consigliato
+        (201, 'piano 201', 'Horror, Mystery, Action', 0, 'plan_to_read'),  #un terzo: escluso
+        (202, 'piano 202', '', 0, 'plan_to_read'),                         #senza generi: escluso
+        (203, 'piano 203', 'Drama, Romance', 0, 'plan_to_read'),           #tutti dominanti: consigliato
+    ]
+)
+
+#catalogo di prova: ID, generi, punteggio medio, popolarità
+CATALOGO = [
+    (1, 'Action, Drama', 9.0, 10),              #già letto
+    (100, 'Action', 8.5, 2000),                 #genere dominante, qualità nascosta
+    (101, 'Comedy', 9.0, 3000),                 #nessun genere dominante
+    (102, 'Drama, Award Winning, Romance', 7.0, 100),   #premiato con 2 generi dominanti, misto (award_winning mai letto)
+    (103, 'Action, Award Winning', 9.0, 5000),  #qualità nascosta, misto, premiato con un solo genere dominante
+    (104, 'Horror', 9.0, 9000),                 #nessun genere dominante
+    (105, 'Romance, Horror', '', ''),           #valori mancanti, misto (horror compare solo nei plan_to_read)
+    (106, 'Romance, Comedy', 8.0, 1500),        #popolarità non superiore a 1500
+    (200, 'Action, Horror', 9.0, 4000),         #in lista come plan_to_read
+]
+
+#risultati attesi dalle regole di system.pl, calcolati a mano sui dati di prova
+ATTESI = {
+    'random': [100, 102, 103, 105, 106],
+    'qualita_nascosto': [100, 103],
+    'premiato': [102],
+    'misto': [102, 103, 105],
+    'plan_to_read': [200, 203],
+}
+FREQUENZE = {'action': 10, 'drama': 10, 'romance': 20, 'comedy': 5}
+#generi forniti e giudizio atteso: romance 3, action 2 + comedy 1, horror 0
+COMPATIBILITA = [(['romance'], 'MOLTO'), (['action', 'comedy'], 'ABBASTANZA'), (['horror'], 'POCO'), (['action', 'drama'], 'MOLTO')]
+
+def scrivi_lista(percorso, righe):
+    with open(percorso, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['ID', 'Titolo', 'Generi', 'Punteggio', 'Stato'])
+        writer.writerows(righe)
+
+def scrivi_catalogo(percorso):
+    with open(percorso, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['ID', 'Titolo', 'Generi', 'Punteggio Medio', 'Rank', 'Popolarità', 'Stato', 'Autori'])
+        for rank, (ID, generi, mean, pop) in enumerate(CATALOGO, start=1):
+            writer.writerow([ID, f'manga {ID}', generi, mean, rank, pop, 'finished', 'Autore Prova'])
+
+#CSV di prova e KB generata da crea_kb.py con system.pl accanto
+@pytest.fixture
+def kb(tmp_path):
+    catalogo, lista = tmp_path / 'top_manga.csv', tmp_path / 'mangalist.csv'
+    scrivi_catalogo(catalogo)
+    scrivi_lista(lista, LISTA)
+    cartella = tmp_path / 'KB'
+    (cartella / 'letture').mkdir(parents=True)
+    genera_catalogo_prolog(str(catalogo), str(cartella / 'catalogo.pl'))
+    genera_letture_prolog(str(lista), 'utente', str(cartella / 'letture' / 'utente.pl'))
+    shutil.copy(os.path.join(CARTELLA_KB, 'system.pl'), cartella / 'system.pl')
+    return {'catalogo': str(catalogo), 'lista': str(lista), 'cartella': str(cartella)}
+
+@pytest.fixture
+def utenti(kb):
+    return carica(kb['catalogo'], {'utente': kb['lista']})
+
+@pytest.mark.parametrize('tipo', sorted(ATTESI))
+def test_regola_motore(utenti, tipo):
+    assert id_candidati(utenti, tipo)[0] == ATTESI[tipo]
+
+def test_frequenze_motore(utenti):
+    istogramma = {g: int(c) for g, c in zip(utenti.catalogo.generi, utenti.istogramma[0]) if c > 0}
+    assert istogramma == FREQUENZE
+
+@pytest.mark.parametrize('generi, giudizio', COMPATIBILITA)
+def test_compatibilita_motore(utenti, generi, giudizio):
+    assert valuta_compatibilita(utenti, generi) == [giudizio]
+
+#con più utenti ogni riga delle matrici deve dare gli stessi risultati del singolo utente
+def test_utenti_indipendenti(kb, tmp_path):
+    altra = tmp_path / 'altra.csv'
+    scrivi_lista(altra, [(i, f'letto {i}', 'Horror, Comedy', 9, 'completed') for i in range(300, 312)])
+    insieme = carica(kb['catalogo'], {'utente': kb['lista'], 'altro': str(altra)})
+    da_solo = carica(kb['catalogo'], {'altro': str(altra)})
+    for tipo in ATTESI:
+        assert id_candidati(insieme, tipo)[0] == ATTESI[tipo]
+        assert id_candidati(insieme, tipo)[1] == id_candidati(da_solo, tipo)[0]
+
+@pytest.mark.parametrize('tipo', sorted(ATTESI))
+def test_campiona_distinti(utenti, tipo):
+    campione = campiona(utenti, tipo, k=2, seed=1)[0]
+    assert len(campione) == min(2, len(ATTESI[tipo]))
+    assert len(set(campione)) == len(campione) and set(campione) <= set(ATTESI[tipo])
+
+#lettura dei fatti generati da crea_kb.py (catalogo.pl e letture/utente.pl)
+def test_riferimento_da_kb(kb):
+    risultati, frequenze = riferimento_da_kb(os.path.join(kb['cartella'], 'catalogo.pl'), os.path.join(kb['cartella'], 'letture', 'utente.pl'))
+    assert {tipo: risultati[tipo] for tipo in ATTESI} == ATTESI
+    assert frequenze == FREQUENZE
+
+#predicati reali di system.pl sulla KB di prova
+@pytest.mark.skipif(shutil.which('swipl') is None, reason="SWI-Prolog non installato")
+def test_regole_system_pl(kb):
+    risultati, frequenze = riferimento_da_prolog(os.path.join(kb['cartella'], 'system.pl'))
+    assert {tipo: sorted(risultati[tipo]) for tipo in ATTESI} == ATTESI
+    assert frequenze == FREQUENZE
+
+@pytest.mark.skipif(shutil.which('swipl') is None, reason="SWI-Prolog non installato")
+def test_compatibilita_system_pl(kb):
+    percorso = os.path.join(kb['cartella'], 'system.pl').replace('\\', '/')
+    liste = ', '.join('[' + ', '.join(generi) + ']' for generi, _ in COMPATIBILITA)
+    obiettivo = f"forall(member(G, [{liste}]), (compatibilita(G, _, J), format('~w~n', [J])))"
+    risultato = subprocess.run([shutil.which('swipl'), '-q', '-g', f"consult('{percorso}')", '-g', obiettivo, '-t', 'halt'], capture_output=True, text=True, encoding='utf-8')
+    assert risultato.stdout.split() == [giudizio.lower() for _, giudizio in COMPATIBILITA]
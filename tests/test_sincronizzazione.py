@@ -0,0 +1,39 @@
+import os   #usato per rendere importabili i moduli di PYTHON_DATASET
+import sys  #usato per rendere importabili i moduli di PYTHON_DATASET
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'PYTHON_DATASET'))
+from sincronizzazione import scarica_modifiche  #scansione della lista fino al watermark
+
+WATERMARK = '2024-05-01T10:00:00+00:00'
+
+#risposta minima con lo stesso formato della lista MAL
+class Risposta:
+    def __init__(self, data):
+        self.status_code = 200
+        self.data = data
+
+    def json(self):
+        return {'data': self.data}
+
+def voce(manga_id, aggiornato):
+    return {'node': {'id': manga_id}, 'list_status': {'updated_at': aggiornato}}
+
+#lista già ordinata per data di modifica, più recenti prima, servita a pagine di limit voci
+def pagine(voci):
+    return lambda params: Risposta(voci[params['offset']:params['offset'] + params['limit']])
+
+def test_voce_con_data_uguale_al_watermark():
+    voci = [voce(1, '2024-05-02T08:00:00+00:00'), voce(2, WATERMARK), voce(3, '2024-05-01T09:59:59+00:00'), voce(4, '2024-04-01T00:00:00+00:00')]
+    modificate, watermark = scarica_modifiche('id', WATERMARK, pagine(voci), limit=2)
+    assert [v['node']['id'] for v in modificate] == [1, 2]
+    assert watermark == '2024-05-02T08:00:00+00:00'
+
+def test_senza_watermark_scarica_tutto():
+    voci = [voce(i, f'2024-05-0{9 - i}T00:00:00+00:00') for i in range(1, 5)]
+    modificate, watermark = scarica_modifiche('id', None, pagine(voci), limit=3)
+    assert [v['node']['id'] for v in modificate] == [1, 2, 3, 4]
+    assert watermark == '2024-05-08T00:00:00+00:00'
+
+def test_nessuna_modifica():
+    modificate, watermark = scarica_modifiche('id', WATERMARK, pagine([voce(5, '2024-04-30T00:00:00+00:00')]))
+    assert modificate == [] and watermark == WATERMARK